@@ -10,6 +10,7 @@ orchestration, and shutdown logic live in ``oncutf.boot.lifecycle`` and
 """
 
 import logging
+import multiprocessing
 import os
 import platform
 import sys
@@ -22,123 +23,147 @@ if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
 # ---------------------------------------------------------------------------
-# CLI argument parsing -- BEFORE QApplication so --version / --help exit fast
+# Everything that starts the application runs from main(): worker processes
+# started with "spawn" re-import this file (as __mp_main__) and must only get
+# the definitions below.
 # ---------------------------------------------------------------------------
 import argparse
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from PyQt5.QtWidgets import QApplication, QSplashScreen
+
+
+def _parse_cli() -> argparse.Namespace:
+    """Parse the command line (BEFORE QApplication so --version / --help exit fast)."""
+    parser = argparse.ArgumentParser(
+        prog="oncutf",
+        description="oncutf -- batch file renaming with EXIF/metadata support",
+        add_help=True,
+    )
+    parser.add_argument(
+        "-V",
+        "--version",
+        action="store_true",
+        help="print version and exit",
+    )
+    parser.add_argument(
+        "--debug",
+        action="store_true",
+        help="set log level to DEBUG (default: INFO)",
+    )
+    parser.add_argument(
+        "--no-splash",
+        dest="no_splash",
+        action="store_true",
+        help="skip the splash screen on startup",
+    )
+    parser.add_argument(
+        "-c",
+        "--clean",
+        action="store_true",
+        help="delete database and config.json on startup (fresh start)",
+    )
+    # Parse known args so Qt's own flags (--platform, -style, etc.) pass through
+    cli_args, qt_argv = parser.parse_known_args()
+
+    if cli_args.version:
+        # oncutf/config/app.py has no heavy deps; safe to import early
+        from oncutf.config.app import APP_NAME, APP_VERSION
+
+        print(f"{APP_NAME} {APP_VERSION}")
+        sys.exit(0)
+
+    # Reconstruct sys.argv with only the Qt-compatible remainder
+    sys.argv = [sys.argv[0], *qt_argv]
+
+    if cli_args.clean:
+        # Mutate the config module attribute before any oncutf module reads it.
+        # database_manager and startup_orchestrator import DEBUG_FRESH_START lazily
+        # (inside method bodies), so this mutation takes effect in time.
+        import oncutf.config.app as _app_cfg
+
+        _app_cfg.DEBUG_FRESH_START = True
+
+    return cli_args
+
+
+def _show_early_splash(show_splash: bool) -> tuple["QApplication", "QSplashScreen | None"]:
+    """Create the QApplication and show the early splash screen.
+
+    Runs before heavy oncutf imports (~230ms saved) and uses only PyQt5; no
+    oncutf dependencies.
+    """
+    from PyQt5.QtCore import Qt
+    from PyQt5.QtGui import QPixmap
+    from PyQt5.QtWidgets import QApplication
+
+    # Enable High DPI support BEFORE creating QApplication
+    QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
+    QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
+
+    early_app = QApplication(sys.argv)
+    early_splash = None
+
+    splash_path = Path(project_root) / "oncutf" / "resources" / "images" / "splash.png"
+    if show_splash and splash_path.exists():
+        from PyQt5.QtWidgets import QSplashScreen
+
+        pixmap = QPixmap(str(splash_path))
+        if not pixmap.isNull():
+            # Scale to 600x400
+            pixmap = pixmap.scaled(600, 400, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            early_splash = QSplashScreen(pixmap, Qt.WindowStaysOnTopHint)
+            early_splash.show()
+            early_app.processEvents()
+
+    return early_app, early_splash
+
+
+def _configure_logging(debug: bool) -> logging.Logger:
+    """Configure logging to use the centralized user data directory."""
+    from oncutf.utils.logging.logger_setup import ConfigureLogger
+    from oncutf.utils.paths import AppPaths
+
+    logs_dir = str(AppPaths.get_logs_dir())
+    ConfigureLogger(log_name="oncutf", log_dir=logs_dir)
+
+    if debug:
+        logging.getLogger().setLevel(logging.DEBUG)
+
+    logger = logging.getLogger()
+
+    # Log application start with current date/time
+    now = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
+    logger.info("[App] Application started at %s", now)
+
+    logger_effective_level = logger.getEffectiveLevel()
+    logger.debug("Effective logging level: %d", logger_effective_level, extra={"dev_only": True})
+    return logger
 
-_parser = argparse.ArgumentParser(
-    prog="oncutf",
-    description="oncutf -- batch file renaming with EXIF/metadata support",
-    add_help=True,
-)
-_parser.add_argument(
-    "-V",
-    "--version",
-    action="store_true",
-    help="print version and exit",
-)
-_parser.add_argument(
-    "--debug",
-    action="store_true",
-    help="set log level to DEBUG (default: INFO)",
-)
-_parser.add_argument(
-    "--no-splash",
-    dest="no_splash",
-    action="store_true",
-    help="skip the splash screen on startup",
-)
-_parser.add_argument(
-    "-c",
-    "--clean",
-    action="store_true",
-    help="delete database and config.json on startup (fresh start)",
-)
-# Parse known args so Qt's own flags (--platform, -style, etc.) pass through
-_cli_args, _qt_argv = _parser.parse_known_args()
-
-if _cli_args.version:
-    # oncutf/config/app.py has no heavy deps; safe to import early
-    from oncutf.config.app import APP_NAME, APP_VERSION
-
-    print(f"{APP_NAME} {APP_VERSION}")
-    sys.exit(0)
-
-# Reconstruct sys.argv with only the Qt-compatible remainder
-sys.argv = [sys.argv[0], *_qt_argv]
-
-if _cli_args.clean:
-    # Mutate the config module attribute before any oncutf module reads it.
-    # database_manager and startup_orchestrator import DEBUG_FRESH_START lazily
-    # (inside method bodies), so this mutation takes effect in time.
-    import oncutf.config.app as _app_cfg
-
-    _app_cfg.DEBUG_FRESH_START = True
 
-# ---------------------------------------------------------------------------
-# EARLY SPLASH SCREEN -- show before heavy oncutf imports (~230ms saved)
-# Uses only PyQt5 stdlib; no oncutf dependencies.
-# ---------------------------------------------------------------------------
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QPixmap
-from PyQt5.QtWidgets import QApplication
-
-# Enable High DPI support BEFORE creating QApplication
-QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
-QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
-
-_early_app = QApplication(sys.argv)
-_early_splash = None
-
-_splash_path = Path(project_root) / "oncutf" / "resources" / "images" / "splash.png"
-if not _cli_args.no_splash and _splash_path.exists():
-    from PyQt5.QtWidgets import QSplashScreen
-
-    _pixmap = QPixmap(str(_splash_path))
-    if not _pixmap.isNull():
-        # Scale to 600x400
-        _pixmap = _pixmap.scaled(600, 400, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-        _early_splash = QSplashScreen(_pixmap, Qt.WindowStaysOnTopHint)
-        _early_splash.show()
-        _early_app.processEvents()
-
-# ---------------------------------------------------------------------------
-# Now load the rest of oncutf (heavy imports happen here)
-# ---------------------------------------------------------------------------
-from oncutf.boot.lifecycle import (
-    perform_emergency_cleanup,
-    perform_graceful_shutdown,
-    setup_lifecycle_handlers,
-)
-from oncutf.boot.startup_orchestrator import run_startup
-from oncutf.ui.helpers.fonts import _get_inter_fonts, _get_jetbrains_fonts
-from oncutf.ui.theme_manager import get_theme_manager
-from oncutf.utils.logging.logger_setup import ConfigureLogger
-from oncutf.utils.paths import AppPaths
-
-# Configure logging to use centralized user data directory
-logs_dir = str(AppPaths.get_logs_dir())
-ConfigureLogger(log_name="oncutf", log_dir=logs_dir)
-
-if _cli_args.debug:
-    logging.getLogger().setLevel(logging.DEBUG)
-
-logger = logging.getLogger()
-
-# Log application start with current date/time
-now = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
-logger.info("[App] Application started at %s", now)
+def main() -> int:
+    """Entry point for the oncutf application."""
+    # Frozen builds: let spawned worker processes run their task, not the app
+    multiprocessing.freeze_support()
 
-logger_effective_level = logger.getEffectiveLevel()
-logger.debug("Effective logging level: %d", logger_effective_level, extra={"dev_only": True})
+    cli_args = _parse_cli()
+    app, early_splash = _show_early_splash(not cli_args.no_splash)
 
-# Register signal handlers, atexit cleanup, and global exception handler
-setup_lifecycle_handlers()
+    # Now load the rest of oncutf (heavy imports happen here)
+    from oncutf.boot.lifecycle import (
+        perform_emergency_cleanup,
+        perform_graceful_shutdown,
+        setup_lifecycle_handlers,
+    )
+    from oncutf.boot.startup_orchestrator import run_startup
+    from oncutf.ui.helpers.fonts import _get_inter_fonts, _get_jetbrains_fonts
+    from oncutf.ui.theme_manager import get_theme_manager
 
+    logger = _configure_logging(cli_args.debug)
 
-def main() -> int:
-    """Entry point for the oncutf application."""
-    app = _early_app  # Use the pre-created QApplication
+    # Register signal handlers, atexit cleanup, and global exception handler
+    setup_lifecycle_handlers()
 
     try:
         # CRITICAL: Set working directory to project root first
@@ -187,8 +212,8 @@ def main() -> int:
             logger.warning("[App] Could not create full splash screen: %s", e)
 
         # Close early splash now that the full one is visible
-        if _early_splash is not None:
-            _early_splash.close()
+        if early_splash is not None:
+            early_splash.close()
 
         # Log locale information (important for date/time formatting)
         try:
@@ -7,7 +7,7 @@ Protocol for UI updates after file loading operations.
 Decouples core file loading logic from UI refresh operations.
 """
 
-from typing import TYPE_CHECKING, Protocol
+from typing import TYPE_CHECKING, Any, Protocol
 
 if TYPE_CHECKING:
     from oncutf.domain.models.file_item import FileItem
@@ -21,6 +21,9 @@ class FileLoadUIPort(Protocol):
     - FileStore synchronization
     - UI widget refreshes (placeholder, labels, preview tables)
     - Metadata tree coordination
+    - Progressive loads, whose files arrive in batches from a background
+      thread (adapters marshal those calls to the main thread)
+    - Filesystem-monitor file events, handed to the main thread the same way
     """
 
     def update_model_and_ui(self, items: list["FileItem"], clear: bool = True) -> None:
@@ -32,3 +35,43 @@ class FileLoadUIPort(Protocol):
 
         """
         ...
+
+    def begin_progressive_load(self, load_id: int, folder_path: str, clear: bool = True) -> None:
+        """Prepare the model for a load whose files arrive in batches (main thread).
+
+        Args:
+            load_id: Identifies the load; batches of other loads are ignored
+            folder_path: Root folder being loaded
+            clear: Whether to clear existing files (True) or merge (False)
+
+        """
+        ...
+
+    def add_loaded_batch(self, load_id: int, items: list["FileItem"]) -> None:
+        """Append a batch of a progressive load (any thread).
+
+        Args:
+            load_id: Load the batch belongs to
+            items: FileItem objects to append
+
+        """
+        ...
+
+    def finish_progressive_load(self, load_id: int, cancelled: bool = False) -> None:
+        """Refresh the UI after the last batch of a progressive load (any thread).
+
+        Args:
+            load_id: Load that finished
+            cancelled: Whether the load was cancelled before the walk completed
+
+        """
+        ...
+
+    def apply_file_changes(self, changes: list[Any]) -> None:
+        """Apply filesystem-monitor file events to the loaded files (any thread).
+
+        Args:
+            changes: FileChange events in the order they happened
+
+        """
+        ...
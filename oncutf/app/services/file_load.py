@@ -6,7 +6,7 @@ Date: 2026-01-26
 Adapter service for file loading UI updates using port-adapter pattern.
 """
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from oncutf.app.state.context import AppContext
 
@@ -14,6 +14,23 @@ if TYPE_CHECKING:
     from oncutf.domain.models.file_item import FileItem
 
 
+def _get_file_load_ui() -> Any:
+    """Return the registered FileLoadUIPort adapter.
+
+    Raises:
+        RuntimeError: If no FileLoadUIPort adapter is registered
+
+    """
+    ctx = AppContext.get_instance()
+    adapter = ctx.get_manager("file_load_ui") if ctx.has_manager("file_load_ui") else None
+    if adapter is None:
+        raise RuntimeError(
+            "FileLoadUIPort adapter not registered. "
+            "Call AppContext.register_manager('file_load_ui', adapter) during initialization."
+        )
+    return adapter
+
+
 def update_file_load_ui(items: list["FileItem"], clear: bool = True) -> None:
     """Update file model and UI after loading files.
 
@@ -29,17 +46,78 @@ def update_file_load_ui(items: list["FileItem"], clear: bool = True) -> None:
         RuntimeError: If no FileLoadUIPort adapter is registered
 
     """
-    ctx = AppContext.get_instance()
-    if not ctx.has_manager("file_load_ui"):
-        raise RuntimeError(
-            "FileLoadUIPort adapter not registered. "
-            "Call AppContext.register_manager('file_load_ui', adapter) during initialization."
-        )
+    _get_file_load_ui().update_model_and_ui(items, clear)
 
-    adapter = ctx.get_manager("file_load_ui")
-    if adapter is None:
-        raise RuntimeError(
-            "FileLoadUIPort adapter not registered. "
-            "Call AppContext.register_manager('file_load_ui', adapter) during initialization."
-        )
-    adapter.update_model_and_ui(items, clear)
+
+def begin_progressive_file_load(load_id: int, folder_path: str, clear: bool = True) -> bool:
+    """Prepare the UI for a load whose files arrive in batches.
+
+    Must be called from the main thread, before any batch is added.
+
+    Args:
+    ----
+        load_id: Identifies the load; batches of other loads are ignored
+        folder_path: Root folder being loaded
+        clear: Whether to clear existing files (True) or merge (False)
+
+    Returns:
+    -------
+        False if the registered adapter does not support progressive loads
+        (the caller then loads synchronously)
+
+    """
+    try:
+        adapter = _get_file_load_ui()
+    except RuntimeError:
+        return False
+    if not hasattr(adapter, "begin_progressive_load"):
+        return False
+    adapter.begin_progressive_load(load_id, folder_path, clear)
+    return True
+
+
+def add_progressive_file_batch(load_id: int, items: list["FileItem"]) -> None:
+    """Add a batch of files to a progressive load (from any thread).
+
+    Args:
+    ----
+        load_id: Load the batch belongs to
+        items: FileItem objects to add
+
+    """
+    _get_file_load_ui().add_loaded_batch(load_id, items)
+
+
+def finish_progressive_file_load(load_id: int, cancelled: bool = False) -> None:
+    """Finish a progressive load and refresh the UI (from any thread).
+
+    Args:
+    ----
+        load_id: Load that finished
+        cancelled: Whether the load was cancelled before the walk completed
+
+    """
+    _get_file_load_ui().finish_progressive_load(load_id, cancelled)
+
+
+def queue_file_changes(changes: list[Any]) -> bool:
+    """Hand filesystem-monitor file events to the main thread (from any thread).
+
+    Args:
+    ----
+        changes: FileChange events in the order they happened
+
+    Returns:
+    -------
+        False if no registered adapter takes file events (the caller then
+        applies them itself)
+
+    """
+    try:
+        adapter = _get_file_load_ui()
+    except RuntimeError:
+        return False
+    if not hasattr(adapter, "apply_file_changes"):
+        return False
+    adapter.apply_file_changes(changes)
+    return True
@@ -76,6 +76,21 @@ class FileStore(Observable):
         self.files_loaded.emit(self._loaded_files)
         logger.debug("[FileStore] Loaded files set: %d files", len(self._loaded_files))
 
+    def add_loaded_files(self, files: list[FileItem]) -> None:
+        """Append files to the loaded files and emit signal.
+
+        Args:
+            files: List of FileItem objects to append
+
+        """
+        if not files:
+            return
+        self._loaded_files.extend(files)
+        self.files_loaded.emit(self._loaded_files)
+        logger.debug(
+            "[FileStore] Added %d loaded files (%d total)", len(files), len(self._loaded_files)
+        )
+
     def get_current_folder(self) -> str | None:
         """Get current folder path."""
         return self._current_folder
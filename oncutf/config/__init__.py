@@ -73,15 +73,37 @@ from oncutf.config.features import (
     AUTO_COLOR_MAX_RETRIES,
     AUTO_COLOR_MIN_BRIGHTNESS,
     COMMAND_TYPES,
+    COMPARE_HASH_ALGORITHM,
+    DB_WRITER_MAX_BATCH,
+    DUPLICATE_HASH_ALGORITHM,
     EXTENDED_METADATA_SIZE_LIMIT_MB,
+    FILE_TABLE_PREFETCH_MARGIN,
+    FILE_TABLE_ROW_STATE_CACHE_SIZE,
+    FILESYSTEM_MONITOR_MAX_PENDING_EVENTS,
+    FOLDER_IMPORT_BATCH_INTERVAL,
+    FOLDER_SCAN_MAX_WORKERS,
+    HASH_ENGINE,
     LARGE_FOLDER_WARNING_THRESHOLD,
     MAX_HASH_MEMORY_CACHE_SIZE,
+    METADATA_EXTRACTION_BACKEND,
+    METADATA_FLUSH_BATCH_SIZE,
+    METADATA_FLUSH_INTERVAL,
+    METADATA_KEY_GROUP_CACHE_SIZE,
+    METADATA_PROCESS_BATCH_SIZE,
+    METADATA_PROCESS_MAX_RESTARTS,
+    METADATA_PROCESS_MAX_WORKERS,
     METADATA_TIMEOUT_BATCH_BASE,
     METADATA_TIMEOUT_BATCH_PER_FILE,
     METADATA_TIMEOUT_EXTENDED,
     METADATA_TIMEOUT_FAST,
     METADATA_TIMEOUT_WRITE,
+    METADATA_TREE_MODEL_CACHE_SIZE,
+    METADATA_UI_UPDATE_INTERVAL,
     PARALLEL_HASH_MAX_WORKERS,
+    PARALLEL_PREVIEW_CHUNK_SIZE,
+    PARALLEL_PREVIEW_MAX_WORKERS,
+    PARALLEL_PREVIEW_MIN_FILES,
+    PREVIEW_MEMO_MAX_STAGES,
     SAVE_OPERATION_SETTINGS,
     UNDO_REDO_SETTINGS,
     USE_PARALLEL_HASH_WORKER,
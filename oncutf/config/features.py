@@ -50,17 +50,119 @@ METADATA_TIMEOUT_WRITE = 60  # Large MP4s on slow/USB drives can take >10 s
 METADATA_TIMEOUT_BATCH_BASE = 60
 METADATA_TIMEOUT_BATCH_PER_FILE = 0.5
 
+# =====================================
+# METADATA EXTRACTION WORKERS
+# =====================================
+
+# Extraction backend for ParallelMetadataLoader:
+# "thread"  - extract in worker threads of the UI process
+# "process" - extract in long-lived spawned worker processes that import
+#             exopsis once (threads are used where processes are unavailable)
+METADATA_EXTRACTION_BACKEND = "process"
+METADATA_PROCESS_MAX_WORKERS = None  # None: one process per CPU
+METADATA_PROCESS_BATCH_SIZE = 8  # Files sent to a worker at a time
+METADATA_PROCESS_MAX_RESTARTS = 5  # Worker crashes tolerated per load
+
+# Loaded metadata is handed to the cache and the UI in batches of at most
+# this many files, and at least this often (seconds)
+METADATA_FLUSH_BATCH_SIZE = 200
+METADATA_FLUSH_INTERVAL = 0.25
+
+# Seconds between file table/progress repaints and event-loop pumps while
+# metadata loads (results arriving faster are coalesced)
+METADATA_UI_UPDATE_INTERVAL = 1 / 30
+
 # =====================================
 # HASH CALCULATION PERFORMANCE
 # =====================================
 
 USE_PARALLEL_HASH_WORKER = True
-PARALLEL_HASH_MAX_WORKERS = None  # Auto-detect optimal count
+PARALLEL_HASH_MAX_WORKERS = None  # Auto-detect optimal count (per-device read probe)
+
+# Hashing engine for ParallelHashWorker:
+# "thread"  - hash in worker threads (mmap reads; zlib releases the GIL)
+# "process" - hash in a process pool, only digests are returned (spawned workers)
+HASH_ENGINE = "thread"
+
+# Per-operation hash algorithms: a role ("fast", "strong") or a name from
+# oncutf/core/hash/hash_algorithms.py. "fast" is XXH3_128 with the optional
+# xxhash package, "strong" is BLAKE3 with the optional blake3 package; both
+# fall back to BLAKE2B (stdlib).
+# The file table shows CRC32 (checksums always use it); the hash workers
+# compute and store it in the same read when an operation uses another
+# algorithm.
+DUPLICATE_HASH_ALGORITHM = "fast"
+COMPARE_HASH_ALGORITHM = "strong"
 
 # Maximum memory cache size for hash storage (LRU eviction)
 # Hash values are small (~100B each), so 2000 entries ≈ 200KB
 MAX_HASH_MEMORY_CACHE_SIZE = 2000
 
+# =====================================
+# PREVIEW GENERATION
+# =====================================
+
+# Module configurations whose per-file name parts are memoized for incremental
+# preview (least recently used configurations are dropped first)
+PREVIEW_MEMO_MAX_STAGES = 16
+
+# Module columns with at least this many files to compute are split into
+# chunks and computed in a shared pool of spawned worker processes; 0 disables it.
+# Counter and original-name columns always run in the UI process.
+PARALLEL_PREVIEW_MIN_FILES = 20000
+PARALLEL_PREVIEW_MAX_WORKERS = None  # None: one process per CPU
+PARALLEL_PREVIEW_CHUNK_SIZE = 5000
+
+# =====================================
+# FILE TABLE ROW STATE
+# =====================================
+
+# Rows above and below the visible window whose hash and metadata state is
+# loaded in the same batch as the visible rows
+FILE_TABLE_PREFETCH_MARGIN = 100
+
+# Rows whose loaded state is kept (least recently loaded are dropped first)
+FILE_TABLE_ROW_STATE_CACHE_SIZE = 5000
+
+# =====================================
+# METADATA TREE
+# =====================================
+
+# Files whose metadata tree model is kept, so reselecting a file reuses its
+# model instead of rebuilding it (least recently shown are dropped first)
+METADATA_TREE_MODEL_CACHE_SIZE = 32
+
+# Metadata keys whose group classification is remembered across files
+METADATA_KEY_GROUP_CACHE_SIZE = 20000
+
+# =====================================
+# FOLDER SCANNING
+# =====================================
+
+# Threads listing subdirectories of a recursive load (1: scan sequentially).
+# Listings are I/O bound, so this helps most on network shares and card readers
+FOLDER_SCAN_MAX_WORKERS = 8
+
+# Recursive folder loads run in the background and add rows to the file table
+# while the walk continues: the first listed folder at once, then at most one
+# batch per interval (seconds)
+FOLDER_IMPORT_BATCH_INTERVAL = 0.1
+
+# =====================================
+# FILESYSTEM MONITOR
+# =====================================
+
+# File events queued per debounce window; beyond this the changed folders are
+# rescanned instead of applying the events one by one
+FILESYSTEM_MONITOR_MAX_PENDING_EVENTS = 10000
+
+# =====================================
+# DATABASE CONNECTIONS
+# =====================================
+
+# Most queued write calls the database writer thread commits together
+DB_WRITER_MAX_BATCH = 64
+
 # =====================================
 # FILE HANDLING LIMITS
 # =====================================
@@ -175,6 +175,18 @@ class RenameController:
                 post_transform=post_transform,
                 metadata_cache=metadata_cache,
             )
+            if preview_result.cancelled:
+                logger.debug(
+                    "[RenameController] Preview superseded by a newer request",
+                    extra={"dev_only": True},
+                )
+                return {
+                    "success": False,
+                    "name_pairs": [],
+                    "has_changes": False,
+                    "errors": ["Preview superseded by a newer request"],
+                    "cancelled": True,
+                }
 
             # Extract results
             name_pairs = preview_result.name_pairs
@@ -412,6 +424,10 @@ class RenameController:
             metadata_cache=metadata_cache,
         )
 
+        if preview_result.cancelled:
+            logger.info("[RenameController] Preview superseded, rename cancelled")
+            return self._empty_rename_result("Preview superseded by a newer request")
+
         if not preview_result.has_changes:
             logger.info("[RenameController] No changes detected in preview")
             return {
@@ -498,6 +514,9 @@ class RenameController:
             post_transform=post_transform,
             metadata_cache=metadata_cache,
         )
+        if preview_result.cancelled:
+            logger.info("[RenameController] Preview superseded, rename cancelled")
+            return self._empty_rename_result("Preview superseded by a newer request")
         return file_items, preview_result
 
     def _execute_rename_operation(
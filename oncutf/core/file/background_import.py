@@ -0,0 +1,137 @@
+"""Module: background_import.py.
+
+Author: Michael Economou
+Date: 2026-10-16
+
+Recursive folder import in the background.
+
+A synchronous recursive load shows nothing until the whole tree is walked,
+so a large archive root keeps the window behind a wait cursor for the entire
+walk. ``BackgroundFolderImport`` walks the tree in a background thread (the
+directory listings themselves run on the scanner's thread pool), turns each
+listed directory into FileItems with the caller's ``prepare`` step (companion
+filtering, color tags) and hands them to ``on_batch`` while the walk
+continues: the first directory at once, then at most one batch per
+``FOLDER_IMPORT_BATCH_INTERVAL``.
+
+Callbacks run in the import thread; UI adapters marshal them to the main
+thread themselves.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING
+
+from oncutf.config import FOLDER_IMPORT_BATCH_INTERVAL, FOLDER_SCAN_MAX_WORKERS
+from oncutf.utils.filesystem.folder_scanner import iter_directory_scans
+from oncutf.utils.logging.logger_factory import get_cached_logger
+from oncutf.utils.shared.update_coalescer import UpdateCoalescer
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from oncutf.domain.models.file_item import FileItem
+    from oncutf.utils.filesystem.folder_scanner import ScannedFile
+
+logger = get_cached_logger(__name__)
+
+
+class BackgroundFolderImport:
+    """Walks a folder tree in a background thread and delivers FileItems in batches."""
+
+    def __init__(
+        self,
+        folder_path: str,
+        *,
+        accept: Callable[[str], bool],
+        prepare: Callable[[list[ScannedFile]], list[FileItem]],
+        on_batch: Callable[[list[FileItem]], None],
+        on_finished: Callable[[int, bool], None],
+        batch_interval: float = FOLDER_IMPORT_BATCH_INTERVAL,
+        max_workers: int = FOLDER_SCAN_MAX_WORKERS,
+    ) -> None:
+        """Configure the import (call ``start()`` to run it).
+
+        Args:
+            folder_path: Root folder to import recursively
+            accept: File name filter applied while listing
+            prepare: Turns the files of one directory into FileItems
+            on_batch: Called with each batch of FileItems
+            on_finished: Called once with the number of items delivered and
+                whether the import was cancelled
+            batch_interval: Minimum seconds between batches after the first
+            max_workers: Threads listing directories
+
+        """
+        self.folder_path = folder_path
+        self._accept = accept
+        self._prepare = prepare
+        self._on_batch = on_batch
+        self._on_finished = on_finished
+        self._batch_interval = batch_interval
+        self._max_workers = max_workers
+        self._cancel_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._delivered = 0
+
+    def start(self) -> None:
+        """Start walking in a background thread."""
+        self._thread = threading.Thread(target=self._run, name="oncutf-folder-import", daemon=True)
+        self._thread.start()
+        logger.info("[BackgroundFolderImport] Started import of %s", self.folder_path)
+
+    def cancel(self) -> None:
+        """Stop the walk; batches not yet delivered are dropped."""
+        self._cancel_event.set()
+
+    def is_cancelled(self) -> bool:
+        """Return True once ``cancel()`` was called."""
+        return self._cancel_event.is_set()
+
+    def is_running(self) -> bool:
+        """Return True while the import thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Wait for the import thread; return True if it finished."""
+        if self._thread is not None:
+            self._thread.join(timeout)
+        return not self.is_running()
+
+    def _deliver(self, items: list[FileItem]) -> None:
+        if self.is_cancelled():
+            return
+        self._delivered += len(items)
+        self._on_batch(items)
+
+    def _run(self) -> None:
+        """Walk the tree and deliver batches (import thread)."""
+        batches = UpdateCoalescer(self._deliver, self._batch_interval)
+        try:
+            for _directory, files, _subdirs in iter_directory_scans(
+                self.folder_path,
+                accept=self._accept,
+                max_workers=self._max_workers,
+                cancelled=self.is_cancelled,
+            ):
+                items = self._prepare(files) if files else []
+                if not items:
+                    continue
+                batches.add(items)
+                if not self._delivered:
+                    # Show the first rows as soon as one folder is listed
+                    batches.flush()
+            if not self.is_cancelled():
+                batches.flush()
+        except Exception:
+            logger.exception("[BackgroundFolderImport] Import of %s failed", self.folder_path)
+
+        cancelled = self.is_cancelled()
+        logger.info(
+            "[BackgroundFolderImport] %s import of %s: %d files",
+            "Cancelled" if cancelled else "Finished",
+            self.folder_path,
+            self._delivered,
+        )
+        self._on_finished(self._delivered, cancelled)
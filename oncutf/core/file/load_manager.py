@@ -14,25 +14,48 @@ Responsibilities:
 """
 
 import os
+from dataclasses import dataclass
+from datetime import UTC, datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any, Literal, cast
 
-from oncutf.app.services.file_load import update_file_load_ui
+from oncutf.app.services.file_load import (
+    add_progressive_file_batch,
+    begin_progressive_file_load,
+    finish_progressive_file_load,
+    update_file_load_ui,
+)
 from oncutf.config import (
     ALLOWED_EXTENSIONS,
     COMPANION_FILES_ENABLED,
+    FOLDER_SCAN_MAX_WORKERS,
     SHOW_COMPANION_FILES_IN_TABLE,
 )
+from oncutf.core.file.background_import import BackgroundFolderImport
 from oncutf.domain.keyboard import KeyboardModifier
 from oncutf.domain.models.file_item import FileItem
 from oncutf.utils.filesystem.companion_files_helper import CompanionFilesHelper
+from oncutf.utils.filesystem.folder_scanner import ScannedFile, scan_folder
 from oncutf.utils.logging.logger_factory import get_cached_logger
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from oncutf.app.ports.drag_state import DragStatePort
 
 logger = get_cached_logger(__name__)
 
+FileChangeKind = Literal["created", "deleted", "moved", "modified"]
+
+
+@dataclass(frozen=True, slots=True)
+class FileChange:
+    """A single file event reported by the filesystem monitor."""
+
+    kind: FileChangeKind
+    path: str
+    dest_path: str | None = None  # Set for "moved"
+
 
 class FileLoadManager:
     """Unified file loading manager with fully optimized policy:
@@ -58,6 +81,9 @@ class FileLoadManager:
         self._metadata_operation_in_progress = False
         # When True, FS-monitor triggered refresh is suppressed (dirty files visible)
         self._has_dirty_renamed_files: bool = False
+        # Recursive folder load running in the background (one at a time)
+        self._background_import: BackgroundFolderImport | None = None
+        self._import_count = 0
         logger.debug(
             "[FileLoadManager] Initialized with unified loading policy",
             extra={"dev_only": True},
@@ -102,6 +128,9 @@ class FileLoadManager:
             logger.error("Path is not a directory: %s", folder_path)
             return
 
+        # A new load replaces any recursive load still running
+        self.cancel_background_import()
+
         # Clear rename-dirty suppression on full folder loads so that the FS
         # monitor can operate normally and fresh FileItem objects are shown.
         if not merge_mode:
@@ -161,6 +190,7 @@ class FileLoadManager:
 
         # Process all paths with fast wait cursor approach (same as drag operations)
         all_file_paths = []
+        scanned: list[ScannedFile] = []
 
         from oncutf.app.services import wait_cursor
 
@@ -171,12 +201,13 @@ class FileLoadManager:
                         all_file_paths.append(path)
                 elif Path(path).is_dir():
                     # Always recursive for import button (user selected folders deliberately)
-                    folder_files = self._get_files_from_folder(path, recursive=True)
-                    all_file_paths.extend(folder_files)
+                    folder_files = self._scan_folder(path, recursive=True)
+                    all_file_paths.extend(f.path for f in folder_files)
+                    scanned.extend(folder_files)
 
         # Update UI with all collected files
         if all_file_paths:
-            self._update_ui_with_files(all_file_paths, clear=clear)
+            self._update_ui_with_files(all_file_paths, clear=clear, scanned=scanned)
 
     def load_single_item_from_drop(
         self,
@@ -257,6 +288,7 @@ class FileLoadManager:
 
         # Process all items with unified logic
         all_file_paths = []
+        scanned: list[ScannedFile] = []
 
         for path in paths:
             if Path(path).is_file():
@@ -264,12 +296,13 @@ class FileLoadManager:
                     all_file_paths.append(path)
             elif Path(path).is_dir():
                 # For table drops, collect files synchronously to avoid multiple dialogs
-                folder_files = self._get_files_from_folder(path, recursive)
-                all_file_paths.extend(folder_files)
+                folder_files = self._scan_folder(path, recursive)
+                all_file_paths.extend(f.path for f in folder_files)
+                scanned.extend(folder_files)
 
         # Update UI with all collected files
         if all_file_paths:
-            self._update_ui_with_files(all_file_paths, clear=not merge_mode)
+            self._update_ui_with_files(all_file_paths, clear=not merge_mode, scanned=scanned)
 
     def _load_folder_with_wait_cursor(
         self, folder_path: str, merge_mode: bool, recursive: bool = False
@@ -282,19 +315,77 @@ class FileLoadManager:
             extra={"dev_only": True},
         )
 
+        # Recursive loads can be large: walk in the background and show rows
+        # as folders are listed
+        if recursive and self._start_background_import(folder_path, clear=not merge_mode):
+            return
+
         from oncutf.app.services import wait_cursor
 
         with wait_cursor():
-            file_paths = self._get_files_from_folder(folder_path, recursive)
-            self._update_ui_with_files(file_paths, clear=not merge_mode)
+            scanned = self._scan_folder(folder_path, recursive)
+            self._update_ui_with_files(
+                [f.path for f in scanned], clear=not merge_mode, scanned=scanned
+            )
+
+    def _start_background_import(self, folder_path: str, *, clear: bool) -> bool:
+        """Start a recursive load that streams FileItems into the model.
+
+        Args:
+            folder_path: Root folder to load recursively
+            clear: Whether to replace (True) or merge into (False) loaded files
+
+        Returns:
+            bool: False if the UI cannot take progressive loads (load synchronously)
+
+        """
+        self.cancel_background_import()
+        self._import_count += 1
+        load_id = self._import_count
+        root = str(Path(folder_path).resolve())
+        if not begin_progressive_file_load(load_id, root, clear):
+            return False
+
+        self._background_import = BackgroundFolderImport(
+            root,
+            accept=self._is_allowed_extension,
+            prepare=self._file_items_from_scan,
+            on_batch=lambda items: add_progressive_file_batch(load_id, items),
+            on_finished=lambda _count, cancelled: finish_progressive_file_load(load_id, cancelled),
+        )
+        self._background_import.start()
+        return True
+
+    def cancel_background_import(self) -> None:
+        """Cancel the recursive load running in the background, if any."""
+        if self._background_import is not None:
+            if self._background_import.is_running():
+                logger.info(
+                    "[FileLoadManager] Cancelling background import of %s",
+                    self._background_import.folder_path,
+                )
+            self._background_import.cancel()
+            self._background_import = None
+
+    def _file_items_from_scan(self, scanned: list[ScannedFile]) -> list[FileItem]:
+        """Build FileItems for the scanned files of one folder (import thread).
+
+        Applies companion filtering and loads color tags, like
+        _update_ui_with_files() does for synchronous loads.
+        """
+        stats = {f.path: f for f in scanned}
+        file_items = [
+            FileItem.from_stat(path, stats[path].size, stats[path].mtime)
+            for path in self._filter_companion_files(list(stats))
+        ]
+        self._load_color_tags(file_items)
+        return file_items
 
     def _get_files_from_folder(
         self, folder_path: str, recursive: bool = False, *, sorted_output: bool = False
     ) -> list[str]:
         """Get all valid files from folder (I/O operation).
 
-        Core scanning method used by all folder loading operations.
-
         Args:
             folder_path: Path to folder to scan
             recursive: Whether to scan subdirectories
@@ -304,44 +395,48 @@ class FileLoadManager:
             List of file paths
 
         """
-        file_paths = []
-        if recursive:
-            try:
-                for root, _, filenames in os.walk(folder_path):
-                    for filename in filenames:
-                        if self._is_allowed_extension(filename):
-                            try:
-                                # Use Path for cross-platform compatibility
-                                full_path = str((Path(root) / filename).resolve())
-                                file_paths.append(full_path)
-                            except Exception as e:
-                                logger.warning(
-                                    "[FileLoadManager] Error processing file %s: %s",
-                                    filename,
-                                    e,
-                                )
-            except Exception:
-                logger.exception("[FileLoadManager] Error walking directory %s", folder_path)
-        else:
-            try:
-                file_paths.extend(
-                    str(entry)
-                    for entry in Path(folder_path).iterdir()
-                    if self._is_allowed_extension(entry.name) and entry.is_file()
-                )
-            except OSError:
-                logger.exception("[FileLoadManager] Error listing directory %s", folder_path)
+        return [
+            f.path for f in self._scan_folder(folder_path, recursive, sorted_output=sorted_output)
+        ]
+
+    def _scan_folder(
+        self, folder_path: str, recursive: bool = False, *, sorted_output: bool = False
+    ) -> list[ScannedFile]:
+        """Scan folder for valid files with their size and mtime (I/O operation).
+
+        Core scanning method used by all folder loading operations. Each file
+        is stat'ed once; FileItem.from_stat() builds items from the results
+        without further syscalls.
+
+        Args:
+            folder_path: Path to folder to scan
+            recursive: Whether to scan subdirectories (in parallel threads)
+            sorted_output: Whether to sort results alphabetically
+
+        Returns:
+            List of scanned files
+
+        """
+        # Recursive loads report absolute paths; resolve the root once
+        # instead of every file below it
+        root = str(Path(folder_path).resolve()) if recursive else str(Path(folder_path))
+        scanned = scan_folder(
+            root,
+            recursive=recursive,
+            accept=self._is_allowed_extension,
+            max_workers=FOLDER_SCAN_MAX_WORKERS,
+        )
 
         if sorted_output:
-            file_paths.sort()
+            scanned.sort()
 
         logger.info(
             "[FileLoadManager] Found %d files in %s (recursive=%s)",
-            len(file_paths),
+            len(scanned),
             folder_path,
             recursive,
         )
-        return file_paths
+        return scanned
 
     def _is_allowed_extension(self, path: str) -> bool:
         """Check if file has allowed extension."""
@@ -356,7 +451,7 @@ class FileLoadManager:
 
         This method performs I/O operations to scan the filesystem.
         Cache is stored in FileStore for state persistence.
-        Delegates scanning to _get_files_from_folder() for consistency.
+        Delegates scanning to _scan_folder() for consistency.
 
         Args:
             folder_path: Absolute path to folder to scan
@@ -386,20 +481,10 @@ class FileLoadManager:
                 return cast("list[FileItem]", cached_files)
 
         # Scan folder using unified scanning method (I/O operation)
-        file_paths = self._get_files_from_folder(folder_path, recursive=False, sorted_output=True)
+        scanned = self._scan_folder(folder_path, recursive=False, sorted_output=True)
 
-        # Convert to FileItem objects
-        file_items = []
-        for file_path in file_paths:
-            try:
-                file_items.append(FileItem.from_path(file_path))
-            except OSError as e:
-                logger.warning(
-                    "[FileLoadManager] Could not create FileItem for %s: %s",
-                    Path(file_path).name,
-                    e,
-                )
-                continue
+        # Convert to FileItem objects from the scanned stat results (no extra I/O)
+        file_items = [FileItem.from_stat(f.path, f.size, f.mtime) for f in scanned]
 
         # Cache results (via FileStore)
         if use_cache and file_store:
@@ -449,14 +534,24 @@ class FileLoadManager:
         else:
             return filtered_files
 
-    def _update_ui_with_files(self, file_paths: list[str], clear: bool = True) -> None:
+    def _update_ui_with_files(
+        self,
+        file_paths: list[str],
+        clear: bool = True,
+        scanned: "Iterable[ScannedFile]" = (),
+    ) -> None:
         """Update UI with loaded files.
         Converts file paths to FileItem objects and delegates to service.
+        Paths found in *scanned* reuse the scan's size and mtime instead of
+        being stat'ed again.
         """
         if not file_paths:
             logger.info("[FileLoadManager] No files to update UI with")
             return
 
+        # A synchronous load replaces any recursive load still running
+        self.cancel_background_import()
+
         # Filter companion files if needed
         filtered_paths = self._filter_companion_files(file_paths)
 
@@ -467,11 +562,17 @@ class FileLoadManager:
             extra={"dev_only": True},
         )
 
-        # Convert file paths to FileItem objects (I/O only)
+        # Convert file paths to FileItem objects (I/O only for unscanned paths)
+        stats = {f.path: f for f in scanned}
         file_items = []
         for path in filtered_paths:
             try:
-                file_item = FileItem.from_path(path)
+                stat = stats.get(path)
+                file_item = (
+                    FileItem.from_stat(path, stat.size, stat.mtime)
+                    if stat
+                    else FileItem.from_path(path)
+                )
                 file_items.append(file_item)
             except Exception:
                 logger.exception("Error creating FileItem for %s", path)
@@ -697,6 +798,144 @@ class FileLoadManager:
         )
         return True
 
+    def apply_file_changes(self, changes: "Iterable[FileChange]", file_store: Any = None) -> bool:
+        """Apply individual file events to the loaded files without rescanning.
+
+        I/O LAYER METHOD - Only the files named in *changes* are stat'ed.
+        Like refresh_loaded_folders(), existing FileItem objects are mutated
+        in place: deleted files get file_missing=True, renamed files take
+        their new path, modified files get fresh size and date, and new
+        files in a loaded folder are appended to FileStore and inserted into
+        file_model. Changed rows are repainted with one dataChanged.
+
+        Must run in the main thread; the filesystem monitor hands its events
+        over through the FileLoadUIPort.
+
+        Args:
+            changes: File events in the order they happened
+            file_store: FileStore instance to update (optional, uses parent_window if available)
+
+        Returns:
+            bool: True if the changes were applied
+
+        """
+        if self._has_dirty_renamed_files:
+            logger.debug(
+                "[FileLoadManager] Skipping FS-monitor changes (dirty renamed files suppressed)",
+                extra={"dev_only": True},
+            )
+            return True
+
+        if not file_store:
+            if hasattr(self.parent_window, "context") and hasattr(
+                self.parent_window.context, "file_store"
+            ):
+                file_store = self.parent_window.context.file_store
+            else:
+                logger.warning("[FileLoadManager] No FileStore available for file changes")
+                return False
+
+        file_model: Any = getattr(self.parent_window, "file_model", None)
+        model_files: list[FileItem] | None = getattr(file_model, "files", None)
+        live_files = model_files or file_store.get_loaded_files()
+        if not live_files:
+            return False
+
+        by_path: dict[str, FileItem] = {f.full_path: f for f in live_files}
+        loaded_folders = {str(Path(path).parent) for path in by_path}
+        new_items: dict[str, FileItem] = {}
+        changed: dict[int, FileItem] = {}
+
+        def mark_missing(path: str) -> None:
+            if new_items.pop(path, None) is not None:
+                return
+            item = by_path.get(path)
+            if item is not None and not item.file_missing:
+                item.file_missing = True
+                changed[id(item)] = item
+                logger.info("[FileLoadManager] File went missing: %s", item.filename)
+
+        def update_or_add(path: str) -> None:
+            item = by_path.get(path) or new_items.get(path)
+            if item is not None:
+                if self._refresh_file_stat(item) and path not in new_items:
+                    changed[id(item)] = item
+            elif str(Path(path).parent) in loaded_folders and self._is_allowed_extension(path):
+                if not Path(path).is_file():
+                    return
+                new_items[path] = FileItem.from_path(path)
+                logger.info("[FileLoadManager] New file appeared: %s", new_items[path].filename)
+
+        for change in changes:
+            if change.kind == "deleted":
+                mark_missing(change.path)
+            elif change.kind != "moved":
+                update_or_add(change.path)
+            elif change.dest_path is None:
+                mark_missing(change.path)
+            else:
+                item = by_path.get(change.path)
+                dest_folder = str(Path(change.dest_path).parent)
+                if item is None or change.dest_path in by_path or dest_folder not in loaded_folders:
+                    mark_missing(change.path)
+                    update_or_add(change.dest_path)
+                    continue
+                del by_path[change.path]
+                self._move_file_item(item, change.dest_path)
+                by_path[change.dest_path] = item
+                changed[id(item)] = item
+
+        if new_items:
+            added = list(new_items.values())
+            self._load_color_tags(added)
+            file_store.add_loaded_files(added)
+            if file_model is not None and hasattr(file_model, "add_files"):
+                file_model.add_files(added)
+            elif model_files is not None:
+                model_files.extend(added)
+
+        if file_model is not None and changed:
+            if not hasattr(file_model, "rows_for_paths"):
+                file_model.layoutChanged.emit()
+            else:
+                rows = file_model.rows_for_paths(item.full_path for item in changed.values())
+                if rows:
+                    file_model.dataChanged.emit(
+                        file_model.index(min(rows), 0),
+                        file_model.index(max(rows), file_model.columnCount() - 1),
+                    )
+
+        logger.info(
+            "[FileLoadManager] Applied file changes: %d added, %d updated",
+            len(new_items),
+            len(changed),
+        )
+        return True
+
+    @staticmethod
+    def _refresh_file_stat(item: FileItem) -> bool:
+        """Re-read size and modification date of a file; return False if it is gone."""
+        try:
+            stat = Path(item.full_path).stat()
+        except OSError:
+            return False
+        item.size = stat.st_size
+        item.modified = stat.st_mtime
+        if item.file_missing:
+            item.file_missing = False
+            logger.info("[FileLoadManager] File reappeared: %s", item.filename)
+        return True
+
+    @staticmethod
+    def _move_file_item(item: FileItem, new_path: str) -> None:
+        """Point a FileItem at the path its file was renamed or moved to."""
+        suffix = Path(new_path).suffix
+        item.full_path = new_path
+        item.filename = Path(new_path).name
+        item.extension = suffix[1:].lower() if suffix else ""
+        item.file_missing = False
+        logger.info("[FileLoadManager] File renamed externally: %s", item.filename)
+
     def _load_color_tags(self, file_items: list[FileItem]) -> None:
         """Load color tags from database for a list of files.
 
@@ -9,7 +9,9 @@ Filesystem monitoring for drive and directory changes.
 Features:
 - Drive mount/unmount detection (polling-based)
 - Directory content change detection (watchdog library)
-- Automatic refresh via FileLoadManager when changes detected
+- Automatic refresh via FileLoadManager when changes detected: file events
+  are applied one by one; folders are rescanned only when the event queue
+  overflows or a directory itself is created, deleted or moved
 """
 
 from __future__ import annotations
@@ -24,13 +26,17 @@ from typing import TYPE_CHECKING, Any
 from watchdog.events import FileSystemEvent, FileSystemEventHandler
 from watchdog.observers import Observer
 
+from oncutf.app.services.file_load import queue_file_changes
 from oncutf.app.services.ui_scheduler import (
     TimerPriority,
     TimerType,
     cancel_timer,
     schedule_timer,
 )
+from oncutf.config import FILESYSTEM_MONITOR_MAX_PENDING_EVENTS
+from oncutf.core.file.load_manager import FileChange
 from oncutf.utils.events import Observable, Signal
+from oncutf.utils.filesystem.companion_index import invalidate_companion_index
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -65,6 +71,7 @@ class _DirectoryEventHandler(FileSystemEventHandler):
             self.monitor._on_directory_changed(str(event.src_path))
         else:
             self.monitor._on_file_changed(str(event.src_path))
+            self.monitor._on_file_event(FileChange("modified", str(event.src_path)))
 
     def on_created(self, event: FileSystemEvent) -> None:
         """Handle file/directory creation.
@@ -75,11 +82,12 @@ class _DirectoryEventHandler(FileSystemEventHandler):
         """
         if event.is_directory:
             # New subdirectory created - notify parent
-            self.monitor._on_directory_changed(str(Path(str(event.src_path)).parent))
+            self.monitor._on_directory_changed(
+                str(Path(str(event.src_path)).parent), rescan=str(event.src_path)
+            )
         else:
-            # New file created - notify containing directory
-            parent_path = str(Path(str(event.src_path)).parent)
-            self.monitor._on_directory_changed(parent_path)
+            # New file created - queue it for its containing directory
+            self.monitor._on_file_event(FileChange("created", str(event.src_path)))
 
     def on_deleted(self, event: FileSystemEvent) -> None:
         """Handle file/directory deletion.
@@ -89,10 +97,11 @@ class _DirectoryEventHandler(FileSystemEventHandler):
 
         """
         if event.is_directory:
-            self.monitor._on_directory_changed(str(Path(str(event.src_path)).parent))
+            self.monitor._on_directory_changed(
+                str(Path(str(event.src_path)).parent), rescan=str(event.src_path)
+            )
         else:
-            parent_path = str(Path(str(event.src_path)).parent)
-            self.monitor._on_directory_changed(parent_path)
+            self.monitor._on_file_event(FileChange("deleted", str(event.src_path)))
 
     def on_moved(self, event: FileSystemEvent) -> None:
         """Handle file/directory move.
@@ -101,12 +110,16 @@ class _DirectoryEventHandler(FileSystemEventHandler):
             event: File system event
 
         """
+        dest_path = str(event.dest_path) if getattr(event, "dest_path", None) else None
+        if not event.is_directory:
+            self.monitor._on_file_event(FileChange("moved", str(event.src_path), dest_path))
+            return
+
         # Notify both source and destination parent directories
         src_parent = str(Path(str(event.src_path)).parent)
-        self.monitor._on_directory_changed(src_parent)
-        if hasattr(event, "dest_path"):
-            dest_parent = str(Path(str(event.dest_path)).parent)
-            self.monitor._on_directory_changed(dest_parent)
+        self.monitor._on_directory_changed(src_parent, rescan=str(event.src_path))
+        if dest_path:
+            self.monitor._on_directory_changed(str(Path(dest_path).parent), rescan=dest_path)
 
 
 class FilesystemMonitor(Observable):
@@ -154,6 +167,9 @@ class FilesystemMonitor(Observable):
         # Debounce timer for change events (threading.Timer for thread-safety)
         self._debounce_timer: threading.Timer | None = None
         self._pending_changes: set[str] = set()
+        self._pending_events: list[FileChange] = []
+        self._pending_rescans: set[str] = set()
+        self._events_overflowed = False
         self._pending_lock = threading.Lock()
 
         # Track loaded folders
@@ -314,7 +330,7 @@ class FilesystemMonitor(Observable):
             if self._debounce_timer:
                 self._debounce_timer.cancel()
                 self._debounce_timer = None
-            self._pending_changes.clear()
+            self._clear_pending()
         logger.debug("[FilesystemMonitor] Paused", extra={"dev_only": True})
 
     def resume(self) -> None:
@@ -322,7 +338,7 @@ class FilesystemMonitor(Observable):
         self._paused = False
         # Clear any pending changes that accumulated during pause
         with self._pending_lock:
-            self._pending_changes.clear()
+            self._clear_pending()
             # Also cancel any debounce timer that might have been scheduled
             if self._debounce_timer:
                 self._debounce_timer.cancel()
@@ -463,11 +479,13 @@ class FilesystemMonitor(Observable):
                 timer_id="filesystem_monitor_drive_poll",
             )
 
-    def _on_directory_changed(self, path: str) -> None:
+    def _on_directory_changed(self, path: str, rescan: str | None = None) -> None:
         """Handle directory changed event (debounced).
 
         Args:
             path: Changed directory path
+            rescan: Directory that was itself created, deleted or moved; its
+                loaded files (if any) are rescanned
 
         """
         logger.debug("[FilesystemMonitor] Directory changed: %s", path, extra={"dev_only": True})
@@ -475,15 +493,64 @@ class FilesystemMonitor(Observable):
         # Add to pending changes (thread-safe)
         with self._pending_lock:
             self._pending_changes.add(path)
+            if rescan:
+                self._pending_rescans.add(rescan)
+            self._restart_debounce_timer()
 
-            # Cancel existing timer and reschedule (debounce behavior)
-            if self._debounce_timer:
-                self._debounce_timer.cancel()
+    def _on_file_event(self, change: FileChange) -> None:
+        """Queue a file event for the next debounced refresh.
 
-            # Create new timer (500ms debounce)
-            self._debounce_timer = threading.Timer(0.5, self._process_pending_changes)
-            self._debounce_timer.daemon = True
-            self._debounce_timer.start()
+        Created, deleted and moved files also mark their directories as
+        changed. When more than FILESYSTEM_MONITOR_MAX_PENDING_EVENTS events
+        arrive within one debounce window, the queue is dropped and those
+        directories are rescanned instead.
+
+        Args:
+            change: File event reported by watchdog
+
+        """
+        folders = {str(Path(path).parent) for path in (change.path, change.dest_path) if path}
+        with self._pending_lock:
+            if change.kind != "modified":
+                self._pending_changes.update(folders)
+
+            if self._events_overflowed:
+                self._pending_rescans.update(folders)
+            elif len(self._pending_events) < FILESYSTEM_MONITOR_MAX_PENDING_EVENTS:
+                self._pending_events.append(change)
+            else:
+                logger.info(
+                    "[FilesystemMonitor] More than %d file events pending, falling back to rescan",
+                    FILESYSTEM_MONITOR_MAX_PENDING_EVENTS,
+                )
+                self._events_overflowed = True
+                self._pending_rescans.update(folders)
+                self._pending_rescans.update(
+                    str(Path(path).parent)
+                    for event in self._pending_events
+                    for path in (event.path, event.dest_path)
+                    if path
+                )
+                self._pending_events = []
+
+            self._restart_debounce_timer()
+
+    def _restart_debounce_timer(self) -> None:
+        """(Re)start the 500ms debounce timer; caller holds _pending_lock."""
+        # Cancel existing timer and reschedule (debounce behavior)
+        if self._debounce_timer:
+            self._debounce_timer.cancel()
+
+        self._debounce_timer = threading.Timer(0.5, self._process_pending_changes)
+        self._debounce_timer.daemon = True
+        self._debounce_timer.start()
+
+    def _clear_pending(self) -> None:
+        """Drop queued changes; caller holds _pending_lock."""
+        self._pending_changes.clear()
+        self._pending_events = []
+        self._pending_rescans.clear()
+        self._events_overflowed = False
 
     def _on_file_changed(self, path: str) -> None:
         """Handle file changed event.
@@ -503,23 +570,29 @@ class FilesystemMonitor(Observable):
         emit() calls connected callbacks synchronously.  The UI-layer listener
         (FilesystemHandler._on_directory_changed) guards against cross-thread
         access itself by re-dispatching to the Qt main thread when needed.
-        Similarly, refresh_loaded_folders() emits layoutChanged (a Qt
-        pyqtSignal) which Qt delivers as a queued connection to the main thread
-        automatically when the emitter is on a different thread.
+        File events are handed to the main thread, which applies them with
+        apply_file_changes(). refresh_loaded_folders() emits model signals
+        (Qt pyqtSignals) which Qt delivers as queued connections to the main
+        thread automatically when the emitter is on a different thread.
         """
         # Skip processing if paused
         if self._paused:
             with self._pending_lock:
-                self._pending_changes.clear()
+                self._clear_pending()
             return
 
         # Get pending changes (thread-safe)
         with self._pending_lock:
             pending = self._pending_changes.copy()
+            events, self._pending_events = self._pending_events, []
+            rescans = self._pending_rescans.copy()
             self._pending_changes.clear()
+            self._pending_rescans.clear()
+            self._events_overflowed = False
 
         for path in pending:
             logger.info("[FilesystemMonitor] Processing directory change: %s", path)
+            invalidate_companion_index(path)
             self.directory_changed.emit(path)
 
             # Trigger custom callback
@@ -529,12 +602,35 @@ class FilesystemMonitor(Observable):
                 except Exception:
                     logger.exception("[FilesystemMonitor] Folder callback error")
 
-            # Auto-refresh FileStore if available
-            if self.file_store:
-                try:
-                    self._refresh_filestore_for_path(path)
-                except Exception:
-                    logger.exception("[FilesystemMonitor] FileStore refresh error")
+        # Auto-refresh FileStore if available
+        if not self.file_store:
+            return
+        if events:
+            try:
+                self._apply_file_events(events)
+            except Exception:
+                logger.exception("[FilesystemMonitor] FileStore update error")
+        for path in rescans:
+            try:
+                self._refresh_filestore_for_path(path)
+            except Exception:
+                logger.exception("[FilesystemMonitor] FileStore refresh error")
+
+    def _apply_file_events(self, events: list[FileChange]) -> None:
+        """Apply queued file events to FileStore without rescanning.
+
+        Args:
+            events: File events in the order they arrived
+
+        """
+        if not self.file_load_manager or not self.file_store:
+            return
+
+        logger.info("[FilesystemMonitor] Applying %d file event(s) to FileStore", len(events))
+        # The model is updated in the main thread; without a UI adapter the
+        # events are applied here
+        if not queue_file_changes(events):
+            self.file_load_manager.apply_file_changes(events, file_store=self.file_store)
 
     def _refresh_filestore_for_path(self, changed_path: str) -> None:
         """Refresh FileStore for changed path.
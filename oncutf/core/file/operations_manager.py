@@ -208,6 +208,16 @@ class FileOperationsManager:
                 )
             return 0
 
+        if preview_result.cancelled:
+            logger.info("[Rename] Preview superseded by a newer request, rename cancelled")
+            if self.parent_window and hasattr(self.parent_window, "status_manager"):
+                self.parent_window.status_manager.finish_operation(
+                    operation_id,
+                    success=False,
+                    final_message="Rename cancelled: the preview was superseded",
+                )
+            return 0
+
         # Step 2: Execute rename using unified engine
         try:
             execution_result = engine.execute_rename(
@@ -11,7 +11,7 @@ Provides common infrastructure for both sequential and parallel hash workers:
 - Thread-safe cancellation support
 - Operation setup methods
 - Progress tracking state management
-- Batch operations support
+- Batch operations support (single-writer group commit of hash results)
 
 Subclasses must implement:
 - run(): Main thread execution logic
@@ -22,15 +22,26 @@ Subclasses must implement:
 
 import threading
 from abc import abstractmethod
+from collections.abc import Sequence
+from pathlib import Path
 from typing import Any
 
+from oncutf.core.hash.hash_algorithms import HASH_ALGORITHM_CRC32, resolve_algorithm
+from oncutf.infra.batch import HashBatchWriter
+from oncutf.infra.db.hash_store import HashRecord
 from oncutf.utils.events import Signal
+from oncutf.utils.filesystem.file_signature import FileSignature
 from oncutf.utils.logging.logger_factory import get_cached_logger
 from oncutf.utils.threading.worker_base import WorkerBase
 
 logger = get_cached_logger(__name__)
 
 
+def _table_algorithms(algorithm: str) -> tuple[str, ...]:
+    """Algorithms stored along with *algorithm* (the file table shows CRC32)."""
+    return () if algorithm == HASH_ALGORITHM_CRC32 else (HASH_ALGORITHM_CRC32,)
+
+
 class BaseHashWorker(WorkerBase):
     """Abstract base class for hash calculation workers.
 
@@ -84,12 +95,17 @@ class BaseHashWorker(WorkerBase):
         self._operation_type: str | None = None  # "duplicates", "compare", "checksums"
         self._file_paths: list[str] = []
         self._external_folder: str | None = None  # for comparison
+        self._algorithm = HASH_ALGORITHM_CRC32  # canonical name, see hash_algorithms
+        # Computed in the same read and stored too, so the file table shows
+        # hashes of files hashed with another algorithm
+        self._extra_algorithms: tuple[str, ...] = ()
 
         # Progress tracking
         self._total_bytes = 0
 
-        # Batch operations support
-        self._batch_manager: Any = None
+        # Batch operations support: hash results are group-committed by a
+        # single writer thread instead of one transaction per file
+        self._hash_sink: HashBatchWriter | None = None
         self._enable_batching = True
         self._batch_operations: list[dict[str, Any]] = []
 
@@ -107,26 +123,53 @@ class BaseHashWorker(WorkerBase):
             batch_state,
         )
 
-    def setup_duplicate_scan(self, file_paths: list[str]) -> None:
-        """Configure worker for duplicate detection."""
+    def setup_duplicate_scan(
+        self, file_paths: list[str], algorithm: str = HASH_ALGORITHM_CRC32
+    ) -> None:
+        """Configure worker for duplicate detection.
+
+        Args:
+            file_paths: Files to scan
+            algorithm: Algorithm or role name of the full hashes (partial
+                hashes always use the "fast" role)
+
+        """
         with self._mutex:
             self._operation_type = "duplicates"
             self._file_paths = list(file_paths)
             self._external_folder = None
+            self._algorithm = resolve_algorithm(algorithm)
+            self._extra_algorithms = _table_algorithms(self._algorithm)
+
+    def setup_external_comparison(
+        self,
+        file_paths: list[str],
+        external_folder: str,
+        algorithm: str = HASH_ALGORITHM_CRC32,
+    ) -> None:
+        """Configure worker for external folder comparison.
 
-    def setup_external_comparison(self, file_paths: list[str], external_folder: str) -> None:
-        """Configure worker for external folder comparison."""
+        Args:
+            file_paths: Files to compare
+            external_folder: Folder holding the counterparts
+            algorithm: Algorithm or role name ("strong" for integrity checks)
+
+        """
         with self._mutex:
             self._operation_type = "compare"
             self._file_paths = list(file_paths)
             self._external_folder = external_folder
+            self._algorithm = resolve_algorithm(algorithm)
+            self._extra_algorithms = _table_algorithms(self._algorithm)
 
     def setup_checksum_calculation(self, file_paths: list[str]) -> None:
-        """Configure worker for checksum calculation."""
+        """Configure worker for checksum calculation (CRC32, shown in the UI)."""
         with self._mutex:
             self._operation_type = "checksums"
             self._file_paths = list(file_paths)
             self._external_folder = None
+            self._algorithm = HASH_ALGORITHM_CRC32
+            self._extra_algorithms = ()
 
     def set_total_size(self, total_size: int) -> None:
         """Set total size from external calculation."""
@@ -163,8 +206,6 @@ class BaseHashWorker(WorkerBase):
             Total size in bytes
 
         """
-        from pathlib import Path
-
         total_size = 0
         files_counted = 0
 
@@ -205,42 +246,96 @@ class BaseHashWorker(WorkerBase):
         )
         return total_size
 
+    def _report_candidate_progress(
+        self, files_done: int, files_total: int, file_path: str, bytes_read: int, bytes_to_read: int
+    ) -> None:
+        """Forward duplicate candidate filtering progress to the progress signals.
+
+        Used as the progress callback of find_duplicate_candidates (stat pass,
+        then partial hashes); the stat pass reads no bytes, so it reports files only.
+        """
+        self.progress_updated.emit(files_done, files_total, Path(file_path).name)
+        if bytes_to_read:
+            self.size_progress.emit(bytes_read, bytes_to_read)
+
     def _store_hash_optimized(
-        self, file_path: str, hash_value: str, algorithm: str = "crc32"
+        self,
+        file_path: str,
+        hash_value: str,
+        algorithm: str = HASH_ALGORITHM_CRC32,
+        signature: FileSignature | None = None,
     ) -> None:
         """Store hash using batch operations if available (thread-safe).
 
-        Note: In multi-threaded workers, this queues for later batch flush
-        from main thread to avoid DB thread-safety issues.
+        With batching, the hash is cached in memory immediately (so lookups see
+        it) and queued on the writer thread, which persists results in bulk.
 
         Falls back to direct storage via hash manager if batching is not available.
         """
-        from pathlib import Path
-
-        with self._mutex:
-            if self._enable_batching and self._batch_manager:
-                logger.debug(
-                    "[%s] Queuing hash for batch: %s",
-                    self.__class__.__name__,
-                    Path(file_path).name,
-                )
-                self._batch_manager.queue_hash_store(
-                    file_path=file_path,
-                    hash_value=hash_value,
-                    algorithm=algorithm,
-                    priority=10,
-                )
+        if not self._hash_manager:
+            return
+
+        sink = self._hash_sink
+        if self._enable_batching and sink is not None:
+            self._hash_manager.store_hash(
+                file_path, hash_value, algorithm, signature, persist=False
+            )
+            sink.submit(HashRecord(file_path, hash_value, algorithm, signature))
+            with self._mutex:
                 self._batch_operations.append(
                     {"path": file_path, "tag": hash_value, "algorithm": algorithm}
                 )
-            elif self._hash_manager:
-                # Fallback to direct storage
-                logger.debug(
-                    "[%s] Storing hash directly: %s",
-                    self.__class__.__name__,
-                    Path(file_path).name,
-                )
-                self._hash_manager.store_hash(file_path, hash_value, algorithm)
+        else:
+            # Fallback to direct storage
+            logger.debug(
+                "[%s] Storing hash directly: %s",
+                self.__class__.__name__,
+                Path(file_path).name,
+            )
+            self._hash_manager.store_hash(file_path, hash_value, algorithm, signature)
+
+    def _hash_algorithms(self) -> tuple[str, ...]:
+        """Algorithms to hash a file with: the operation's, then the extra ones."""
+        return (self._algorithm, *self._extra_algorithms)
+
+    def _store_hashes(
+        self, file_path: str, digests: Sequence[str], signature: FileSignature | None
+    ) -> None:
+        """Store the digests computed for _hash_algorithms()."""
+        for algorithm, hash_value in zip(self._hash_algorithms(), digests, strict=True):
+            self._store_hash_optimized(file_path, hash_value, algorithm, signature)
+
+    def _start_hash_sink(self) -> None:
+        """Start the batch writer used to persist hashes (if batching is enabled)."""
+        if not self._enable_batching or not self._hash_manager:
+            return
+        try:
+            sink = HashBatchWriter(self._hash_manager.store_hashes_batch)
+            sink.start()
+        except Exception as e:
+            logger.warning("[%s] Failed to start hash writer: %s", self.__class__.__name__, e)
+            self._enable_batching = False
+        else:
+            self._hash_sink = sink
+            logger.debug("[%s] Hash writer started", self.__class__.__name__)
+
+    def _close_hash_sink(self) -> None:
+        """Flush queued hashes and stop the batch writer."""
+        sink = self._hash_sink
+        if sink is None:
+            return
+        self._hash_sink = None
+        try:
+            written = sink.close()
+        except Exception:
+            logger.exception("[%s] Error flushing hash writer", self.__class__.__name__)
+            return
+        logger.info(
+            "[%s] Persisted %d hashes in %d transactions",
+            self.__class__.__name__,
+            written,
+            sink.flush_count,
+        )
 
     # =========================================================================
     # Abstract Methods (Must be implemented by subclasses)
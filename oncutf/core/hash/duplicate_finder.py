@@ -0,0 +1,194 @@
+"""Module: duplicate_finder.py.
+
+Author: Michael Economou
+Date: 2026-10-16
+
+Staged candidate filtering for duplicate detection.
+
+Files can only be duplicates if they have the same size, and same-size files
+usually differ in their first or last bytes. Duplicate detection therefore
+runs in stages, each one cheaper than reading every file in full:
+
+1. stat every file and drop sizes that occur only once
+2. for large files, hash the first and last PARTIAL_HASH_BYTES and drop
+   files whose partial hash is unique within their size bucket
+3. full-hash (through the persistent hash cache) only the survivors
+
+Stages 1 and 2 live here; stage 3 is run by the caller (HashManager or a hash
+worker) so results go through the usual cache lookup and batched store.
+Callers can follow stages 1 and 2 through a progress callback.
+
+Partial hashes are never stored, so they always use the "fast" role; the full
+hashes of stage 3 use the operation's algorithm (config.DUPLICATE_HASH_ALGORITHM
+for the hash workers).
+"""
+
+from __future__ import annotations
+
+import stat
+from collections import defaultdict
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+from oncutf.core.hash.hash_algorithms import HASH_ROLE_FAST, new_hasher
+from oncutf.utils.logging.logger_factory import get_cached_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
+logger = get_cached_logger(__name__)
+
+# Bytes read from each end of a file for the partial hash
+PARTIAL_HASH_BYTES = 64 * 1024
+
+# Algorithm of the partial hashes (only compared within one scan)
+PARTIAL_HASH_ALGORITHM = HASH_ROLE_FAST
+
+# Files stat'ed between progress reports in stage 1 (a stat is much cheaper
+# than a report)
+_STAT_PROGRESS_STEP = 256
+
+
+class CandidateGroup(NamedTuple):
+    """Files of one size that may be duplicates of each other."""
+
+    size: int
+    paths: list[str]
+
+
+def partial_hash(file_path: str, size: int, algorithm: str) -> str:
+    """Hash the first and last PARTIAL_HASH_BYTES of a file.
+
+    Args:
+        file_path: Path to the file
+        size: File size from the stat pass
+        algorithm: Algorithm or role name (see hash_algorithms)
+
+    Returns:
+        Hex digest of head + tail
+
+    Raises:
+        OSError: If the file cannot be read
+
+    """
+    hasher = new_hasher(algorithm)
+    with Path(file_path).open("rb") as f:
+        hasher.update(f.read(PARTIAL_HASH_BYTES))
+        if size > PARTIAL_HASH_BYTES:
+            f.seek(max(PARTIAL_HASH_BYTES, size - PARTIAL_HASH_BYTES))
+            hasher.update(f.read(PARTIAL_HASH_BYTES))
+    return hasher.hexdigest()
+
+
+def group_by_size(file_paths: Iterable[str]) -> list[CandidateGroup]:
+    """Stage 1: group files by size, dropping sizes that occur once.
+
+    Unreadable paths and non-regular files are skipped.
+    """
+    by_size: dict[int, list[str]] = defaultdict(list)
+    for file_path in file_paths:
+        try:
+            st = Path(file_path).stat()
+        except OSError:
+            continue
+        if stat.S_ISREG(st.st_mode):
+            by_size[st.st_size].append(file_path)
+    return [CandidateGroup(size, paths) for size, paths in by_size.items() if len(paths) > 1]
+
+
+def _report_stat_progress(
+    file_paths: list[str], progress_callback: Callable[[int, int, str, int, int], None]
+) -> Iterator[str]:
+    """Yield *file_paths*, reporting every few files once they were stat'ed."""
+    total = len(file_paths)
+    for done, file_path in enumerate(file_paths, 1):
+        yield file_path
+        if done % _STAT_PROGRESS_STEP == 0 or done == total:
+            progress_callback(done, total, file_path, 0, 0)
+
+
+def find_duplicate_candidates(
+    file_paths: Iterable[str],
+    algorithm: str,
+    cancellation_check: Callable[[], bool] | None = None,
+    map_fn: Callable[..., Iterator[str | None]] = map,
+    progress_callback: Callable[[int, int, str, int, int], None] | None = None,
+) -> list[CandidateGroup] | None:
+    """Run stages 1 and 2 and return the groups that still need a full hash.
+
+    Args:
+        file_paths: Files to scan
+        algorithm: Algorithm of the partial hashes (callers pass
+            PARTIAL_HASH_ALGORITHM; unrelated to the full hash algorithm)
+        cancellation_check: Optional callable returning True to abort
+        map_fn: map-like callable used for partial hashing (e.g. executor.map)
+        progress_callback: Optional callable receiving (files_done, files_total,
+            current_path, bytes_read, bytes_to_read), first for the stat pass
+            (no bytes read) and then for the partial hashes
+
+    Returns:
+        Candidate groups (2+ files each), or None if cancelled
+
+    """
+    file_paths = list(dict.fromkeys(file_paths))
+    size_groups = group_by_size(
+        _report_stat_progress(file_paths, progress_callback) if progress_callback else file_paths
+    )
+
+    # Files small enough that head + tail covers them entirely go straight
+    # to the full hash; partial hashing would read the same bytes
+    small = [group for group in size_groups if group.size <= 2 * PARTIAL_HASH_BYTES]
+    large = [group for group in size_groups if group.size > 2 * PARTIAL_HASH_BYTES]
+
+    jobs = [(path, group.size) for group in large for path in group.paths]
+    if cancellation_check and cancellation_check():
+        return None
+
+    def hash_job(job: tuple[str, int]) -> str | None:
+        if cancellation_check and cancellation_check():
+            return None
+        path, size = job
+        try:
+            return partial_hash(path, size, algorithm)
+        except OSError as e:
+            logger.debug("[DuplicateFinder] Partial hash failed for %s: %s", path, e)
+            return None
+
+    # Every large file has both ends read
+    bytes_to_read = len(jobs) * 2 * PARTIAL_HASH_BYTES
+    partial_keys: dict[str, str | None] = {}
+    for done, ((path, _size), key) in enumerate(zip(jobs, map_fn(hash_job, jobs), strict=True), 1):
+        partial_keys[path] = key
+        if progress_callback:
+            progress_callback(done, len(jobs), path, done * 2 * PARTIAL_HASH_BYTES, bytes_to_read)
+    if cancellation_check and cancellation_check():
+        return None
+
+    candidates = list(small)
+    for group in large:
+        by_partial: dict[str, list[str]] = defaultdict(list)
+        for path in group.paths:
+            key = partial_keys.get(path)
+            if key is not None:
+                by_partial[key].append(path)
+        candidates.extend(
+            CandidateGroup(group.size, paths) for paths in by_partial.values() if len(paths) > 1
+        )
+
+    candidate_count = sum(len(group.paths) for group in candidates)
+    logger.info(
+        "[DuplicateFinder] %d files: %d share a size, %d need a full hash",
+        len(file_paths),
+        sum(len(group.paths) for group in size_groups),
+        candidate_count,
+    )
+    return candidates
+
+
+def group_duplicates(hashes: Iterable[tuple[str, str | None]]) -> dict[str, list[str]]:
+    """Stage 3 helper: group (path, full_hash) pairs, keeping groups of 2+ files."""
+    by_hash: dict[str, list[str]] = defaultdict(list)
+    for path, file_hash in hashes:
+        if file_hash is not None:
+            by_hash[file_hash].append(path)
+    return {file_hash: paths for file_hash, paths in by_hash.items() if len(paths) > 1}
@@ -0,0 +1,135 @@
+"""Module: hash_algorithms.py.
+
+Author: Michael Economou
+Date: 2026-10-16
+
+Registry of file hash algorithms.
+
+Algorithm names are the canonical upper-case values stored in
+file_hashes.algorithm, so one file can carry one cached hash per algorithm.
+
+- CRC32: legacy default, 32-bit; fine for checksum display, collides on large
+  libraries
+- XXH3_128: fast non-cryptographic 128-bit hash (optional ``xxhash`` package)
+- BLAKE3: fast cryptographic hash (optional ``blake3`` package)
+- BLAKE2B: cryptographic 256-bit hash from the standard library
+- SHA256: cryptographic hash from the standard library, for interoperability
+
+The roles "fast" (duplicate detection) and "strong" (integrity verification)
+resolve to the best algorithm installed, falling back to BLAKE2B.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import zlib
+from typing import TYPE_CHECKING, Any, Protocol
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+HASH_ALGORITHM_CRC32 = "CRC32"
+HASH_ALGORITHM_XXH3 = "XXH3_128"
+HASH_ALGORITHM_BLAKE3 = "BLAKE3"
+HASH_ALGORITHM_BLAKE2B = "BLAKE2B"
+HASH_ALGORITHM_SHA256 = "SHA256"
+
+# Role aliases accepted wherever an algorithm name is
+HASH_ROLE_FAST = "fast"
+HASH_ROLE_STRONG = "strong"
+
+
+class Hasher(Protocol):
+    """Incremental hasher interface (subset of hashlib objects)."""
+
+    def update(self, data: Any, /) -> None:
+        """Feed a chunk of data."""
+        ...
+
+    def hexdigest(self) -> str:
+        """Return the digest as lowercase hex."""
+        ...
+
+
+class _Crc32Hasher:
+    """hashlib-style wrapper around zlib.crc32."""
+
+    def __init__(self) -> None:
+        self._crc = 0
+
+    def update(self, data: Any, /) -> None:
+        """Feed a chunk of data."""
+        self._crc = zlib.crc32(data, self._crc)
+
+    def hexdigest(self) -> str:
+        """Return the CRC32 as 8 lowercase hex characters."""
+        return f"{self._crc & 0xFFFFFFFF:08x}"
+
+
+def _blake2b() -> Hasher:
+    return hashlib.blake2b(digest_size=32)
+
+
+def _optional_factories() -> dict[str, Callable[[], Hasher]]:
+    """Factories for algorithms backed by optional packages that are installed."""
+    factories: dict[str, Callable[[], Hasher]] = {}
+    try:
+        import xxhash
+
+        factories[HASH_ALGORITHM_XXH3] = xxhash.xxh3_128
+    except ImportError:
+        pass
+    try:
+        import blake3
+
+        factories[HASH_ALGORITHM_BLAKE3] = blake3.blake3
+    except ImportError:
+        pass
+    return factories
+
+
+_FACTORIES: dict[str, Callable[[], Hasher]] = {
+    HASH_ALGORITHM_CRC32: _Crc32Hasher,
+    HASH_ALGORITHM_BLAKE2B: _blake2b,
+    HASH_ALGORITHM_SHA256: hashlib.sha256,
+    **_optional_factories(),
+}
+
+# Preference order per role; the first installed algorithm wins
+_ROLE_PREFERENCES = {
+    HASH_ROLE_FAST: (HASH_ALGORITHM_XXH3, HASH_ALGORITHM_BLAKE3, HASH_ALGORITHM_BLAKE2B),
+    HASH_ROLE_STRONG: (HASH_ALGORITHM_BLAKE3, HASH_ALGORITHM_BLAKE2B),
+}
+
+
+def available_algorithms() -> list[str]:
+    """Return the canonical names of all usable algorithms."""
+    return list(_FACTORIES)
+
+
+def resolve_algorithm(algorithm: str) -> str:
+    """Resolve a role or algorithm name to a canonical algorithm name.
+
+    Args:
+        algorithm: "fast", "strong" or an algorithm name (case-insensitive)
+
+    Returns:
+        Canonical upper-case algorithm name
+
+    Raises:
+        ValueError: If the algorithm is unknown or its package is not installed
+
+    """
+    preferences = _ROLE_PREFERENCES.get(algorithm.lower())
+    if preferences is not None:
+        return next(name for name in preferences if name in _FACTORIES)
+
+    name = algorithm.upper()
+    if name not in _FACTORIES:
+        raise ValueError(f"Unsupported hash algorithm: {algorithm}")
+    return name
+
+
+def new_hasher(algorithm: str) -> Hasher:
+    """Create an incremental hasher for a role or algorithm name."""
+    return _FACTORIES[resolve_algorithm(algorithm)]()
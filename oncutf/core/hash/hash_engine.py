@@ -0,0 +1,501 @@
+"""Module: hash_engine.py.
+
+Author: Michael Economou
+Date: 2026-10-16
+
+File hashing engines used by the hash workers.
+
+Two engines are available (selected with config.HASH_ENGINE):
+
+- "thread": hashes in the calling thread. Large files are read through mmap in
+  multi-megabyte slices; zlib and hashlib release the GIL for buffers that size,
+  so worker threads hash in parallel and the loop overhead is negligible.
+- "process": hashes in a ProcessPoolExecutor and returns only the digest.
+  Per-file byte progress and cancellation are shared with the worker
+  processes through multiprocessing primitives, so the callbacks used by the
+  thread engine keep working. Workers are spawned (the GUI process is never
+  forked); where that is unavailable the thread engine is used.
+
+The number of concurrent streams is chosen per device by
+suggest_worker_count(): rotational disks get a single stream (parallel reads
+only add seeks), while SSD/NVMe get as many streams as a short read probe
+shows to scale.
+"""
+
+from __future__ import annotations
+
+import mmap
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Protocol
+
+from oncutf.core.hash.hash_algorithms import HASH_ALGORITHM_CRC32, new_hasher
+from oncutf.utils.logging.logger_factory import get_cached_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from oncutf.core.hash.hash_algorithms import Hasher
+
+logger = get_cached_logger(__name__)
+
+HASH_ENGINE_THREAD = "thread"
+HASH_ENGINE_PROCESS = "process"
+
+# Files at least this large are hashed through mmap instead of read() calls
+MMAP_MIN_SIZE = 4 * 1024 * 1024
+# Slice handed to the hasher per iteration (progress/cancel granularity)
+READ_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Parent-side polling interval for process engine progress/cancellation
+_POLL_INTERVAL = 0.1
+
+# Read-throughput probe settings
+_PROBE_BYTES = 4 * 1024 * 1024
+_PROBE_SAMPLE_LIMIT = 64
+# Multi-stream/single-stream throughput ratios: above SCALING use all
+# workers, below SERIAL use one stream, in between use two
+_PROBE_SCALING_THRESHOLD = 1.5
+_PROBE_SERIAL_THRESHOLD = 1.1
+
+
+def hash_file(
+    file_path: str | Path,
+    algorithm: str = HASH_ALGORITHM_CRC32,
+    progress_callback: Callable[[int], None] | None = None,
+    cancellation_check: Callable[[], bool] | None = None,
+) -> str | None:
+    """Hash a file with large sequential reads.
+
+    Args:
+        file_path: Path to the file
+        algorithm: Algorithm or role name (see hash_algorithms)
+        progress_callback: Optional callback(bytes_processed_in_file)
+        cancellation_check: Optional callable returning True to abort
+
+    Returns:
+        Lowercase hex digest, or None if cancelled
+
+    Raises:
+        OSError: If the file cannot be opened or read
+        ValueError: If the algorithm is not available
+
+    """
+    digests = hash_file_multi(file_path, (algorithm,), progress_callback, cancellation_check)
+    return None if digests is None else digests[0]
+
+
+def hash_file_multi(
+    file_path: str | Path,
+    algorithms: Sequence[str],
+    progress_callback: Callable[[int], None] | None = None,
+    cancellation_check: Callable[[], bool] | None = None,
+) -> list[str] | None:
+    """Hash a file with several algorithms in one read.
+
+    Args:
+        file_path: Path to the file
+        algorithms: Algorithm or role names (see hash_algorithms)
+        progress_callback: Optional callback(bytes_processed_in_file)
+        cancellation_check: Optional callable returning True to abort
+
+    Returns:
+        Lowercase hex digests in the order of *algorithms*, or None if cancelled
+
+    Raises:
+        OSError: If the file cannot be opened or read
+        ValueError: If an algorithm is not available
+
+    """
+    hashers = [new_hasher(algorithm) for algorithm in algorithms]
+    with Path(file_path).open("rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size >= MMAP_MIN_SIZE:
+            try:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                mapped = None  # e.g. special filesystems; fall back to read()
+            if mapped is not None:
+                with mapped:
+                    if hasattr(mmap, "MADV_SEQUENTIAL"):
+                        mapped.madvise(mmap.MADV_SEQUENTIAL)
+                    return _hash_mapped(
+                        hashers, mapped, size, progress_callback, cancellation_check
+                    )
+
+        return _hash_stream(hashers, f, size, progress_callback, cancellation_check)
+
+
+def crc32_file(
+    file_path: str | Path,
+    progress_callback: Callable[[int], None] | None = None,
+    cancellation_check: Callable[[], bool] | None = None,
+) -> str | None:
+    """Calculate the CRC32 of a file (8 lowercase hex characters, None if cancelled)."""
+    return hash_file(file_path, HASH_ALGORITHM_CRC32, progress_callback, cancellation_check)
+
+
+def _hash_mapped(
+    hashers: Sequence[Hasher],
+    mapped: mmap.mmap,
+    size: int,
+    progress_callback: Callable[[int], None] | None,
+    cancellation_check: Callable[[], bool] | None,
+) -> list[str] | None:
+    """Hash a memory-mapped file in READ_CHUNK_SIZE slices."""
+    with memoryview(mapped) as view:
+        for offset in range(0, size, READ_CHUNK_SIZE):
+            if cancellation_check and cancellation_check():
+                return None
+            end = min(offset + READ_CHUNK_SIZE, size)
+            with view[offset:end] as chunk:
+                for hasher in hashers:
+                    hasher.update(chunk)
+            if progress_callback:
+                progress_callback(end)
+    return [hasher.hexdigest() for hasher in hashers]
+
+
+def _hash_stream(
+    hashers: Sequence[Hasher],
+    f: Any,
+    size: int,
+    progress_callback: Callable[[int], None] | None,
+    cancellation_check: Callable[[], bool] | None,
+) -> list[str] | None:
+    """Hash a file object using readinto() with a reused buffer."""
+    buffer = bytearray(max(1, min(size, READ_CHUNK_SIZE)))
+    bytes_processed = 0
+    with memoryview(buffer) as view:
+        while True:
+            if cancellation_check and cancellation_check():
+                return None
+            bytes_read = f.readinto(buffer)
+            if not bytes_read:
+                break
+            for hasher in hashers:
+                hasher.update(view[:bytes_read])
+            bytes_processed += bytes_read
+            if progress_callback:
+                progress_callback(bytes_processed)
+    return [hasher.hexdigest() for hasher in hashers]
+
+
+# =====================================
+# Engines
+# =====================================
+
+
+class HashEngine(Protocol):
+    """Interface shared by the hashing engines."""
+
+    def hash_file(
+        self,
+        file_path: str,
+        progress_callback: Callable[[int], None] | None = None,
+        cancellation_check: Callable[[], bool] | None = None,
+        algorithm: str = HASH_ALGORITHM_CRC32,
+    ) -> str | None:
+        """Hash a file; returns None if cancelled, raises OSError on I/O errors."""
+        ...
+
+    def hash_file_multi(
+        self,
+        file_path: str,
+        algorithms: Sequence[str],
+        progress_callback: Callable[[int], None] | None = None,
+        cancellation_check: Callable[[], bool] | None = None,
+    ) -> list[str] | None:
+        """Hash a file with several algorithms in one read (digests in order)."""
+        ...
+
+    def shutdown(self) -> None:
+        """Release engine resources."""
+        ...
+
+
+class ThreadHashEngine:
+    """Hashes in the calling thread (GIL released by zlib for large slices)."""
+
+    def hash_file(
+        self,
+        file_path: str,
+        progress_callback: Callable[[int], None] | None = None,
+        cancellation_check: Callable[[], bool] | None = None,
+        algorithm: str = HASH_ALGORITHM_CRC32,
+    ) -> str | None:
+        """Hash a file in the calling thread."""
+        return hash_file(file_path, algorithm, progress_callback, cancellation_check)
+
+    def hash_file_multi(
+        self,
+        file_path: str,
+        algorithms: Sequence[str],
+        progress_callback: Callable[[int], None] | None = None,
+        cancellation_check: Callable[[], bool] | None = None,
+    ) -> list[str] | None:
+        """Hash a file with several algorithms in the calling thread."""
+        return hash_file_multi(file_path, algorithms, progress_callback, cancellation_check)
+
+    def shutdown(self) -> None:
+        """Nothing to release."""
+
+
+# Worker-process globals, installed by _init_process_worker
+_worker_cancel_event: Any = None
+_worker_progress: Any = None
+
+
+def _init_process_worker(cancel_event: Any, progress_slots: Any) -> None:
+    """Install the shared cancel event and progress slots in a worker process."""
+    global _worker_cancel_event, _worker_progress
+    _worker_cancel_event = cancel_event
+    _worker_progress = progress_slots
+
+
+def _hash_in_process(file_path: str, slot: int, algorithms: tuple[str, ...]) -> list[str] | None:
+    """Worker-process entry point: hash a file, reporting progress to a slot."""
+
+    def report(bytes_processed: int) -> None:
+        _worker_progress[slot] = bytes_processed
+
+    return hash_file_multi(file_path, algorithms, report, _worker_cancel_event.is_set)
+
+
+class ProcessHashEngine:
+    """Hashes in a process pool; only the digest crosses the process boundary."""
+
+    def __init__(self, max_workers: int) -> None:
+        """Start the process pool.
+
+        Args:
+            max_workers: Number of worker processes (and concurrent files)
+
+        """
+        self._max_workers = max(1, max_workers)
+        context = multiprocessing.get_context("spawn")
+
+        self._cancel_event = context.Event()
+        # One progress slot per in-flight file; callers borrow a free slot
+        self._progress = context.Array("q", self._max_workers)
+        self._free_slots: queue.Queue[int] = queue.Queue()
+        for slot in range(self._max_workers):
+            self._free_slots.put(slot)
+
+        self._executor = ProcessPoolExecutor(
+            max_workers=self._max_workers,
+            mp_context=context,
+            initializer=_init_process_worker,
+            initargs=(self._cancel_event, self._progress),
+        )
+        logger.debug("[ProcessHashEngine] Started with %d processes", self._max_workers)
+
+    @staticmethod
+    def is_available() -> bool:
+        """Return True if worker processes can be spawned on this platform."""
+        return "spawn" in multiprocessing.get_all_start_methods()
+
+    def hash_file(
+        self,
+        file_path: str,
+        progress_callback: Callable[[int], None] | None = None,
+        cancellation_check: Callable[[], bool] | None = None,
+        algorithm: str = HASH_ALGORITHM_CRC32,
+    ) -> str | None:
+        """Hash a file in a worker process, blocking until it finishes."""
+        digests = self.hash_file_multi(
+            file_path, (algorithm,), progress_callback, cancellation_check
+        )
+        return None if digests is None else digests[0]
+
+    def hash_file_multi(
+        self,
+        file_path: str,
+        algorithms: Sequence[str],
+        progress_callback: Callable[[int], None] | None = None,
+        cancellation_check: Callable[[], bool] | None = None,
+    ) -> list[str] | None:
+        """Hash a file with several algorithms in a worker process, blocking until it finishes.
+
+        Progress and cancellation are polled from the calling thread. A
+        cancellation stops every file currently hashed by this engine.
+        """
+        slot = self._free_slots.get()
+        try:
+            self._progress[slot] = 0
+            future = self._executor.submit(
+                _hash_in_process, str(file_path), slot, tuple(algorithms)
+            )
+            last_reported = 0
+            while True:
+                try:
+                    return future.result(timeout=_POLL_INTERVAL)
+                except FutureTimeoutError:
+                    pass
+                if cancellation_check and cancellation_check():
+                    self._cancel_event.set()
+                if progress_callback:
+                    processed = self._progress[slot]
+                    if processed != last_reported:
+                        last_reported = processed
+                        progress_callback(processed)
+        finally:
+            self._free_slots.put(slot)
+
+    def cancel(self) -> None:
+        """Abort all in-flight hashes."""
+        self._cancel_event.set()
+
+    def shutdown(self) -> None:
+        """Stop the worker processes."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+
+def create_hash_engine(kind: str, max_workers: int) -> HashEngine:
+    """Create the configured hashing engine.
+
+    Args:
+        kind: HASH_ENGINE_THREAD or HASH_ENGINE_PROCESS
+        max_workers: Concurrent files the caller will hash
+
+    Returns:
+        The engine; falls back to the thread engine if processes are unavailable
+
+    """
+    if kind == HASH_ENGINE_PROCESS:
+        if ProcessHashEngine.is_available():
+            try:
+                return ProcessHashEngine(max_workers)
+            except (OSError, ValueError) as e:
+                logger.warning("[HashEngine] Process engine unavailable, using threads: %s", e)
+        else:
+            logger.info("[HashEngine] 'spawn' start method unavailable, using thread engine")
+    elif kind != HASH_ENGINE_THREAD:
+        logger.warning("[HashEngine] Unknown hash engine %r, using threads", kind)
+    return ThreadHashEngine()
+
+
+# =====================================
+# Adaptive worker count
+# =====================================
+
+_device_streams: dict[int, int] = {}
+_device_streams_lock = threading.Lock()
+
+
+def suggest_worker_count(file_paths: Sequence[str], max_workers: int) -> int:
+    """Choose how many files to hash concurrently for the given paths.
+
+    The device holding most of the (sampled) files is probed once per session:
+    rotational disks get 1 stream; otherwise single-stream and multi-stream
+    read throughput are measured and parallelism is used only if it scales.
+
+    Args:
+        file_paths: Files about to be hashed
+        max_workers: Upper bound on concurrent streams
+
+    Returns:
+        Worker count between 1 and max_workers
+
+    """
+    max_workers = max(1, max_workers)
+    if max_workers == 1 or len(file_paths) < 2:
+        return max_workers
+
+    by_device: dict[int, list[tuple[int, str]]] = {}
+    for path in file_paths[:_PROBE_SAMPLE_LIMIT]:
+        try:
+            st = Path(path).stat()
+        except OSError:
+            continue
+        by_device.setdefault(st.st_dev, []).append((st.st_size, path))
+    if not by_device:
+        return max_workers
+
+    device, samples = max(by_device.items(), key=lambda item: len(item[1]))
+    with _device_streams_lock:
+        streams = _device_streams.get(device)
+    if streams is None:
+        largest_first = [path for _size, path in sorted(samples, reverse=True)]
+        streams = _probe_device(device, largest_first, max_workers)
+        with _device_streams_lock:
+            _device_streams[device] = streams
+        logger.info("[HashEngine] Device %d: using %d hash stream(s)", device, streams)
+    return min(streams, max_workers)
+
+
+def _probe_device(device: int, paths_by_size: list[str], max_workers: int) -> int:
+    """Measure how many concurrent read streams a device benefits from."""
+    if _is_rotational(device):
+        return 1
+
+    streams = min(4, max_workers, len(paths_by_size) - 1)
+    if streams < 2:
+        return max_workers
+
+    single = _read_throughput(paths_by_size[:1])
+    multi = _read_throughput(paths_by_size[1 : 1 + streams])
+    if single <= 0 or multi <= 0:
+        return max_workers
+
+    ratio = multi / single
+    logger.debug(
+        "[HashEngine] Read probe on device %d: x%.2f with %d streams", device, ratio, streams
+    )
+    if ratio >= _PROBE_SCALING_THRESHOLD:
+        return max_workers
+    return 1 if ratio < _PROBE_SERIAL_THRESHOLD else 2
+
+
+def _is_rotational(device: int) -> bool:
+    """Return True if Linux sysfs reports the device as a spinning disk."""
+    base = Path(f"/sys/dev/block/{os.major(device)}:{os.minor(device)}")
+    try:
+        resolved = base.resolve()
+    except OSError:
+        return False
+    # Partitions have no queue/ directory; it lives on the parent disk
+    for candidate in (resolved / "queue" / "rotational", resolved.parent / "queue" / "rotational"):
+        try:
+            return candidate.read_text().strip() == "1"
+        except OSError:
+            continue
+    return False
+
+
+def _read_throughput(paths: Sequence[str]) -> float:
+    """Read up to _PROBE_BYTES from each path concurrently; return bytes/second."""
+    totals = [0] * len(paths)
+
+    def read_one(index: int, path: str) -> None:
+        try:
+            with Path(path).open("rb", buffering=0) as f:
+                size = os.fstat(f.fileno()).st_size
+                # Start mid-file to avoid blocks warmed by metadata readers
+                f.seek(max(0, size // 2 - _PROBE_BYTES // 2))
+                remaining = _PROBE_BYTES
+                while remaining > 0:
+                    data = f.read(min(remaining, 1024 * 1024))
+                    if not data:
+                        break
+                    remaining -= len(data)
+                    totals[index] += len(data)
+        except OSError:
+            pass
+
+    threads = [
+        threading.Thread(target=read_one, args=(i, path), daemon=True)
+        for i, path in enumerate(paths)
+    ]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    return sum(totals) / elapsed if elapsed > 0 else 0.0
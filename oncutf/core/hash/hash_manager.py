@@ -10,11 +10,20 @@ NOTE: This is the main hash implementation used throughout the application.
 For DI-compatible interface, see HashServiceProtocol in services/interfaces.py.
 """
 
-import zlib
-from collections.abc import Callable
+import stat
+from collections.abc import Callable, Sequence
 from pathlib import Path
 
+from oncutf.core.hash.duplicate_finder import (
+    PARTIAL_HASH_ALGORITHM,
+    find_duplicate_candidates,
+    group_duplicates,
+)
+from oncutf.core.hash.hash_algorithms import HASH_ALGORITHM_CRC32, resolve_algorithm
+from oncutf.core.hash.hash_engine import hash_file_multi
 from oncutf.domain.models.file_item import FileItem
+from oncutf.infra.db.hash_store import HashRecord
+from oncutf.utils.filesystem.file_signature import FileSignature, get_file_signature
 from oncutf.utils.filesystem.path_normalizer import normalize_path
 from oncutf.utils.logging.logger_factory import get_cached_logger
 
@@ -25,7 +34,7 @@ class HashManager:
     """Manages file hashing operations and duplicate detection.
 
     Provides functionality for:
-    - CRC32 hash calculation with progress tracking
+    - Hash calculation (CRC32 by default, pluggable algorithms) with progress tracking
     - File and folder comparison
     - Duplicate detection in file lists
     - Hash caching for performance optimization
@@ -43,37 +52,43 @@ class HashManager:
             self._use_persistent_cache = True
         except ImportError:
             # Fallback to memory-only cache if persistent cache not available
-            self._hash_cache: dict[str, str] = {}
+            self._hash_cache: dict[tuple[str, str], tuple[str, FileSignature]] = {}
             self._use_persistent_cache = False
 
-    def has_cached_hash(self, file_path: str | Path) -> bool:
-        """Check if a hash exists in cache without calculating it.
+    def has_cached_hash(self, file_path: str | Path, algorithm: str = HASH_ALGORITHM_CRC32) -> bool:
+        """Check if a valid hash is cached without calculating it.
+
+        Stat-validated like get_cached_hash: a file edited since it was hashed
+        has no cached hash.
 
         Args:
             file_path: Path to the file to check
+            algorithm: Algorithm or role name ("fast", "strong")
 
         Returns:
-            bool: True if hash exists in cache, False otherwise
+            bool: True if a still valid hash is cached, False otherwise
 
         """
-        if isinstance(file_path, str):
-            file_path = Path(file_path)
-
-        # Use central path normalization
-        cache_key = normalize_path(file_path)
+        return self.get_cached_hash(file_path, algorithm=algorithm) is not None
 
-        if self._use_persistent_cache:
-            return self._persistent_cache.has_hash(cache_key)
-        return cache_key in self._hash_cache
-
-    def get_cached_hash(self, file_path: str | Path) -> str | None:
+    def get_cached_hash(
+        self,
+        file_path: str | Path,
+        signature: FileSignature | None = None,
+        algorithm: str = HASH_ALGORITHM_CRC32,
+    ) -> str | None:
         """Get hash from cache without calculating it.
 
+        The cached hash is returned only if the file's current stat signature
+        matches the one recorded when the hash was computed.
+
         Args:
             file_path: Path to the file
+            signature: Current stat signature, if the caller already has one
+            algorithm: Algorithm or role name ("fast", "strong")
 
         Returns:
-            str: Cached hash if found, None otherwise
+            str: Cached hash if found and still valid, None otherwise
 
         """
         if isinstance(file_path, str):
@@ -82,98 +97,124 @@ class HashManager:
         # Use central path normalization
         cache_key = normalize_path(file_path)
 
+        algorithm = resolve_algorithm(algorithm)
+
         if self._use_persistent_cache:
-            return self._persistent_cache.get_hash(cache_key)
-        return self._hash_cache.get(cache_key)
+            return self._persistent_cache.get_hash(cache_key, algorithm, signature)
+
+        cached_entry = self._hash_cache.get((cache_key, algorithm))
+        if cached_entry is None:
+            return None
+        if signature is None:
+            signature = get_file_signature(file_path)
+        return cached_entry[0] if cached_entry[1] == signature else None
 
     def calculate_hash(
         self,
         file_path: str | Path,
         progress_callback: Callable[[int], None] | None = None,
         cancellation_check: Callable[[], bool] | None = None,
+        *,
+        algorithm: str = HASH_ALGORITHM_CRC32,
+        use_cache: bool = True,
+        store: bool = True,
     ) -> str | None:
-        """Calculate the CRC32 hash of a file with error handling and progress tracking.
+        """Calculate the hash of a file with error handling and progress tracking.
         Checks cache first before calculating.
 
         Args:
             file_path: Path to the file to hash
             progress_callback: Optional callback function(bytes_processed) for progress tracking
             cancellation_check: Optional callback to check if operation should be cancelled
+            algorithm: Algorithm or role name ("fast", "strong"); defaults to CRC32
+            use_cache: Look up the cache first (False when the caller already did)
+            store: Persist the result (False when the caller batches persistence)
 
         Returns:
-            str: CRC32 hash in hexadecimal format (8 characters), or None if error occurred
+            str: Hash in hexadecimal format (8 characters for CRC32), or None if error occurred
 
         """
         if isinstance(file_path, str):
             file_path = Path(file_path)
 
-        # Check cache first (persistent or memory)
+        # Single stat: existence/type check plus the signature used to validate the cache
+        try:
+            file_stat = file_path.stat()
+        except FileNotFoundError:
+            logger.warning("[HashManager] File does not exist: %s", file_path)
+            return None
+        except OSError:
+            logger.exception("[HashManager] OS error accessing file %s", file_path)
+            return None
+
+        if not stat.S_ISREG(file_stat.st_mode):
+            logger.warning("[HashManager] Path is not a file: %s", file_path)
+            return None
+
+        signature = FileSignature.from_stat(file_stat)
+        algorithm = resolve_algorithm(algorithm)
+
+        # Check cache first (persistent or memory); entries are only served if
+        # size, mtime and inode still match the stored signature
         cache_key = normalize_path(file_path)
-        if self._use_persistent_cache:
-            cached_hash = self._persistent_cache.get_hash(cache_key)
+        if not use_cache:
+            pass
+        elif self._use_persistent_cache:
+            cached_hash = self._persistent_cache.get_hash(cache_key, algorithm, signature)
             if cached_hash:
                 logger.debug("[HashManager] Cache hit for: %s", file_path.name)
                 return cached_hash
-        elif cache_key in self._hash_cache:
-            logger.debug("[HashManager] Cache hit for: %s", file_path.name)
-            return self._hash_cache[cache_key]
+        else:
+            cached_entry = self._hash_cache.get((cache_key, algorithm))
+            if cached_entry is not None and cached_entry[1] == signature:
+                logger.debug("[HashManager] Cache hit for: %s", file_path.name)
+                return cached_entry[0]
 
-        # Cache miss - need to calculate hash
+        # Cache miss (or stale entry) - need to calculate hash
         logger.debug("[HashManager] Cache miss, calculating hash for: %s", file_path.name)
 
-        try:
-            if not file_path.exists():
-                logger.warning("[HashManager] File does not exist: %s", file_path)
-                return None
-
-            if not file_path.is_file():
-                logger.warning("[HashManager] Path is not a file: %s", file_path)
-                return None
-
-            # Adaptive buffer sizing based on file size
-            file_size = file_path.stat().st_size
-            if file_size < 64 * 1024:  # Files < 64KB
-                buffer_size = min(file_size, 8 * 1024)  # 8KB max for small files
-            elif file_size < 10 * 1024 * 1024:  # Files < 10MB
-                buffer_size = 64 * 1024  # 64KB for medium files
-            else:  # Large files >= 10MB
-                buffer_size = 256 * 1024  # 256KB for large files
-
-            # Calculate CRC32 with optimized memory buffer
-            crc = 0
-            buffer = bytearray(buffer_size)
-            mv = memoryview(buffer)
-            bytes_processed = 0
-
-            with file_path.open("rb") as f:
-                while True:
-                    # Check for cancellation
-                    if cancellation_check and cancellation_check():
-                        logger.debug(
-                            "[HashManager] Hash calculation cancelled for: %s",
-                            file_path.name,
-                        )
-                        return None
+        hash_results = self.calculate_hashes(
+            file_path, (algorithm,), progress_callback, cancellation_check
+        )
+        if hash_results is None:
+            return None
+        hash_result = hash_results[0]
+
+        # Cache the result against the pre-read signature (persistent or memory)
+        if store:
+            self.store_hash(cache_key, hash_result, algorithm, signature)
+        return hash_result
+
+    def calculate_hashes(
+        self,
+        file_path: str | Path,
+        algorithms: Sequence[str],
+        progress_callback: Callable[[int], None] | None = None,
+        cancellation_check: Callable[[], bool] | None = None,
+    ) -> list[str] | None:
+        """Hash a file with several algorithms in one read, bypassing the cache.
 
-                    bytes_read = f.readinto(buffer)
-                    if not bytes_read:
-                        break
+        The caller checks the cache and stores the results (the hash workers
+        queue them on their batch writer).
 
-                    chunk_view = mv[:bytes_read]
-                    crc = zlib.crc32(chunk_view, crc)
+        Args:
+            file_path: Path to the file to hash
+            algorithms: Algorithm or role names ("fast", "strong")
+            progress_callback: Optional callback function(bytes_processed) for progress tracking
+            cancellation_check: Optional callback to check if operation should be cancelled
 
-                    bytes_processed += bytes_read
-                    if progress_callback:
-                        progress_callback(bytes_processed)
+        Returns:
+            list: Digests in the order of *algorithms*, or None if cancelled or on error
 
-            # Convert to unsigned 32-bit and format as hex
-            hash_result = f"{crc & 0xFFFFFFFF:08x}"
+        """
+        if isinstance(file_path, str):
+            file_path = Path(file_path)
 
-            # Cache the result (persistent or memory)
-            if self._use_persistent_cache:
-                self._persistent_cache.store_hash(cache_key, hash_result)
-            else:
-                self._hash_cache[cache_key] = hash_result
+        try:
+            # Large sequential reads (mmap for big files); the hashers release the GIL
+            hash_results = hash_file_multi(
+                file_path, algorithms, progress_callback, cancellation_check
+            )
         except PermissionError:
             logger.exception("[HashManager] Permission denied accessing file: %s", file_path)
             return None
@@ -183,17 +224,73 @@ class HashManager:
         except Exception:
             logger.exception("[HashManager] Unexpected error hashing file %s", file_path)
             return None
-        else:
-            return hash_result
+
+        if hash_results is None:
+            logger.debug("[HashManager] Hash calculation cancelled for: %s", file_path.name)
+        return hash_results
+
+    def store_hash(
+        self,
+        file_path: str | Path,
+        hash_value: str,
+        algorithm: str = HASH_ALGORITHM_CRC32,
+        signature: FileSignature | None = None,
+        *,
+        persist: bool = True,
+    ) -> None:
+        """Store a computed hash in the cache.
+
+        Args:
+            file_path: Path to the file
+            hash_value: Hash value to store
+            algorithm: Algorithm or role name ("fast", "strong")
+            signature: Stat signature taken before hashing (stat'ed now if None)
+            persist: Write to the database now; False keeps it memory-only until
+                a batch writer persists it
+
+        """
+        cache_key = normalize_path(file_path)
+        algorithm = resolve_algorithm(algorithm)
+        if self._use_persistent_cache:
+            self._persistent_cache.store_hash(
+                cache_key, hash_value, algorithm, signature, persist=persist
+            )
+            return
+
+        if signature is None:
+            signature = get_file_signature(cache_key)
+        if signature is not None:
+            self._hash_cache[(cache_key, algorithm)] = (hash_value, signature)
+
+    def store_hashes_batch(self, records: list[HashRecord]) -> int:
+        """Persist many hash results in a single transaction.
+
+        Args:
+            records: Hash results to store
+
+        Returns:
+            Number of hashes stored
+
+        """
+        if self._use_persistent_cache:
+            return self._persistent_cache.store_hashes_batch(records)
+
+        for record in records:
+            self.store_hash(record.file_path, record.hash_value, record.algorithm, record.signature)
+        return len(records)
 
     def compare_folders(
-        self, folder1: str | Path, folder2: str | Path
+        self,
+        folder1: str | Path,
+        folder2: str | Path,
+        algorithm: str = HASH_ALGORITHM_CRC32,
     ) -> dict[str, tuple[bool, str, str]]:
         """Compare two folders and return file comparison results.
 
         Args:
             folder1: First folder to compare
             folder2: Second folder to compare
+            algorithm: Algorithm or role name; "strong" for integrity checks
 
         Returns:
             dict: Dictionary with filename as key and (is_same, hash1, hash2) as value
@@ -228,8 +325,8 @@ class HashManager:
 
                 file2 = folder2 / file1.name
                 if file2.exists() and file2.is_file():
-                    hash1 = self.calculate_hash(file1)
-                    hash2 = self.calculate_hash(file2)
+                    hash1 = self.calculate_hash(file1, algorithm=algorithm)
+                    hash2 = self.calculate_hash(file2, algorithm=algorithm)
 
                     if hash1 is not None and hash2 is not None:
                         result[file1.name] = (hash1 == hash2, hash1, hash2)
@@ -247,11 +344,17 @@ class HashManager:
         else:
             return result
 
-    def find_duplicates_in_list(self, file_items: list[FileItem]) -> dict[str, list[FileItem]]:
-        """Find duplicate files in a list of FileItem objects based on CRC32 hash.
+    def find_duplicates_in_list(
+        self, file_items: list[FileItem], algorithm: str = HASH_ALGORITHM_CRC32
+    ) -> dict[str, list[FileItem]]:
+        """Find duplicate files in a list of FileItem objects based on their hash.
+
+        Uses the staged pipeline of find_duplicates_in_paths, so only files
+        sharing a size (and partial hash) are read in full.
 
         Args:
             file_items: List of FileItem objects to check for duplicates
+            algorithm: Algorithm or role name ("fast", "strong")
 
         Returns:
             dict: Dictionary with hash as key and list of duplicate FileItem objects as value
@@ -260,43 +363,29 @@ class HashManager:
         if not file_items:
             return {}
 
-        hash_to_files: dict[str, list[FileItem]] = {}
-        processed_count = 0
-
-        logger.info("[HashManager] Scanning %d files for duplicates...", len(file_items))
-
+        items_by_path: dict[str, list[FileItem]] = {}
         for file_item in file_items:
-            try:
-                file_hash = self.calculate_hash(file_item.full_path)
-                if file_hash is not None:
-                    if file_hash not in hash_to_files:
-                        hash_to_files[file_hash] = []
-                    hash_to_files[file_hash].append(file_item)
-                    processed_count += 1
-            except Exception:
-                logger.exception("[HashManager] Error processing file %s", file_item.filename)
+            items_by_path.setdefault(file_item.full_path, []).append(file_item)
 
-        # Filter to only return groups with duplicates
-        duplicates = {
-            hash_val: files for hash_val, files in hash_to_files.items() if len(files) > 1
+        duplicate_paths = self.find_duplicates_in_paths(list(items_by_path), algorithm)
+        return {
+            hash_val: [item for path in paths for item in items_by_path[path]]
+            for hash_val, paths in duplicate_paths.items()
         }
 
-        duplicate_count = sum(len(files) for files in duplicates.values())
-        duplicate_groups = len(duplicates)
-
-        logger.info(
-            "[HashManager] Found %d duplicate files in %d groups",
-            duplicate_count,
-            duplicate_groups,
-        )
+    def find_duplicates_in_paths(
+        self, file_paths: list[str], algorithm: str = HASH_ALGORITHM_CRC32
+    ) -> dict[str, list[str]]:
+        """Find duplicate files in a list of file paths based on their hash.
 
-        return duplicates
-
-    def find_duplicates_in_paths(self, file_paths: list[str]) -> dict[str, list[str]]:
-        """Find duplicate files in a list of file paths based on CRC32 hash.
+        Files are grouped by size first and large same-size files are compared
+        by a hash of their first and last 64 KB; only files that still collide
+        are hashed in full (through the cache).
 
         Args:
             file_paths: List of file paths (strings) to check for duplicates
+            algorithm: Algorithm or role name of the full hashes (the partial
+                hashes always use the "fast" role)
 
         Returns:
             dict: Dictionary with hash as key and list of duplicate file paths as value
@@ -305,26 +394,20 @@ class HashManager:
         if not file_paths:
             return {}
 
-        hash_to_paths: dict[str, list[str]] = {}
-        processed_count = 0
-
         logger.info("[HashManager] Scanning %d files for duplicates...", len(file_paths))
 
-        for file_path in file_paths:
+        candidates = find_duplicate_candidates(file_paths, PARTIAL_HASH_ALGORITHM) or []
+
+        def full_hash(file_path: str) -> tuple[str, str | None]:
             try:
-                file_hash = self.calculate_hash(file_path)
-                if file_hash is not None:
-                    if file_hash not in hash_to_paths:
-                        hash_to_paths[file_hash] = []
-                    hash_to_paths[file_hash].append(file_path)
-                    processed_count += 1
+                return file_path, self.calculate_hash(file_path, algorithm=algorithm)
             except Exception:
                 logger.exception("[HashManager] Error processing file %s", file_path)
+                return file_path, None
 
-        # Filter to only return groups with duplicates
-        duplicates = {
-            hash_val: paths for hash_val, paths in hash_to_paths.items() if len(paths) > 1
-        }
+        duplicates = group_duplicates(
+            full_hash(file_path) for group in candidates for file_path in group.paths
+        )
 
         duplicate_count = sum(len(paths) for paths in duplicates.values())
         duplicate_groups = len(duplicates)
@@ -337,18 +420,21 @@ class HashManager:
 
         return duplicates
 
-    def verify_file_integrity(self, file_path: str | Path, expected_hash: str) -> bool:
+    def verify_file_integrity(
+        self, file_path: str | Path, expected_hash: str, algorithm: str = HASH_ALGORITHM_CRC32
+    ) -> bool:
         """Verify file integrity by comparing its hash with an expected hash.
 
         Args:
             file_path: Path to the file to verify
-            expected_hash: Expected CRC32 hash in hexadecimal format
+            expected_hash: Expected hash in hexadecimal format
+            algorithm: Algorithm the expected hash was computed with
 
         Returns:
             bool: True if file hash matches expected hash, False otherwise
 
         """
-        actual_hash = self.calculate_hash(file_path)
+        actual_hash = self.calculate_hash(file_path, algorithm=algorithm)
         if actual_hash is None:
             return False
 
@@ -375,6 +461,7 @@ class HashManager:
                 "cache_hits": persistent_stats.get("cache_hits", 0),
                 "cache_misses": persistent_stats.get("cache_misses", 0),
                 "hit_rate_percent": persistent_stats.get("hit_rate_percent", 0.0),
+                "stale_entries": persistent_stats.get("stale_entries", 0),
             }
         # Memory cache only
         return {
@@ -383,6 +470,7 @@ class HashManager:
             "cache_hits": 0,  # Not tracked in memory-only mode
             "cache_misses": 0,  # Not tracked in memory-only mode
             "hit_rate_percent": 0.0,
+            "stale_entries": 0,
         }
 
     def clear_cache(self) -> None:
@@ -410,16 +498,19 @@ def calculate_crc32(file_path: str | Path) -> str | None:
     return manager.calculate_hash(file_path)
 
 
-def compare_folders(folder1: str | Path, folder2: str | Path) -> dict[str, tuple[bool, str, str]]:
+def compare_folders(
+    folder1: str | Path, folder2: str | Path, algorithm: str = HASH_ALGORITHM_CRC32
+) -> dict[str, tuple[bool, str, str]]:
     """Compare two folders and return file comparison results (convenience function).
 
     Args:
         folder1: First folder to compare
         folder2: Second folder to compare
+        algorithm: Algorithm or role name
 
     Returns:
         dict: Dictionary with filename as key and (is_same, hash1, hash2) as value
 
     """
     manager = HashManager()
-    return manager.compare_folders(folder1, folder2)
+    return manager.compare_folders(folder1, folder2, algorithm)
@@ -23,10 +23,15 @@ Usage:
 """
 
 import os
+from collections.abc import Sequence
 from pathlib import Path
 from typing import Any, Protocol
 
 from oncutf.core.hash.base_hash_worker import BaseHashWorker
+from oncutf.core.hash.duplicate_finder import PARTIAL_HASH_ALGORITHM, find_duplicate_candidates
+from oncutf.core.hash.hash_algorithms import HASH_ALGORITHM_CRC32
+from oncutf.infra.db.hash_store import HashRecord
+from oncutf.utils.filesystem.file_signature import FileSignature, get_file_signature
 from oncutf.utils.logging.logger_factory import get_cached_logger
 
 logger = get_cached_logger(__name__)
@@ -35,18 +40,33 @@ logger = get_cached_logger(__name__)
 class HashStore(Protocol):
     """Protocol for hash storage operations."""
 
-    def store_hash(self, file_path: str, hash_value: str, algorithm: str) -> None:
+    def store_hash(self, file_path: str, hash_value: str, algorithm: str, **kwargs: Any) -> None:
         """Store hash value for file path."""
         ...
 
-    def get_cached_hash(self, file_path: str) -> str | None:
-        """Get cached hash for file path if available."""
+    def store_hashes_batch(self, records: list[HashRecord]) -> int:
+        """Persist many hash results in a single transaction."""
+        ...
+
+    def get_cached_hash(
+        self,
+        file_path: str,
+        signature: FileSignature | None = None,
+        algorithm: str = HASH_ALGORITHM_CRC32,
+    ) -> str | None:
+        """Get cached hash for file path if available and still valid."""
         ...
 
     def calculate_hash(self, file_path: str, **kwargs: Any) -> str | None:
         """Calculate hash for file path."""
         ...
 
+    def calculate_hashes(
+        self, file_path: str, algorithms: Sequence[str], **kwargs: Any
+    ) -> list[str] | None:
+        """Hash a file with several algorithms in one read, bypassing the cache."""
+        ...
+
 
 class HashWorker(BaseHashWorker):
     """Sequential background worker for hash calculation operations.
@@ -92,15 +112,22 @@ class HashWorker(BaseHashWorker):
         self._cache_misses = 0
         self._batch_operations = []
 
-    def setup_duplicate_scan(self, file_paths: list[str]) -> None:
+    def setup_duplicate_scan(
+        self, file_paths: list[str], algorithm: str = HASH_ALGORITHM_CRC32
+    ) -> None:
         """Configure worker for duplicate detection."""
-        super().setup_duplicate_scan(file_paths)
+        super().setup_duplicate_scan(file_paths, algorithm)
         with self._mutex:
             self._reset_sequential_state()
 
-    def setup_external_comparison(self, file_paths: list[str], external_folder: str) -> None:
+    def setup_external_comparison(
+        self,
+        file_paths: list[str],
+        external_folder: str,
+        algorithm: str = HASH_ALGORITHM_CRC32,
+    ) -> None:
         """Configure worker for external folder comparison."""
-        super().setup_external_comparison(file_paths, external_folder)
+        super().setup_external_comparison(file_paths, external_folder, algorithm)
         with self._mutex:
             self._reset_sequential_state()
 
@@ -125,16 +152,8 @@ class HashWorker(BaseHashWorker):
                 self.finished_processing.emit(False)
                 return
 
-            # Initialize batch manager if enabled
-            if self._enable_batching:
-                try:
-                    from oncutf.infra.batch import get_batch_manager
-
-                    self._batch_manager = get_batch_manager(self.main_window)
-                    logger.debug("[HashWorker] Batch operations manager initialized")
-                except Exception as e:
-                    logger.warning("[HashWorker] Failed to initialize batch manager: %s", e)
-                    self._enable_batching = False
+            # Start the hash writer if batching is enabled
+            self._start_hash_sink()
 
             # Get configuration safely
             with self._mutex:
@@ -146,8 +165,9 @@ class HashWorker(BaseHashWorker):
                 self.error_occurred.emit("Invalid operation configuration")
                 return
 
-            # Calculate total size if not already set
-            if self._total_bytes == 0:
+            # Calculate total size if not already set (duplicate scans size
+            # only the files that survive their own stat pass)
+            if self._total_bytes == 0 and operation_type != "duplicates":
                 self._total_bytes = self._calculate_total_size(file_paths)
 
             # Execute the appropriate operation
@@ -163,39 +183,24 @@ class HashWorker(BaseHashWorker):
             self.error_occurred.emit(str(e))
             self.finished_processing.emit(False)
         finally:
-            # Flush any remaining batch operations
-            if self._enable_batching and self._batch_manager and self._batch_operations:
-                logger.info(
-                    "[HashWorker] Flushing %d batched hash operations",
-                    len(self._batch_operations),
-                )
-
-                try:
-                    # Force flush all hash operations
-                    flushed = self._batch_manager.flush_batch_type("hash_store")
-                    logger.info("[HashWorker] Successfully flushed %d hash operations", flushed)
+            # Persist any hashes still queued on the writer
+            self._close_hash_sink()
 
-                    # Get batch statistics
-                    stats = self._batch_manager.get_stats()
-                    logger.info(
-                        "[HashWorker] Batch stats: %d batched, avg batch size: %.1f, time saved: %.2fs",
-                        stats.batched_operations,
-                        stats.average_batch_size,
-                        stats.total_time_saved,
-                    )
-
-                except Exception:
-                    logger.exception("[HashWorker] Error flushing batch operations")
-
-    def _check_cache_before_calculation(self, file_path: str) -> str | None:
+    def _check_cache_before_calculation(
+        self, file_path: str, signature: FileSignature | None = None
+    ) -> str | None:
         """Check if hash exists in cache before calculating.
 
+        Args:
+            file_path: Path to the file
+            signature: Current stat signature, if already known
+
         Returns:
-            str: Hash value if found in cache, None otherwise
+            str: Hash value if found in cache and file unchanged, None otherwise
 
         """
         try:
-            hash_value = self._hash_manager.get_cached_hash(file_path)
+            hash_value = self._hash_manager.get_cached_hash(file_path, signature, self._algorithm)
             if hash_value is not None:
                 self._cache_hits += 1
                 logger.debug("[HashWorker] Cache hit for: %s", Path(file_path).name)
@@ -223,15 +228,12 @@ class HashWorker(BaseHashWorker):
         filename = Path(file_path).name
         self.progress_updated.emit(i + 1, total_files, filename)
 
-        # Get file size for progress tracking
-        try:
-            path = Path(file_path)
-            file_size = path.stat().st_size if path.exists() else 0
-        except OSError:
-            file_size = 0
+        # Single stat: file size for progress plus the signature that validates the cache
+        signature = get_file_signature(file_path)
+        file_size = signature.size if signature else 0
 
         # Check cache first before calculating
-        file_hash = self._check_cache_before_calculation(file_path)
+        file_hash = self._check_cache_before_calculation(file_path, signature)
 
         if file_hash is not None:
             # Hash found in cache - update progress and return
@@ -269,13 +271,16 @@ class HashWorker(BaseHashWorker):
             progress_callback = update_progress
 
         # Calculate hash with optional real-time progress for large files
-        file_hash = self._hash_manager.calculate_hash(
-            file_path, progress_callback=progress_callback
+        # (cache was already checked above; persistence is batched below)
+        digests = self._hash_manager.calculate_hashes(
+            file_path, self._hash_algorithms(), progress_callback=progress_callback
         )
 
-        # Store hash using optimized batching if available
-        if file_hash is not None:
-            self._store_hash_optimized(file_path, file_hash, "crc32")
+        # Store hashes using optimized batching if available
+        file_hash = None
+        if digests is not None:
+            file_hash = digests[0]
+            self._store_hashes(file_path, digests, signature)
 
         # Update cumulative bytes AFTER each file is completed
         with self._mutex:
@@ -358,15 +363,33 @@ class HashWorker(BaseHashWorker):
     def _find_duplicates(self, file_paths: list[str]) -> None:
         """Find duplicates with file-by-file progress tracking and smart cache usage."""
         hash_to_files: dict[str, list[str]] = {}  # Use more descriptive name
-        total_files = len(file_paths)
 
-        self.status_updated.emit("Calculating CRC32 hashes for duplicate detection...")
+        # Stages 1-2: only same-size files whose head/tail hashes collide survive
+        self.status_updated.emit("Grouping files by size...")
+        candidates = find_duplicate_candidates(
+            file_paths,
+            PARTIAL_HASH_ALGORITHM,
+            self.is_cancelled,
+            progress_callback=self._report_candidate_progress,
+        )
+        if candidates is None:
+            self.finished_processing.emit(False)
+            return
 
-        # Reset cumulative tracking at start
+        candidate_paths = [path for group in candidates for path in group.paths]
+        total_files = len(candidate_paths)
+
+        self.status_updated.emit(
+            f"Calculating {self._algorithm} hashes for {total_files} of {len(file_paths)} "
+            "files (duplicate detection)..."
+        )
+
+        # Reset cumulative tracking at start; progress covers only full reads
         with self._mutex:
             self._cumulative_processed_bytes = 0
+            self._total_bytes = sum(group.size * len(group.paths) for group in candidates)
 
-        for i, file_path in enumerate(file_paths):
+        for i, file_path in enumerate(candidate_paths):
             if self._check_cancellation():
                 # Show partial results if operation was cancelled
                 if hash_to_files:
@@ -461,13 +484,26 @@ class HashWorker(BaseHashWorker):
             external_file_path = Path(external_folder) / filename
             if external_file_path.exists():
                 # Check cache for external file too
-                external_hash = self._check_cache_before_calculation(str(external_file_path))
+                external_signature = get_file_signature(external_file_path)
+                external_hash = self._check_cache_before_calculation(
+                    str(external_file_path), external_signature
+                )
                 if external_hash is None:
                     # Calculate if not in cache
-                    external_hash = self._hash_manager.calculate_hash(str(external_file_path))
+                    external_hash = self._hash_manager.calculate_hash(
+                        str(external_file_path),
+                        algorithm=self._algorithm,
+                        use_cache=False,
+                        store=False,
+                    )
                     # Store external hash using batch operations too
                     if external_hash is not None:
-                        self._store_hash_optimized(str(external_file_path), external_hash, "crc32")
+                        self._store_hash_optimized(
+                            str(external_file_path),
+                            external_hash,
+                            self._algorithm,
+                            external_signature,
+                        )
 
                 if external_hash is not None:
                     is_same = current_hash == external_hash
@@ -10,7 +10,8 @@ Parallel hash worker using ThreadPoolExecutor for concurrent hash calculation.
 Key Features:
     - Concurrent hash calculation using ThreadPoolExecutor
     - Thread-safe progress tracking with threading.Lock
-    - Smart worker count based on CPU cores and I/O considerations
+    - Smart worker count based on CPU cores and a per-device read probe
+    - Selectable hashing engine (threads or process pool, see hash_engine)
     - Cache-aware to avoid redundant calculations
     - Inherits common infrastructure from BaseHashWorker
 """
@@ -20,7 +21,11 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Any
 
+from oncutf.config import HASH_ENGINE
 from oncutf.core.hash.base_hash_worker import BaseHashWorker
+from oncutf.core.hash.duplicate_finder import PARTIAL_HASH_ALGORITHM, find_duplicate_candidates
+from oncutf.core.hash.hash_engine import HashEngine, create_hash_engine, suggest_worker_count
+from oncutf.utils.filesystem.file_signature import get_file_signature
 from oncutf.utils.logging.logger_factory import get_cached_logger
 
 logger = get_cached_logger(__name__)
@@ -44,16 +49,22 @@ class ParallelHashWorker(BaseHashWorker):
         super().__init__(parent)
 
         # Determine optimal worker count
+        self._auto_workers = max_workers is None
         if max_workers is None:
             import multiprocessing
 
             cpu_count = multiprocessing.cpu_count()
             # For I/O bound operations (hash calculation), use 2x CPU cores
-            # but cap at 8 to avoid excessive overhead
+            # but cap at 8 to avoid excessive overhead; run() narrows this
+            # further from a per-device read probe
             self._max_workers = min(cpu_count * 2, 8)
         else:
             self._max_workers = max(1, max_workers)
 
+        # Hashing engine (thread or process pool), created per run
+        self._engine_kind = HASH_ENGINE
+        self._engine: HashEngine | None = None
+
         logger.info("[ParallelHashWorker] Initialized with %d worker threads", self._max_workers)
 
         # Initialize hash manager
@@ -99,15 +110,16 @@ class ParallelHashWorker(BaseHashWorker):
 
         filename = Path(file_path).name
 
-        # Get file size
-        try:
-            path = Path(file_path)
-            file_size = path.stat().st_size if path.exists() else 0
-        except OSError:
-            file_size = 0
+        # Single stat: file size for progress plus the signature that validates the cache
+        signature = get_file_signature(file_path)
+        file_size = signature.size if signature else 0
 
-        # Check cache first
-        hash_value = self._hash_manager.get_cached_hash(file_path)
+        # Check cache first (served only if the file is unchanged since it was hashed)
+        hash_value = (
+            self._hash_manager.get_cached_hash(file_path, signature, self._algorithm)
+            if signature
+            else None
+        )
 
         if hash_value is not None:
             # Cache hit
@@ -123,13 +135,23 @@ class ParallelHashWorker(BaseHashWorker):
         logger.debug("[ParallelHashWorker] Calculating hash: %s", filename)
 
         try:
-            hash_value = self._hash_manager.calculate_hash(
-                file_path, cancellation_check=self.is_cancelled
-            )
+            # Cache was already checked above; persistence goes through the
+            # batch writer instead of one commit per file
+            algorithms = self._hash_algorithms()
+            if self._engine is not None:
+                digests = self._engine.hash_file_multi(
+                    file_path, algorithms, cancellation_check=self.is_cancelled
+                )
+            else:
+                digests = self._hash_manager.calculate_hashes(
+                    file_path, algorithms, cancellation_check=self.is_cancelled
+                )
 
-            if hash_value is not None:
-                # Store hash (will use batch if enabled)
-                self._store_hash_optimized(file_path, hash_value, "crc32")
+            hash_value = None
+            if digests is not None:
+                hash_value = digests[0]
+                # Store hashes (will use batch if enabled)
+                self._store_hashes(file_path, digests, signature)
         except Exception as e:
             logger.warning("[ParallelHashWorker] Error processing %s: %s", filename, e)
             with self._mutex:
@@ -165,16 +187,8 @@ class ParallelHashWorker(BaseHashWorker):
                 self.finished_processing.emit(False)
                 return
 
-            # Initialize batch manager if enabled
-            if self._enable_batching:
-                try:
-                    from oncutf.infra.batch import get_batch_manager
-
-                    self._batch_manager = get_batch_manager(self.main_window)
-                    logger.debug("[ParallelHashWorker] Batch manager initialized")
-                except Exception as e:
-                    logger.warning("[ParallelHashWorker] Failed to init batch manager: %s", e)
-                    self._enable_batching = False
+            # Start the hash writer if batching is enabled
+            self._start_hash_sink()
 
             # Get operation config
             with self._mutex:
@@ -187,10 +201,21 @@ class ParallelHashWorker(BaseHashWorker):
                 self.finished_processing.emit(False)
                 return
 
-            # Calculate total size if not already set
-            if self._total_bytes == 0:
+            # Calculate total size if not already set (duplicate scans size
+            # only the files that survive their own stat pass)
+            if self._total_bytes == 0 and operation_type != "duplicates":
                 self._total_bytes = self._calculate_total_size(file_paths)
 
+            # One stream for spinning disks, more where parallel reads scale
+            if self._auto_workers:
+                self._max_workers = suggest_worker_count(file_paths, self._max_workers)
+            self._engine = create_hash_engine(self._engine_kind, self._max_workers)
+            logger.info(
+                "[ParallelHashWorker] Hashing with %s engine, %d workers",
+                type(self._engine).__name__,
+                self._max_workers,
+            )
+
             # Execute operation with parallel workers
             if operation_type == "duplicates":
                 self._find_duplicates_parallel(file_paths)
@@ -204,25 +229,11 @@ class ParallelHashWorker(BaseHashWorker):
             self.error_occurred.emit(str(e))
             self.finished_processing.emit(False)
         finally:
-            # Flush batch operations
-            if self._enable_batching and self._batch_manager and self._batch_operations:
-                logger.info(
-                    "[ParallelHashWorker] Flushing %d batched ops",
-                    len(self._batch_operations),
-                )
-                try:
-                    flushed = self._batch_manager.flush_batch_type("hash_store")
-                    logger.info("[ParallelHashWorker] Flushed %d hash operations", flushed)
-
-                    stats = self._batch_manager.get_stats()
-                    logger.info(
-                        "[ParallelHashWorker] Batch stats: %d batched, avg: %.1f, saved: %.2fs",
-                        stats.batched_operations,
-                        stats.average_batch_size,
-                        stats.total_time_saved,
-                    )
-                except Exception:
-                    logger.exception("[ParallelHashWorker] Error flushing batches")
+            if self._engine is not None:
+                self._engine.shutdown()
+                self._engine = None
+            # Persist any hashes still queued on the writer
+            self._close_hash_sink()
 
     def _calculate_checksums_parallel(self, file_paths: list[str]) -> None:
         """Calculate checksums using parallel workers."""
@@ -299,16 +310,39 @@ class ParallelHashWorker(BaseHashWorker):
         self.finished_processing.emit(True)
 
     def _find_duplicates_parallel(self, file_paths: list[str]) -> None:
-        """Find duplicates using parallel hash calculation."""
+        """Find duplicates: size buckets, then partial hashes, then full hashes."""
         hash_to_files: dict[str, list[str]] = {}
-        len(file_paths)
 
-        self.status_updated.emit("Scanning for duplicates...")
+        self.status_updated.emit("Grouping files by size...")
 
-        # Calculate all hashes in parallel
         with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            # Stages 1-2: only same-size files whose head/tail hashes collide survive
+            candidates = find_duplicate_candidates(
+                file_paths,
+                PARTIAL_HASH_ALGORITHM,
+                self.is_cancelled,
+                executor.map,
+                self._report_candidate_progress,
+            )
+            if candidates is None or self.is_cancelled():
+                self.finished_processing.emit(False)
+                return
+
+            candidate_paths = [path for group in candidates for path in group.paths]
+
+            # Progress now covers only the files that are read in full
+            with self._mutex:
+                self._total_files = len(candidate_paths)
+                self._total_bytes = sum(group.size * len(group.paths) for group in candidates)
+
+            self.status_updated.emit(
+                f"Hashing {len(candidate_paths)} of {len(file_paths)} files "
+                f"({self._algorithm}) for duplicate detection..."
+            )
+
+            # Stage 3: full hashes (cache-aware, batched store)
             future_to_path = {
-                executor.submit(self._process_single_file, path): path for path in file_paths
+                executor.submit(self._process_single_file, path): path for path in candidate_paths
             }
 
             for future in as_completed(future_to_path):
@@ -363,9 +397,11 @@ class ParallelHashWorker(BaseHashWorker):
             if external_path is None:
                 return (source_path, {"exists_in_external": False})
 
-            # Calculate both hashes
-            source_hash = self._hash_manager.calculate_hash(source_path)
-            external_hash = self._hash_manager.calculate_hash(external_path)
+            # Calculate both hashes (the source through the cache and batch writer)
+            _path, source_hash, _size = self._process_single_file(source_path)
+            external_hash = self._hash_manager.calculate_hash(
+                external_path, algorithm=self._algorithm
+            )
 
             return (
                 source_path,
@@ -9,6 +9,7 @@ Maps column keys to metadata keys and formats values for compact display.
 Based on comprehensive analysis of fast vs extended metadata across multiple file types.
 """
 
+from collections.abc import Mapping
 from typing import Any, ClassVar
 
 from oncutf.utils.logging.logger_factory import get_cached_logger
@@ -96,7 +97,7 @@ class MetadataFieldMapper:
     }
 
     @classmethod
-    def get_metadata_value(cls, metadata_dict: dict[str, Any], field_key: str) -> str:
+    def get_metadata_value(cls, metadata_dict: Mapping[str, Any], field_key: str) -> str:
         """Get metadata value for a field key with fallback support and formatting.
 
         Args:
@@ -107,7 +108,7 @@ class MetadataFieldMapper:
             Formatted string value for display, or empty string if not found
 
         """
-        if not isinstance(metadata_dict, dict) or not metadata_dict:
+        if not isinstance(metadata_dict, Mapping) or not metadata_dict:
             return ""
 
         # Special handling for image_size (combines width x height)
@@ -153,7 +154,7 @@ class MetadataFieldMapper:
         return formatted_value
 
     @classmethod
-    def _get_image_size_value(cls, metadata_dict: dict[str, Any]) -> str:
+    def _get_image_size_value(cls, metadata_dict: Mapping[str, Any]) -> str:
         """Special handling for image size (combines width x height).
 
         Args:
@@ -16,23 +16,31 @@ Responsibilities:
 
 from __future__ import annotations
 
-from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeout, as_completed
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeout
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-from oncutf.config import COMPANION_FILES_ENABLED, LOAD_COMPANION_METADATA
+from oncutf.config import (
+    COMPANION_FILES_ENABLED,
+    LOAD_COMPANION_METADATA,
+    METADATA_FLUSH_BATCH_SIZE,
+    METADATA_UI_UPDATE_INTERVAL,
+)
 from oncutf.config.features import FeatureAvailability
 from oncutf.core.metadata.metadata_ui_bridge import MetadataUIBridge, NullMetadataUIBridge
+from oncutf.utils.filesystem.file_signature import get_file_signature
 from oncutf.utils.logging.logger_factory import get_cached_logger
+from oncutf.utils.shared.update_coalescer import UpdateCoalescer
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Iterator
+    from collections.abc import Callable, Iterable, Iterator
 
     from oncutf.core.metadata.companion_metadata_handler import CompanionMetadataHandler
     from oncutf.core.metadata.metadata_progress_handler import MetadataProgressHandler
     from oncutf.core.metadata.parallel_loader import ParallelMetadataLoader
     from oncutf.domain.models.file_item import FileItem
     from oncutf.infra.external.exopsis_wrapper import ExopsisWrapper
+    from oncutf.utils.filesystem.file_signature import FileSignature
 
 logger = get_cached_logger(__name__)
 
@@ -269,6 +277,9 @@ class MetadataLoader:
     ) -> tuple[list[FileItem], int]:
         """Filter items that already have valid cached metadata.
 
+        Cached metadata is valid while the file is unchanged on disk (one
+        batched stat pass); stale and missing files are loaded again.
+
         Args:
             items: List of items to check
             use_extended: Whether extended metadata is required
@@ -280,36 +291,24 @@ class MetadataLoader:
         needs_loading = []
         skipped_count = 0
 
-        # Use batch cache retrieval for performance
-        paths = [item.full_path for item in items]
-        cache_entries = self._ui_bridge.cache_get_entries_batch(paths)
+        check = self._ui_bridge.cache_check_entries([item.full_path for item in items])
+        if check.stale:
+            logger.info(
+                "[MetadataLoader] Cached metadata: %d fresh, %d stale, %d missing",
+                len(check.fresh),
+                len(check.stale),
+                len(check.missing),
+            )
 
         from oncutf.utils.filesystem.path_normalizer import normalize_path
 
         for item in items:
-            norm_path = normalize_path(item.full_path)
-            cache_entry = cache_entries.get(norm_path)
-
-            # Check if we have valid metadata in cache
-            has_valid_cache = (
-                cache_entry is not None
-                and hasattr(cache_entry, "is_extended")
-                and hasattr(cache_entry, "data")
-                and cache_entry.data
-            )
+            cache_entry = check.fresh.get(normalize_path(item.full_path))
 
-            # Already has extended - never downgrade
-            if (
-                has_valid_cache
-                and cache_entry is not None
-                and (
-                    (cache_entry.is_extended and not use_extended)
-                    or cache_entry.is_extended == use_extended
-                )
-            ):
+            # Already has extended - never downgrade; fast is upgraded on request
+            if cache_entry is not None and (cache_entry.is_extended or not use_extended):
                 skipped_count += 1
                 continue
-            # else: Need upgrade from fast to extended - add to needs_loading
 
             needs_loading.append(item)
 
@@ -384,9 +383,7 @@ class MetadataLoader:
                 if metadata:
                     enhanced_metadata = self._enhance_with_companions(item, metadata, [item])
 
-                    self._ui_bridge.cache_set(
-                        item.full_path, enhanced_metadata, is_extended=False
-                    )
+                    self._ui_bridge.cache_set(item.full_path, enhanced_metadata, is_extended=False)
                     item.metadata = enhanced_metadata
                     self._ui_bridge.refresh_model_icons()
 
@@ -397,14 +394,10 @@ class MetadataLoader:
 
                     logger.debug("[MetadataLoader] Loaded metadata for %s", item.filename)
                 else:
-                    logger.warning(
-                        "[MetadataLoader] No metadata returned for %s", item.filename
-                    )
+                    logger.warning("[MetadataLoader] No metadata returned for %s", item.filename)
 
             except Exception:
-                logger.exception(
-                    "[MetadataLoader] Failed to load metadata for %s", item.filename
-                )
+                logger.exception("[MetadataLoader] Failed to load metadata for %s", item.filename)
                 self._ui_bridge.set_metadata_status(
                     "Exopsis is not available. Install the exopsis package to enable metadata loading.",
                     operation_type="error",
@@ -486,10 +479,40 @@ class MetadataLoader:
 
         # Progress tracking
         processed_size = 0
+        completed = 0
+        last_filename = ""
+
+        def update_rows(paths: list[str]) -> None:
+            """Repaint the rows saved to the cache since the last frame."""
+            self._ui_bridge.emit_rows_changed(paths)
 
-        def on_progress(current: int, total: int, item: FileItem, metadata: dict[str, Any]) -> None:
+        def update_progress(_keys: list[None]) -> None:
+            """Update the progress dialog once per frame."""
+            loading_dialog.update_progress(
+                file_count=completed,
+                total_files=total_files,
+                processed_bytes=processed_size,
+                total_bytes=total_size,
+            )
+            loading_dialog.set_filename(last_filename)
+            loading_dialog.set_count(completed, total_files)
+
+        # Rows are queued once their batch is in the cache: a repaint reads the
+        # row state from the cache, so repainting earlier would show stale icons
+        row_updates = UpdateCoalescer(update_rows, METADATA_UI_UPDATE_INTERVAL)
+        progress_updates: UpdateCoalescer[None] = UpdateCoalescer(
+            update_progress, METADATA_UI_UPDATE_INTERVAL
+        )
+
+        def poll_updates() -> None:
+            row_updates.poll()
+            progress_updates.poll()
+
+        def on_progress(
+            current: int, _total: int, item: FileItem, metadata: dict[str, Any]
+        ) -> None:
             """Called for each completed file during parallel loading."""
-            nonlocal processed_size
+            nonlocal processed_size, completed, last_filename
 
             # Update processed size
             try:
@@ -504,34 +527,34 @@ class MetadataLoader:
             except (OSError, AttributeError):
                 pass
 
-            # Update progress dialog
-            loading_dialog.update_progress(
-                file_count=current,
-                total_files=total,
-                processed_bytes=processed_size,
-                total_bytes=total_size,
-            )
-            loading_dialog.set_filename(item.filename)
-            loading_dialog.set_count(current, total)
-
-            # Process metadata
             if metadata:
-                # Enhance with companion data
-                enhanced_metadata = self._enhance_with_companions(item, metadata, needs_loading)
-
-                # Save to cache
-                self._ui_bridge.cache_set(
-                    item.full_path, enhanced_metadata, is_extended=False
+                # Enhance with companion data and update file item
+                item.metadata = self._enhance_with_companions(item, metadata, needs_loading)
+
+            completed = current
+            last_filename = item.filename
+            progress_updates.add((None,))
+
+        def on_batch(
+            _current: int, _total: int, batch: list[tuple[FileItem, dict[str, Any]]]
+        ) -> None:
+            """Save each batch of completed files to cache with one database write."""
+            batch_signatures = {
+                item.full_path: signatures.pop(item.full_path)
+                for item, _metadata in batch
+                if item.full_path in signatures
+            }
+            loaded = [(item.full_path, item.metadata) for item, metadata in batch if metadata]
+            if loaded:
+                self._ui_bridge.cache_set_batch(
+                    loaded, is_extended=use_extended, signatures=batch_signatures
                 )
-
-                # Update file item
-                item.metadata = enhanced_metadata
-
-                # Emit dataChanged for progressive UI update
-                self._ui_bridge.emit_data_changed(item.full_path)
+            row_updates.add(item.full_path for item, _metadata in batch)
 
         def on_completion() -> None:
             """Called when parallel loading completes."""
+            row_updates.flush()
+            progress_updates.flush()
             loading_dialog.close()
 
             # Smart display: respect selection count
@@ -561,13 +584,17 @@ class MetadataLoader:
             return self._metadata_cancelled
 
         # Start parallel loading
+        signatures: dict[str, FileSignature | None] = {}
         try:
             self.parallel_loader.load_metadata_parallel(
-                items=needs_loading,
+                items=self._with_signatures(needs_loading, signatures),
+                total=len(needs_loading),
                 use_extended=use_extended,
                 progress_callback=on_progress,
                 completion_callback=on_completion,
                 cancellation_check=check_cancellation,
+                batch_callback=on_batch,
+                idle_callback=poll_updates,
             )
         except RuntimeError:
             loading_dialog.close()
@@ -592,6 +619,10 @@ class MetadataLoader:
     ) -> Iterator[tuple[FileItem, dict[str, Any]]]:
         """Yield metadata as soon as available using parallel loading.
 
+        Fresh cached metadata is yielded first. The rest is extracted with a
+        bounded window of files in flight and saved to the cache in batches,
+        so memory stays flat however many files are loaded.
+
         Args:
             items: List of FileItem objects to load metadata for
             use_extended: Whether to use extended metadata loading
@@ -603,27 +634,17 @@ class MetadataLoader:
         if not items:
             return
 
-        # Separate cached vs non-cached
-        items_to_load = []
+        from oncutf.utils.filesystem.path_normalizer import normalize_path
 
+        # Separate fresh cached vs stale/missing
+        check = self._ui_bridge.cache_check_entries([item.full_path for item in items])
+        items_to_load = []
         for item in items:
-            # Check cache
-            cache_entry = self._ui_bridge.cache_get_entry(item.full_path)
-
-            has_valid_cache = (
+            cache_entry = check.fresh.get(normalize_path(item.full_path))
+            if (
                 cache_entry is not None
-                and hasattr(cache_entry, "is_extended")
-                and hasattr(cache_entry, "data")
                 and cache_entry.data
-            )
-
-            if (
-                has_valid_cache
-                and cache_entry is not None
-                and (
-                    (cache_entry.is_extended and not use_extended)
-                    or cache_entry.is_extended == use_extended
-                )
+                and (cache_entry.is_extended or not use_extended)
             ):
                 yield item, cache_entry.data
                 continue
@@ -634,33 +655,48 @@ class MetadataLoader:
             return
 
         # Use parallel loading for the rest
-        import multiprocessing
-
-        max_workers = min(multiprocessing.cpu_count() * 2, 16)
-
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_to_item = {
-                executor.submit(
-                    self.wrapper.get_metadata, item.full_path, use_extended
-                ): item
-                for item in items_to_load
-            }
-
-            for future in as_completed(future_to_item):
-                item = future_to_item[future]
-                try:
-                    metadata = future.result()
-
-                    # Update cache
-                    self._ui_bridge.cache_set(item.full_path, metadata, is_extended=use_extended)
-
-                    # Update item metadata
+        signatures: dict[str, FileSignature | None] = {}
+        pending: list[tuple[str, dict[str, Any]]] = []
+        pending_signatures: dict[str, FileSignature | None] = {}
+        try:
+            for item, metadata in self.parallel_loader.iter_metadata(
+                self._with_signatures(items_to_load, signatures),
+                use_extended,
+                cancellation_check=self.is_cancelled,
+            ):
+                if metadata:
                     item.metadata = metadata
+                    pending.append((item.full_path, metadata))
+                    if item.full_path in signatures:
+                        pending_signatures[item.full_path] = signatures[item.full_path]
+                    if len(pending) >= METADATA_FLUSH_BATCH_SIZE:
+                        self._ui_bridge.cache_set_batch(
+                            pending, is_extended=use_extended, signatures=pending_signatures
+                        )
+                        pending = []
+                        pending_signatures = {}
+
+                signatures.pop(item.full_path, None)
+                yield item, metadata
+        finally:
+            if pending:
+                self._ui_bridge.cache_set_batch(
+                    pending, is_extended=use_extended, signatures=pending_signatures
+                )
 
-                    yield item, metadata
-                except Exception:
-                    logger.exception("Failed to load metadata for %s", item.filename)
-                    yield item, {}
+    @staticmethod
+    def _with_signatures(
+        items: Iterable[FileItem], signatures: dict[str, FileSignature | None]
+    ) -> Iterator[FileItem]:
+        """Yield *items*, recording each file's stat signature as it goes to extraction.
+
+        The parallel loader takes files lazily, right before extracting them,
+        so a file edited while its metadata is read is stored as stale
+        instead of matching the newer stat taken when the batch is saved.
+        """
+        for item in items:
+            signatures[item.full_path] = get_file_signature(item.full_path)
+            yield item
 
     # =========================================================================
     # Companion File Enhancement
@@ -10,7 +10,15 @@ Date: 2026-03-08
 
 from __future__ import annotations
 
-from typing import Any, Protocol, runtime_checkable
+from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
+
+from oncutf.infra.cache.persistent_metadata_cache import MetadataCacheCheck
+from oncutf.utils.filesystem.path_normalizer import normalize_path
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from oncutf.utils.filesystem.file_signature import FileSignature
 
 
 @runtime_checkable
@@ -26,6 +34,10 @@ class MetadataUIBridge(Protocol):
         """Get cache entries for multiple paths at once."""
         ...
 
+    def cache_check_entries(self, paths: list[str]) -> MetadataCacheCheck:
+        """Split paths into fresh, stale and missing cache entries (stat-validated)."""
+        ...
+
     def cache_get_entry(self, path: str) -> Any:
         """Get single cache entry by normalized path."""
         ...
@@ -34,6 +46,19 @@ class MetadataUIBridge(Protocol):
         """Store metadata in cache."""
         ...
 
+    def cache_set_batch(
+        self,
+        items: list[tuple[str, dict[str, Any]]],
+        *,
+        is_extended: bool,
+        signatures: Mapping[str, FileSignature | None] | None = None,
+    ) -> None:
+        """Store metadata for many files in cache with one database write.
+
+        *signatures* are the files' stat signatures taken before extraction.
+        """
+        ...
+
     def refresh_model_icons(self) -> None:
         """Refresh file model icons after metadata update."""
         ...
@@ -42,6 +67,10 @@ class MetadataUIBridge(Protocol):
         """Emit dataChanged signal for a specific file in the model."""
         ...
 
+    def emit_rows_changed(self, full_paths: list[str]) -> None:
+        """Emit one dataChanged signal spanning the rows of many files."""
+        ...
+
     def get_selection_count(self) -> int:
         """Get current file selection count."""
         ...
@@ -76,6 +105,10 @@ class NullMetadataUIBridge:
         """Return empty dict -- no cache available."""
         return {}
 
+    def cache_check_entries(self, paths: list[str]) -> MetadataCacheCheck:
+        """Report every path as missing -- no cache available."""
+        return MetadataCacheCheck({}, [], list(dict.fromkeys(map(normalize_path, paths))))
+
     def cache_get_entry(self, path: str) -> Any:
         """Return None -- no cache available."""
         return None
@@ -83,12 +116,24 @@ class NullMetadataUIBridge:
     def cache_set(self, path: str, data: dict[str, Any], *, is_extended: bool) -> None:
         """No-op -- no cache available."""
 
+    def cache_set_batch(
+        self,
+        items: list[tuple[str, dict[str, Any]]],
+        *,
+        is_extended: bool,
+        signatures: Mapping[str, FileSignature | None] | None = None,
+    ) -> None:
+        """No-op -- no cache available."""
+
     def refresh_model_icons(self) -> None:
         """No-op -- no model available."""
 
     def emit_data_changed(self, full_path: str) -> None:
         """No-op -- no model available."""
 
+    def emit_rows_changed(self, full_paths: list[str]) -> None:
+        """No-op -- no model available."""
+
     def get_selection_count(self) -> int:
         """Return 0 -- no selection available."""
         return 0
@@ -3,29 +3,50 @@
 Author: Michael Economou
 Date: 2025-11-22
 
-Parallel metadata loading using thread pool for faster batch operations.
+Parallel metadata loading using worker processes or threads for faster batch operations.
 
 Features:
-- Parallel metadata extraction using ThreadPoolExecutor
-- Progressive UI updates as metadata arrives
+- Parallel metadata extraction in the shared ExopsisProcessPool, or with
+  ThreadPoolExecutor where worker processes are unavailable
+- Progressive UI updates as metadata arrives, flushed in batches
 - Cancellation support
 - Automatic batch size optimization
-- Memory-efficient streaming results
+- Memory-efficient streaming results: a bounded window of files in flight,
+  nothing kept after it has been delivered
 - Error handling per file (failures don't stop the batch)
 """
 
+import time
 import traceback
-from collections.abc import Callable
-from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Sized
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from itertools import islice
 from typing import Any
 
+from oncutf.config import (
+    METADATA_EXTRACTION_BACKEND,
+    METADATA_FLUSH_BATCH_SIZE,
+    METADATA_FLUSH_INTERVAL,
+    METADATA_UI_UPDATE_INTERVAL,
+)
 from oncutf.domain.models.file_item import FileItem
+from oncutf.infra.external.exopsis_process_pool import (
+    ExopsisProcessPool,
+    get_exopsis_process_pool,
+)
 from oncutf.infra.external.exopsis_wrapper import ExopsisWrapper
 from oncutf.utils.filesystem.path_utils import paths_equal
 from oncutf.utils.logging.logger_factory import get_cached_logger
 
 logger = get_cached_logger(__name__)
 
+# Files submitted ahead per worker thread: keeps workers busy between polls
+# without holding a future for every file
+_IN_FLIGHT_PER_WORKER = 2
+
+BatchCallback = Callable[[int, int, list[tuple[FileItem, dict[str, Any]]]], None]
+
 
 class ParallelMetadataLoader:
     """Parallel metadata loader using thread pool for optimal performance.
@@ -43,13 +64,15 @@ class ParallelMetadataLoader:
     - Large batches (50+ files): 5-10x faster
     """
 
-    def __init__(self, max_workers: int | None = None):
+    def __init__(self, max_workers: int | None = None, backend: str = METADATA_EXTRACTION_BACKEND):
         """Initialize parallel metadata loader.
 
         Args:
             max_workers: Maximum number of worker threads. If None, uses optimal default:
                         - CPU count for small files
                         - CPU count * 2 for I/O-bound operations (Exopsis)
+            backend: "process" to extract in the shared worker process pool
+                (threads are used if it is unavailable), "thread" for threads only
 
         """
         if max_workers is None:
@@ -60,6 +83,7 @@ class ParallelMetadataLoader:
             max_workers = min(cpu_count * 2, 16)  # Cap at 16 to avoid overwhelming system
 
         self.max_workers = max_workers
+        self.backend = backend
         self._metadata_wrapper: ExopsisWrapper | None = None
         try:
             self._metadata_wrapper = ExopsisWrapper()
@@ -76,146 +100,90 @@ class ParallelMetadataLoader:
 
     def load_metadata_parallel(
         self,
-        items: list[FileItem],
+        items: Iterable[FileItem],
         use_extended: bool = False,
         progress_callback: Callable[[int, int, FileItem, dict[str, Any]], None] | None = None,
         completion_callback: Callable[[], None] | None = None,
         cancellation_check: Callable[[], bool] | None = None,
-    ) -> list[tuple[FileItem, dict[str, Any]]]:
-        """Load metadata for multiple files in parallel.
+        batch_callback: BatchCallback | None = None,
+        total: int | None = None,
+        idle_callback: Callable[[], None] | None = None,
+    ) -> int:
+        """Load metadata for multiple files in parallel, streaming results to callbacks.
+
+        Only a bounded window of files is in flight and results are not kept
+        once their callbacks ran, so memory does not grow with the number of
+        files. UI events are processed at most once per
+        METADATA_UI_UPDATE_INTERVAL while waiting, not per result.
 
         Args:
-            items: List of FileItem objects to load metadata for
+            items: FileItem objects to load metadata for (consumed lazily)
             use_extended: Whether to use extended metadata loading
             progress_callback: Called for each completed file: (current, total, item, metadata)
             completion_callback: Called when all files are processed
             cancellation_check: Function that returns True if loading should be cancelled
+            batch_callback: Called with (current, total, batch) for completed files,
+                flushed every METADATA_FLUSH_BATCH_SIZE files or METADATA_FLUSH_INTERVAL
+                seconds
+            total: Number of items, if *items* has no len()
+            idle_callback: Called while waiting for results, after UI events
+                were processed (e.g. to deliver coalesced UI updates)
 
         Returns:
-            List of (FileItem, metadata_dict) tuples in original order
+            Number of files processed
 
         """
-        if not items:
-            return []
+        if isinstance(items, Sized) and not items:
+            return 0
 
         if not self.exopsis_available:
             raise RuntimeError(
                 "Exopsis is not available. Install the exopsis package to enable metadata loading."
             )
 
-        # Reset cancellation flag
-        self._cancelled = False
+        from oncutf.app.services.ui_events import process_events
 
-        total_files = len(items)
-        results: dict[str, tuple[FileItem, dict[str, Any]]] = {}  # file_path -> (item, metadata)
+        if total is None:
+            total = len(items) if isinstance(items, Sized) else 0
         completed = 0
+        batch: list[tuple[FileItem, dict[str, Any]]] = []
+        last_flush = last_pump = time.monotonic()
+
+        def flush() -> None:
+            nonlocal batch, last_flush
+            last_flush = time.monotonic()
+            if batch and batch_callback:
+                flushed, batch = batch, []
+                batch_callback(completed, total, flushed)
+
+        def idle() -> None:
+            nonlocal last_pump
+            now = time.monotonic()
+            if now - last_pump >= METADATA_UI_UPDATE_INTERVAL:
+                last_pump = now
+                process_events()
+            if idle_callback:
+                idle_callback()
+            if now - last_flush >= METADATA_FLUSH_INTERVAL:
+                flush()
 
         logger.info(
             "[ParallelMetadataLoader] Starting parallel load for %d files (extended=%s, workers=%d)",
-            total_files,
+            total,
             use_extended,
             self.max_workers,
         )
 
         try:
-            # Use ThreadPoolExecutor for parallel Exopsis extraction
-            executor = ThreadPoolExecutor(max_workers=self.max_workers)
-
-            def should_cancel() -> bool:
-                if self._cancelled:
-                    return True
-                return cancellation_check() if cancellation_check else False
-
-            try:
-                # Submit all tasks
-                future_to_item = {
-                    executor.submit(
-                        self._load_single_file_safe,
-                        item,
-                        use_extended,
-                        should_cancel,
-                    ): item
-                    for item in items
-                }
-
-                # Use polling with timeout for responsive UI
-                # This prevents blocking until first result
-                from oncutf.app.services.ui_events import process_events
-
-                pending = set(future_to_item.keys())
-
-                while pending and not self._cancelled:
-                    # Process Qt events first for responsive UI
-                    process_events()
-
-                    # Check for cancellation
-                    if should_cancel():
-                        logger.info(
-                            "[ParallelMetadataLoader] Cancellation detected - stopping immediately"
-                        )
-                        self._cancelled = True
-
-                        # Cancel all pending futures
-                        cancelled_count = 0
-                        for f in pending:
-                            if f.cancel():
-                                cancelled_count += 1
-
-                        logger.info(
-                            "[ParallelMetadataLoader] Cancelled %d pending tasks due to user request",
-                            cancelled_count,
-                        )
-
-                        # Shutdown executor without waiting
-                        executor.shutdown(wait=False, cancel_futures=True)
-                        break
-
-                    # Wait for any task to complete with short timeout
-                    # This allows processEvents() to run frequently
-                    done, pending = wait(pending, timeout=0.05, return_when=FIRST_COMPLETED)
-
-                    # Process completed futures
-                    for future in done:
-                        item = future_to_item[future]
-                        completed += 1
-
-                        try:
-                            metadata = future.result()
-                            results[item.full_path] = (item, metadata)
-
-                            # Progressive callback for UI updates
-                            if progress_callback:
-                                progress_callback(completed, total_files, item, metadata)
-                                process_events()
-
-                            logger.debug(
-                                "[ParallelMetadataLoader] Loaded %d/%d: %s",
-                                completed,
-                                total_files,
-                                item.filename,
-                                extra={"dev_only": True},
-                            )
-
-                        except Exception:
-                            logger.exception(
-                                "[ParallelMetadataLoader] Failed to load %s",
-                                item.filename,
-                            )
-                            # Store empty metadata on error
-                            results[item.full_path] = (item, {})
-
-                            # Still call progress callback to update count
-                            if progress_callback:
-                                progress_callback(completed, total_files, item, {})
-                                process_events()
-
-            finally:
-                # Ensure executor is always shut down
-                if not self._cancelled:
-                    executor.shutdown(wait=True)
-                else:
-                    executor.shutdown(wait=False, cancel_futures=True)
-
+            for item, metadata in self.iter_metadata(items, use_extended, cancellation_check, idle):
+                completed += 1
+                if progress_callback:
+                    progress_callback(completed, total, item, metadata)
+                if batch_callback:
+                    batch.append((item, metadata))
+                    if len(batch) >= METADATA_FLUSH_BATCH_SIZE:
+                        flush()
+            flush()
         except Exception:
             logger.exception("[ParallelMetadataLoader] Parallel loading failed")
 
@@ -224,23 +192,136 @@ class ParallelMetadataLoader:
             if completion_callback:
                 completion_callback()
 
-        # Return results in original order
-        ordered_results = []
-        for item in items:
-            if item.full_path in results:
-                ordered_results.append(results[item.full_path])
-            else:
-                # File was not processed (cancelled or error)
-                ordered_results.append((item, {}))
-
         logger.info(
             "[ParallelMetadataLoader] Completed: %d/%d files loaded (cancelled=%s)",
-            len(results),
-            total_files,
+            completed,
+            total,
             self._cancelled,
         )
 
-        return ordered_results
+        return completed
+
+    def iter_metadata(
+        self,
+        items: Iterable[FileItem],
+        use_extended: bool = False,
+        cancellation_check: Callable[[], bool] | None = None,
+        idle: Callable[[], None] | None = None,
+    ) -> Iterator[tuple[FileItem, dict[str, Any]]]:
+        """Yield (item, metadata) as files complete, in completion order.
+
+        *items* is consumed lazily: at most a fixed window of files is being
+        extracted at a time. Files whose extraction fails yield empty
+        metadata; cancelled files are not yielded.
+
+        Args:
+            items: FileItem objects to load metadata for
+            use_extended: Whether to use extended metadata loading
+            cancellation_check: Function that returns True if loading should be cancelled
+            idle: Called between polls while waiting for results (e.g. to process UI events)
+
+        """
+        # Reset cancellation flag
+        self._cancelled = False
+
+        def should_cancel() -> bool:
+            if self._cancelled:
+                return True
+            return cancellation_check() if cancellation_check else False
+
+        pool = get_exopsis_process_pool() if self.backend == "process" else None
+        if pool is not None:
+            yield from self._iter_in_processes(pool, items, should_cancel, idle)
+        else:
+            yield from self._iter_in_threads(items, use_extended, should_cancel, idle)
+
+    def _iter_in_threads(
+        self,
+        items: Iterable[FileItem],
+        use_extended: bool,
+        should_cancel: Callable[[], bool],
+        idle: Callable[[], None] | None,
+    ) -> Iterator[tuple[FileItem, dict[str, Any]]]:
+        """Extract metadata on worker threads of this process, one file per task."""
+        item_iter = iter(items)
+        in_flight: dict[Future[dict[str, Any]], FileItem] = {}
+        window = self.max_workers * _IN_FLIGHT_PER_WORKER
+
+        # Use ThreadPoolExecutor for parallel Exopsis extraction
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+
+        try:
+            while True:
+                # Keep the window full without submitting the whole list
+                for item in islice(item_iter, window - len(in_flight)):
+                    future = executor.submit(
+                        self._load_single_file_safe, item, use_extended, should_cancel
+                    )
+                    in_flight[future] = item
+                if not in_flight:
+                    break
+
+                # Wait for any task to complete with short timeout so the
+                # idle callback runs frequently
+                done, _ = wait(in_flight, timeout=0.05, return_when=FIRST_COMPLETED)
+                if idle:
+                    idle()
+
+                if should_cancel():
+                    logger.info(
+                        "[ParallelMetadataLoader] Cancellation detected - stopping immediately"
+                    )
+                    self._cancelled = True
+                    break
+
+                for future in done:
+                    item = in_flight.pop(future)
+                    try:
+                        metadata = future.result()
+                    except Exception:
+                        logger.exception(
+                            "[ParallelMetadataLoader] Failed to load %s",
+                            item.filename,
+                        )
+                        # Store empty metadata on error
+                        metadata = {}
+                    yield item, metadata
+
+        finally:
+            # Drop tasks that have not started; running ones observe should_cancel
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _iter_in_processes(
+        self,
+        pool: ExopsisProcessPool,
+        items: Iterable[FileItem],
+        should_cancel: Callable[[], bool],
+        idle: Callable[[], None] | None,
+    ) -> Iterator[tuple[FileItem, dict[str, Any]]]:
+        """Extract metadata in the worker process pool, in batches of files."""
+        # Items sent to the pool and not yet returned, by path
+        waiting: dict[str, deque[FileItem]] = {}
+
+        def paths() -> Iterator[str]:
+            for item in items:
+                waiting.setdefault(item.full_path, deque()).append(item)
+                yield item.full_path
+
+        for path, metadata in pool.extract(paths(), cancellation_check=should_cancel, idle=idle):
+            queue = waiting[path]
+            item = queue.popleft()
+            if not queue:
+                del waiting[path]
+            yield item, metadata
+
+        if should_cancel():
+            self._cancelled = True
+            logger.info("[ParallelMetadataLoader] Cancellation detected - stopped worker processes")
+        elif not pool.is_healthy():
+            logger.warning(
+                "[ParallelMetadataLoader] Worker processes unhealthy (%s), using threads from now on",
+                pool.health_check()["last_error"],
+            )
 
     def _load_single_file_safe(
         self,
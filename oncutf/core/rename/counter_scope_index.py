@@ -0,0 +1,118 @@
+"""oncutf.core.rename.counter_scope_index.
+
+Precomputed counter-scope ordinals for a preview file list.
+
+Scope-aware counters need, for every file, its position among the files that
+share its folder, extension or file group. Computing that per file by
+rescanning the file list is O(N^2) in path parsing; ``CounterScopeIndex``
+walks the list once per scope actually used and answers each lookup in O(1).
+
+Author: Michael Economou
+Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from oncutf.domain.models.counter_scope import CounterScope
+
+if TYPE_CHECKING:
+    from oncutf.domain.models.file_item import FileItem
+
+
+class CounterScopeIndex:
+    """Map from global file index to scope-local counter index.
+
+    Paths and filenames are captured when the index is created; ordinals for
+    a scope are computed on first use, so GLOBAL-only previews pay nothing.
+    """
+
+    def __init__(self, files: list[FileItem]) -> None:
+        """Create an index over the current paths of *files*."""
+        self._paths = [f.full_path for f in files]
+        self._filenames = [f.filename for f in files]
+        self._ordinals: dict[CounterScope, list[int]] = {}
+        self._extensions: list[str] | None = None
+
+    def matches(self, files: list[FileItem]) -> bool:
+        """Return True if *files* lists the same files in the same order."""
+        return (
+            len(files) == len(self._paths)
+            and all(f.full_path == p for f, p in zip(files, self._paths, strict=True))
+            and all(f.filename == n for f, n in zip(files, self._filenames, strict=True))
+        )
+
+    def index_for(self, scope: CounterScope, global_index: int, file_item: FileItem) -> int | None:
+        """Return the counter index of *file_item* within *scope*.
+
+        Args:
+            scope: Counter scope.
+            global_index: Index of *file_item* in the indexed list.
+            file_item: The file being renamed.
+
+        Returns:
+            The scope-adjusted index, or ``None`` if *file_item* is not the
+            file at *global_index* (the caller should fall back to a scan).
+
+        """
+        if scope == CounterScope.GLOBAL:
+            return global_index
+        if not 0 <= global_index < len(self._paths):
+            return None
+        if self._paths[global_index] != file_item.full_path:
+            return None
+        return self.ordinals(scope)[global_index]
+
+    def ordinals(self, scope: CounterScope) -> list[int]:
+        """Return the scope-adjusted index of every indexed file, in order."""
+        if scope == CounterScope.GLOBAL:
+            return list(range(len(self._paths)))
+        ordinals = self._ordinals.get(scope)
+        if ordinals is None:
+            ordinals = self._ordinals[scope] = self._build(scope)
+        return ordinals
+
+    def extensions(self) -> list[str]:
+        """Return each indexed file's extension (``Path.suffix``), in order."""
+        if self._extensions is None:
+            self._extensions = [Path(name).suffix for name in self._filenames]
+        return self._extensions
+
+    def _build(self, scope: CounterScope) -> list[int]:
+        """Compute the ordinal of every file within *scope* in one pass."""
+        if scope == CounterScope.PER_EXTENSION:
+            return self._running_counts([extension.lower() for extension in self.extensions()])
+        folders = [str(Path(path).parent) for path in self._paths]
+        if scope == CounterScope.PER_FILEGROUP:
+            return self._filegroup_ordinals(folders)
+        return self._running_counts(folders)
+
+    @staticmethod
+    def _running_counts(keys: list[str]) -> list[int]:
+        counts: dict[str, int] = {}
+        ordinals: list[int] = []
+        for key in keys:
+            ordinal = counts.get(key, 0)
+            ordinals.append(ordinal)
+            counts[key] = ordinal + 1
+        return ordinals
+
+    def _filegroup_ordinals(self, folders: list[str]) -> list[int]:
+        """Ordinals within folder groups, matching ``group_files_by_folder``.
+
+        A folder group holds each path once, so a repeated path gets the
+        ordinal of its first occurrence.
+        """
+        counts: dict[str, int] = {}
+        first_seen: dict[str, int] = {}
+        ordinals: list[int] = []
+        for path, folder in zip(self._paths, folders, strict=True):
+            ordinal = first_seen.get(path)
+            if ordinal is None:
+                ordinal = counts.get(folder, 0)
+                counts[folder] = ordinal + 1
+                first_seen[path] = ordinal
+            ordinals.append(ordinal)
+        return ordinals
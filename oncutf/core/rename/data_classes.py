@@ -28,6 +28,8 @@ class PreviewResult:
         errors: Optional list of error messages captured during preview
             generation.
         timestamp: Time when preview was generated (for staleness checking).
+        cancelled: True if a newer preview request superseded this one; the
+            result is empty and should be discarded.
 
     """
 
@@ -35,6 +37,7 @@ class PreviewResult:
     has_changes: bool
     errors: list[str] | None = None
     timestamp: float = 0.0  # Unix timestamp
+    cancelled: bool = False
 
     def __post_init__(self) -> None:
         """Initialize default values for errors and timestamp."""
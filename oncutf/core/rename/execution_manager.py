@@ -206,8 +206,9 @@ class UnifiedExecutionManager:
                 return companion_items
 
             # Process each main file for companion renames
+            companion_index = CompanionFilesHelper.companion_index(folder_files)
             for file, new_name in zip(files, new_names, strict=False):
-                companions = CompanionFilesHelper.find_companion_files(file.full_path, folder_files)
+                companions = companion_index.companions_of(file.full_path)
 
                 if companions:
                     # Generate companion rename pairs
@@ -7,12 +7,26 @@ rename module type.  Both ``UnifiedPreviewManager`` (via ``NameComposer``)
 and the standalone helper functions use this registry instead of maintaining
 their own parallel dictionaries or ``if/elif`` chains.
 
+Batch contract
+--------------
+Every logic class provides ``apply_from_data(data, file_item, index,
+metadata_cache) -> str``.  A class may also provide the vectorized form::
+
+    apply_batch(data, file_items, indices, metadata_cache) -> list[str]
+
+which must return exactly
+``[apply_from_data(data, f, i, metadata_cache) for f, i in zip(file_items, indices)]``
+while parsing *data*, compiling patterns and creating helpers once per call.
+``get_batch_apply`` returns it when present; callers fall back to the
+per-file method otherwise.
+
 Author: Michael Economou
 Date: 2026-03-08
 """
 
 from __future__ import annotations
 
+from collections.abc import Callable, Sequence
 from typing import Any
 
 from oncutf.modules.logic.counter_logic import CounterLogic
@@ -30,7 +44,22 @@ MODULE_TYPE_MAP: dict[str, Any] = {
     "remove_text_from_original_name": TextRemovalLogic,
 }
 
+# Module types whose output depends only on their own configuration, not on
+# the file or its index; previews compute them once instead of per file.
+FILE_INDEPENDENT_MODULE_TYPES = frozenset({"specified_text"})
+
+
+# apply_batch(data, file_items, indices, metadata_cache) -> one part per file
+BatchApply = Callable[[dict[str, Any], Sequence[Any], Sequence[int], Any], list[str]]
+
 
 def get_logic_class(module_type: str) -> Any | None:
     """Return the logic class for *module_type*, or ``None`` if unknown."""
     return MODULE_TYPE_MAP.get(module_type)
+
+
+def get_batch_apply(module_type: str) -> BatchApply | None:
+    """Return the ``apply_batch`` of *module_type*'s logic class, if it has one."""
+    logic_class = MODULE_TYPE_MAP.get(module_type)
+    batch_apply: BatchApply | None = getattr(logic_class, "apply_batch", None)
+    return batch_apply
@@ -17,9 +17,16 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from oncutf.core.rename.parallel_preview import ParallelColumnRunner
+    from oncutf.core.rename.preview_memo import StageCache
     from oncutf.domain.models.file_item import FileItem
 
-from oncutf.core.rename.module_registry import get_logic_class
+from oncutf.core.rename.counter_scope_index import CounterScopeIndex
+from oncutf.core.rename.module_registry import (
+    FILE_INDEPENDENT_MODULE_TYPES,
+    get_batch_apply,
+    get_logic_class,
+)
 from oncutf.domain.models.counter_scope import CounterScope
 from oncutf.utils.logging.logger_factory import get_cached_logger
 
@@ -45,6 +52,8 @@ class NameComposer:
         file_item: FileItem,
         metadata_cache: dict[str, Any] | None = None,
         all_files: list[FileItem] | None = None,
+        scope_index: CounterScopeIndex | None = None,
+        stage_caches: list[StageCache | None] | None = None,
     ) -> str:
         """Apply rename modules and return the new basename (no extension).
 
@@ -54,25 +63,27 @@ class NameComposer:
             file_item: The file being renamed.
             metadata_cache: Optional metadata cache used by modules.
             all_files: Full list of files (needed for scope-aware counters).
+            scope_index: Precomputed counter-scope index over *all_files*.
+            stage_caches: Per-module memo caches aligned with *modules_data*
+                (see :class:`~oncutf.core.rename.preview_memo.PreviewMemo`).
 
         Returns:
             Concatenated name parts produced by each module.
 
         """
-        file_path_obj = Path(file_item.filename)
-        original_base_name = file_path_obj.stem
         new_name_parts: list[str] = []
 
-        for data in modules_data:
+        for position, data in enumerate(modules_data):
             module_type = data.get("type")
             part = self._apply_single_module(
                 module_type,
                 data,
                 file_item,
                 index,
-                original_base_name,
                 metadata_cache,
                 all_files,
+                scope_index,
+                stage_caches[position] if stage_caches else None,
             )
             new_name_parts.append(part)
 
@@ -87,6 +98,8 @@ class NameComposer:
         hash_availability: dict[str, bool],
         metadata_availability: dict[str, bool],
         all_files: list[FileItem] | None = None,
+        scope_index: CounterScopeIndex | None = None,
+        stage_caches: list[StageCache | None] | None = None,
     ) -> str:
         """Apply rename modules for a single file, checking required data.
 
@@ -94,18 +107,81 @@ class NameComposer:
         short-circuited and a sentinel string (e.g. ``"missing_hash"``)
         returned when preconditions are not met.
         """
-        for module_data in modules_data:
-            if module_data.get("type") == "metadata":
-                category = module_data.get("category")
-                if category == "tag":
-                    if not hash_availability.get(file.full_path, False):
-                        return "missing_hash"
-                elif category == "metadata_keys" and not metadata_availability.get(
-                    file.full_path, False
-                ):
-                    return "missing_metadata"
+        sentinel = self._missing_data_sentinel(
+            file, modules_data, hash_availability, metadata_availability
+        )
+        if sentinel is not None:
+            return sentinel
+
+        return self.compose_name(
+            modules_data, index, file, metadata_cache, all_files, scope_index, stage_caches
+        )
+
+    def compose_names(
+        self,
+        files: list[FileItem],
+        modules_data: list[dict[str, Any]],
+        metadata_cache: Any,
+        hash_availability: dict[str, bool],
+        metadata_availability: dict[str, bool],
+        scope_index: CounterScopeIndex | None = None,
+        stage_caches: list[StageCache | None] | None = None,
+        column_runner: ParallelColumnRunner | None = None,
+    ) -> list[str | None]:
+        """Column-wise :meth:`compose_name_with_context` over all *files*.
+
+        Each module runs once over the files that still need its part, through
+        the logic class's ``apply_batch`` when it has one (see
+        :mod:`~oncutf.core.rename.module_registry`), instead of once per file.
+
+        Args:
+            files: Files to compose names for (also the counter-scope list).
+            modules_data: Ordered list of module configuration dicts.
+            metadata_cache: Metadata cache used by modules.
+            hash_availability: Path -> whether a hash is cached.
+            metadata_availability: Path -> whether metadata is loaded.
+            scope_index: Counter-scope index over *files*; built if omitted.
+            stage_caches: Per-module memo caches aligned with *modules_data*.
+            column_runner: Runs the memo misses of each column (in parallel
+                for large columns); columns are computed here if omitted.
 
-        return self.compose_name(modules_data, index, file, metadata_cache, all_files)
+        Returns:
+            One composed name per file, or ``None`` where a module failed.
+
+        """
+        names: list[str | None] = [None] * len(files)
+        active: list[int] = []
+        for position, file_item in enumerate(files):
+            sentinel = self._missing_data_sentinel(
+                file_item, modules_data, hash_availability, metadata_availability
+            )
+            if sentinel is None:
+                active.append(position)
+            else:
+                names[position] = sentinel
+        if not active:
+            return names
+
+        if scope_index is None:
+            scope_index = CounterScopeIndex(files)
+        composed = dict.fromkeys(active, "")
+        failed: set[int] = set()
+
+        for module_position, data in enumerate(modules_data):
+            stage_cache = stage_caches[module_position] if stage_caches else None
+            parts = self._compose_column(
+                data, files, active, metadata_cache, scope_index, stage_cache, column_runner
+            )
+            for position, part in zip(active, parts, strict=True):
+                if part is None:
+                    failed.add(position)
+                else:
+                    composed[position] += part
+
+        for position in active:
+            if position not in failed:
+                names[position] = composed[position]
+        return names
 
     # ------------------------------------------------------------------
     # Filename helpers (pure functions, kept as methods for grouping)
@@ -134,6 +210,53 @@ class NameComposer:
         """Build final filename from *basename* and *extension*."""
         return f"{basename}{extension}" if extension else basename
 
+    @classmethod
+    def finalize_name(
+        cls,
+        new_fullname: str,
+        extension: str,
+        post_transform: dict[str, Any],
+        has_transform: bool,
+    ) -> str | None:
+        """Turn composed module output into the final filename.
+
+        Strips *extension*, applies the post-transform, validates and
+        re-attaches the extension.
+
+        Returns:
+            The final filename, or ``None`` if the basename is invalid.
+
+        """
+        new_basename = cls.strip_extension(new_fullname, extension)
+        new_basename = cls.apply_post_transform(new_basename, post_transform, has_transform)
+        if not cls.is_valid_filename_text(new_basename):
+            return None
+        return cls.build_final_filename(new_basename, extension)
+
+    @classmethod
+    def finalize_names(
+        cls,
+        new_fullnames: list[str],
+        extensions: list[str],
+        post_transform: dict[str, Any],
+        has_transform: bool,
+    ) -> list[str | None]:
+        """Batch form of :meth:`finalize_name`; the post-transform runs once per column."""
+        from oncutf.modules.name_transform_module import NameTransformModule
+
+        basenames = [
+            cls.strip_extension(fullname, extension)
+            for fullname, extension in zip(new_fullnames, extensions, strict=True)
+        ]
+        if has_transform:
+            basenames = NameTransformModule.apply_batch(post_transform, basenames)
+        return [
+            cls.build_final_filename(basename, extension)
+            if cls.is_valid_filename_text(basename)
+            else None
+            for basename, extension in zip(basenames, extensions, strict=True)
+        ]
+
     @staticmethod
     def is_valid_filename_text(basename: str) -> bool:
         """Return ``True`` if *basename* is acceptable for a filename."""
@@ -156,6 +279,7 @@ class NameComposer:
         global_index: int,
         file_item: FileItem,
         all_files: list[FileItem] | None = None,
+        scope_index: CounterScopeIndex | None = None,
     ) -> int:
         """Calculate the counter index adjusted for *scope*.
 
@@ -165,6 +289,8 @@ class NameComposer:
             global_index: Index in the full file list.
             file_item: Current file being processed.
             all_files: Full list of files.
+            scope_index: Precomputed index over *all_files*; when given, the
+                lookup is O(1) instead of a rescan of *all_files*.
 
         Returns:
             The scope-adjusted index.
@@ -179,6 +305,11 @@ class NameComposer:
         if scope_enum == CounterScope.GLOBAL:
             return global_index
 
+        if scope_index is not None and file_item:
+            scope_adjusted = scope_index.index_for(scope_enum, global_index, file_item)
+            if scope_adjusted is not None:
+                return scope_adjusted
+
         if scope_enum == CounterScope.PER_FOLDER:
             if not all_files or not file_item:
                 return global_index
@@ -222,29 +353,214 @@ class NameComposer:
     # Internal
     # ------------------------------------------------------------------
 
+    @staticmethod
+    def _missing_data_sentinel(
+        file_item: FileItem,
+        modules_data: list[dict[str, Any]],
+        hash_availability: dict[str, bool],
+        metadata_availability: dict[str, bool],
+    ) -> str | None:
+        """Return ``"missing_hash"``/``"missing_metadata"`` if a module lacks data."""
+        for module_data in modules_data:
+            if module_data.get("type") == "metadata":
+                category = module_data.get("category")
+                if category == "tag":
+                    if not hash_availability.get(file_item.full_path, False):
+                        return "missing_hash"
+                elif category == "metadata_keys" and not metadata_availability.get(
+                    file_item.full_path, False
+                ):
+                    return "missing_metadata"
+        return None
+
+    def _compose_column(
+        self,
+        data: dict[str, Any],
+        files: list[FileItem],
+        active: list[int],
+        metadata_cache: Any,
+        scope_index: CounterScopeIndex,
+        stage_cache: StageCache | None,
+        column_runner: ParallelColumnRunner | None = None,
+    ) -> list[str | None]:
+        """Return one module's part for each position in *active*.
+
+        Memo hits are reused; the misses are computed in one batch call, or
+        handed to *column_runner* when given.
+        """
+        module_type = data.get("type")
+
+        if module_type in FILE_INDEPENDENT_MODULE_TYPES:
+            part = stage_cache.get(("", 0)) if stage_cache is not None else None
+            if part is None:
+                part = self._compute_column(
+                    module_type, data, [files[active[0]]], [0], metadata_cache
+                )[0]
+                if part is not None and stage_cache is not None:
+                    stage_cache[("", 0)] = part
+            return [part] * len(active)
+
+        indices = self._module_indices(module_type, data, active, scope_index)
+        parts: list[str | None] = [None] * len(active)
+        misses: list[int] = []
+        for k, position in enumerate(active):
+            if stage_cache is not None:
+                cached = stage_cache.get((files[position].full_path, indices[k]))
+                if cached is not None:
+                    parts[k] = cached
+                    continue
+            misses.append(k)
+
+        if misses:
+            miss_files = [files[active[k]] for k in misses]
+            miss_indices = [indices[k] for k in misses]
+            if column_runner is None:
+                computed = self._compute_column(
+                    module_type, data, miss_files, miss_indices, metadata_cache
+                )
+            else:
+                computed = column_runner(
+                    self._compute_column,
+                    module_type,
+                    data,
+                    miss_files,
+                    miss_indices,
+                    metadata_cache,
+                )
+            for k, part in zip(misses, computed, strict=True):
+                parts[k] = part
+                if part is not None and stage_cache is not None:
+                    stage_cache[(files[active[k]].full_path, indices[k])] = part
+        return parts
+
+    @staticmethod
+    def _module_indices(
+        module_type: str | None,
+        data: dict[str, Any],
+        active: list[int],
+        scope_index: CounterScopeIndex,
+    ) -> list[int]:
+        """Return the index each file passes to the module (scope-adjusted for counters)."""
+        if module_type != "counter" or get_logic_class(module_type) is None:
+            return active
+
+        scope = data.get("scope", CounterScope.PER_FOLDER.value)
+        try:
+            scope_enum = CounterScope(scope)
+        except ValueError:
+            logger.warning("[NameComposer] Unknown counter scope: %s, using GLOBAL", scope)
+            return active
+        ordinals = scope_index.ordinals(scope_enum)
+        return [ordinals[position] for position in active]
+
+    def _compute_column(
+        self,
+        module_type: str | None,
+        data: dict[str, Any],
+        file_items: list[FileItem],
+        indices: list[int],
+        metadata_cache: Any,
+    ) -> list[str | None]:
+        """Run one module over *file_items* (no caching).
+
+        Uses ``apply_batch`` when available; if it is missing or raises, each
+        file is computed on its own and failures are reported as ``None``.
+        """
+        if module_type == "original_name":
+            return [Path(f.filename).stem or "originalname" for f in file_items]
+
+        batch_apply = get_batch_apply(module_type) if module_type else None
+        if batch_apply is not None:
+            try:
+                results = batch_apply(data, file_items, indices, metadata_cache)
+            except Exception:
+                logger.warning(
+                    "[NameComposer] Batch %s failed, retrying per file",
+                    module_type,
+                    exc_info=True,
+                )
+            else:
+                if module_type == "remove_text_from_original_name":
+                    return [Path(result).stem for result in results]
+                return list(results)
+
+        logic_class = get_logic_class(module_type) if module_type else None
+        parts: list[str | None] = []
+        for file_item, index in zip(file_items, indices, strict=True):
+            try:
+                parts.append(
+                    self._compute_part(
+                        module_type, logic_class, data, file_item, index, metadata_cache
+                    )
+                )
+            except Exception:
+                logger.warning(
+                    "Failed to generate preview for %s",
+                    file_item.filename,
+                    exc_info=True,
+                )
+                parts.append(None)
+        return parts
+
     def _apply_single_module(
         self,
         module_type: str | None,
         data: dict[str, Any],
         file_item: FileItem,
         index: int,
-        original_base_name: str,
         metadata_cache: dict[str, Any] | None,
         all_files: list[FileItem] | None,
+        scope_index: CounterScopeIndex | None = None,
+        stage_cache: StageCache | None = None,
     ) -> str:
-        """Dispatch a single module and return its name fragment."""
+        """Dispatch a single module and return its name fragment.
+
+        With a *stage_cache*, the fragment is looked up by file path and the
+        index the module sees (or once for all files, for file-independent
+        modules), and computed only on a miss.
+        """
         logic_class = get_logic_class(module_type) if module_type else None
 
+        module_index = index
         if module_type == "counter" and logic_class is not None:
             scope = data.get("scope", CounterScope.PER_FOLDER.value)
-            counter_index = self.calculate_scope_aware_index(scope, index, file_item, all_files)
-            result: str = logic_class.apply_from_data(
-                data, file_item, counter_index, metadata_cache
+            module_index = self.calculate_scope_aware_index(
+                scope, index, file_item, all_files, scope_index
             )
-            return result
 
+        if module_type in FILE_INDEPENDENT_MODULE_TYPES:
+            key = ("", 0)
+        else:
+            key = (file_item.full_path, module_index)
+        if stage_cache is not None:
+            cached = stage_cache.get(key)
+            if cached is not None:
+                return cached
+
+        part = self._compute_part(
+            module_type,
+            logic_class,
+            data,
+            file_item,
+            module_index,
+            metadata_cache,
+        )
+        if stage_cache is not None:
+            stage_cache[key] = part
+        return part
+
+    @staticmethod
+    def _compute_part(
+        module_type: str | None,
+        logic_class: Any | None,
+        data: dict[str, Any],
+        file_item: FileItem,
+        index: int,
+        metadata_cache: dict[str, Any] | None,
+    ) -> str:
+        """Run one module for one file (no caching)."""
         if module_type == "original_name":
-            return original_base_name or "originalname"
+            return Path(file_item.filename).stem or "originalname"
 
         if module_type == "remove_text_from_original_name" and logic_class is not None:
             result_filename: str = logic_class.apply_from_data(
@@ -0,0 +1,310 @@
+"""oncutf.core.rename.parallel_preview.
+
+Chunked parallel computation of preview module columns.
+
+Once counter indices are known, a module's part for one file does not depend
+on any other file, so a column (one module over many files) can be split
+into chunks and computed in worker processes. ``ParallelColumnRunner`` does
+that for :meth:`NameComposer.compose_names`:
+
+- one pool of spawned worker processes is started on first use and shared by
+  every later preview, so the GUI process is never forked and workers start
+  once; each chunk carries its files (without their metadata dicts), the
+  module config and the metadata it needs
+- columns that are cheaper than the round trip (counters, original name) and
+  columns that need the database (hash tags) stay in this process
+- metadata is read from the cache in this process and handed to workers as a
+  ``MetadataSnapshot``; workers never open the database
+- while waiting, the runner calls an idle callback (the preview manager
+  processes UI events there, so the GUI thread stays responsive) and polls a
+  cancellation check; when a newer preview supersedes this one the column is
+  abandoned: chunks not yet started are dropped and the workers only finish
+  the chunk they are running
+
+Author: Michael Economou
+Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+import copy
+import multiprocessing
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import TYPE_CHECKING, Any
+
+from oncutf.config import (
+    PARALLEL_PREVIEW_CHUNK_SIZE,
+    PARALLEL_PREVIEW_MAX_WORKERS,
+    PARALLEL_PREVIEW_MIN_FILES,
+)
+from oncutf.utils.logging.logger_factory import get_cached_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from oncutf.domain.models.file_item import FileItem
+    from oncutf.modules.metadata_module import MetadataSnapshot
+
+logger = get_cached_logger(__name__)
+
+# Modules whose per-file work costs less than shipping the part back
+_SERIAL_MODULE_TYPES = frozenset({"counter", "original_name"})
+
+# Seconds between cancellation checks (and idle callbacks) while waiting for chunks
+_CANCEL_POLL_INTERVAL = 0.05
+
+# Worker processes shared by all previews, started on first use
+_executor: ProcessPoolExecutor | None = None
+_executor_workers = 0
+_executor_lock = threading.Lock()
+
+
+class PreviewCancelledError(Exception):
+    """Raised when a newer preview request supersedes a running one."""
+
+
+def _compute_chunk(
+    compute_column: Callable[..., list[str | None]],
+    module_type: str,
+    logic_class: Any,
+    data: dict[str, Any],
+    file_items: list[FileItem],
+    indices: list[int],
+    metadata_cache: MetadataSnapshot,
+) -> list[str | None]:
+    """Worker-process entry point: compute one chunk of a column."""
+    from oncutf.core.rename.module_registry import MODULE_TYPE_MAP
+
+    # Modules registered at runtime are missing from a spawned worker's registry
+    MODULE_TYPE_MAP.setdefault(module_type, logic_class)
+    return compute_column(module_type, data, file_items, indices, metadata_cache)
+
+
+def _get_executor(workers: int) -> ProcessPoolExecutor:
+    """Return the shared pool, starting it (or resizing it) if needed."""
+    global _executor, _executor_workers
+    with _executor_lock:
+        if _executor is None or _executor_workers != workers:
+            if _executor is not None:
+                _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            )
+            _executor_workers = workers
+            logger.info("[ParallelColumnRunner] Started %d preview worker processes", workers)
+        return _executor
+
+
+def _discard_executor(executor: ProcessPoolExecutor) -> None:
+    """Drop a broken pool so the next column starts a new one."""
+    global _executor
+    with _executor_lock:
+        if _executor is executor:
+            _executor = None
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_preview_pool() -> None:
+    """Stop the shared preview worker processes, if started."""
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=True, cancel_futures=True)
+        logger.info("[ParallelColumnRunner] Preview worker processes stopped")
+
+
+def _without_metadata(file_items: list[FileItem]) -> list[FileItem]:
+    """Return shallow copies of *file_items* without their metadata dicts.
+
+    Modules read metadata from the snapshot, so the dicts would only make
+    every chunk larger to send.
+    """
+    copies = []
+    for item in file_items:
+        item_copy = copy.copy(item)
+        item_copy.metadata = None  # type: ignore[assignment]
+        copies.append(item_copy)
+    return copies
+
+
+class ParallelColumnRunner:
+    """Compute large module columns in the shared preview process pool.
+
+    Instances are callables with the signature of
+    :meth:`NameComposer._compute_column` plus a fallback; columns that should
+    not run in parallel are passed to the fallback unchanged.
+    """
+
+    def __init__(
+        self,
+        min_files: int | None = PARALLEL_PREVIEW_MIN_FILES,
+        max_workers: int | None = PARALLEL_PREVIEW_MAX_WORKERS,
+        chunk_size: int = PARALLEL_PREVIEW_CHUNK_SIZE,
+        cancellation_check: Callable[[], bool] | None = None,
+        idle: Callable[[], None] | None = None,
+    ) -> None:
+        """Configure the runner.
+
+        Args:
+            min_files: Smallest column run in parallel; None or 0 disables it
+            max_workers: Worker processes; None uses the CPU count
+            chunk_size: Files per chunk sent to a worker
+            cancellation_check: Optional callable returning True to abort
+            idle: Optional callable run between polls (e.g. to process UI events)
+
+        """
+        self._min_files = min_files or 0
+        self._max_workers = max_workers or os.cpu_count() or 1
+        self._chunk_size = max(1, chunk_size)
+        self._cancellation_check = cancellation_check
+        self._idle = idle
+
+    @staticmethod
+    def is_available() -> bool:
+        """Return True if worker processes can be spawned on this platform."""
+        return "spawn" in multiprocessing.get_all_start_methods()
+
+    def is_enabled(self, file_count: int) -> bool:
+        """Return True if a column of *file_count* files may run in parallel."""
+        return (
+            bool(self._min_files)
+            and file_count >= self._min_files
+            and self._max_workers > 1
+            and self.is_available()
+        )
+
+    def __call__(
+        self,
+        compute_column: Callable[..., list[str | None]],
+        module_type: str | None,
+        data: dict[str, Any],
+        file_items: list[FileItem],
+        indices: list[int],
+        metadata_cache: Any,
+    ) -> list[str | None]:
+        """Compute one column, in parallel when it is large enough.
+
+        Args:
+            compute_column: Serial column function (also run by the workers)
+            module_type: Module type of the column
+            data: Module configuration
+            file_items: Files that need this module's part
+            indices: Index passed to the module for each file
+            metadata_cache: Metadata cache used by modules
+
+        Returns:
+            One part per file, ``None`` where the module failed
+
+        Raises:
+            PreviewCancelledError: If the cancellation check fired
+
+        """
+        if (
+            not module_type
+            or module_type in _SERIAL_MODULE_TYPES
+            or not self.is_enabled(len(file_items))
+        ):
+            return compute_column(module_type, data, file_items, indices, metadata_cache)
+
+        if module_type == "metadata" and data.get("category", "file_dates") == "tag":
+            # Hash tags read the database
+            return compute_column(module_type, data, file_items, indices, metadata_cache)
+
+        try:
+            return self._run(compute_column, module_type, data, file_items, indices, metadata_cache)
+        except PreviewCancelledError:
+            raise
+        except Exception:
+            logger.warning(
+                "[ParallelColumnRunner] Parallel %s column failed, computing serially",
+                module_type,
+                exc_info=True,
+            )
+            return compute_column(module_type, data, file_items, indices, metadata_cache)
+
+    def _run(
+        self,
+        compute_column: Callable[..., list[str | None]],
+        module_type: str,
+        data: dict[str, Any],
+        file_items: list[FileItem],
+        indices: list[int],
+        metadata_cache: Any,
+    ) -> list[str | None]:
+        from oncutf.core.rename.module_registry import get_logic_class
+
+        bounds = [
+            (start, min(start + self._chunk_size, len(file_items)))
+            for start in range(0, len(file_items), self._chunk_size)
+        ]
+        workers = min(self._max_workers, len(bounds))
+        executor = _get_executor(self._max_workers)
+        logic_class = get_logic_class(module_type)
+        futures = [
+            executor.submit(
+                _compute_chunk,
+                compute_column,
+                module_type,
+                logic_class,
+                data,
+                _without_metadata(file_items[start:stop]),
+                indices[start:stop],
+                self._metadata_snapshot(module_type, data, file_items[start:stop], metadata_cache),
+            )
+            for start, stop in bounds
+        ]
+        try:
+            pending = set(futures)
+            while pending:
+                if self._cancellation_check and self._cancellation_check():
+                    raise PreviewCancelledError(module_type)
+                _, pending = wait(
+                    pending, timeout=_CANCEL_POLL_INTERVAL, return_when=FIRST_COMPLETED
+                )
+                if pending and self._idle:
+                    self._idle()
+
+            parts: list[str | None] = []
+            for future in futures:
+                parts.extend(future.result())
+        except BrokenProcessPool:
+            _discard_executor(executor)
+            raise
+        finally:
+            # Drop the chunks no worker has started (cancellation or failure);
+            # running ones finish and are discarded
+            for future in futures:
+                future.cancel()
+
+        logger.debug(
+            "[ParallelColumnRunner] %s: %d files in %d chunks on %d processes",
+            module_type,
+            len(file_items),
+            len(bounds),
+            workers,
+            extra={"dev_only": True},
+        )
+        return parts
+
+    @staticmethod
+    def _metadata_snapshot(
+        module_type: str, data: dict[str, Any], file_items: list[FileItem], metadata_cache: Any
+    ) -> MetadataSnapshot:
+        """Read what a chunk needs from the metadata cache in this process.
+
+        Returns:
+            The snapshot the worker uses as its metadata cache (empty unless
+            the column shows metadata keys)
+
+        """
+        from oncutf.modules.metadata_module import MetadataModule, MetadataSnapshot
+
+        if module_type != "metadata" or data.get("category", "file_dates") != "metadata_keys":
+            # Other modules and file dates (from stat()) only need to be kept
+            # away from the persistent cache
+            return MetadataSnapshot()
+        return MetadataModule.snapshot(file_items, metadata_cache)
@@ -27,6 +27,8 @@ if TYPE_CHECKING:
 
 from oncutf.core.rename.data_classes import PreviewResult
 from oncutf.core.rename.name_composer import NameComposer
+from oncutf.core.rename.parallel_preview import ParallelColumnRunner, PreviewCancelledError
+from oncutf.core.rename.preview_memo import PreviewMemo
 from oncutf.utils.logging.logger_factory import get_cached_logger
 
 logger = get_cached_logger(__name__)
@@ -38,6 +40,11 @@ class UnifiedPreviewManager:
     Responsibilities:
         - Use ``BatchQueryManager`` to supply availability hints.
         - Cache results to reduce repeated computation during UI edits.
+        - Memoize per-file, per-module results (:class:`PreviewMemo`) so an
+          edit to one module only recomputes that module's parts.
+        - Compute large module columns in worker processes
+          (:class:`ParallelColumnRunner`), processing UI events while they
+          run and abandoning a preview as soon as a newer one is requested.
         - Delegate name composition to :class:`NameComposer`.
     """
 
@@ -46,6 +53,13 @@ class UnifiedPreviewManager:
         self.batch_query_manager = batch_query_manager
         self.cache_manager = cache_manager
         self._composer = NameComposer()
+        self._memo = PreviewMemo()
+        # Bumped by every preview request; a running preview whose number is
+        # no longer current has been superseded and stops at the next check
+        self._generation = 0
+        # True while UI events are processed for a running preview; a preview
+        # requested from one of those events runs without processing events
+        self._processing_events = False
 
     def generate_preview(
         self,
@@ -65,9 +79,14 @@ class UnifiedPreviewManager:
 
         Returns:
             A :class:`PreviewResult` containing proposed names and a flag
-            indicating whether any change is present.
+            indicating whether any change is present. If a newer request
+            superseded this one while it ran, the result is empty and
+            ``cancelled`` is set.
 
         """
+        self._generation += 1
+        generation = self._generation
+
         if not files:
             return PreviewResult([], False)
 
@@ -86,14 +105,26 @@ class UnifiedPreviewManager:
 
         # Generate preview
         start_time = time.time()
-        name_pairs = self._generate_name_pairs(
-            files,
-            modules_data,
-            post_transform,
-            metadata_cache,
-            hash_availability,
-            metadata_availability,
-        )
+        try:
+            name_pairs = self._generate_name_pairs(
+                files,
+                modules_data,
+                post_transform,
+                metadata_cache,
+                hash_availability,
+                metadata_availability,
+                ParallelColumnRunner(
+                    cancellation_check=lambda: generation != self._generation,
+                    idle=self._process_events,
+                ),
+            )
+        except PreviewCancelledError:
+            logger.debug(
+                "[UnifiedPreviewManager] Preview of %d files superseded",
+                len(files),
+                extra={"dev_only": True},
+            )
+            return PreviewResult([], False, cancelled=True)
 
         # Check for changes
         has_changes = any(old_name != new_name for old_name, new_name in name_pairs)
@@ -114,6 +145,30 @@ class UnifiedPreviewManager:
 
         return result
 
+    def cancel_preview(self) -> None:
+        """Stop the running preview at its next check.
+
+        Called when new rename data or a new selection arrives, usually from a
+        UI event processed while the running preview waits for its workers.
+        """
+        self._generation += 1
+
+    def _process_events(self) -> None:
+        """Process pending UI events while a parallel column is computed.
+
+        Not re-entrant: a preview started from one of these events does not
+        process events itself, so previews never nest more than one level.
+        """
+        if self._processing_events:
+            return
+        from oncutf.app.services.ui_events import process_events
+
+        self._processing_events = True
+        try:
+            process_events()
+        finally:
+            self._processing_events = False
+
     def _generate_cache_key(
         self,
         files: list[FileItem],
@@ -145,23 +200,99 @@ class UnifiedPreviewManager:
         metadata_cache: Any,
         hash_availability: dict[str, bool],
         metadata_availability: dict[str, bool],
+        column_runner: ParallelColumnRunner | None = None,
     ) -> list[tuple[str, str]]:
         """Produce (old_name, new_name) tuples for each file.
 
         Delegates name composition to :class:`NameComposer` while keeping
         availability checks, post-transform, validation and error handling
-        in this orchestration layer.
+        in this orchestration layer. Names are composed column-wise (one
+        batch call per module, large columns through *column_runner*); if
+        that fails unexpectedly, the per-file path is used instead.
+
+        Raises:
+            PreviewCancelledError: If *column_runner* was cancelled.
+
         """
         from oncutf.modules.name_transform_module import NameTransformModule
 
+        has_name_transform = NameTransformModule.is_effective_data(post_transform)
+        # Built once per file list so scoped counters avoid rescanning `files`
+        scope_index = self._memo.scope_index(files)
+        stage_caches = self._memo.stage_caches(modules_data, len(files))
+        final_cache = self._memo.final_cache(post_transform, len(files))
+
+        try:
+            new_fullnames = self._composer.compose_names(
+                files,
+                modules_data,
+                metadata_cache,
+                hash_availability,
+                metadata_availability,
+                scope_index=scope_index,
+                stage_caches=stage_caches,
+                column_runner=column_runner,
+            )
+        except PreviewCancelledError:
+            raise
+        except Exception:
+            logger.exception(
+                "[UnifiedPreviewManager] Batch composition failed, using per-file path"
+            )
+            return self._generate_name_pairs_per_file(
+                files,
+                modules_data,
+                post_transform,
+                metadata_cache,
+                hash_availability,
+                metadata_availability,
+            )
+
+        extensions = scope_index.extensions()
+
+        # Strip extension, post-transform and validate, memoized per composed
+        # name (unchanged parts give unchanged names); misses run as one batch
+        pending = {
+            (fullname, extension)
+            for fullname, extension in zip(new_fullnames, extensions, strict=True)
+            if fullname is not None and (fullname, extension) not in final_cache
+        }
+        if pending:
+            keys = list(pending)
+            finals = self._composer.finalize_names(
+                [fullname for fullname, _ in keys],
+                [extension for _, extension in keys],
+                post_transform,
+                has_name_transform,
+            )
+            final_cache.update(zip(keys, finals, strict=True))
+
+        name_pairs: list[tuple[str, str]] = []
+        for file, fullname, extension in zip(files, new_fullnames, extensions, strict=True):
+            new_name = None if fullname is None else final_cache[(fullname, extension)]
+            name_pairs.append((file.filename, file.filename if new_name is None else new_name))
+        return name_pairs
+
+    def _generate_name_pairs_per_file(
+        self,
+        files: list[FileItem],
+        modules_data: list[dict[str, Any]],
+        post_transform: dict[str, Any],
+        metadata_cache: Any,
+        hash_availability: dict[str, bool],
+        metadata_availability: dict[str, bool],
+    ) -> list[tuple[str, str]]:
+        """Per-file fallback for :meth:`_generate_name_pairs` (no memoization)."""
+        from oncutf.modules.name_transform_module import NameTransformModule
+
         name_pairs: list[tuple[str, str]] = []
         has_name_transform = NameTransformModule.is_effective_data(post_transform)
         composer = self._composer
+        scope_index = self._memo.scope_index(files)
 
         for idx, file in enumerate(files):
             try:
-                file_path_obj = Path(file.filename)
-                extension = file_path_obj.suffix
+                extension = Path(file.filename).suffix
 
                 # Apply modules with availability context
                 new_fullname = composer.compose_name_with_context(
@@ -172,24 +303,12 @@ class UnifiedPreviewManager:
                     hash_availability,
                     metadata_availability,
                     all_files=files,
+                    scope_index=scope_index,
                 )
-
-                # Strip extension from generated fullname
-                new_basename = composer.strip_extension(new_fullname, extension)
-
-                # Apply post-transform if configured
-                new_basename = composer.apply_post_transform(
-                    new_basename, post_transform, has_name_transform
+                new_name = composer.finalize_name(
+                    new_fullname, extension, post_transform, has_name_transform
                 )
-
-                # Validate basename
-                if not composer.is_valid_filename_text(new_basename):
-                    name_pairs.append((file.filename, file.filename))
-                    continue
-
-                # Build final filename
-                new_name = composer.build_final_filename(new_basename, extension)
-                name_pairs.append((file.filename, new_name))
+                name_pairs.append((file.filename, file.filename if new_name is None else new_name))
 
             except Exception:
                 logger.warning(
@@ -0,0 +1,132 @@
+"""oncutf.core.rename.preview_memo.
+
+Memoization of per-file preview results across preview runs.
+
+A preview name is the concatenation of one part per rename module, followed
+by the post-transform stage. Each part depends only on the module's own
+configuration, the file and its (scope-adjusted) index, so when the user
+edits one module only that module's parts need recomputing; the other
+modules' parts, and the post-transform of unchanged names, are reused.
+
+``PreviewMemo`` keeps:
+
+- one *stage cache* per module configuration, mapping ``(full_path, index)``
+  to the part that module produced
+- one *final cache* per post-transform configuration, mapping the composed
+  ``(fullname, extension)`` to the final filename
+- the counter-scope index of the last file list, reused while the selection
+  stays the same
+
+Metadata modules read the metadata cache, which fills in while the user
+works, so their parts are never memoized.
+
+Author: Michael Economou
+Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+import json
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+from oncutf.config import PREVIEW_MEMO_MAX_STAGES
+from oncutf.core.rename.counter_scope_index import CounterScopeIndex
+
+if TYPE_CHECKING:
+    from oncutf.domain.models.file_item import FileItem
+
+# (full_path, index passed to the module) -> name part
+StageCache = dict[tuple[str, int], str]
+# (composed fullname, extension) -> final filename, None if invalid
+FinalCache = dict[tuple[str, str], str | None]
+
+# Module types whose output depends on more than (config, file, index)
+_UNCACHEABLE_MODULE_TYPES = frozenset({"metadata"})
+
+# A cache holding more than this many entries per previewed file mostly holds
+# names from earlier edits or deselected files; it is emptied and refilled
+_STALE_ENTRIES_FACTOR = 4
+
+
+def _fingerprint(data: Any) -> str:
+    """Return a stable string key for a module or post-transform config."""
+    try:
+        return json.dumps(data, sort_keys=True, default=str)
+    except (TypeError, ValueError):
+        return str(data)
+
+
+class PreviewMemo:
+    """Per-file, per-module result cache shared by successive previews."""
+
+    def __init__(self, max_stages: int = PREVIEW_MEMO_MAX_STAGES) -> None:
+        """Create an empty memo keeping at most *max_stages* module configs."""
+        self._max_stages = max_stages
+        self._stages: OrderedDict[str, StageCache] = OrderedDict()
+        self._finals: OrderedDict[str, FinalCache] = OrderedDict()
+        self._scope_index: CounterScopeIndex | None = None
+
+    def stage_caches(
+        self, modules_data: list[dict[str, Any]], file_count: int
+    ) -> list[StageCache | None]:
+        """Return the stage cache for each module, aligned with *modules_data*.
+
+        Entries are ``None`` for modules whose parts must not be memoized.
+        """
+        caches: list[StageCache | None] = []
+        limit = self._entry_limit(file_count)
+        for data in modules_data:
+            if data.get("type") in _UNCACHEABLE_MODULE_TYPES:
+                caches.append(None)
+                continue
+            # Position is part of the key: the same config in two slots is
+            # cheap to compute twice and keeps slot edits independent
+            cache = self._get_or_create(self._stages, f"{len(caches)}:{_fingerprint(data)}")
+            if len(cache) > limit:
+                cache.clear()
+            caches.append(cache)
+        return caches
+
+    def final_cache(self, post_transform: dict[str, Any], file_count: int) -> FinalCache:
+        """Return the post-transform stage cache for *post_transform*."""
+        cache = self._get_or_create(self._finals, _fingerprint(post_transform))
+        if len(cache) > self._entry_limit(file_count):
+            cache.clear()
+        return cache
+
+    def scope_index(self, files: list[FileItem]) -> CounterScopeIndex:
+        """Return a counter-scope index for *files*, reusing the last one if it matches."""
+        if self._scope_index is None or not self._scope_index.matches(files):
+            self._scope_index = CounterScopeIndex(files)
+        return self._scope_index
+
+    def clear(self) -> None:
+        """Drop all memoized results (e.g. after a rename or metadata reload)."""
+        self._stages.clear()
+        self._finals.clear()
+        self._scope_index = None
+
+    def get_stats(self) -> dict[str, int]:
+        """Return memo sizes for diagnostics."""
+        return {
+            "stage_count": len(self._stages),
+            "stage_entries": sum(len(cache) for cache in self._stages.values()),
+            "final_count": len(self._finals),
+        }
+
+    @staticmethod
+    def _entry_limit(file_count: int) -> int:
+        return _STALE_ENTRIES_FACTOR * max(file_count, 256)
+
+    def _get_or_create(
+        self, caches: OrderedDict[str, dict[tuple[str, Any], Any]], key: str
+    ) -> dict[tuple[str, Any], Any]:
+        cache = caches.get(key)
+        if cache is None:
+            cache = caches[key] = {}
+            while len(caches) > self._max_stages:
+                caches.popitem(last=False)
+        else:
+            caches.move_to_end(key)
+        return cache
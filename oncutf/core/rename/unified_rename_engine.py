@@ -105,6 +105,9 @@ class UnifiedRenameEngine:
         result = self.preview_manager.generate_preview(
             files, modules_data, post_transform, metadata_cache
         )
+        if result.cancelled:
+            # Superseded by a newer request, which updates the state itself
+            return result
 
         # Update state
         new_state = RenameState(
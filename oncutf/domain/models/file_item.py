@@ -14,6 +14,7 @@ Classes:
 
 import logging
 import os
+import sys
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
@@ -27,30 +28,58 @@ logger = logging.getLogger(__name__)
 class FileItem:
     """Represents a file in the application.
     Stores file metadata and handles file operations.
+
+    A folder load can hold hundreds of thousands of items, so the class uses
+    ``__slots__`` and keeps the per-item footprint small:
+
+    - ``full_path`` is stored as an interned folder (shared by every file in
+      the folder) plus the file name, and joined on access
+    - extensions are interned
+    - ``modified`` is kept as the POSIX timestamp it was read as and only
+      turned into a datetime when accessed (``mtime`` returns the float)
+    - the ``metadata`` dict is created on first access
+
+    ``path`` and ``name`` remain as aliases of ``full_path`` and ``filename``.
+    Optional attributes set by callers (e.g. a video ``duration``) still work:
+    they go to an instance dict that is only allocated when first used.
     """
 
-    def __init__(self, path: str, extension: str, modified: datetime):
+    __slots__ = (
+        "__dict__",
+        "_folder",
+        "_metadata",
+        "_modified",
+        "_name",
+        "checked",
+        "color",
+        "extension",
+        "file_missing",
+        "filename",
+        "hash_value",
+        "metadata_status",
+        "pre_rename_name",
+        "rename_dirty",
+        "size",
+    )
+
+    def __init__(self, path: str, extension: str, modified: datetime | float | None):
         """Initialize a FileItem instance.
 
         Args:
             path: Full absolute path to the file
             extension: File extension without leading dot (e.g., 'jpg', 'png')
-            modified: Last modification datetime of the file
+            modified: Last modification datetime of the file (or POSIX timestamp)
 
         """
-        self.full_path = path  # Full absolute path
-        self.path = path  # Keep for compatibility
-        self.extension = extension
-        self.modified = modified
-        self.filename = Path(path).name  # Just the filename
-        self.name = self.filename  # Keep for compatibility
+        self.full_path = path  # Full absolute path (stored as folder + name)
+        self.extension = sys.intern(extension) if extension else extension
+        self._modified = modified
+        self.filename = self._name or Path(path).name  # Just the filename
         self.size = 0  # Will be updated later if needed
-        self.metadata: dict[str, Any] = {}  # Will store file metadata
-        self.metadata_status = (
-            "none"  # Track metadata loading status: "none", "loaded", "modified"
-        )
+        self._metadata: dict[str, Any] | None = None  # File metadata, created on first access
+        self.metadata_status = "none"  # Track metadata loading status: "none", "loaded", "modified"
         self.checked = False  # Selection state for UI
-        self.hash_value: str | None = None  # SHA256 hash for file integrity
+        self.hash_value: str | None = None  # Cached CRC32 checksum (hex), if computed
 
         # Color tag (hex color or "none")
         # NOTE: Color loading moved to external repository to break models→core cycle
@@ -65,6 +94,66 @@ class FileItem:
         # Used to visually mark unreachable files with a red text color in all views
         self.file_missing: bool = False
 
+    @property
+    def full_path(self) -> str:
+        """Full absolute path to the file."""
+        return self._folder + self._name
+
+    @full_path.setter
+    def full_path(self, path: str) -> None:
+        # Split after the last separator; the folder part is shared between items
+        split = max(path.rfind("/"), path.rfind(os.sep)) + 1
+        self._folder = sys.intern(path[:split])
+        self._name = path[split:]
+
+    # Keep for compatibility
+    path = full_path
+
+    @property
+    def name(self) -> str:
+        """Alias of ``filename`` (kept for compatibility)."""
+        return self.filename
+
+    @name.setter
+    def name(self, value: str) -> None:
+        self.filename = value
+
+    @property
+    def modified(self) -> datetime | None:
+        """Last modification time as a local datetime (converted on access)."""
+        modified = self._modified
+        if isinstance(modified, (int, float)):
+            try:
+                return datetime.fromtimestamp(modified, tz=UTC).astimezone()
+            except (OSError, OverflowError, ValueError):
+                return datetime.fromtimestamp(0, tz=UTC).astimezone()
+        return modified
+
+    @modified.setter
+    def modified(self, value: datetime | float | None) -> None:
+        self._modified = value
+
+    @property
+    def mtime(self) -> float:
+        """Last modification time as a POSIX timestamp (0.0 if unknown)."""
+        modified = self._modified
+        if isinstance(modified, (int, float)):
+            return float(modified)
+        if isinstance(modified, datetime):
+            return modified.timestamp()
+        return 0.0
+
+    @property
+    def metadata(self) -> dict[str, Any]:
+        """File metadata (created empty on first access)."""
+        if self._metadata is None:
+            self._metadata = {}
+        return self._metadata
+
+    @metadata.setter
+    def metadata(self, value: dict[str, Any]) -> None:
+        self._metadata = value
+
     def __str__(self) -> str:
         """Return simple string representation with filename only."""
         return f"FileItem({self.filename})"
@@ -84,22 +173,32 @@ class FileItem:
             FileItem instance with auto-detected properties
 
         """
-        filename = Path(file_path).name
-        extension = Path(filename).suffix[1:].lower() if Path(filename).suffix else ""
-
-        # Get modification time
+        # One stat for both modification time and size
         try:
-            mtime = Path(file_path).stat().st_mtime
-            modified = datetime.fromtimestamp(mtime, tz=UTC).astimezone()
+            st = Path(file_path).stat()
         except (OSError, ValueError):
-            modified = datetime.fromtimestamp(0, tz=UTC).astimezone()
+            return cls.from_stat(file_path, 0, 0)
+        return cls.from_stat(file_path, st.st_size, st.st_mtime)
 
-        # Create the instance
-        instance = cls(file_path, extension, modified)
+    @classmethod
+    def from_stat(cls, file_path: str, size: int, mtime: float) -> "FileItem":
+        """Create a FileItem from an already known size and mtime (no filesystem access).
+
+        Args:
+            file_path: Full path to the file
+            size: File size in bytes
+            mtime: Modification time as a POSIX timestamp
 
-        # Calculate and set the file size
-        instance.size = instance._detect_size()
+        Returns:
+            FileItem instance
+
+        """
+        suffix = Path(file_path).suffix
+        extension = suffix[1:].lower() if suffix else ""
 
+        # The timestamp is turned into a datetime only when displayed
+        instance = cls(file_path, extension, mtime)
+        instance.size = size
         return instance
 
     @property
@@ -110,7 +209,7 @@ class FileItem:
             True if metadata dict exists and is non-empty
 
         """
-        result = bool(self.metadata)
+        result = bool(self._metadata)
         logger.debug(
             "[DEBUG] has_metadata for %s: %s",
             self.filename,
@@ -9,8 +9,10 @@ database queries, cache operations, and file I/O operations.
 Modules:
     operations_manager: BatchOperationsManager for grouping similar operations
     processor: BatchProcessor for parallel batch processing
+    hash_batch_writer: HashBatchWriter single-writer sink for hash results
 """
 
+from oncutf.infra.batch.hash_batch_writer import HashBatchWriter
 from oncutf.infra.batch.operations_manager import (
     BatchOperation,
     BatchOperationsManager,
@@ -28,5 +30,6 @@ __all__ = [
     "BatchProcessor",
     "BatchProcessorFactory",
     "BatchStats",
+    "HashBatchWriter",
     "get_batch_manager",
 ]
@@ -0,0 +1,173 @@
+"""Module: hash_batch_writer.py.
+
+Author: Michael Economou
+Date: 2026-10-16
+
+Single-writer sink that group-commits hash results.
+
+Hash workers push HashRecord results onto a queue from any thread; one
+background writer thread drains the queue and persists them through a bulk
+store callable (e.g. PersistentHashCache.store_hashes_batch) every N records
+or T milliseconds, whichever comes first. This turns one SQLite commit per
+file into one commit per batch, so parallel hashing is no longer serialized
+on commit latency.
+
+Usage:
+    writer = HashBatchWriter(hash_cache.store_hashes_batch)
+    writer.start()
+    writer.submit(HashRecord(path, hash_value, "CRC32", signature))
+    ...
+    written = writer.close()  # flushes remaining records
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from typing import TYPE_CHECKING
+
+from oncutf.utils.logging.logger_factory import get_cached_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from oncutf.infra.db.hash_store import HashRecord
+
+logger = get_cached_logger(__name__)
+
+
+class HashBatchWriter:
+    """Background writer that persists queued hash records in batches."""
+
+    def __init__(
+        self,
+        store_batch: Callable[[list[HashRecord]], int],
+        max_batch_size: int = 500,
+        max_batch_age_ms: int = 250,
+    ) -> None:
+        """Initialize the writer.
+
+        Args:
+            store_batch: Callable persisting a list of records in one transaction,
+                returning the number written
+            max_batch_size: Flush once this many records are pending
+            max_batch_age_ms: Flush once the oldest pending record is this old
+
+        """
+        self._store_batch = store_batch
+        self._max_batch_size = max(1, max_batch_size)
+        self._max_batch_age = max(0, max_batch_age_ms) / 1000.0
+
+        # None is the stop sentinel
+        self._queue: queue.Queue[HashRecord | None] = queue.Queue()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+        self._submitted = 0
+        self._written = 0
+        self._flushes = 0
+
+    def start(self) -> None:
+        """Start the writer thread (no-op if already running)."""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run, name="HashBatchWriter", daemon=True)
+            self._thread.start()
+
+    def submit(self, record: HashRecord) -> None:
+        """Queue a record for persistence (thread-safe, non-blocking)."""
+        with self._lock:
+            self._submitted += 1
+        self._queue.put(record)
+
+    def close(self, timeout: float | None = None) -> int:
+        """Flush pending records, stop the writer thread and return records written.
+
+        Args:
+            timeout: Maximum seconds to wait for the final flush (None = wait)
+
+        """
+        with self._lock:
+            thread = self._thread
+            self._thread = None
+
+        if thread is None:
+            # Never started: flush synchronously so nothing submitted is lost
+            pending = self._drain()
+            if pending:
+                self._flush(pending)
+        else:
+            self._queue.put(None)
+            thread.join(timeout)
+            if thread.is_alive():
+                logger.warning("[HashBatchWriter] Writer did not finish within %.1fs", timeout)
+
+        logger.debug(
+            "[HashBatchWriter] Closed: %d submitted, %d written in %d flushes",
+            self._submitted,
+            self._written,
+            self._flushes,
+        )
+        return self._written
+
+    @property
+    def written_count(self) -> int:
+        """Number of records persisted so far."""
+        return self._written
+
+    @property
+    def flush_count(self) -> int:
+        """Number of transactions committed so far."""
+        return self._flushes
+
+    def _run(self) -> None:
+        """Writer loop: accumulate records and flush on size or age."""
+        pending: list[HashRecord] = []
+        deadline: float | None = None
+
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                pass
+            else:
+                if item is None:
+                    pending.extend(self._drain())
+                    if pending:
+                        self._flush(pending)
+                    return
+                pending.append(item)
+                if deadline is None:
+                    deadline = time.monotonic() + self._max_batch_age
+
+            if pending and (
+                len(pending) >= self._max_batch_size
+                or (deadline is not None and time.monotonic() >= deadline)
+            ):
+                self._flush(pending)
+                pending = []
+                deadline = None
+
+    def _drain(self) -> list[HashRecord]:
+        """Take every record currently queued without blocking."""
+        drained: list[HashRecord] = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return drained
+            if item is not None:
+                drained.append(item)
+
+    def _flush(self, pending: list[HashRecord]) -> None:
+        """Persist a batch; errors are logged so the writer keeps running."""
+        try:
+            written = self._store_batch(pending)
+        except Exception:
+            logger.exception("[HashBatchWriter] Failed to persist %d hashes", len(pending))
+            return
+        self._written += written
+        self._flushes += 1
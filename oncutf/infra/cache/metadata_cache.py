@@ -15,33 +15,36 @@ from typing import TYPE_CHECKING, Any
 if TYPE_CHECKING:
     from pathlib import Path
 
+from oncutf.utils.filesystem.file_signature import FileSignature, get_file_signature
 from oncutf.utils.logging.logger_factory import get_cached_logger
 
 logger = get_cached_logger(__name__)
 
 
 class MetadataCache:
-    """In-memory metadata cache with TTL support.
+    """In-memory metadata cache validated against the files on disk.
 
     This is a canonical implementation that consolidates various caching
     approaches used throughout the application.
 
     Features:
-    - TTL-based expiration
-    - File modification time tracking
+    - Stat signature tracking (size, mtime, inode/device): an entry is
+      served only while its file is unchanged
+    - Optional TTL-based expiration
     - Thread-safe operations (via dict atomicity)
     - Memory-efficient storage
     """
 
-    def __init__(self, ttl_seconds: float = 300.0) -> None:
+    def __init__(self, ttl_seconds: float | None = None) -> None:
         """Initialize metadata cache.
 
         Args:
-            ttl_seconds: Time-to-live for cache entries (default 5 minutes)
+            ttl_seconds: Time-to-live for cache entries (default: no expiry,
+                entries stay valid until their file changes)
 
         """
-        self._cache: dict[str, tuple[dict[str, Any], float, float]] = {}
-        # Key -> (metadata, timestamp, mtime)
+        self._cache: dict[str, tuple[dict[str, Any], float, FileSignature | None]] = {}
+        # Key -> (metadata, timestamp, signature)
         self._ttl = ttl_seconds
 
     def get(self, path: Path) -> dict[str, Any] | None:
@@ -59,22 +62,17 @@ class MetadataCache:
         if key not in self._cache:
             return None
 
-        metadata, cache_time, cached_mtime = self._cache[key]
+        metadata, cache_time, cached_signature = self._cache[key]
 
         # Check TTL
-        if time.time() - cache_time > self._ttl:
+        if self._ttl is not None and time.time() - cache_time > self._ttl:
             logger.debug("Cache expired for %s", path, extra={"dev_only": True})
             del self._cache[key]
             return None
 
-        # Check file modification time
-        try:
-            current_mtime = path.stat().st_mtime
-            if current_mtime != cached_mtime:
-                logger.debug("File modified, cache stale for %s", path, extra={"dev_only": True})
-                del self._cache[key]
-                return None
-        except OSError:
+        # Check the file is unchanged
+        current_signature = get_file_signature(path)
+        if current_signature is None:
             # File no longer exists or not accessible
             logger.debug(
                 "File not accessible, removing from cache: %s",
@@ -83,6 +81,10 @@ class MetadataCache:
             )
             del self._cache[key]
             return None
+        if current_signature != cached_signature:
+            logger.debug("File modified, cache stale for %s", path, extra={"dev_only": True})
+            del self._cache[key]
+            return None
 
         return metadata
 
@@ -96,13 +98,11 @@ class MetadataCache:
         """
         key = str(path)
 
-        try:
-            mtime = path.stat().st_mtime
-        except OSError:
+        signature = get_file_signature(path)
+        if signature is None:
             logger.warning("Cannot stat file for caching: %s", path)
-            mtime = 0.0
 
-        self._cache[key] = (metadata, time.time(), mtime)
+        self._cache[key] = (metadata, time.time(), signature)
         logger.debug("Cached metadata for %s", path, extra={"dev_only": True})
 
     def invalidate(self, path: Path) -> None:
@@ -139,6 +139,9 @@ class MetadataCache:
             Number of entries removed
 
         """
+        if self._ttl is None:
+            return 0
+
         current_time = time.time()
         expired_keys = [
             key
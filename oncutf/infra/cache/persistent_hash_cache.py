@@ -14,16 +14,29 @@ import logging
 import os
 from collections import OrderedDict
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NamedTuple
 
 from oncutf.config import MAX_HASH_MEMORY_CACHE_SIZE
 from oncutf.infra.db.database_manager import get_database_manager
+from oncutf.utils.filesystem.file_signature import FileSignature, get_file_signature
 from oncutf.utils.filesystem.path_normalizer import normalize_path
 from oncutf.utils.logging.logger_factory import get_cached_logger
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from oncutf.infra.db.hash_store import HashRecord
+
 logger = get_cached_logger(__name__)
 
 
+class CachedHash(NamedTuple):
+    """In-memory hash entry with the stat signature it was computed against."""
+
+    hash_value: str
+    signature: FileSignature | None
+
+
 class PersistentHashCache:
     """Enhanced persistent hash cache using improved database architecture.
 
@@ -32,15 +45,18 @@ class PersistentHashCache:
     - Improved performance with focused indexes
     - More maintainable architecture
     - Easier to extend with new hash algorithms
+    - Stat-validated lookups: a stored hash is only served while the file's
+      size, mtime and inode/device still match the values recorded at hash time
     """
 
     def __init__(self) -> None:
         """Initialize persistent hash cache with database backend."""
         self._db_manager = get_database_manager()
         # Use OrderedDict for LRU behavior - limit cache size to prevent memory growth
-        self._memory_cache: OrderedDict[str, str] = OrderedDict()
+        self._memory_cache: OrderedDict[str, CachedHash] = OrderedDict()
         self._cache_hits = 0
         self._cache_misses = 0
+        self._stale_entries = 0
 
         logger.info("[PersistentHashCache] Initialized with database backend")
 
@@ -48,26 +64,40 @@ class PersistentHashCache:
         """Use the central normalize_path function."""
         return normalize_path(file_path)
 
-    def store_hash(self, file_path: str, hash_value: str, algorithm: str = "CRC32") -> bool:
-        """Store hash for a file with database persistence."""
+    def store_hash(
+        self,
+        file_path: str,
+        hash_value: str,
+        algorithm: str = "CRC32",
+        signature: FileSignature | None = None,
+        *,
+        persist: bool = True,
+    ) -> bool:
+        """Store hash for a file with database persistence.
+
+        Args:
+            file_path: Path to the file
+            hash_value: Hash value to store
+            algorithm: Hash algorithm name
+            signature: Stat signature taken before hashing (stat'ed now if None)
+            persist: Write to the database now; pass False when the caller hands
+                the record to a batch writer and only needs it visible in memory
+
+        """
         norm_path = self._normalize_path(file_path)
+        if signature is None:
+            signature = get_file_signature(norm_path)
 
         # Store in memory cache for fast access with LRU eviction
         cache_key = f"{norm_path}:{algorithm}"
+        self._remember(cache_key, CachedHash(hash_value, signature))
 
-        # If key exists, move to end (most recent)
-        if cache_key in self._memory_cache:
-            self._memory_cache.move_to_end(cache_key)
-
-        self._memory_cache[cache_key] = hash_value
-
-        # Enforce cache size limit (LRU eviction)
-        while len(self._memory_cache) > MAX_HASH_MEMORY_CACHE_SIZE:
-            self._memory_cache.popitem(last=False)  # Remove oldest
+        if not persist:
+            return True
 
         # Persist to database
         try:
-            success = self._db_manager.store_hash(norm_path, hash_value, algorithm)
+            success = self._db_manager.store_hash(norm_path, hash_value, algorithm, signature)
             if success:
                 logger.debug(
                     "[PersistentHashCache] Stored %s hash for: %s",
@@ -80,52 +110,152 @@ class PersistentHashCache:
         else:
             return success
 
-    def get_hash(self, file_path: str, algorithm: str = "CRC32") -> str | None:
-        """Retrieve hash for a file, checking memory cache first."""
+    def store_hashes_batch(self, records: Sequence[HashRecord]) -> int:
+        """Store many hashes in memory and persist them in one database transaction.
+
+        Args:
+            records: Hash results to store
+
+        Returns:
+            Number of hashes written to the database
+
+        """
+        normalized = [
+            record._replace(file_path=self._normalize_path(record.file_path)) for record in records
+        ]
+        for record in normalized:
+            self._remember(
+                f"{record.file_path}:{record.algorithm}",
+                CachedHash(record.hash_value, record.signature),
+            )
+
+        try:
+            stored = self._db_manager.store_hashes_batch(normalized)
+        except Exception:
+            logger.exception("[PersistentHashCache] Error storing batch of %d hashes", len(records))
+            return 0
+
+        logger.debug("[PersistentHashCache] Persisted %d/%d hashes", stored, len(records))
+        return stored
+
+    def get_hash(
+        self,
+        file_path: str,
+        algorithm: str = "CRC32",
+        signature: FileSignature | None = None,
+        *,
+        validate: bool = True,
+    ) -> str | None:
+        """Retrieve hash for a file, checking memory cache first.
+
+        Args:
+            file_path: Path to the file
+            algorithm: Hash algorithm name
+            signature: Current stat signature, if the caller already stat'ed the file
+            validate: Serve the hash only if the file's stat signature is unchanged
+
+        Returns:
+            Stored hash, or None if missing or stale
+
+        """
         norm_path = self._normalize_path(file_path)
         cache_key = f"{norm_path}:{algorithm}"
 
-        # Check memory cache first
-        if cache_key in self._memory_cache:
+        entry = self._memory_cache.get(cache_key)
+        if entry is not None:
             self._cache_hits += 1
             # Move to end (most recently used) for LRU
             self._memory_cache.move_to_end(cache_key)
-            return self._memory_cache[cache_key]
+        else:
+            # Load from database
+            self._cache_misses += 1
+            try:
+                db_entry = self._db_manager.get_hash_entry(norm_path, algorithm)
+            except Exception:
+                logger.exception("[PersistentHashCache] Error loading hash for %s", file_path)
+                return None
+            if db_entry is None:
+                return None
+            entry = CachedHash(*db_entry)
+            self._remember(cache_key, entry)
+
+        if not validate:
+            return entry.hash_value
+
+        current = signature if signature is not None else get_file_signature(norm_path)
+        if current is None or entry.signature != current:
+            self._stale_entries += 1
+            self._memory_cache.pop(cache_key, None)
+            logger.debug(
+                "[PersistentHashCache] Stale %s hash (file changed): %s",
+                algorithm,
+                Path(file_path).name,
+            )
+            return None
 
-        # Load from database
-        self._cache_misses += 1
-        try:
-            hash_value = self._db_manager.get_hash(norm_path, algorithm)
-            if hash_value:
-                # Cache it for future access with LRU eviction
-                self._memory_cache[cache_key] = hash_value
+        return entry.hash_value
 
-                # Enforce cache size limit
-                while len(self._memory_cache) > MAX_HASH_MEMORY_CACHE_SIZE:
-                    self._memory_cache.popitem(last=False)  # Remove oldest
+    def get_hashes_batch(
+        self, file_paths: list[str], algorithm: str = "CRC32"
+    ) -> dict[str, str | None]:
+        """Retrieve the stat-validated hashes of many files.
 
-                return hash_value
+        Memory-cache misses are loaded with a single database query, so a
+        missing hash costs nothing beyond that query.
 
-        except Exception:
-            logger.exception("[PersistentHashCache] Error loading hash for %s", file_path)
+        Args:
+            file_paths: Paths to look up
+            algorithm: Hash algorithm name
 
-        return None
+        Returns:
+            Mapping of each given path -> stored hash, or None if missing or stale
 
-    def has_hash(self, file_path: str, algorithm: str = "CRC32") -> bool:
-        """Check if hash exists for a file."""
-        norm_path = self._normalize_path(file_path)
-        cache_key = f"{norm_path}:{algorithm}"
-
-        # Check memory cache first
+        """
+        norm_paths = {path: self._normalize_path(path) for path in file_paths}
+        entries: dict[str, CachedHash] = {}
+        misses: list[str] = []
+        for norm_path in dict.fromkeys(norm_paths.values()):
+            entry = self._memory_cache.get(f"{norm_path}:{algorithm}")
+            if entry is None:
+                misses.append(norm_path)
+            else:
+                entries[norm_path] = entry
+        self._cache_hits += len(entries)
+        self._cache_misses += len(misses)
+
+        if misses:
+            try:
+                loaded = self._db_manager.get_hash_entries_batch(misses, algorithm)
+            except Exception:
+                logger.exception("[PersistentHashCache] Error loading %d hashes", len(misses))
+                loaded = {}
+            for norm_path, db_entry in loaded.items():
+                entry = CachedHash(*db_entry)
+                self._remember(f"{norm_path}:{algorithm}", entry)
+                entries[norm_path] = entry
+
+        hashes: dict[str, str | None] = {}
+        for norm_path, entry in entries.items():
+            current = get_file_signature(norm_path)
+            if current is None or entry.signature != current:
+                self._stale_entries += 1
+                self._memory_cache.pop(f"{norm_path}:{algorithm}", None)
+            else:
+                hashes[norm_path] = entry.hash_value
+        return {path: hashes.get(norm_path) for path, norm_path in norm_paths.items()}
+
+    def _remember(self, cache_key: str, entry: CachedHash) -> None:
+        """Insert an entry into the memory cache, enforcing the LRU size limit."""
         if cache_key in self._memory_cache:
-            return True
+            self._memory_cache.move_to_end(cache_key)
+        self._memory_cache[cache_key] = entry
 
-        # Check database
-        try:
-            return self._db_manager.has_hash(norm_path, algorithm)
-        except Exception:
-            logger.exception("[PersistentHashCache] Error checking hash for %s", file_path)
-            return False
+        while len(self._memory_cache) > MAX_HASH_MEMORY_CACHE_SIZE:
+            self._memory_cache.popitem(last=False)  # Remove oldest
+
+    def has_hash(self, file_path: str, algorithm: str = "CRC32") -> bool:
+        """Check if a file has a stored hash that is still valid (same as get_hash)."""
+        return self.get_hash(file_path, algorithm) is not None
 
     def remove_hash(self, file_path: str) -> bool:
         """Remove hash for a file from both cache and database."""
@@ -154,7 +284,7 @@ class PersistentHashCache:
             return
         old_prefix = f"{old_norm}:"
         for key in [k for k in self._memory_cache if k.startswith(old_prefix)]:
-            algorithm = key[len(old_prefix):]
+            algorithm = key[len(old_prefix) :]
             self._memory_cache[f"{new_norm}:{algorithm}"] = self._memory_cache.pop(key)
 
     def find_duplicates(
@@ -194,25 +324,19 @@ class PersistentHashCache:
         return None  # Implementation would go here
 
     def get_files_with_hash(self, file_paths: list[str], algorithm: str = "CRC32") -> list[str]:
-        """Get all files from the list that have a hash stored."""
-        return [file_path for file_path in file_paths if self.has_hash(file_path, algorithm)]
+        """Get all files from the list that have a valid stored hash."""
+        return self.get_files_with_hash_batch(file_paths, algorithm)
 
     def get_files_with_hash_batch(
         self, file_paths: list[str], algorithm: str = "CRC32"
     ) -> list[str]:
-        """Get all files from the list that have a hash stored using batch database query."""
-        try:
-            # Use database manager for batch query if available
-            if hasattr(self._db_manager, "get_files_with_hash_batch"):
-                return self._db_manager.get_files_with_hash_batch(file_paths, algorithm)
-            # Fallback to individual checking
-            return self.get_files_with_hash(file_paths, algorithm)
-        except Exception as e:
-            logger.warning(
-                "[PersistentHashCache] Batch query failed, falling back to individual checks: %s",
-                e,
-            )
-            return self.get_files_with_hash(file_paths, algorithm)
+        """Get all files from the list that have a valid stored hash.
+
+        Uses get_hashes_batch (one database query, one stat pass), so files
+        edited since they were hashed are not listed.
+        """
+        hashes = self.get_hashes_batch(file_paths, algorithm)
+        return [file_path for file_path in file_paths if hashes[file_path] is not None]
 
     def clear_memory_cache(self) -> None:
         """Clear memory cache (database remains intact)."""
@@ -229,6 +353,7 @@ class PersistentHashCache:
             "cache_hits": self._cache_hits,
             "cache_misses": self._cache_misses,
             "hit_rate_percent": round(hit_rate, 2),
+            "stale_entries": self._stale_entries,
         }
 
 
@@ -11,7 +11,8 @@ and separation of concerns.
 
 import time
 from collections import OrderedDict
-from typing import Any, Union
+from collections.abc import Mapping
+from typing import Any, NamedTuple, Union
 
 from oncutf.utils.logging.logger_factory import get_cached_logger
 
@@ -25,6 +26,8 @@ MAX_MEMORY_CACHE_SIZE = 1000  # Metadata is larger than hashes
 
 try:
     from oncutf.infra.db.database_manager import get_database_manager
+    from oncutf.infra.db.metadata_codec import LazyMetadata
+    from oncutf.infra.db.metadata_store import StoredMetadata
 
     logger.debug(
         "[DEBUG] [PersistentMetadataCache] Successfully imported get_database_manager",
@@ -35,6 +38,7 @@ except Exception:
     raise
 
 try:
+    from oncutf.utils.filesystem.file_signature import FileSignature, get_file_signature
     from oncutf.utils.filesystem.path_normalizer import normalize_path
 
     logger.debug(
@@ -53,16 +57,44 @@ class MetadataEntry:
 
     def __init__(
         self,
-        data: dict[str, Any],
+        data: Mapping[str, Any],
         is_extended: bool = False,
         timestamp: float | None = None,
         modified: bool = False,
+        signature: FileSignature | None = None,
     ) -> None:
-        """Initialize metadata entry with data and flags."""
-        self.data = data
+        """Initialize metadata entry with data and flags.
+
+        *data* may be a lazily decoded mapping from the database; it is
+        turned into a dict the first time ``data`` is accessed. *signature*
+        is the file's stat signature when the metadata was extracted.
+        """
+        self._data = data
         self.is_extended = is_extended
         self.timestamp = timestamp or time.time()
         self.modified = modified
+        self.signature = signature
+
+    @property
+    def data(self) -> dict[str, Any]:
+        """Metadata dictionary (decoded in full on first access)."""
+        if not isinstance(self._data, dict):
+            self._data = (
+                self._data.to_dict() if isinstance(self._data, LazyMetadata) else dict(self._data)
+            )
+        return self._data
+
+    @data.setter
+    def data(self, value: Mapping[str, Any]) -> None:
+        self._data = value
+
+    @property
+    def fields(self) -> Mapping[str, Any]:
+        """Read-only view of the metadata that decodes fields as they are read.
+
+        Use it to look up a few fields; use ``data`` to change or copy them.
+        """
+        return self._data
 
     def to_dict(self) -> dict[str, Any]:
         """Returns a copy of the raw metadata dictionary."""
@@ -70,7 +102,15 @@ class MetadataEntry:
 
     def __repr__(self) -> str:
         """Return a compact debug representation."""
-        return f"<MetadataEntry(extended={self.is_extended}, keys={len(self.data)}, modified={self.modified})>"
+        return f"<MetadataEntry(extended={self.is_extended}, keys={len(self._data)}, modified={self.modified})>"
+
+
+class MetadataCacheCheck(NamedTuple):
+    """Result of validating cached metadata against the files on disk."""
+
+    fresh: dict[str, MetadataEntry]
+    stale: list[str]
+    missing: list[str]
 
 
 class PersistentMetadataCache:
@@ -81,6 +121,9 @@ class PersistentMetadataCache:
     - Improved performance with dedicated tables
     - More maintainable architecture
     - Easier to extend with new features
+    - Stat-validated checks: ``check_entries`` serves stored metadata only
+      while the file's size, mtime and inode/device match the values
+      recorded when it was extracted
     """
 
     def __init__(self) -> None:
@@ -105,6 +148,9 @@ class PersistentMetadataCache:
         self._memory_cache: OrderedDict[str, MetadataEntry] = OrderedDict()
         self._cache_hits = 0
         self._cache_misses = 0
+        self._fresh_entries = 0
+        self._stale_entries = 0
+        self._missing_entries = 0
 
         logger.info("[PersistentMetadataCache] Initialized with database backend")
 
@@ -118,23 +164,28 @@ class PersistentMetadataCache:
         metadata: dict[str, Any],
         is_extended: bool = False,
         modified: bool = False,
+        signature: FileSignature | None = None,
     ) -> None:
-        """Store metadata for a file with database persistence."""
-        norm_path = self._normalize_path(file_path)
+        """Store metadata for a file with database persistence.
 
-        # Create metadata entry
-        entry = MetadataEntry(metadata, is_extended=is_extended, modified=modified)
+        Args:
+            file_path: Path to the file
+            metadata: Metadata dictionary
+            is_extended: Whether this is extended metadata
+            modified: Whether the metadata has unsaved edits
+            signature: Stat signature taken before extraction (stat'ed now if None)
 
-        # Store in memory cache with LRU eviction
-        # If key exists, move to end (most recent)
-        if norm_path in self._memory_cache:
-            self._memory_cache.move_to_end(norm_path)
+        """
+        norm_path = self._normalize_path(file_path)
+        if signature is None:
+            signature = get_file_signature(norm_path)
 
-        self._memory_cache[norm_path] = entry
+        # Create metadata entry
+        entry = MetadataEntry(
+            metadata, is_extended=is_extended, modified=modified, signature=signature
+        )
 
-        # Enforce cache size limit (LRU eviction)
-        while len(self._memory_cache) > MAX_MEMORY_CACHE_SIZE:
-            self._memory_cache.popitem(last=False)  # Remove oldest
+        self._remember(norm_path, entry)
 
         # Persist to database
         try:
@@ -147,6 +198,7 @@ class PersistentMetadataCache:
                 metadata=clean_metadata,
                 is_extended=is_extended,
                 is_modified=modified,
+                signature=signature,
             )
 
             logger.debug("[PersistentMetadataCache] Stored metadata for: %s", file_path)
@@ -157,6 +209,57 @@ class PersistentMetadataCache:
                 file_path,
             )
 
+    def set_batch(
+        self,
+        items: list[tuple[str, dict[str, Any]]],
+        is_extended: bool = False,
+        signatures: Mapping[str, FileSignature | None] | None = None,
+    ) -> None:
+        """Store freshly extracted metadata for many files with one database write.
+
+        Args:
+            items: (file_path, metadata) pairs
+            is_extended: Whether this is extended metadata
+            signatures: Stat signatures taken before extraction, by file path
+                as given in *items* (files missing from it are stat'ed now)
+
+        """
+        rows: list[tuple[str, dict[str, Any], bool, bool]] = []
+        stored_signatures: dict[str, FileSignature | None] = {}
+        for file_path, metadata in items:
+            norm_path = self._normalize_path(file_path)
+            if signatures is not None and file_path in signatures:
+                signature = signatures[file_path]
+            else:
+                signature = get_file_signature(norm_path)
+            self._remember(
+                norm_path, MetadataEntry(metadata, is_extended=is_extended, signature=signature)
+            )
+
+            clean_metadata = metadata.copy()
+            clean_metadata.pop("__modified__", None)
+            rows.append((norm_path, clean_metadata, is_extended, False))
+            stored_signatures[norm_path] = signature
+
+        try:
+            self._db_manager.batch_store_metadata(rows, stored_signatures)
+        except Exception:
+            logger.exception(
+                "[PersistentMetadataCache] Error persisting metadata for %d files", len(rows)
+            )
+
+    def _remember(self, norm_path: str, entry: MetadataEntry) -> None:
+        """Keep *entry* in the memory cache, evicting the least recently used."""
+        # If key exists, move to end (most recent)
+        if norm_path in self._memory_cache:
+            self._memory_cache.move_to_end(norm_path)
+
+        self._memory_cache[norm_path] = entry
+
+        # Enforce cache size limit (LRU eviction)
+        while len(self._memory_cache) > MAX_MEMORY_CACHE_SIZE:
+            self._memory_cache.popitem(last=False)  # Remove oldest
+
     def get(self, file_path: str) -> dict[str, Any]:
         """Get metadata for file."""
         norm_path = self._normalize_path(file_path)
@@ -179,9 +282,19 @@ class PersistentMetadataCache:
             return metadata or {}
 
     def get_entry(self, path: str) -> MetadataEntry | None:
-        """Get the MetadataEntry for a file if available."""
-        norm_path = self._normalize_path(path)
+        """Get the MetadataEntry for a file if available.
 
+        Entries whose file changed on disk since extraction are misses.
+        """
+        norm_path = self._normalize_path(path)
+        entry = self._lookup_entry(path, norm_path)
+        if entry is not None and not self._is_current(norm_path, entry):
+            self._evict_stale(norm_path)
+            return None
+        return entry
+
+    def _lookup_entry(self, path: str, norm_path: str) -> MetadataEntry | None:
+        """Get the entry from memory or the database, without stat validation."""
         in_memory = norm_path in self._memory_cache
 
         logger.debug(
@@ -207,12 +320,10 @@ class PersistentMetadataCache:
         # Load from database
         self._cache_misses += 1
         try:
-            metadata = self._db_manager.get_metadata(norm_path)
-            if metadata:
+            stored = self._db_manager.get_stored_metadata_batch([norm_path]).get(norm_path)
+            if stored and stored.data:
                 # Create entry and cache it with LRU eviction
-                is_modified = metadata.pop("__modified__", False)
-
-                entry = MetadataEntry(metadata, is_extended=False, modified=is_modified)
+                entry = self._entry_from_stored(stored)
                 self._memory_cache[norm_path] = entry
 
                 # Enforce cache size limit
@@ -232,6 +343,9 @@ class PersistentMetadataCache:
     def get_entries_batch(self, file_paths: list[str]) -> dict[str, MetadataEntry | None]:
         """Get metadata entries for multiple files in a single batch operation.
 
+        Entries whose file changed on disk since extraction are returned as
+        None, like files that were never loaded.
+
         Args:
             file_paths: List of file paths to get entries for
 
@@ -239,6 +353,15 @@ class PersistentMetadataCache:
             dict: Mapping of normalized path -> MetadataEntry (or None if not found)
 
         """
+        entries = self._lookup_entries_batch(file_paths)
+        for norm_path, entry in entries.items():
+            if entry is not None and not self._is_current(norm_path, entry):
+                self._evict_stale(norm_path)
+                entries[norm_path] = None
+        return entries
+
+    def _lookup_entries_batch(self, file_paths: list[str]) -> dict[str, MetadataEntry | None]:
+        """Get entries from memory or the database, without stat validation."""
         if not file_paths:
             return {}
 
@@ -261,18 +384,14 @@ class PersistentMetadataCache:
         if paths_to_query:
             self._cache_misses += len(paths_to_query)
             try:
-                # Use batch query method from database manager
-                batch_metadata = self._db_manager.get_metadata_batch(paths_to_query)
+                # Fields are decoded when first read, not here
+                batch_metadata = self._db_manager.get_stored_metadata_batch(paths_to_query)
 
                 for path in paths_to_query:
-                    metadata = batch_metadata.get(path)
-                    if metadata:
+                    stored = batch_metadata.get(path)
+                    if stored and stored.data:
                         # Create entry and cache it with LRU eviction
-                        is_modified = metadata.pop("__modified__", False)
-
-                        entry = MetadataEntry(
-                            metadata, is_extended=False, modified=is_modified
-                        )
+                        entry = self._entry_from_stored(stored)
                         self._memory_cache[path] = entry
 
                         # Enforce cache size limit
@@ -292,6 +411,69 @@ class PersistentMetadataCache:
 
         return result
 
+    def check_entries(self, file_paths: list[str]) -> MetadataCacheCheck:
+        """Validate the cached metadata of many files with one stat pass.
+
+        An entry is fresh while the file's stat signature matches the one
+        recorded when its metadata was extracted. Entries with unsaved edits
+        are always fresh; entries stored without a signature are stale.
+
+        Args:
+            file_paths: Paths to check
+
+        Returns:
+            MetadataCacheCheck with the fresh entries by normalized path and
+            the normalized paths whose metadata is stale or missing
+
+        """
+        fresh: dict[str, MetadataEntry] = {}
+        stale: list[str] = []
+        missing: list[str] = []
+
+        for norm_path, entry in self._lookup_entries_batch(file_paths).items():
+            if entry is None:
+                missing.append(norm_path)
+            elif self._is_current(norm_path, entry):
+                fresh[norm_path] = entry
+            else:
+                self._evict_stale(norm_path)
+                stale.append(norm_path)
+
+        self._fresh_entries += len(fresh)
+        self._missing_entries += len(missing)
+        logger.debug(
+            "[PersistentMetadataCache] Checked %d entries: %d fresh, %d stale, %d missing",
+            len(fresh) + len(stale) + len(missing),
+            len(fresh),
+            len(stale),
+            len(missing),
+            extra={"dev_only": True},
+        )
+        return MetadataCacheCheck(fresh, stale, missing)
+
+    @staticmethod
+    def _is_current(norm_path: str, entry: MetadataEntry) -> bool:
+        """Return True if *entry* still describes the file on disk."""
+        if entry.modified:
+            return True
+        current = get_file_signature(norm_path)
+        return current is not None and entry.signature == current
+
+    def _evict_stale(self, norm_path: str) -> None:
+        """Forget an entry whose file changed since its metadata was extracted."""
+        self._stale_entries += 1
+        self._memory_cache.pop(norm_path, None)
+
+    @staticmethod
+    def _entry_from_stored(stored: StoredMetadata) -> MetadataEntry:
+        """Build a cache entry from a database row."""
+        return MetadataEntry(
+            stored.data,
+            is_extended=stored.is_extended,
+            modified=stored.is_modified,
+            signature=stored.signature,
+        )
+
     def has(self, file_path: str) -> bool:
         """Check if metadata exists for file."""
         norm_path = self._normalize_path(file_path)
@@ -390,6 +572,9 @@ class PersistentMetadataCache:
             "cache_hits": self._cache_hits,
             "cache_misses": self._cache_misses,
             "hit_rate_percent": round(hit_rate, 2),
+            "fresh_entries": self._fresh_entries,
+            "stale_entries": self._stale_entries,
+            "missing_entries": self._missing_entries,
         }
 
     def cleanup_orphaned_records(self) -> int:
@@ -482,6 +667,9 @@ class DummyMetadataCache:
     def set(self, _file_path: str, _metadata: dict[str, Any], **kwargs: Any) -> None:
         """No-op setter for dummy cache."""
 
+    def set_batch(self, _items: list[tuple[str, dict[str, Any]]], **kwargs: Any) -> None:
+        """No-op batch setter for dummy cache."""
+
     def get_entry(self, path: str) -> MetadataEntry | None:
         """Return None (dummy cache has no persistent entries)."""
         return None
@@ -490,6 +678,10 @@ class DummyMetadataCache:
         """Return a mapping of normalized paths to None entries."""
         return {normalize_path(p): None for p in file_paths}
 
+    def check_entries(self, file_paths: list[str]) -> MetadataCacheCheck:
+        """Report every path as missing (dummy cache has no entries)."""
+        return MetadataCacheCheck({}, [], list(dict.fromkeys(map(normalize_path, file_paths))))
+
     def _normalize_path(self, path: str) -> str:
         """Normalize a path using the shared normalizer."""
         return normalize_path(path)
@@ -514,4 +706,7 @@ class DummyMetadataCache:
             "cache_hits": 0,
             "cache_misses": 0,
             "hit_rate_percent": 0.0,
+            "fresh_entries": 0,
+            "stale_entries": 0,
+            "missing_entries": 0,
         }
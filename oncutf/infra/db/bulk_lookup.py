@@ -0,0 +1,80 @@
+"""Module: bulk_lookup.py.
+
+Author: Michael Economou
+Date: 2026-10-16
+
+Key-set lookups that work at any size.
+
+SQLite limits the number of ``?`` parameters per statement, and very long
+``IN (...)`` lists make large query plans. Batch reads go through
+``fetch_by_keys``, which runs the query once per fixed-size chunk of keys, so
+cost stays linear and no statement exceeds the limit. Chunked reads do not
+write anything, so they never open a transaction on the shared connection.
+
+Statements that cannot be split into chunks (``NOT IN`` anti-joins) use
+``temporary_keys``, which loads the keys into a temporary table for the
+statement to join against.
+"""
+
+import itertools
+import sqlite3
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from typing import Any
+
+# Keys per statement; well below SQLITE_MAX_VARIABLE_NUMBER (999 before 3.32)
+BULK_LOOKUP_CHUNK_SIZE = 500
+
+_temp_table_ids = itertools.count()
+
+
+def fetch_by_keys(
+    cursor: sqlite3.Cursor,
+    query: str,
+    keys: Sequence[Any],
+    params: Sequence[Any] = (),
+    chunk_size: int = BULK_LOOKUP_CHUNK_SIZE,
+) -> list[sqlite3.Row]:
+    """Run *query* for every chunk of *keys* and return all rows.
+
+    Args:
+        cursor: Cursor to execute on
+        query: SQL with one ``{keys}`` placeholder where the ``?`` list of a
+            chunk goes; it must come before any other ``?`` in the statement
+        keys: Key values (duplicates are looked up once)
+        params: Extra parameters following the keys in every chunk
+        chunk_size: Keys per statement
+
+    Returns:
+        Rows of all chunks, in chunk order
+
+    """
+    unique_keys = list(dict.fromkeys(keys))
+    rows: list[sqlite3.Row] = []
+    for start in range(0, len(unique_keys), chunk_size):
+        chunk = unique_keys[start : start + chunk_size]
+        cursor.execute(query.format(keys=",".join("?" * len(chunk))), [*chunk, *params])
+        rows.extend(cursor.fetchall())
+    return rows
+
+
+@contextmanager
+def temporary_keys(cursor: sqlite3.Cursor, keys: Sequence[str] | Sequence[int]) -> Iterator[str]:
+    """Load *keys* into a temporary table for the duration of the block.
+
+    The table has a single ``k`` column and is dropped on exit. Inserting
+    into it opens a transaction, so use it only where the caller commits.
+
+    Yields:
+        Qualified name of the table (``temp.<name>``)
+
+    """
+    table = f"temp.bulk_keys_{next(_temp_table_ids)}"
+    cursor.execute(f"CREATE TEMP TABLE {table.removeprefix('temp.')} (k PRIMARY KEY)")
+    try:
+        cursor.executemany(
+            f"INSERT OR IGNORE INTO {table} (k) VALUES (?)", ((key,) for key in keys)
+        )
+        yield table
+    finally:
+        cursor.execute(f"DROP TABLE IF EXISTS {table}")
@@ -0,0 +1,355 @@
+"""Module: connections.py.
+
+Author: Michael Economou
+Date: 2026-10-16
+
+Connection architecture for DatabaseManager: one writer, many readers.
+
+All writes run on a single writer thread that owns the read-write
+connection. Callers hand it store calls through a queue and wait for the
+result. The writer takes whatever is queued (up to ``DB_WRITER_MAX_BATCH``
+calls) and runs it in one transaction, each call inside its own savepoint,
+so concurrent writers share one commit instead of taking turns on a lock.
+
+Reads run on the calling thread over a read-only connection owned by that
+thread. In WAL mode these never wait for the writer, and they see every
+write whose call has returned.
+
+Stores are unchanged: they get a ``RoutedConnection``, which is the writer
+connection on the writer thread and the thread's read connection elsewhere,
+and are wrapped with ``route_writes`` so their ``WRITE_METHODS`` run on the
+writer thread.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import functools
+import queue
+import sqlite3
+import threading
+import weakref
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Any, ClassVar, Protocol, cast
+
+from oncutf.config import DB_WRITER_MAX_BATCH
+from oncutf.utils.logging.logger_factory import get_cached_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+    from pathlib import Path
+
+logger = get_cached_logger(__name__)
+
+
+class _WriteCall:
+    """One store call queued for the writer thread."""
+
+    __slots__ = ("args", "func", "future", "kwargs")
+
+    def __init__(self, func: Callable[..., Any], args: tuple[Any, ...], kwargs: dict[str, Any]):
+        """Bind *func* to its arguments with a pending future for the result."""
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.future: Future[Any] = Future()
+
+
+class DatabaseWriter:
+    """Writer thread that owns the read-write connection and group-commits.
+
+    Attributes:
+        lock: Held while a batch runs and by ``exclusive()`` callers
+
+    """
+
+    def __init__(self, connection: sqlite3.Connection, max_batch: int = DB_WRITER_MAX_BATCH):
+        """Initialize the writer for *connection* (call ``start()`` to run it).
+
+        Args:
+            connection: Read-write connection (``check_same_thread=False``)
+            max_batch: Most calls committed together
+
+        """
+        self.connection = connection
+        self.lock = threading.RLock()
+        self._max_batch = max(1, max_batch)
+        self._queue: queue.SimpleQueue[_WriteCall | None] = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name="oncutf-db-writer", daemon=True)
+        self._owner: int | None = None
+        self._in_call = False
+        self._running = False
+
+    def start(self) -> None:
+        """Start the writer thread."""
+        self._running = True
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Run the calls already queued, then stop the writer thread."""
+        if not self._running:
+            return
+        self._running = False
+        self._queue.put(None)
+        self._thread.join()
+
+    def owns_connection(self) -> bool:
+        """Return True if the current thread may use the write connection."""
+        return threading.get_ident() in (self._thread.ident, self._owner)
+
+    def in_call(self) -> bool:
+        """Return True while a queued call runs (its commits are deferred)."""
+        return self._in_call and threading.get_ident() == self._thread.ident
+
+    def call[**P, R](self, func: Callable[P, R], *args: P.args, **kwargs: P.kwargs) -> R:
+        """Run *func* on the writer thread and return its result.
+
+        Runs directly if the current thread already owns the write
+        connection or the writer has stopped.
+        """
+        if self.owns_connection():
+            return func(*args, **kwargs)
+        if not self._running:
+            with self._owned():
+                return func(*args, **kwargs)
+        write_call = _WriteCall(func, args, kwargs)
+        self._queue.put(write_call)
+        return cast("R", write_call.future.result())
+
+    def rollback_call(self) -> None:
+        """Undo the writes of the running call (store ``rollback()``)."""
+        self.connection.execute("ROLLBACK TO SAVEPOINT write_call")
+
+    @contextlib.contextmanager
+    def exclusive(self) -> Iterator[sqlite3.Connection]:
+        """Lend the write connection to the current thread for one transaction.
+
+        The writer thread waits until the block ends. Commits on success,
+        rolls back on exception.
+        """
+        with self._owned():
+            try:
+                yield self.connection
+                self.connection.commit()
+            except Exception:
+                self.connection.rollback()
+                raise
+
+    @contextlib.contextmanager
+    def _owned(self) -> Iterator[None]:
+        """Make the current thread the owner of the write connection."""
+        with self.lock:
+            previous, self._owner = self._owner, threading.get_ident()
+            try:
+                yield
+            finally:
+                self._owner = previous
+
+    def _run(self) -> None:
+        """Take queued calls in batches until stopped."""
+        stopping = False
+        while not stopping:
+            first = self._queue.get()
+            if first is None:
+                break
+            batch = [first]
+            while len(batch) < self._max_batch:
+                try:
+                    write_call = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if write_call is None:
+                    stopping = True
+                    break
+                batch.append(write_call)
+
+            batch = [c for c in batch if c.future.set_running_or_notify_cancel()]
+            with self.lock:
+                self._run_batch(batch)
+
+    def _run_batch(self, batch: list[_WriteCall]) -> None:
+        """Run *batch* in one transaction, or call by call if it cannot commit."""
+        try:
+            outcomes = self._run_transaction(batch)
+        except sqlite3.Error as e:
+            # Run each call on its own, committing and handling errors itself
+            logger.warning(
+                "[DatabaseWriter] Group commit of %d calls failed, running them one by one: %s",
+                len(batch),
+                e,
+            )
+            for write_call in batch:
+                try:
+                    result = write_call.func(*write_call.args, **write_call.kwargs)
+                except Exception as call_error:
+                    write_call.future.set_exception(call_error)
+                else:
+                    write_call.future.set_result(result)
+            return
+
+        for write_call, (result, error) in zip(batch, outcomes, strict=True):
+            if error is None:
+                write_call.future.set_result(result)
+            else:
+                write_call.future.set_exception(error)
+
+        if len(batch) > 1:
+            logger.debug(
+                "[DatabaseWriter] Committed %d calls together",
+                len(batch),
+                extra={"dev_only": True},
+            )
+
+    def _run_transaction(self, batch: list[_WriteCall]) -> list[tuple[Any, BaseException | None]]:
+        """Run each call in its own savepoint and commit once."""
+        conn = self.connection
+        outcomes: list[tuple[Any, BaseException | None]] = []
+        try:
+            if not conn.in_transaction:
+                conn.execute("BEGIN IMMEDIATE")
+            for write_call in batch:
+                conn.execute("SAVEPOINT write_call")
+                self._in_call = True
+                try:
+                    result = write_call.func(*write_call.args, **write_call.kwargs)
+                except Exception as e:  # the caller gets it from its future
+                    conn.execute("ROLLBACK TO SAVEPOINT write_call")
+                    outcomes.append((None, e))
+                else:
+                    outcomes.append((result, None))
+                finally:
+                    self._in_call = False
+                    conn.execute("RELEASE SAVEPOINT write_call")
+            conn.commit()
+        except sqlite3.Error:
+            with contextlib.suppress(sqlite3.Error):
+                conn.rollback()
+            raise
+        return outcomes
+
+
+class _ThreadReadConnection:
+    """Read-only connection of one thread, closed when the thread ends."""
+
+    __slots__ = ("__weakref__", "connection")
+
+    def __init__(self, connection: sqlite3.Connection):
+        """Wrap *connection*."""
+        self.connection = connection
+
+
+class ReadConnectionPool:
+    """Read-only connections to the database, one per thread."""
+
+    def __init__(self, db_path: Path):
+        """Initialize the pool for the database at *db_path*."""
+        self._uri = f"{db_path.resolve().as_uri()}?mode=ro"
+        self._local = threading.local()
+        self._open: weakref.WeakSet[_ThreadReadConnection] = weakref.WeakSet()
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def connection(self) -> sqlite3.Connection:
+        """Return the read-only connection of the current thread."""
+        holder: _ThreadReadConnection | None = getattr(self._local, "holder", None)
+        if holder is not None:
+            return holder.connection
+        if self._closed:
+            raise sqlite3.ProgrammingError("Cannot operate on a closed database.")
+
+        conn = sqlite3.connect(self._uri, uri=True, timeout=30.0, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA cache_size = -16000")  # 16MB cache
+        conn.execute("PRAGMA temp_store = MEMORY")
+
+        holder = _ThreadReadConnection(conn)
+        weakref.finalize(holder, conn.close)
+        with self._lock:
+            self._open.add(holder)
+        self._local.holder = holder
+        logger.debug(
+            "[ReadConnectionPool] Opened read connection for %s",
+            threading.current_thread().name,
+            extra={"dev_only": True},
+        )
+        return conn
+
+    def close(self) -> None:
+        """Close the connections of all threads."""
+        self._closed = True
+        with self._lock:
+            holders = list(self._open)
+        for holder in holders:
+            with contextlib.suppress(sqlite3.Error):
+                holder.connection.close()
+
+
+class RoutedConnection:
+    """Connection handed to the stores.
+
+    Resolves to the write connection on the writer thread (where commits
+    and rollbacks are deferred to the writer's transaction) and to the
+    thread's read-only connection everywhere else.
+    """
+
+    def __init__(self, writer: DatabaseWriter, read_pool: ReadConnectionPool):
+        """Route between *writer* and *read_pool*."""
+        self._writer = writer
+        self._read_pool = read_pool
+
+    def current(self) -> sqlite3.Connection:
+        """Return the connection the current thread should use."""
+        if self._writer.owns_connection():
+            return self._writer.connection
+        return self._read_pool.connection()
+
+    def cursor(self) -> sqlite3.Cursor:
+        """Return a cursor on the current connection."""
+        return self.current().cursor()
+
+    def execute(self, sql: str, parameters: Any = ()) -> sqlite3.Cursor:
+        """Execute *sql* on the current connection."""
+        return self.current().execute(sql, parameters)
+
+    def commit(self) -> None:
+        """Commit, unless the writer commits the running call itself."""
+        if not self._writer.in_call():
+            self.current().commit()
+
+    def rollback(self) -> None:
+        """Roll back the running call, or the current transaction."""
+        if self._writer.in_call():
+            self._writer.rollback_call()
+        else:
+            self.current().rollback()
+
+    def __getattr__(self, name: str) -> Any:
+        """Forward other attributes to the current connection."""
+        return getattr(self.current(), name)
+
+
+class _WriteStore(Protocol):
+    WRITE_METHODS: ClassVar[frozenset[str]]
+
+
+class _WriteRoutedStore:
+    """Store proxy that runs the store's write methods on the writer thread."""
+
+    __slots__ = ("_store", "_writer")
+
+    def __init__(self, store: _WriteStore, writer: DatabaseWriter):
+        """Wrap *store*."""
+        self._store = store
+        self._writer = writer
+
+    def __getattr__(self, name: str) -> Any:
+        """Return the store attribute, routed to the writer for write methods."""
+        attr = getattr(self._store, name)
+        if name in self._store.WRITE_METHODS:
+            return functools.partial(self._writer.call, attr)
+        return attr
+
+
+def route_writes[StoreT: _WriteStore](store: StoreT, writer: DatabaseWriter) -> StoreT:
+    """Return *store* with its ``WRITE_METHODS`` running on *writer*."""
+    return cast("StoreT", _WriteRoutedStore(store, writer))
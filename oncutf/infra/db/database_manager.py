@@ -11,23 +11,32 @@ This is the main entry point for database operations. It delegates to:
 - HashStore: file_hashes table operations
 - migrations: Schema creation and migration functions
 
+Writes run on a single writer thread that group-commits them; reads run on
+a read-only connection of the calling thread (see connections.py).
+
 All public methods are preserved for backward compatibility.
 """
 
 import contextlib
 import sqlite3
-import threading
-from collections.abc import Iterator
+from collections.abc import Iterator, Mapping, Sequence
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Any
-
-from oncutf.infra.db.hash_store import HashStore
-from oncutf.infra.db.metadata_store import MetadataStore
+from typing import Any, cast
+
+from oncutf.infra.db.connections import (
+    DatabaseWriter,
+    ReadConnectionPool,
+    RoutedConnection,
+    route_writes,
+)
+from oncutf.infra.db.hash_store import HashRecord, HashStore
+from oncutf.infra.db.metadata_store import MetadataStore, StoredMetadata
 from oncutf.infra.db.migrations import create_indexes, create_schema, migrate_schema
 from oncutf.infra.db.path_store import PathStore
 from oncutf.infra.db.session_state_store import SessionStateStore
 from oncutf.infra.db.thumbnail_store import ThumbnailStore
+from oncutf.utils.filesystem.file_signature import FileSignature
 from oncutf.utils.logging.logger_factory import get_cached_logger
 
 logger = get_cached_logger(__name__)
@@ -50,7 +59,7 @@ class DatabaseManager:
     - Backward compatible API
     """
 
-    SCHEMA_VERSION = 5
+    SCHEMA_VERSION = 8
 
     def __init__(self, db_path: str | None = None):
         """Initialize database manager with store composition.
@@ -142,8 +151,6 @@ class DatabaseManager:
                 logger.exception("[DatabaseManager] Failed to clear thumbnail cache")
 
             _FRESH_START_DONE = True
-        # Thread safety lock for concurrent access from parallel workers
-        self._write_lock = threading.RLock()
 
         # Ensure database directory exists
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
@@ -178,8 +185,8 @@ class DatabaseManager:
 
     @contextmanager
     def _get_connection(self) -> Iterator[sqlite3.Connection]:
-        """Get database connection (yields existing connection)."""
-        yield self._conn
+        """Get database connection for reads (the current thread's connection)."""
+        yield self._connection.current()
 
     @contextlib.contextmanager
     def transaction(self) -> Iterator[sqlite3.Connection]:
@@ -190,13 +197,11 @@ class DatabaseManager:
                 cursor = conn.cursor()
                 cursor.execute(...)
                 # Automatically commits on success, rolls back on exception
+
+        The writer thread waits until the block ends.
         """
-        try:
-            yield self._conn
-            self._conn.commit()
-        except Exception:
-            self._conn.rollback()
-            raise
+        with self._writer.exclusive() as conn:
+            yield conn
 
     def _initialize_database(self) -> None:
         """Initialize database schema and store instances."""
@@ -235,12 +240,31 @@ class DatabaseManager:
                 cursor.execute(f"UPDATE schema_version SET version = {self.SCHEMA_VERSION}")
                 self._conn.commit()
 
-        # Initialize specialized stores (composition pattern)
-        self.path_store = PathStore(self._conn)
-        self.hash_store = HashStore(self._conn, self.path_store, self._write_lock)
-        self.metadata_store = MetadataStore(self._conn, self.path_store, self._write_lock)
-        self.session_state_store = SessionStateStore(self._conn, self._write_lock)
-        self.thumbnail_store = ThumbnailStore(self._conn, self._write_lock)
+        # One writer thread owns self._conn; every other thread reads through
+        # its own read-only connection
+        self._writer = DatabaseWriter(self._conn)
+        self._read_pool = ReadConnectionPool(self.db_path)
+        self._connection = RoutedConnection(self._writer, self._read_pool)
+        self._write_lock = self._writer.lock
+        self._writer.start()
+
+        # Initialize specialized stores (composition pattern); their write
+        # methods run on the writer thread
+        connection = cast("sqlite3.Connection", self._connection)
+        path_store = PathStore(connection)
+        self.path_store = route_writes(path_store, self._writer)
+        self.hash_store = route_writes(
+            HashStore(connection, path_store, self._write_lock), self._writer
+        )
+        self.metadata_store = route_writes(
+            MetadataStore(connection, path_store, self._write_lock), self._writer
+        )
+        self.session_state_store = route_writes(
+            self._writer.call(SessionStateStore, connection, self._write_lock), self._writer
+        )
+        self.thumbnail_store = route_writes(
+            ThumbnailStore(connection, self._write_lock), self._writer
+        )
 
         logger.debug("[DatabaseManager] Store instances initialized", extra={"dev_only": True})
 
@@ -250,8 +274,7 @@ class DatabaseManager:
 
     def get_or_create_path_id(self, file_path: str) -> int:
         """Get or create path ID for a file path (thread-safe)."""
-        with self._write_lock:
-            return self.path_store.get_or_create_path_id(file_path)
+        return self.path_store.get_or_create_path_id(file_path)
 
     def get_path_id(self, file_path: str) -> int | None:
         """Get path ID for a file path."""
@@ -259,26 +282,46 @@ class DatabaseManager:
 
     def update_file_path(self, old_path: str, new_path: str) -> bool:
         """Update file path after rename (thread-safe)."""
-        with self._write_lock:
-            return self.path_store.update_file_path(old_path, new_path)
+        return self.path_store.update_file_path(old_path, new_path)
 
     def normalize_path(self, file_path: str) -> str:
         """Normalize file path for database consistency."""
         return self.path_store.normalize_path(file_path)
 
     # ====================================================================
-    # HashStore delegation (4 methods)
+    # HashStore delegation (6 methods)
     # ====================================================================
 
-    def store_hash(self, file_path: str, hash_value: str, algorithm: str = "CRC32") -> bool:
+    def store_hash(
+        self,
+        file_path: str,
+        hash_value: str,
+        algorithm: str = "CRC32",
+        signature: FileSignature | None = None,
+    ) -> bool:
         """Store hash value for a file (thread-safe)."""
-        with self._write_lock:
-            return self.hash_store.store_hash(file_path, hash_value, algorithm)
+        return self.hash_store.store_hash(file_path, hash_value, algorithm, signature)
+
+    def store_hashes_batch(self, records: Sequence[HashRecord]) -> int:
+        """Store many hash values in one transaction (thread-safe)."""
+        return self.hash_store.store_hashes_batch(records)
 
     def get_hash(self, file_path: str, algorithm: str = "CRC32") -> str | None:
         """Get hash value for a file."""
         return self.hash_store.get_hash(file_path, algorithm)
 
+    def get_hash_entry(
+        self, file_path: str, algorithm: str = "CRC32"
+    ) -> tuple[str, FileSignature | None] | None:
+        """Get hash value and the stat signature it was computed against."""
+        return self.hash_store.get_hash_entry(file_path, algorithm)
+
+    def get_hash_entries_batch(
+        self, file_paths: list[str], algorithm: str = "CRC32"
+    ) -> dict[str, tuple[str, FileSignature | None]]:
+        """Get hash values and signatures for multiple files in one query."""
+        return self.hash_store.get_hash_entries_batch(file_paths, algorithm)
+
     def has_hash(self, file_path: str, algorithm: str = "CRC32") -> bool:
         """Check if file has a hash value."""
         return self.hash_store.has_hash(file_path, algorithm)
@@ -299,18 +342,20 @@ class DatabaseManager:
         metadata: dict[str, Any],
         is_extended: bool = False,
         is_modified: bool = False,
+        signature: FileSignature | None = None,
     ) -> bool:
-        """Store metadata for a file (thread-safe)."""
-        with self._write_lock:
-            return self.metadata_store.store_metadata(file_path, metadata, is_extended, is_modified)
+        """Store metadata for a file with its stat signature (thread-safe)."""
+        return self.metadata_store.store_metadata(
+            file_path, metadata, is_extended, is_modified, signature
+        )
 
     def batch_store_metadata(
         self,
         file_metadata_list: list[tuple[str, dict[str, Any], bool, bool]],
+        signatures: Mapping[str, FileSignature | None] | None = None,
     ) -> int:
         """Batch store metadata for multiple files (thread-safe)."""
-        with self._write_lock:
-            return self.metadata_store.batch_store_metadata(file_metadata_list)
+        return self.metadata_store.batch_store_metadata(file_metadata_list, signatures)
 
     def get_metadata(self, file_path: str) -> dict[str, Any] | None:
         """Get metadata for a file."""
@@ -320,6 +365,10 @@ class DatabaseManager:
         """Get metadata for multiple files."""
         return self.metadata_store.get_metadata_batch(file_paths)
 
+    def get_stored_metadata_batch(self, file_paths: list[str]) -> dict[str, StoredMetadata | None]:
+        """Get metadata for multiple files, decoding fields on access."""
+        return self.metadata_store.get_stored_metadata_batch(file_paths)
+
     def has_metadata(self, file_path: str, metadata_type: str | None = None) -> bool:
         """Check if file has metadata."""
         return self.metadata_store.has_metadata(file_path, metadata_type)
@@ -332,10 +381,9 @@ class DatabaseManager:
         display_order: int = 0,
     ) -> int | None:
         """Create or get metadata category (thread-safe)."""
-        with self._write_lock:
-            return self.metadata_store.create_metadata_category(
-                category_key, category_name, description, display_order
-            )
+        return self.metadata_store.create_metadata_category(
+            category_key, category_name, description, display_order
+        )
 
     def get_metadata_categories(self) -> list[dict[str, Any]]:
         """Get all metadata categories."""
@@ -353,17 +401,16 @@ class DatabaseManager:
         sort_order: int = 0,
     ) -> int | None:
         """Create or get metadata field (thread-safe)."""
-        with self._write_lock:
-            return self.metadata_store.create_metadata_field(
-                field_key,
-                field_name,
-                category_id,
-                data_type,
-                is_editable,
-                is_searchable,
-                display_format,
-                sort_order,
-            )
+        return self.metadata_store.create_metadata_field(
+            field_key,
+            field_name,
+            category_id,
+            data_type,
+            is_editable,
+            is_searchable,
+            display_format,
+            sort_order,
+        )
 
     def get_metadata_fields(self, category_id: int | None = None) -> list[dict[str, Any]]:
         """Get metadata fields, optionally filtered by category."""
@@ -375,8 +422,7 @@ class DatabaseManager:
 
     def store_structured_metadata(self, file_path: str, field_key: str, field_value: str) -> bool:
         """Store structured metadata value for a file field (thread-safe)."""
-        with self._write_lock:
-            return self.metadata_store.store_structured_metadata(file_path, field_key, field_value)
+        return self.metadata_store.store_structured_metadata(file_path, field_key, field_value)
 
     def batch_store_structured_metadata(
         self,
@@ -384,8 +430,7 @@ class DatabaseManager:
         field_data: list[tuple[str, str]],
     ) -> int:
         """Batch store structured metadata for a file (thread-safe)."""
-        with self._write_lock:
-            return self.metadata_store.batch_store_structured_metadata(file_path, field_data)
+        return self.metadata_store.batch_store_structured_metadata(file_path, field_data)
 
     def get_structured_metadata(self, file_path: str) -> dict[str, Any]:
         """Get structured metadata for a file."""
@@ -403,8 +448,7 @@ class DatabaseManager:
 
     def set_color_tag(self, file_path: str, color_hex: str) -> bool:
         """Set color tag for a file (thread-safe)."""
-        with self._write_lock:
-            return self.metadata_store.set_color_tag(file_path, color_hex)
+        return self.metadata_store.set_color_tag(file_path, color_hex)
 
     def get_color_tag(self, file_path: str) -> str:
         """Get color tag for a file."""
@@ -455,7 +499,7 @@ class DatabaseManager:
 
         """
         stats = {}
-        cursor = self._conn.cursor()
+        cursor = self._connection.cursor()
 
         # Count file paths
         cursor.execute("SELECT COUNT(*) FROM file_paths")
@@ -492,7 +536,10 @@ class DatabaseManager:
     # ====================================================================
 
     def close(self) -> None:
-        """Close database connection and cleanup resources."""
+        """Run pending writes, then close all connections."""
+        if hasattr(self, "_writer"):
+            self._writer.stop()
+            self._read_pool.close()
         if hasattr(self, "_conn") and self._conn:
             try:
                 self._conn.close()
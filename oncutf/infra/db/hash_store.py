@@ -10,9 +10,12 @@ Handles all file hash CRUD operations.
 import os
 import sqlite3
 import threading
+from collections.abc import Sequence
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar, NamedTuple
 
+from oncutf.infra.db.bulk_lookup import fetch_by_keys
+from oncutf.utils.filesystem.file_signature import FileSignature, get_file_signature
 from oncutf.utils.logging.logger_factory import get_cached_logger
 
 if TYPE_CHECKING:
@@ -20,10 +23,42 @@ if TYPE_CHECKING:
 
 logger = get_cached_logger(__name__)
 
+# One row per (path, algorithm): a new hash updates the row in place
+_UPSERT_HASH_SQL = """
+    INSERT INTO file_hashes
+    (path_id, algorithm, hash_value, file_size_at_hash,
+     file_mtime_ns_at_hash, file_inode_at_hash, file_device_at_hash)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(path_id, algorithm) DO UPDATE SET
+        hash_value = excluded.hash_value,
+        file_size_at_hash = excluded.file_size_at_hash,
+        file_mtime_ns_at_hash = excluded.file_mtime_ns_at_hash,
+        file_inode_at_hash = excluded.file_inode_at_hash,
+        file_device_at_hash = excluded.file_device_at_hash,
+        created_at = CURRENT_TIMESTAMP
+"""
+
+
+class HashRecord(NamedTuple):
+    """One hash result queued for persistence."""
+
+    file_path: str
+    hash_value: str
+    algorithm: str = "CRC32"
+    signature: FileSignature | None = None
+
 
 class HashStore:
     """Manages file hash storage and retrieval in the database."""
 
+    # Methods that write (DatabaseManager runs them on its writer thread)
+    WRITE_METHODS: ClassVar[frozenset[str]] = frozenset(
+        {
+            "store_hash",
+            "store_hashes_batch",
+        }
+    )
+
     def __init__(
         self,
         connection: sqlite3.Connection,
@@ -42,8 +77,22 @@ class HashStore:
         self.path_store = path_store
         self._write_lock = write_lock
 
-    def store_hash(self, file_path: str, hash_value: str, algorithm: str = "CRC32") -> bool:
-        """Store file hash."""
+    def store_hash(
+        self,
+        file_path: str,
+        hash_value: str,
+        algorithm: str = "CRC32",
+        signature: FileSignature | None = None,
+    ) -> bool:
+        """Store file hash together with the stat signature it was computed against.
+
+        Args:
+            file_path: Path to the file
+            hash_value: Hash value to store
+            algorithm: Hash algorithm name
+            signature: Stat signature taken before hashing (stat'ed now if None)
+
+        """
         try:
             # Validate inputs
             if not file_path or not hash_value:
@@ -65,33 +114,18 @@ class HashStore:
             with self._write_lock:
                 path_id = self.path_store.get_or_create_path_id(file_path)
 
-                # Get current file size
-                file_size = None
-                try:
-                    if Path(file_path).exists():
-                        file_size = Path(file_path).stat().st_size
-                except OSError:
-                    pass
+                if signature is None:
+                    signature = get_file_signature(file_path)
 
                 cursor = self.connection.cursor()
-
-                # Remove existing hash for this path and algorithm
-                cursor.execute(
-                    """
-                    DELETE FROM file_hashes
-                    WHERE path_id = ? AND algorithm = ?
-                """,
-                    (path_id, algorithm),
-                )
-
-                # Store new hash
                 cursor.execute(
-                    """
-                    INSERT INTO file_hashes
-                    (path_id, algorithm, hash_value, file_size_at_hash)
-                    VALUES (?, ?, ?, ?)
-                """,
-                    (path_id, algorithm, hash_value, file_size),
+                    _UPSERT_HASH_SQL,
+                    (
+                        path_id,
+                        algorithm,
+                        hash_value,
+                        *(signature or (None, None, None, None)),
+                    ),
                 )
 
                 # Commit the transaction
@@ -112,6 +146,75 @@ class HashStore:
         else:
             return True
 
+    def store_hashes_batch(self, records: Sequence[HashRecord]) -> int:
+        """Store many hashes in a single transaction.
+
+        Path IDs are resolved in bulk and rows are written with ``executemany``,
+        so a batch costs one commit instead of one per file. If the same
+        (path, algorithm) appears more than once, the last record wins.
+
+        Args:
+            records: Hash results to persist
+
+        Returns:
+            Number of hashes written (0 on failure)
+
+        """
+        latest: dict[tuple[str, str], HashRecord] = {}
+        for record in records:
+            if not record.file_path or not record.hash_value:
+                continue
+            if "\x00" in record.file_path or "\x00" in record.hash_value:
+                logger.warning(
+                    "[HashStore] Null byte detected in path or hash, skipping: %s",
+                    record.file_path,
+                )
+                continue
+            if record.signature is None:
+                record = record._replace(signature=get_file_signature(record.file_path))
+            latest[(record.file_path, record.algorithm)] = record
+
+        if not latest:
+            return 0
+
+        try:
+            with self._write_lock:
+                path_ids = self.path_store.get_or_create_path_ids(
+                    [record.file_path for record in latest.values()]
+                )
+                rows = [
+                    (
+                        path_ids[record.file_path],
+                        record.algorithm,
+                        record.hash_value,
+                        *(record.signature or (None, None, None, None)),
+                    )
+                    for record in latest.values()
+                    if record.file_path in path_ids
+                ]
+
+                self.connection.cursor().executemany(_UPSERT_HASH_SQL, rows)
+                self.connection.commit()
+        except sqlite3.OperationalError as e:
+            # Suppress errors during shutdown/cancellation
+            logger.debug("[HashStore] Database locked/closing during batch store: %s", e)
+            self._rollback_quietly()
+            return 0
+        except Exception:
+            logger.exception("[HashStore] Error storing hash batch (%d records)", len(latest))
+            self._rollback_quietly()
+            return 0
+
+        logger.debug("[HashStore] Stored %d hashes in one transaction", len(rows))
+        return len(rows)
+
+    def _rollback_quietly(self) -> None:
+        """Roll back the current transaction, ignoring errors from a closing connection."""
+        try:
+            self.connection.rollback()
+        except sqlite3.Error as e:
+            logger.debug("[HashStore] Rollback failed: %s", e)
+
     def get_hash(self, file_path: str, algorithm: str = "CRC32") -> str | None:
         """Retrieve file hash."""
         try:
@@ -124,24 +227,21 @@ class HashStore:
                 logger.warning("[HashStore] Null byte detected in path, skipping: %s", file_path)
                 return None
 
-            with self._write_lock:
-                path_id = self.path_store.get_path_id(file_path)
-                if not path_id:
-                    return None
+            path_id = self.path_store.get_path_id(file_path)
+            if not path_id:
+                return None
 
-                cursor = self.connection.cursor()
-                cursor.execute(
-                    """
-                    SELECT hash_value FROM file_hashes
-                    WHERE path_id = ? AND algorithm = ?
-                    ORDER BY created_at DESC
-                    LIMIT 1
-                """,
-                    (path_id, algorithm),
-                )
+            cursor = self.connection.cursor()
+            cursor.execute(
+                """
+                SELECT hash_value FROM file_hashes
+                WHERE path_id = ? AND algorithm = ?
+            """,
+                (path_id, algorithm),
+            )
 
-                row = cursor.fetchone()
-                return row["hash_value"] if row else None
+            row = cursor.fetchone()
+            return row["hash_value"] if row else None
 
         except sqlite3.OperationalError as e:
             # Suppress errors during shutdown/cancellation
@@ -152,6 +252,101 @@ class HashStore:
             logger.exception("[HashStore] Error retrieving hash for %s", file_path)
             return None
 
+    def get_hash_entry(
+        self, file_path: str, algorithm: str = "CRC32"
+    ) -> tuple[str, FileSignature | None] | None:
+        """Retrieve file hash together with the stat signature stored with it.
+
+        Returns:
+            (hash_value, signature) or None if no hash is stored. The signature
+            is None for rows written before stat signatures were recorded.
+
+        """
+        try:
+            if not file_path or "\x00" in file_path:
+                return None
+
+            path_id = self.path_store.get_path_id(file_path)
+            if not path_id:
+                return None
+
+            cursor = self.connection.cursor()
+            cursor.execute(
+                """
+                SELECT hash_value, file_size_at_hash, file_mtime_ns_at_hash,
+                       file_inode_at_hash, file_device_at_hash
+                FROM file_hashes
+                WHERE path_id = ? AND algorithm = ?
+            """,
+                (path_id, algorithm),
+            )
+            row = cursor.fetchone()
+
+        except sqlite3.OperationalError as e:
+            logger.debug("[HashStore] Database locked/closing for %s: %s", file_path, e)
+            return None
+        except Exception:
+            logger.exception("[HashStore] Error retrieving hash entry for %s", file_path)
+            return None
+
+        if not row:
+            return None
+
+        return self._hash_entry_from_row(row)
+
+    def get_hash_entries_batch(
+        self, file_paths: list[str], algorithm: str = "CRC32"
+    ) -> dict[str, tuple[str, FileSignature | None]]:
+        """Retrieve the hash and stat signature of many files (chunked query).
+
+        Returns:
+            Mapping of normalized path -> (hash_value, signature); files
+            without a stored hash are omitted
+
+        """
+        norm_paths = [
+            self.path_store.normalize_path(path)
+            for path in file_paths
+            if path and "\x00" not in path
+        ]
+        if not norm_paths:
+            return {}
+
+        try:
+            rows = fetch_by_keys(
+                self.connection.cursor(),
+                """
+                SELECT p.file_path, h.hash_value, h.file_size_at_hash,
+                       h.file_mtime_ns_at_hash, h.file_inode_at_hash,
+                       h.file_device_at_hash
+                FROM file_paths p
+                JOIN file_hashes h ON h.path_id = p.id
+                WHERE p.file_path IN ({keys}) AND h.algorithm = ?
+            """,
+                norm_paths,
+                (algorithm,),
+            )
+        except sqlite3.OperationalError as e:
+            logger.debug("[HashStore] Database locked/closing for batch lookup: %s", e)
+            return {}
+        except Exception:
+            logger.exception("[HashStore] Error retrieving %d hash entries", len(norm_paths))
+            return {}
+
+        return {row["file_path"]: self._hash_entry_from_row(row) for row in rows}
+
+    @staticmethod
+    def _hash_entry_from_row(row: sqlite3.Row) -> tuple[str, FileSignature | None]:
+        signature = None
+        if row["file_mtime_ns_at_hash"] is not None and row["file_size_at_hash"] is not None:
+            signature = FileSignature(
+                row["file_size_at_hash"],
+                row["file_mtime_ns_at_hash"],
+                row["file_inode_at_hash"] or 0,
+                row["file_device_at_hash"] or 0,
+            )
+        return row["hash_value"], signature
+
     def has_hash(self, file_path: str, algorithm: str = "CRC32") -> bool:
         """Check if hash exists for a file."""
         norm_path = self.path_store.normalize_path(file_path)
@@ -180,22 +375,19 @@ class HashStore:
         # Normalize all paths
         norm_paths = [self.path_store.normalize_path(path) for path in file_paths]
 
-        cursor = self.connection.cursor()
-
-        # Create placeholders for the IN clause
-        placeholders = ",".join(["?" for _ in norm_paths])
-
-        cursor.execute(
-            f"""
+        rows = fetch_by_keys(
+            self.connection.cursor(),
+            """
             SELECT p.file_path FROM file_paths p
             JOIN file_hashes h ON h.path_id = p.id
-            WHERE p.file_path IN ({placeholders}) AND h.algorithm = ?
+            WHERE p.file_path IN ({keys}) AND h.algorithm = ?
         """,
-            [*norm_paths, algorithm],
+            norm_paths,
+            (algorithm,),
         )
 
         # Get all file paths that have hashes
-        files_with_hash = [row["file_path"] for row in cursor.fetchall()]
+        files_with_hash = [row["file_path"] for row in rows]
 
         logger.debug(
             "[HashStore] Batch hash check: %d/%d files have %s hashes",
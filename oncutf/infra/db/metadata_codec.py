@@ -0,0 +1,189 @@
+"""Module: metadata_codec.py.
+
+Author: Michael Economou
+Date: 2026-10-16
+
+Compact storage format for the metadata dicts in ``file_metadata``.
+
+A blob is ``MAGIC + field count + zlib(body)``, where the body holds the
+keys, an offset table and the values as one JSON array::
+
+    key block:  NUL key1 NUL key2 NUL ... NUL   (UTF-8)
+    offsets:    uint32 start of each element in the values area, plus its end
+    values:     [value1,value2,...]
+
+``LazyMetadata`` opens a blob without parsing it: looking up a field finds
+the key in the key block and parses only that field's JSON. Decoding the
+whole blob parses the values array in one ``json.loads`` call.
+
+Rows written before this format hold JSON text; ``decode_metadata`` and
+``open_metadata`` read both.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import struct
+import zlib
+from collections.abc import Iterator, Mapping
+from itertools import accumulate
+from json.encoder import encode_basestring
+from typing import Any, cast
+
+MAGIC = b"OMB\x01"
+
+# zlib level 1 compresses the repetitive key names well at a fraction of
+# the cost of the default level
+_COMPRESS_LEVEL = 1
+
+_COUNT = struct.Struct("<I")
+_HEADER_SIZE = len(MAGIC) + _COUNT.size
+_SPAN = struct.Struct("<II")
+
+_encode_json = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+
+def _encode_value(value: Any) -> str:
+    """Return the JSON text of one metadata value."""
+    value_type = type(value)
+    if value_type is str:
+        return encode_basestring(value)
+    if value_type is int:
+        return int.__repr__(value)
+    if value_type is float and math.isfinite(value):
+        return float.__repr__(value)
+    return _encode_json(value)
+
+
+def encode_metadata(metadata: Mapping[str, Any]) -> bytes | str:
+    """Encode *metadata* for the ``metadata_json`` column.
+
+    Returns a blob, or JSON text if a key cannot be stored in the key block.
+    """
+    keys = list(metadata)
+    if any("\x00" in key for key in keys):
+        return json.dumps(dict(metadata), ensure_ascii=False, indent=None)
+
+    values = [_encode_value(value) for value in metadata.values()]
+    text = "[" + ",".join(values) + "]"
+    area = text.encode()
+    if len(area) == len(text):
+        lengths = [len(value) for value in values]
+    else:
+        lengths = [len(value.encode()) for value in values]
+    offsets = list(accumulate((length + 1 for length in lengths), initial=1))
+    key_block = ("\x00" + "\x00".join(keys) + "\x00").encode() if keys else b""
+
+    body = b"".join(
+        (
+            _COUNT.pack(len(key_block)),
+            key_block,
+            struct.pack(f"<{len(offsets)}I", *offsets),
+            area,
+        )
+    )
+    return MAGIC + _COUNT.pack(len(keys)) + zlib.compress(body, _COMPRESS_LEVEL)
+
+
+def decode_metadata(value: bytes | str) -> dict[str, Any]:
+    """Decode a ``metadata_json`` value (blob or JSON text) to a dict."""
+    if isinstance(value, bytes) and value.startswith(MAGIC):
+        return LazyMetadata(value).to_dict()
+    decoded: dict[str, Any] = json.loads(value)
+    return decoded
+
+
+def open_metadata(value: bytes | str) -> Mapping[str, Any]:
+    """Return a mapping over a ``metadata_json`` value.
+
+    Blobs are decoded lazily, field by field; JSON text is parsed at once.
+    """
+    if isinstance(value, bytes) and value.startswith(MAGIC):
+        return LazyMetadata(value)
+    decoded: dict[str, Any] = json.loads(value)
+    return decoded
+
+
+class LazyMetadata(Mapping[str, Any]):
+    """Read-only mapping over a metadata blob that decodes fields on access.
+
+    The blob is decompressed on first access; ``len()`` does not need it.
+    Decoded fields are kept, so repeated lookups parse nothing.
+    """
+
+    __slots__ = ("_blob", "_body", "_count", "_decoded", "_key_block", "_keys", "_values_at")
+
+    def __init__(self, blob: bytes):
+        """Wrap *blob* (as returned by ``encode_metadata``)."""
+        self._blob = blob
+        (self._count,) = _COUNT.unpack_from(blob, len(MAGIC))
+        self._body: bytes | None = None
+        self._key_block = b""
+        self._values_at = 0
+        self._keys: list[str] | None = None
+        self._decoded: dict[str, Any] = {}
+
+    def _open(self) -> bytes:
+        """Decompress the body and locate its sections."""
+        body = zlib.decompress(memoryview(self._blob)[_HEADER_SIZE:])
+        (key_block_len,) = _COUNT.unpack_from(body)
+        self._key_block = body[_COUNT.size : _COUNT.size + key_block_len]
+        self._values_at = _COUNT.size + key_block_len + _COUNT.size * (self._count + 1)
+        self._body = body
+        return body
+
+    def _index(self, key: str) -> int:
+        """Return the position of *key* in the blob, or -1."""
+        if self._body is None:
+            self._open()
+        pos = self._key_block.find(b"\x00" + key.encode() + b"\x00")
+        if pos < 0:
+            return -1
+        return self._key_block.count(b"\x00", 0, pos)
+
+    def __getitem__(self, key: str) -> Any:
+        """Return the value of *key*, decoding it on first access."""
+        try:
+            return self._decoded[key]
+        except KeyError:
+            pass
+        index = self._index(key) if isinstance(key, str) else -1
+        if index < 0:
+            raise KeyError(key)
+        body = cast("bytes", self._body)
+        offsets_at = _COUNT.size + len(self._key_block)
+        start, end = _SPAN.unpack_from(body, offsets_at + _COUNT.size * index)
+        value = json.loads(body[self._values_at + start : self._values_at + end - 1])
+        self._decoded[key] = value
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        """Return True if *key* is stored, without decoding its value."""
+        if key in self._decoded:
+            return True
+        return isinstance(key, str) and self._index(key) >= 0
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the keys in stored order."""
+        if self._keys is None:
+            if self._body is None:
+                self._open()
+            block = self._key_block.decode()
+            self._keys = block[1:-1].split("\x00") if self._count else []
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        """Return the number of fields."""
+        return int(self._count)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Decode all fields into a new dict."""
+        if not self._count:
+            return {}
+        body = self._body if self._body is not None else self._open()
+        return dict(zip(self, json.loads(body[self._values_at :]), strict=True))
+
+    def __repr__(self) -> str:
+        """Return a compact debug representation."""
+        return f"<LazyMetadata(keys={self._count}, decoded={len(self._decoded)})>"
@@ -10,24 +10,68 @@ categories, fields, and color tags.
 
 from __future__ import annotations
 
-import json
 import os
 import sqlite3
 import threading
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any, ClassVar, NamedTuple, cast
 
+from oncutf.infra.db.bulk_lookup import fetch_by_keys
+from oncutf.infra.db.metadata_codec import decode_metadata, encode_metadata, open_metadata
+from oncutf.utils.filesystem.file_signature import FileSignature, get_file_signature
 from oncutf.utils.logging.logger_factory import get_cached_logger
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from oncutf.infra.db.path_store import PathStore
 
 logger = get_cached_logger(__name__)
 
+# A path keeps one metadata row: storing updates the row of that type in
+# place and drops the row of the other type, if any
+_UPSERT_METADATA_SQL = """
+    INSERT INTO file_metadata
+    (path_id, metadata_type, metadata_json, is_modified, file_size_at_extract,
+     file_mtime_ns_at_extract, file_inode_at_extract, file_device_at_extract)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(path_id, metadata_type) DO UPDATE SET
+        metadata_json = excluded.metadata_json,
+        is_modified = excluded.is_modified,
+        file_size_at_extract = excluded.file_size_at_extract,
+        file_mtime_ns_at_extract = excluded.file_mtime_ns_at_extract,
+        file_inode_at_extract = excluded.file_inode_at_extract,
+        file_device_at_extract = excluded.file_device_at_extract,
+        updated_at = CURRENT_TIMESTAMP
+"""
+_DELETE_OTHER_TYPES_SQL = "DELETE FROM file_metadata WHERE path_id = ? AND metadata_type != ?"
+
+
+class StoredMetadata(NamedTuple):
+    """Metadata of one file as stored, with fields decoded on access."""
+
+    data: Mapping[str, Any]
+    is_extended: bool
+    is_modified: bool
+    signature: FileSignature | None
+
 
 class MetadataStore:
     """Manages metadata storage and retrieval in the database."""
 
+    # Methods that write (DatabaseManager runs them on its writer thread)
+    WRITE_METHODS: ClassVar[frozenset[str]] = frozenset(
+        {
+            "batch_store_metadata",
+            "batch_store_structured_metadata",
+            "create_metadata_category",
+            "create_metadata_field",
+            "set_color_tag",
+            "store_metadata",
+            "store_structured_metadata",
+        }
+    )
+
     def __init__(
         self,
         connection: sqlite3.Connection,
@@ -52,29 +96,40 @@ class MetadataStore:
         metadata: dict[str, Any],
         is_extended: bool = False,
         is_modified: bool = False,
+        signature: FileSignature | None = None,
     ) -> bool:
-        """Store metadata for a file."""
+        """Store metadata for a file.
+
+        Args:
+            file_path: Path to the file
+            metadata: Metadata dictionary
+            is_extended: Whether this is extended metadata
+            is_modified: Whether the metadata has unsaved edits
+            signature: Stat signature taken before extraction (stat'ed now if None)
+
+        """
         try:
             with self._write_lock:
                 path_id = self.path_store.get_or_create_path_id(file_path)
 
                 cursor = self.connection.cursor()
 
-                # Remove existing metadata for this path
-                cursor.execute("DELETE FROM file_metadata WHERE path_id = ?", (path_id,))
-
-                # Store new metadata
                 metadata_type = "extended" if is_extended else "fast"
-                metadata_json = json.dumps(metadata, ensure_ascii=False, indent=None)
+                metadata_json = encode_metadata(metadata)
+                if signature is None:
+                    signature = get_file_signature(file_path)
 
                 cursor.execute(
-                    """
-                    INSERT INTO file_metadata
-                    (path_id, metadata_type, metadata_json, is_modified)
-                    VALUES (?, ?, ?, ?)
-                """,
-                    (path_id, metadata_type, metadata_json, is_modified),
+                    _UPSERT_METADATA_SQL,
+                    (
+                        path_id,
+                        metadata_type,
+                        metadata_json,
+                        is_modified,
+                        *(signature or (None, None, None, None)),
+                    ),
                 )
+                cursor.execute(_DELETE_OTHER_TYPES_SQL, (path_id, metadata_type))
 
                 # Commit the transaction
                 self.connection.commit()
@@ -97,11 +152,15 @@ class MetadataStore:
     def batch_store_metadata(
         self,
         metadata_items: list[tuple[str, dict[str, Any], bool, bool]],
+        signatures: Mapping[str, FileSignature | None] | None = None,
     ) -> int:
         """Store metadata for multiple files in a single batch operation.
 
+        Files without a signature in *signatures* are stat'ed when stored.
+
         Args:
             metadata_items: List of (file_path, metadata_dict, is_extended, is_modified) tuples
+            signatures: Optional stat signatures by file path, taken before extraction
 
         Returns:
             Number of files successfully stored
@@ -111,39 +170,44 @@ class MetadataStore:
             return 0
 
         try:
-            success_count = 0
-
-            cursor = self.connection.cursor()
-
+            # The last item of a path wins
+            latest: dict[str, tuple[Any, ...]] = {}
             for file_path, metadata, is_extended, is_modified in metadata_items:
                 try:
-                    path_id = self.path_store.get_or_create_path_id(file_path)
-
-                    # Remove existing metadata
-                    cursor.execute("DELETE FROM file_metadata WHERE path_id = ?", (path_id,))
-
-                    # Store new metadata
                     metadata_type = "extended" if is_extended else "fast"
-                    metadata_json = json.dumps(metadata, ensure_ascii=False, indent=None)
-
-                    cursor.execute(
-                        """
-                        INSERT INTO file_metadata
-                        (path_id, metadata_type, metadata_json, is_modified)
-                        VALUES (?, ?, ?, ?)
-                        """,
-                        (path_id, metadata_type, metadata_json, is_modified),
-                    )
-                    success_count += 1
-
+                    metadata_json = encode_metadata(metadata)
                 except Exception:
                     logger.exception(
                         "[MetadataStore] Error in batch storing metadata for %s",
                         file_path,
                     )
                     continue
+                if signatures is not None and file_path in signatures:
+                    signature = signatures[file_path]
+                else:
+                    signature = get_file_signature(file_path)
+                latest[file_path] = (
+                    metadata_type,
+                    metadata_json,
+                    is_modified,
+                    *(signature or (None, None, None, None)),
+                )
 
-            # Commit all inserts in one transaction
+            path_ids = self.path_store.get_or_create_path_ids(list(latest))
+            rows = list(
+                {
+                    path_ids[file_path]: (path_ids[file_path], *values)
+                    for file_path, values in latest.items()
+                    if file_path in path_ids
+                }.values()
+            )
+
+            cursor = self.connection.cursor()
+            cursor.executemany(_UPSERT_METADATA_SQL, rows)
+            cursor.executemany(_DELETE_OTHER_TYPES_SQL, [(row[0], row[1]) for row in rows])
+            success_count = len(rows)
+
+            # Commit all upserts in one transaction
             self.connection.commit()
 
             logger.debug(
@@ -160,33 +224,29 @@ class MetadataStore:
     def get_metadata(self, file_path: str) -> dict[str, Any] | None:
         """Retrieve metadata for a file."""
         try:
-            with self._write_lock:
-                path_id = self.path_store.get_path_id(file_path)
-                if not path_id:
-                    return None
-
-                cursor = self.connection.cursor()
-                cursor.execute(
-                    """
-                    SELECT metadata_json, metadata_type, is_modified
-                    FROM file_metadata
-                    WHERE path_id = ?
-                    ORDER BY updated_at DESC
-                    LIMIT 1
-                """,
-                    (path_id,),
-                )
+            path_id = self.path_store.get_path_id(file_path)
+            if not path_id:
+                return None
 
-                row = cursor.fetchone()
-                if not row:
-                    return None
+            cursor = self.connection.cursor()
+            cursor.execute(
+                """
+                SELECT metadata_json, metadata_type, is_modified
+                FROM file_metadata
+                WHERE path_id = ?
+                LIMIT 1
+            """,
+                (path_id,),
+            )
 
-                metadata: dict[str, Any] = json.loads(row["metadata_json"])
+            row = cursor.fetchone()
+            if not row:
+                return None
 
-                if row["is_modified"]:
-                    metadata["__modified__"] = True
+            metadata = decode_metadata(row["metadata_json"])
 
-                return metadata
+            if row["is_modified"]:
+                metadata["__modified__"] = True
 
         except sqlite3.OperationalError as e:
             # Suppress errors during shutdown/cancellation
@@ -195,6 +255,8 @@ class MetadataStore:
         except Exception:
             logger.exception("[MetadataStore] Error retrieving metadata for %s", file_path)
             return None
+        else:
+            return metadata
 
     def get_metadata_batch(self, file_paths: list[str]) -> dict[str, dict[str, Any] | None]:
         """Retrieve metadata for multiple files in a single batch operation.
@@ -210,56 +272,86 @@ class MetadataStore:
             return {}
 
         try:
-            # Get path IDs for all files
-            path_ids = {}
-            for file_path in file_paths:
-                path_id = self.path_store.get_path_id(file_path)
-                if path_id:
-                    path_ids[path_id] = file_path
-
-            if not path_ids:
-                return dict.fromkeys(file_paths)
-
-            # Batch query metadata
-            cursor = self.connection.cursor()
+            results: dict[str, dict[str, Any] | None] = dict.fromkeys(file_paths)
+            for file_path, row in self._fetch_metadata_rows(file_paths).items():
+                metadata = decode_metadata(row["metadata_json"])
+                if row["is_modified"]:
+                    metadata["__modified__"] = True
+                results[file_path] = metadata
+        except Exception:
+            logger.exception("[MetadataStore] Error in batch metadata retrieval")
+            return dict.fromkeys(file_paths)
+        else:
+            return results
 
-            # Create placeholders for IN clause
-            placeholders = ",".join("?" * len(path_ids))
+    def get_stored_metadata_batch(self, file_paths: list[str]) -> dict[str, StoredMetadata | None]:
+        """Retrieve metadata for multiple files without decoding it up front.
 
-            cursor.execute(
-                f"""
-                SELECT path_id, metadata_json, metadata_type, is_modified
-                FROM file_metadata
-                WHERE path_id IN ({placeholders})
-                AND (path_id, updated_at) IN (
-                    SELECT path_id, MAX(updated_at)
-                    FROM file_metadata
-                    WHERE path_id IN ({placeholders})
-                    GROUP BY path_id
-                )
-                """,
-                list(path_ids.keys()) * 2,  # placeholders appear twice in query
-            )
+        Fields are decoded when they are first read, so loading many files
+        to show a few columns parses only those columns. Each entry carries
+        the stat signature the file had when its metadata was stored.
 
-            # Process results
-            results: dict[str, dict[str, Any] | None] = {}
-            for file_path in file_paths:
-                results[file_path] = None
+        Args:
+            file_paths: List of file paths to get metadata for
 
-            for row in cursor.fetchall():
-                file_path = path_ids[row["path_id"]]
-                metadata = json.loads(row["metadata_json"])
+        Returns:
+            dict: Mapping of file_path -> StoredMetadata (or None if not found)
 
-                if row["is_modified"]:
-                    metadata["__modified__"] = True
+        """
+        if not file_paths:
+            return {}
 
-                results[file_path] = metadata
+        try:
+            results: dict[str, StoredMetadata | None] = dict.fromkeys(file_paths)
+            for file_path, row in self._fetch_metadata_rows(file_paths).items():
+                results[file_path] = StoredMetadata(
+                    open_metadata(row["metadata_json"]),
+                    row["metadata_type"] == "extended",
+                    bool(row["is_modified"]),
+                    self._signature_from_row(row),
+                )
         except Exception:
             logger.exception("[MetadataStore] Error in batch metadata retrieval")
             return dict.fromkeys(file_paths)
         else:
             return results
 
+    @staticmethod
+    def _signature_from_row(row: sqlite3.Row) -> FileSignature | None:
+        """Return the stat signature stored with a metadata row, if any."""
+        if row["file_mtime_ns_at_extract"] is None or row["file_size_at_extract"] is None:
+            return None
+        return FileSignature(
+            row["file_size_at_extract"],
+            row["file_mtime_ns_at_extract"],
+            row["file_inode_at_extract"] or 0,
+            row["file_device_at_extract"] or 0,
+        )
+
+    def _fetch_metadata_rows(self, file_paths: list[str]) -> dict[str, sqlite3.Row]:
+        """Return the metadata row of each of *file_paths* that has one."""
+        path_ids = self.path_store.get_path_ids(file_paths)
+        if not path_ids:
+            return {}
+
+        rows = fetch_by_keys(
+            self.connection.cursor(),
+            """
+            SELECT path_id, metadata_json, metadata_type, is_modified,
+                   file_size_at_extract, file_mtime_ns_at_extract,
+                   file_inode_at_extract, file_device_at_extract
+            FROM file_metadata
+            WHERE path_id IN ({keys})
+            """,
+            list(path_ids.values()),
+        )
+        by_path_id = {row["path_id"]: row for row in rows}
+        return {
+            file_path: by_path_id[path_id]
+            for file_path, path_id in path_ids.items()
+            if path_id in by_path_id
+        }
+
     def has_metadata(self, file_path: str, metadata_type: str | None = None) -> bool:
         """Check if file has metadata stored."""
         try:
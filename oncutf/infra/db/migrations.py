@@ -15,7 +15,7 @@ from oncutf.utils.logging.logger_factory import get_cached_logger
 logger = get_cached_logger(__name__)
 
 # Database schema version for migrations
-SCHEMA_VERSION = 5
+SCHEMA_VERSION = 8
 
 
 def create_schema(cursor: sqlite3.Cursor) -> None:
@@ -45,6 +45,10 @@ def create_schema(cursor: sqlite3.Cursor) -> None:
             metadata_type TEXT NOT NULL DEFAULT 'fast',
             metadata_json TEXT NOT NULL,
             is_modified BOOLEAN DEFAULT FALSE,
+            file_size_at_extract INTEGER,
+            file_mtime_ns_at_extract INTEGER,
+            file_inode_at_extract INTEGER,
+            file_device_at_extract INTEGER,
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             FOREIGN KEY (path_id) REFERENCES file_paths (id) ON DELETE CASCADE
@@ -61,6 +65,9 @@ def create_schema(cursor: sqlite3.Cursor) -> None:
             algorithm TEXT NOT NULL DEFAULT 'CRC32',
             hash_value TEXT NOT NULL,
             file_size_at_hash INTEGER,
+            file_mtime_ns_at_hash INTEGER,
+            file_inode_at_hash INTEGER,
+            file_device_at_hash INTEGER,
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             FOREIGN KEY (path_id) REFERENCES file_paths (id) ON DELETE CASCADE
         )
@@ -294,6 +301,89 @@ def migrate_schema(cursor: sqlite3.Cursor, from_version: int, to_version: int) -
 
         logger.info("[migrations] Thumbnail cache tables added successfully")
 
+    # Migration to version 6: Add stat signature columns to file_hashes
+    if from_version <= 5 and to_version >= 6:
+        logger.info("[migrations] Adding stat signature columns to file_hashes...")
+
+        cursor.execute("PRAGMA table_info(file_hashes)")
+        existing_columns = {row[1] for row in cursor.fetchall()}
+        for column in (
+            "file_mtime_ns_at_hash",
+            "file_inode_at_hash",
+            "file_device_at_hash",
+        ):
+            if column not in existing_columns:
+                cursor.execute(f"ALTER TABLE file_hashes ADD COLUMN {column} INTEGER")
+
+        logger.info("[migrations] file_hashes stat signature columns added successfully")
+
+    # Migration to version 7: One metadata row per path, one hash row per
+    # (path, algorithm); create_indexes() then adds the unique indexes that
+    # the upserts conflict on
+    if from_version <= 6 and to_version >= 7:
+        logger.info("[migrations] Removing duplicate metadata and hash rows...")
+
+        # Keep the latest row (by timestamp, then id) of each key
+        cursor.execute(
+            """
+            DELETE FROM file_metadata
+            WHERE EXISTS (
+                SELECT 1 FROM file_metadata AS newer
+                WHERE newer.path_id = file_metadata.path_id
+                AND (newer.updated_at > file_metadata.updated_at
+                     OR (newer.updated_at = file_metadata.updated_at
+                         AND newer.id > file_metadata.id))
+            )
+            """
+        )
+        metadata_removed = cursor.rowcount
+        cursor.execute(
+            """
+            DELETE FROM file_hashes
+            WHERE EXISTS (
+                SELECT 1 FROM file_hashes AS newer
+                WHERE newer.path_id = file_hashes.path_id
+                AND newer.algorithm = file_hashes.algorithm
+                AND (newer.created_at > file_hashes.created_at
+                     OR (newer.created_at = file_hashes.created_at
+                         AND newer.id > file_hashes.id))
+            )
+            """
+        )
+        hashes_removed = cursor.rowcount
+
+        # Replaced by the unique (path_id, ...) indexes
+        for index in (
+            "idx_file_metadata_path_id",
+            "idx_metadata_path_type",
+            "idx_file_hashes_path_id",
+            "idx_hashes_path_algo",
+        ):
+            cursor.execute(f"DROP INDEX IF EXISTS {index}")
+
+        logger.info(
+            "[migrations] Removed %d duplicate metadata rows and %d duplicate hash rows",
+            metadata_removed,
+            hashes_removed,
+        )
+
+    # Migration to version 8: Add stat signature columns to file_metadata
+    if from_version <= 7 and to_version >= 8:
+        logger.info("[migrations] Adding stat signature columns to file_metadata...")
+
+        cursor.execute("PRAGMA table_info(file_metadata)")
+        existing_columns = {row[1] for row in cursor.fetchall()}
+        for column in (
+            "file_size_at_extract",
+            "file_mtime_ns_at_extract",
+            "file_inode_at_extract",
+            "file_device_at_extract",
+        ):
+            if column not in existing_columns:
+                cursor.execute(f"ALTER TABLE file_metadata ADD COLUMN {column} INTEGER")
+
+        logger.info("[migrations] file_metadata stat signature columns added successfully")
+
 
 def create_indexes(cursor: sqlite3.Cursor) -> None:
     """Create database indexes for performance."""
@@ -301,11 +391,11 @@ def create_indexes(cursor: sqlite3.Cursor) -> None:
         # File paths indexes
         "CREATE INDEX IF NOT EXISTS idx_file_paths_path ON file_paths (file_path)",
         "CREATE INDEX IF NOT EXISTS idx_file_paths_filename ON file_paths (filename)",
-        # Metadata indexes
-        "CREATE INDEX IF NOT EXISTS idx_file_metadata_path_id ON file_metadata (path_id)",
+        # Metadata indexes (the unique key is the upsert conflict target)
+        "CREATE UNIQUE INDEX IF NOT EXISTS idx_file_metadata_path_type_unique ON file_metadata (path_id, metadata_type)",
         "CREATE INDEX IF NOT EXISTS idx_file_metadata_type ON file_metadata (metadata_type)",
-        # Hash indexes
-        "CREATE INDEX IF NOT EXISTS idx_file_hashes_path_id ON file_hashes (path_id)",
+        # Hash indexes (the unique key is the upsert conflict target)
+        "CREATE UNIQUE INDEX IF NOT EXISTS idx_file_hashes_path_algo_unique ON file_hashes (path_id, algorithm)",
         "CREATE INDEX IF NOT EXISTS idx_file_hashes_algorithm ON file_hashes (algorithm)",
         "CREATE INDEX IF NOT EXISTS idx_file_hashes_value ON file_hashes (hash_value)",
         # Rename history indexes
@@ -327,9 +417,6 @@ def create_indexes(cursor: sqlite3.Cursor) -> None:
         "CREATE INDEX IF NOT EXISTS idx_thumbnail_cache_folder ON thumbnail_cache(folder_path)",
         "CREATE INDEX IF NOT EXISTS idx_thumbnail_cache_file ON thumbnail_cache(file_path)",
         "CREATE INDEX IF NOT EXISTS idx_thumbnail_order_folder ON thumbnail_order(folder_path)",
-        # Composite indexes for faster common queries
-        "CREATE INDEX IF NOT EXISTS idx_metadata_path_type ON file_metadata (path_id, metadata_type)",
-        "CREATE INDEX IF NOT EXISTS idx_hashes_path_algo ON file_hashes (path_id, algorithm)",
     ]
 
     for index_sql in indexes:
@@ -9,9 +9,12 @@ Handles all file path CRUD operations.
 
 import os
 import sqlite3
+from collections.abc import Iterable
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import ClassVar
 
+from oncutf.infra.db.bulk_lookup import fetch_by_keys
 from oncutf.utils.logging.logger_factory import get_cached_logger
 
 logger = get_cached_logger(__name__)
@@ -20,6 +23,15 @@ logger = get_cached_logger(__name__)
 class PathStore:
     """Manages file path storage and retrieval in the database."""
 
+    # Methods that write (DatabaseManager runs them on its writer thread)
+    WRITE_METHODS: ClassVar[frozenset[str]] = frozenset(
+        {
+            "get_or_create_path_id",
+            "get_or_create_path_ids",
+            "update_file_path",
+        }
+    )
+
     def __init__(self, connection: sqlite3.Connection):
         """Initialize PathStore with a database connection.
 
@@ -63,19 +75,7 @@ class PathStore:
             return path_id
 
         # Create new path record
-        file_size = None
-        modified_time = None
-        try:
-            path_obj = Path(norm_path)
-            if path_obj.exists():
-                file_size = path_obj.stat().st_size
-                modified_time = (
-                    datetime.fromtimestamp(path_obj.stat().st_mtime, tz=UTC)
-                    .astimezone()
-                    .isoformat()
-                )
-        except OSError:
-            pass
+        file_size, modified_time = self._stat_fields(norm_path)
 
         cursor.execute(
             """
@@ -95,6 +95,84 @@ class PathStore:
 
         return last_row_id
 
+    def get_or_create_path_ids(self, file_paths: Iterable[str]) -> dict[str, int]:
+        """Resolve path_ids for many files at once, creating missing records.
+
+        Existing ids are looked up in chunked ``IN`` queries and missing paths
+        are inserted with a single ``executemany``. The caller owns the
+        transaction: nothing is committed here, so the inserts land in the same
+        commit as the caller's writes.
+
+        Args:
+            file_paths: Paths to resolve (invalid or empty paths are skipped)
+
+        Returns:
+            Mapping of each given path (as passed in) to its path_id
+
+        """
+        norm_by_input = {
+            path: self.normalize_path(path) for path in file_paths if path and "\x00" not in path
+        }
+        unique_paths = list(dict.fromkeys(norm_by_input.values()))
+
+        path_ids = self._select_path_ids(unique_paths)
+        missing = [path for path in unique_paths if path not in path_ids]
+        if missing:
+            self.connection.cursor().executemany(
+                """
+                INSERT OR IGNORE INTO file_paths
+                (file_path, filename, file_size, modified_time, updated_at)
+                VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
+            """,
+                [(path, Path(path).name, *self._stat_fields(path)) for path in missing],
+            )
+            path_ids.update(self._select_path_ids(missing))
+
+        return {
+            path: path_ids[norm_path]
+            for path, norm_path in norm_by_input.items()
+            if norm_path in path_ids
+        }
+
+    def get_path_ids(self, file_paths: Iterable[str]) -> dict[str, int]:
+        """Resolve existing path_ids for many files without creating records.
+
+        Args:
+            file_paths: Paths to resolve
+
+        Returns:
+            Mapping of each given path (as passed in) that has a record to its path_id
+
+        """
+        norm_by_input = {
+            path: self.normalize_path(path) for path in file_paths if path and "\x00" not in path
+        }
+        path_ids = self._select_path_ids(list(norm_by_input.values()))
+        return {
+            path: path_ids[norm_path]
+            for path, norm_path in norm_by_input.items()
+            if norm_path in path_ids
+        }
+
+    def _select_path_ids(self, norm_paths: list[str]) -> dict[str, int]:
+        """Look up existing path_ids for already-normalized paths (chunked)."""
+        rows = fetch_by_keys(
+            self.connection.cursor(),
+            "SELECT id, file_path FROM file_paths WHERE file_path IN ({keys})",
+            norm_paths,
+        )
+        return {row["file_path"]: row["id"] for row in rows}
+
+    @staticmethod
+    def _stat_fields(norm_path: str) -> tuple[int | None, str | None]:
+        """Return (file_size, modified_time) for a new path record."""
+        try:
+            st = Path(norm_path).stat()
+        except OSError:
+            return None, None
+        modified_time = datetime.fromtimestamp(st.st_mtime, tz=UTC).astimezone().isoformat()
+        return st.st_size, modified_time
+
     def normalize_path(self, file_path: str) -> str:
         """Normalize file path for consistent database keys.
 
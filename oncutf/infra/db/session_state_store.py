@@ -22,7 +22,7 @@ import json
 import sqlite3
 import threading
 from datetime import UTC, datetime
-from typing import Any
+from typing import Any, ClassVar
 
 from oncutf.utils.logging.logger_factory import get_cached_logger
 
@@ -51,6 +51,16 @@ class SessionStateStore:
     Uses key-value pattern with JSON serialization for complex values.
     """
 
+    # Methods that write (DatabaseManager runs them on its writer thread)
+    WRITE_METHODS: ClassVar[frozenset[str]] = frozenset(
+        {
+            "clear",
+            "delete",
+            "set",
+            "set_many",
+        }
+    )
+
     def __init__(
         self,
         connection: sqlite3.Connection,
@@ -22,8 +22,9 @@ import json
 import sqlite3
 import threading
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar
 
+from oncutf.infra.db.bulk_lookup import temporary_keys
 from oncutf.utils.logging.logger_factory import get_cached_logger
 
 logger = get_cached_logger(__name__)
@@ -44,6 +45,17 @@ class ThumbnailStore:
 
     """
 
+    # Methods that write (DatabaseManager runs them on its writer thread)
+    WRITE_METHODS: ClassVar[frozenset[str]] = frozenset(
+        {
+            "cleanup_orphaned_entries",
+            "clear_folder_order",
+            "invalidate_entry",
+            "save_cache_entry",
+            "save_folder_order",
+        }
+    )
+
     def __init__(self, connection: sqlite3.Connection, write_lock: threading.RLock | None = None):
         """Initialize thumbnail store with database connection.
 
@@ -358,24 +370,23 @@ class ThumbnailStore:
             with self._write_lock:
                 cursor = self._connection.cursor()
 
-                # Build placeholders for SQL IN clause
-                placeholders = ",".join("?" * len(valid_folder_paths))
-                query = f"""
-                    DELETE FROM thumbnail_cache
-                    WHERE folder_path NOT IN ({placeholders})
-                """
-
-                cursor.execute(query, valid_folder_paths)
-                cache_deleted = cursor.rowcount
+                # Anti-join against a key table: NOT IN cannot be split into chunks
+                with temporary_keys(cursor, valid_folder_paths) as valid_folders:
+                    cursor.execute(
+                        f"""
+                        DELETE FROM thumbnail_cache
+                        WHERE folder_path NOT IN (SELECT k FROM {valid_folders})
+                        """
+                    )
+                    cache_deleted = cursor.rowcount
 
-                cursor.execute(
-                    f"""
-                    DELETE FROM thumbnail_order
-                    WHERE folder_path NOT IN ({placeholders})
-                    """,
-                    valid_folder_paths,
-                )
-                order_deleted = cursor.rowcount
+                    cursor.execute(
+                        f"""
+                        DELETE FROM thumbnail_order
+                        WHERE folder_path NOT IN (SELECT k FROM {valid_folders})
+                        """
+                    )
+                    order_deleted = cursor.rowcount
 
                 self._connection.commit()
 
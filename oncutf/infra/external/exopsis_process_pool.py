@@ -0,0 +1,388 @@
+"""Module: exopsis_process_pool.py.
+
+Author: Michael Economou
+Date: 2026-10-16
+
+Metadata extraction in long-lived worker processes.
+
+Exopsis parsing is mostly Python, so extraction threads in the GUI process
+contend for the GIL with each other and with the event loop. An
+``ExopsisProcessPool`` keeps spawned worker processes that import exopsis
+once and live across loads (the GUI process is never forked). Paths are
+sent in batches; each batch returns
+the normalized metadata dicts (pickled by the pool) together with the
+``health_check()`` of the worker's ``ExopsisWrapper``.
+
+Health:
+- a worker whose wrapper reports itself unhealthy (too many consecutive
+  errors) gets the pool recycled as soon as no batch is in flight
+- a worker that dies (parser crash, OOM kill) breaks the pool: the pool is
+  restarted and the files of the lost batches are retried one at a time, so
+  a file that crashes a worker again only loses its own metadata
+- after ``METADATA_PROCESS_MAX_RESTARTS`` restarts in one load the remaining
+  files get empty metadata and the pool reports itself unhealthy, so
+  callers go back to thread extraction
+
+Only one extraction runs at a time. ``extract()`` yields and calls its idle
+callback (which processes UI events) while batches are in flight, so a load
+started from there finds the pool busy and extracts in threads instead.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import multiprocessing
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from itertools import islice
+from typing import TYPE_CHECKING, Any, cast
+
+from oncutf.config import (
+    METADATA_PROCESS_BATCH_SIZE,
+    METADATA_PROCESS_MAX_RESTARTS,
+    METADATA_PROCESS_MAX_WORKERS,
+)
+from oncutf.infra.external.exopsis_wrapper import ExopsisWrapper
+from oncutf.utils.logging.logger_factory import get_cached_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+    from concurrent.futures import Future
+
+logger = get_cached_logger(__name__)
+
+# Seconds between cancellation checks (and idle callbacks) while waiting
+_POLL_INTERVAL = 0.05
+
+# Batches in flight per worker: enough to keep workers busy between polls,
+# few enough that a crash or cancellation loses little work
+_BATCHES_PER_WORKER = 2
+
+BatchResult = tuple[list[dict[str, Any]], dict[str, Any]]
+
+# Worker-process globals, installed by _init_worker
+_worker_wrapper: ExopsisWrapper | None = None
+_worker_extract: Callable[[str], dict[str, Any]] | None = None
+_worker_cancel_event: Any = None
+
+
+def _init_worker(extract: Callable[[str], dict[str, Any]] | None, cancel_event: Any) -> None:
+    """Set up a worker process: one wrapper, exopsis imported once."""
+    global _worker_wrapper, _worker_extract, _worker_cancel_event
+    _worker_wrapper = ExopsisWrapper()
+    _worker_extract = extract
+    _worker_cancel_event = cancel_event
+    if extract is None:
+        # Pay the import once here instead of in the first batch
+        with contextlib.suppress(ImportError):
+            import exopsis
+
+
+def _extract_batch(paths: list[str]) -> BatchResult:
+    """Worker-process entry point: extract a batch of files.
+
+    Returns:
+        Metadata per path (empty if extraction failed or was cancelled) and
+        the worker wrapper's health check, tagged with the worker's pid
+
+    """
+    wrapper = cast("ExopsisWrapper", _worker_wrapper)
+    cancelled = _worker_cancel_event.is_set
+
+    results: list[dict[str, Any]] = []
+    for path in paths:
+        if cancelled():
+            results.append({})
+        elif _worker_extract is None:
+            results.append(wrapper.get_metadata(path, cancellation_check=cancelled))
+        else:
+            try:
+                results.append(_worker_extract(path))
+            except Exception as e:
+                wrapper._last_error = str(e)
+                wrapper._consecutive_errors += 1
+                results.append({})
+            else:
+                wrapper._consecutive_errors = 0
+
+    health = wrapper.health_check()
+    health["pid"] = os.getpid()
+    return results, health
+
+
+class ExopsisProcessPool:
+    """Pool of long-lived worker processes that extract metadata in batches."""
+
+    def __init__(
+        self,
+        max_workers: int | None = METADATA_PROCESS_MAX_WORKERS,
+        batch_size: int = METADATA_PROCESS_BATCH_SIZE,
+        max_restarts: int = METADATA_PROCESS_MAX_RESTARTS,
+        extract: Callable[[str], dict[str, Any]] | None = None,
+    ) -> None:
+        """Configure the pool (worker processes start on first use).
+
+        Args:
+            max_workers: Worker processes; None uses the CPU count
+            batch_size: Files sent to a worker at a time
+            max_restarts: Worker crashes tolerated per ``extract()`` call
+            extract: Module-level extraction function run in the workers
+                instead of ``ExopsisWrapper.get_metadata`` (for tests)
+
+        """
+        self._max_workers = max(1, max_workers or os.cpu_count() or 1)
+        self._batch_size = max(1, batch_size)
+        self._max_restarts = max(0, max_restarts)
+        self._extract = extract
+        self._context = multiprocessing.get_context("spawn")
+        # Created with the worker processes and dropped when they stop
+        self._cancel_event: Any = None
+        self._executor: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self._busy = False
+        self._recycle = False
+        self._gave_up = False
+        self._restarts = 0
+        self._last_error: str | None = None
+        self._worker_health: dict[int, dict[str, Any]] = {}
+
+    @staticmethod
+    def is_available() -> bool:
+        """Return True if worker processes can be spawned on this platform."""
+        return "spawn" in multiprocessing.get_all_start_methods()
+
+    def is_busy(self) -> bool:
+        """Return True while an ``extract()`` call is running."""
+        return self._busy
+
+    def extract(
+        self,
+        paths: Iterable[str],
+        cancellation_check: Callable[[], bool] | None = None,
+        idle: Callable[[], None] | None = None,
+    ) -> Iterator[tuple[str, dict[str, Any]]]:
+        """Extract metadata for *paths* in the worker processes.
+
+        Results are yielded as batches complete, not in input order. *paths*
+        is consumed lazily, a bounded number of batches ahead, so memory does
+        not grow with the number of files. Stops without yielding the
+        remaining paths when *cancellation_check* returns True.
+
+        Only one extraction runs at a time: a call made while another is
+        running (e.g. from *idle* or between yields) raises RuntimeError
+        instead of waiting for it; check ``is_busy()`` first.
+
+        Args:
+            paths: Files to extract
+            cancellation_check: Optional callable returning True to abort
+            idle: Optional callable run between polls (e.g. to process UI events)
+
+        Yields:
+            (path, metadata) for each file; metadata is empty on failure
+
+        Raises:
+            RuntimeError: If another extraction is running
+
+        """
+        isolated: deque[str] = deque()  # files lost in a crash, run one at a time
+        in_flight: dict[Future[BatchResult], list[str]] = {}
+        run_restarts = 0
+
+        # Claim the pool without holding the lock across idle() and yields,
+        # which can re-enter the pool from the event loop or the consumer
+        with self._lock:
+            if self._busy:
+                raise RuntimeError("ExopsisProcessPool: an extraction is already running")
+            self._busy = True
+
+        if self._cancel_event is not None:
+            self._cancel_event.clear()
+        try:
+            path_iter = iter(paths)
+            batches = iter(lambda: list(islice(path_iter, self._batch_size)), [])
+            upcoming = next(batches, None)
+            while upcoming is not None or isolated or in_flight:
+                if self._recycle and not in_flight:
+                    self._restart("worker reported unhealthy")
+
+                executor = self._ensure_executor()
+                if isolated:
+                    if not in_flight:
+                        batch = [isolated.popleft()]
+                        in_flight[executor.submit(_extract_batch, batch)] = batch
+                else:
+                    while upcoming is not None and len(in_flight) < self._max_in_flight():
+                        in_flight[executor.submit(_extract_batch, upcoming)] = upcoming
+                        upcoming = next(batches, None)
+
+                done, _ = wait(in_flight, timeout=_POLL_INTERVAL, return_when=FIRST_COMPLETED)
+                if idle:
+                    idle()
+                if cancellation_check and cancellation_check():
+                    logger.info("[ExopsisProcessPool] Extraction cancelled")
+                    return
+
+                lost: list[list[str]] = []
+                for future in done:
+                    batch = in_flight.pop(future)
+                    outcome = self._batch_outcome(future, batch)
+                    if outcome is None:
+                        lost.append(batch)
+                    else:
+                        yield from zip(batch, outcome, strict=True)
+                if not lost:
+                    continue
+
+                # The pool is broken: every other in-flight batch fails too
+                # (or finished just before the crash)
+                wait(in_flight)
+                for future, batch in in_flight.items():
+                    outcome = self._batch_outcome(future, batch)
+                    if outcome is None:
+                        lost.append(batch)
+                    else:
+                        yield from zip(batch, outcome, strict=True)
+                in_flight.clear()
+
+                if len(lost) == 1 and len(lost[0]) == 1 and run_restarts:
+                    # Ran alone after an earlier crash: this file kills workers
+                    logger.warning(
+                        "[ExopsisProcessPool] Skipping file that crashed a worker: %s",
+                        lost[0][0],
+                    )
+                    yield lost[0][0], {}
+                else:
+                    isolated.extend(path for batch in lost for path in batch)
+
+                run_restarts += 1
+                self._restart("worker process died")
+                if run_restarts > self._max_restarts:
+                    self._gave_up = True
+                    logger.error(
+                        "[ExopsisProcessPool] %d worker crashes in one load, giving up",
+                        run_restarts,
+                    )
+                    for path in isolated:
+                        yield path, {}
+                    if upcoming is not None:
+                        for path in upcoming:
+                            yield path, {}
+                        for path in path_iter:
+                            yield path, {}
+                    return
+        finally:
+            # Stop in-flight batches early and drop those not started
+            if self._cancel_event is not None:
+                self._cancel_event.set()
+            for future in in_flight:
+                future.cancel()
+            self._busy = False
+
+    def _batch_outcome(
+        self, future: Future[BatchResult], batch: list[str]
+    ) -> list[dict[str, Any]] | None:
+        """Return the metadata of a finished batch, or None if its worker died."""
+        try:
+            results, health = future.result()
+        except BrokenProcessPool as e:
+            self._last_error = str(e) or "worker process died"
+            return None
+        except Exception as e:
+            logger.exception("[ExopsisProcessPool] Batch of %d files failed", len(batch))
+            self._last_error = str(e)
+            return [{} for _ in batch]
+
+        self._worker_health[health["pid"]] = health
+        if not health["healthy"]:
+            self._recycle = True
+            self._last_error = health["last_error"]
+        return results
+
+    def _max_in_flight(self) -> int:
+        return self._max_workers * _BATCHES_PER_WORKER
+
+    def _ensure_executor(self) -> ProcessPoolExecutor:
+        """Return the executor, starting the worker processes if needed."""
+        if self._executor is None:
+            self._cancel_event = self._context.Event()
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._max_workers,
+                mp_context=self._context,
+                initializer=_init_worker,
+                initargs=(self._extract, self._cancel_event),
+            )
+            logger.info("[ExopsisProcessPool] Started %d worker processes", self._max_workers)
+        return self._executor
+
+    def _restart(self, reason: str) -> None:
+        """Replace the worker processes."""
+        self._restarts += 1
+        self._recycle = False
+        self._worker_health.clear()
+        logger.warning("[ExopsisProcessPool] Restarting worker processes: %s", reason)
+        self.shutdown()
+
+    def is_healthy(self) -> bool:
+        """Return False once a load gave up after repeated worker crashes."""
+        return not self._gave_up
+
+    def health_check(self) -> dict[str, Any]:
+        """Report pool health in the format of ``ExopsisWrapper.health_check``."""
+        processes = getattr(self._executor, "_processes", None) or {}
+        return {
+            "healthy": self.is_healthy(),
+            "process_alive": any(process.is_alive() for process in processes.values()),
+            "process_status": "exopsis-process-pool",
+            "last_error": self._last_error,
+            "consecutive_errors": max(
+                (health["consecutive_errors"] for health in self._worker_health.values()),
+                default=0,
+            ),
+            "last_check": time.time(),
+            "workers": self._max_workers,
+            "restarts": self._restarts,
+        }
+
+    def shutdown(self) -> None:
+        """Stop the worker processes (they restart on next use)."""
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            self._cancel_event.set()
+            executor.shutdown(wait=True, cancel_futures=True)
+            # Release the semaphore with the workers that shared it
+            self._cancel_event = None
+
+
+_pool: ExopsisProcessPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_exopsis_process_pool() -> ExopsisProcessPool | None:
+    """Return the shared process pool, or None if it cannot be used.
+
+    None means workers cannot be spawned on this platform, the pool gave up
+    after repeated crashes, or it is busy with another load; callers then
+    extract in threads.
+    """
+    global _pool
+    if not ExopsisProcessPool.is_available():
+        return None
+    with _pool_lock:
+        if _pool is None:
+            _pool = ExopsisProcessPool()
+        pool = _pool
+    return pool if pool.is_healthy() and not pool.is_busy() else None
+
+
+def shutdown_exopsis_process_pool() -> None:
+    """Stop the shared pool's worker processes, if started."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown()
+        logger.info("[ExopsisProcessPool] Worker processes stopped")
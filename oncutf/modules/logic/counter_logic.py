@@ -7,6 +7,7 @@ This module contains the pure business logic for counter-based renaming,
 extracted from CounterModule to eliminate Qt dependencies in the core layer.
 """
 
+from collections.abc import Sequence
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -77,6 +78,26 @@ class CounterLogic:
         else:
             return result
 
+    @staticmethod
+    def apply_batch(
+        data: dict[str, Any],
+        _file_items: Sequence["FileItem"],
+        indices: Sequence[int],
+        _metadata_cache: dict | None = None,
+    ) -> list[str]:
+        """Batch form of :meth:`apply_from_data`: one counter value per index.
+
+        The configuration is parsed once for the whole column.
+        """
+        try:
+            start = int(data.get("start", 1))
+            step = int(data.get("step", 1))
+            padding = int(data.get("padding", 4))
+            return [f"{start + index * step:0{padding}d}" for index in indices]
+        except Exception:
+            logger.exception("[CounterLogic] Failed to apply counter logic")
+            return ["####"] * len(indices)
+
     @staticmethod
     def is_effective_data(_data: dict[str, Any]) -> bool:
         """Check if counter module data is effective (always True).
@@ -4,6 +4,7 @@ Author: Michael Economou
 Date: 2026-02-03
 """
 
+from collections.abc import Sequence
 from typing import Any
 
 from oncutf.utils.logging.logger_factory import get_cached_logger
@@ -60,6 +61,18 @@ class SpecifiedTextLogic:
         # Return the text exactly as entered by the user
         return text
 
+    @staticmethod
+    def apply_batch(
+        data: dict[str, Any],
+        file_items: Sequence[Any],
+        _indices: Sequence[int] = (),
+        _metadata_cache: dict[str, Any] | None = None,
+    ) -> list[str]:
+        """Batch form of :meth:`apply_from_data`; the text is validated once."""
+        if not file_items:
+            return []
+        return [SpecifiedTextLogic.apply_from_data(data, file_items[0])] * len(file_items)
+
     @staticmethod
     def is_effective_data(data: dict[str, Any]) -> bool:
         """Check if specified text module data is effective.
@@ -6,9 +6,13 @@ Date: 2026-02-03
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
 
 from oncutf.utils.logging.logger_factory import get_cached_logger
 
@@ -46,8 +50,26 @@ class TextRemovalLogic:
         if not pattern:
             return []
 
-        import re
+        regex = TextRemovalLogic.compile_pattern(pattern, position, case_sensitive)
+        if regex is None:
+            return []
+
+        # Find all matches
+        return [
+            TextRemovalMatch(start=match.start(), end=match.end(), matched_text=match.group())
+            for match in regex.finditer(text)
+        ]
+
+    @staticmethod
+    def compile_pattern(
+        pattern: str, position: str, case_sensitive: bool
+    ) -> re.Pattern[str] | None:
+        """Compile the removal regex for *pattern* at *position*.
 
+        Returns:
+            Compiled pattern, or None if it cannot be compiled
+
+        """
         # Escape regex metacharacters in the pattern
         pattern_escaped = re.escape(pattern)
 
@@ -62,16 +84,10 @@ class TextRemovalLogic:
         # Compile with appropriate flags
         flags = 0 if case_sensitive else re.IGNORECASE
         try:
-            regex = re.compile(regex_pattern, flags)
+            return re.compile(regex_pattern, flags)
         except re.error:
             logger.warning("Invalid regex pattern: %s", pattern)
-            return []
-
-        # Find all matches
-        return [
-            TextRemovalMatch(start=match.start(), end=match.end(), matched_text=match.group())
-            for match in regex.finditer(text)
-        ]
+            return None
 
     @staticmethod
     def apply_removal(text: str, matches: list[TextRemovalMatch]) -> str:
@@ -132,6 +148,37 @@ class TextRemovalLogic:
 
         return f"{result_name}{ext}"
 
+    @staticmethod
+    def apply_batch(
+        data: dict[str, Any],
+        file_items: Sequence[Any],
+        _indices: Sequence[int] = (),
+        _metadata_cache: Any = None,
+    ) -> list[str]:
+        """Batch form of :meth:`apply_from_data`; the regex is compiled once.
+
+        Removing every non-overlapping match is what ``regex.sub`` does, so
+        each name costs one substitution.
+        """
+        original_names = [file_item.filename for file_item in file_items]
+        text_to_remove = data.get("text_to_remove", "").strip()
+        if not text_to_remove:
+            return original_names
+
+        regex = TextRemovalLogic.compile_pattern(
+            text_to_remove,
+            data.get("position", "End of name"),
+            data.get("case_sensitive", False),
+        )
+        results: list[str] = []
+        for original_name in original_names:
+            path_obj = Path(original_name)
+            name_without_ext = path_obj.stem
+            if regex is not None:
+                name_without_ext = regex.sub("", name_without_ext)
+            results.append(f"{name_without_ext}{path_obj.suffix}")
+        return results
+
     @staticmethod
     def is_effective_data(data: dict[str, Any]) -> bool:
         """Check if text removal module data is effective.
@@ -9,6 +9,7 @@ modification date, or EXIF tag) to include in renamed filenames.
 Delegates extraction logic to MetadataExtractor domain layer.
 """
 
+from collections.abc import Sequence
 from pathlib import Path
 from typing import Any
 
@@ -20,6 +21,29 @@ from oncutf.utils.logging.logger_factory import get_cached_logger
 logger = get_cached_logger(__name__)
 
 
+class MetadataSnapshot(dict[str, dict[str, Any]]):
+    """Metadata read ahead of time, keyed by normalized path.
+
+    Used as the metadata cache where the database must not be touched (forked
+    preview workers). It also carries each file's normalized path so lookups
+    skip normalization, and it is truthy even when empty so the modules never
+    fall back to the persistent cache.
+    """
+
+    def __init__(
+        self,
+        metadata: dict[str, dict[str, Any]] | None = None,
+        normalized_paths: dict[str, str] | None = None,
+    ) -> None:
+        """Create a snapshot from path -> metadata and full_path -> normalized path."""
+        super().__init__(metadata or {})
+        self.normalized_paths = normalized_paths or {}
+
+    def __bool__(self) -> bool:
+        """Always True: an empty snapshot still means "no metadata", not "ask the DB"."""
+        return True
+
+
 class MetadataModule:
     """Logic component (non-UI) for extracting and formatting metadata fields.
     Uses MetadataExtractor for actual extraction logic.
@@ -117,6 +141,104 @@ class MetadataModule:
 
         return result.value
 
+    @staticmethod
+    def apply_batch(
+        data: dict[str, Any],
+        file_items: Sequence[FileItem],
+        _indices: Sequence[int] = (),
+        metadata_cache: dict[str, Any] | None = None,
+    ) -> list[str]:
+        """Batch form of :meth:`apply_from_data`.
+
+        One MetadataExtractor serves the whole column, and without a
+        metadata cache the persistent cache is read in a single batch query.
+        """
+        field = data.get("field")
+        category = data.get("category", "file_dates")
+        if not field:
+            return ["invalid"] * len(file_items)
+
+        from oncutf.core.metadata.metadata_extractor import MetadataExtractor
+        from oncutf.infra.cache.cached_hash_service import CachedHashService
+        from oncutf.utils.filesystem.path_normalizer import normalize_path
+
+        normalized = (
+            metadata_cache.normalized_paths if isinstance(metadata_cache, MetadataSnapshot) else {}
+        )
+        paths = [
+            (normalized.get(f.full_path) or normalize_path(f.full_path)) if f.full_path else ""
+            for f in file_items
+        ]
+        metadata_dicts = MetadataModule._get_metadata_dicts(
+            [path for path in paths if path], metadata_cache
+        )
+        extractor = MetadataExtractor(hash_service=CachedHashService())
+
+        results: list[str] = []
+        for path in paths:
+            if not path:
+                results.append("invalid")
+                continue
+            result = extractor.extract(
+                file_path=Path(path),
+                field=field,
+                category=category,
+                metadata=metadata_dicts.get(path, {}),
+            )
+            results.append(result.value)
+        return results
+
+    @staticmethod
+    def _get_metadata_dicts(
+        paths: list[str], metadata_cache: dict[str, Any] | None = None
+    ) -> dict[str, dict[str, Any]]:
+        """Batch form of :meth:`_get_metadata_dict` (path -> metadata dict).
+
+        Caches that support ``get_entries_batch`` (the persistent cache, given
+        or not) are read with one batch query instead of one query per path.
+        """
+        if metadata_cache and isinstance(metadata_cache, dict):
+            return {path: MetadataModule._get_metadata_dict(path, metadata_cache) for path in paths}
+
+        batch_cache = metadata_cache
+        if not batch_cache:
+            from oncutf.infra.cache.persistent_metadata_cache import (
+                get_persistent_metadata_cache,
+            )
+
+            batch_cache = get_persistent_metadata_cache()
+        if not batch_cache or not hasattr(batch_cache, "get_entries_batch"):
+            return {path: MetadataModule._get_metadata_dict(path, metadata_cache) for path in paths}
+
+        try:
+            entries = batch_cache.get_entries_batch(paths)
+        except Exception as e:
+            logger.debug(
+                "[MetadataModule] persistent cache batch lookup failed: %s",
+                e,
+                extra={"dev_only": True},
+            )
+            entries = {}
+
+        metadata_dicts: dict[str, dict[str, Any]] = {}
+        for path in paths:
+            metadata = getattr(entries.get(path), "data", {}) or {}
+            metadata_dicts[path] = metadata if isinstance(metadata, dict) else {}
+        return metadata_dicts
+
+    @staticmethod
+    def snapshot(file_items: Sequence[FileItem], metadata_cache: Any = None) -> MetadataSnapshot:
+        """Read the metadata of *file_items* into a :class:`MetadataSnapshot`."""
+        from oncutf.utils.filesystem.path_normalizer import normalize_path
+
+        normalized_paths = {
+            f.full_path: normalize_path(f.full_path) for f in file_items if f.full_path
+        }
+        metadata = MetadataModule._get_metadata_dicts(
+            list(dict.fromkeys(normalized_paths.values())), metadata_cache
+        )
+        return MetadataSnapshot(metadata, normalized_paths)
+
     @staticmethod
     def _get_metadata_dict(
         path: str, metadata_cache: dict[str, Any] | None = None
@@ -75,6 +75,47 @@ class NameTransformModule:
 
         return base_name
 
+    @staticmethod
+    def apply_batch(data: dict[str, Any], base_names: list[str]) -> list[str]:
+        """Batch form of :meth:`apply_from_data` over many base names.
+
+        The transform chain is resolved once and applied without per-name
+        logging.
+        """
+        case = data.get("case", "original")
+        sep = data.get("separator", "as-is")
+        transforms: list[str] = []
+        if data.get("greeklish", False):
+            transforms.append("greeklish")
+        if case in (
+            "lower",
+            "UPPER",
+            "Capitalize",
+            "camelCase",
+            "PascalCase",
+            "Title Case",
+        ):
+            transforms.append(case)
+        if sep in ("snake_case", "kebab-case", "space"):
+            transforms.append(sep)
+
+        results: list[str] = []
+        fallbacks = 0
+        for original in base_names:
+            base_name = original
+            for transform in transforms:
+                base_name = apply_transform(base_name, transform)
+            if not base_name.strip():
+                fallbacks += 1
+                base_name = original
+            results.append(base_name)
+
+        if fallbacks:
+            logger.warning(
+                "[NameTransformModule] Empty output for %d names, kept originals", fallbacks
+            )
+        return results
+
     @staticmethod
     def is_effective_data(data: dict[str, Any]) -> bool:
         """Returns True if any transformation is active."""
@@ -9,10 +9,17 @@ Date: 2026-03-08
 
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
+from oncutf.infra.cache.persistent_metadata_cache import MetadataCacheCheck
+from oncutf.utils.filesystem.path_normalizer import normalize_path
 from oncutf.utils.logging.logger_factory import get_cached_logger
 
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from oncutf.utils.filesystem.file_signature import FileSignature
+
 logger = get_cached_logger(__name__)
 
 
@@ -36,6 +43,13 @@ class QtMetadataUIBridge:
             return self._window.metadata_cache.get_entries_batch(paths)
         return {}
 
+    def cache_check_entries(self, paths: list[str]) -> MetadataCacheCheck:
+        cache = getattr(self._window, "metadata_cache", None) if self._window else None
+        if cache is not None and hasattr(cache, "check_entries"):
+            check: MetadataCacheCheck = cache.check_entries(paths)
+            return check
+        return MetadataCacheCheck({}, [], list(dict.fromkeys(map(normalize_path, paths))))
+
     def cache_get_entry(self, path: str) -> Any:
         if self._window and hasattr(self._window, "metadata_cache"):
             return self._window.metadata_cache.get_entry(path)
@@ -45,6 +59,22 @@ class QtMetadataUIBridge:
         if self._window and hasattr(self._window, "metadata_cache"):
             self._window.metadata_cache.set(path, data, is_extended=is_extended)
 
+    def cache_set_batch(
+        self,
+        items: list[tuple[str, dict[str, Any]]],
+        *,
+        is_extended: bool,
+        signatures: Mapping[str, FileSignature | None] | None = None,
+    ) -> None:
+        cache = getattr(self._window, "metadata_cache", None) if self._window else None
+        if cache is None:
+            return
+        if hasattr(cache, "set_batch"):
+            cache.set_batch(items, is_extended=is_extended, signatures=signatures)
+            return
+        for path, data in items:
+            cache.set(path, data, is_extended=is_extended)
+
     # -- model operations -----------------------------------------------------
 
     def refresh_model_icons(self) -> None:
@@ -78,6 +108,29 @@ class QtMetadataUIBridge:
                 exc_info=True,
             )
 
+    def emit_rows_changed(self, full_paths: list[str]) -> None:
+        model = getattr(self._window, "file_model", None) if self._window else None
+        if model is None:
+            return
+        try:
+            from oncutf.app.services.ui_events import get_item_data_roles
+
+            rows = model.rows_for_paths(full_paths)
+            if not rows:
+                return
+            roles = get_item_data_roles()
+            model.dataChanged.emit(
+                model.index(min(rows), 0),
+                model.index(max(rows), model.columnCount() - 1),
+                [roles["DecorationRole"], roles["ToolTipRole"]],
+            )
+        except Exception:
+            logger.warning(
+                "[QtMetadataUIBridge] Failed to emit dataChanged for %d files",
+                len(full_paths),
+                exc_info=True,
+            )
+
     # -- selection / display --------------------------------------------------
 
     def get_selection_count(self) -> int:
@@ -8,12 +8,22 @@ Adapts FileLoadUIService to FileLoadUIPort protocol.
 
 from typing import TYPE_CHECKING, Any
 
+from PyQt5.QtCore import QObject, pyqtSignal
+
 from oncutf.ui.managers.file_load_ui_service import FileLoadUIService
 
 if TYPE_CHECKING:
     from oncutf.domain.models.file_item import FileItem
 
 
+class _ProgressiveLoadRelay(QObject):
+    """Delivers progressive load calls from the import thread to the main thread."""
+
+    batch_ready = pyqtSignal(int, list)
+    finished = pyqtSignal(int, bool)
+    file_changes = pyqtSignal(list)
+
+
 class QtFileLoadUIAdapter:
     """Adapter wrapping FileLoadUIService for FileLoadUIPort protocol."""
 
@@ -25,6 +35,11 @@ class QtFileLoadUIAdapter:
 
         """
         self._service = FileLoadUIService(main_window)
+        # Created in the main thread, so its slots run there (queued connection)
+        self._relay = _ProgressiveLoadRelay()
+        self._relay.batch_ready.connect(self._service.add_loaded_batch)
+        self._relay.finished.connect(self._service.finish_progressive_load)
+        self._relay.file_changes.connect(self._service.apply_file_changes)
 
     def update_model_and_ui(self, items: list["FileItem"], clear: bool = True) -> None:
         """Update file model and all UI elements after loading files.
@@ -37,3 +52,19 @@ class QtFileLoadUIAdapter:
 
         """
         self._service.update_model_and_ui(items, clear)
+
+    def begin_progressive_load(self, load_id: int, folder_path: str, clear: bool = True) -> None:
+        """Prepare the model for a progressive load (main thread)."""
+        self._service.begin_progressive_load(load_id, folder_path, clear)
+
+    def add_loaded_batch(self, load_id: int, items: list["FileItem"]) -> None:
+        """Append a batch of a progressive load (any thread)."""
+        self._relay.batch_ready.emit(load_id, items)
+
+    def finish_progressive_load(self, load_id: int, cancelled: bool = False) -> None:
+        """Refresh the UI after a progressive load (any thread)."""
+        self._relay.finished.emit(load_id, cancelled)
+
+    def apply_file_changes(self, changes: list[Any]) -> None:
+        """Apply filesystem-monitor file events (any thread)."""
+        self._relay.file_changes.emit(changes)
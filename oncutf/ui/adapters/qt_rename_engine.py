@@ -78,6 +78,9 @@ class QtRenameEngine(QObject):
 
         """
         result = self._engine.generate_preview(files, modules_data, post_transform, metadata_cache)
+        if result.cancelled:
+            # Superseded; the newer request emits for itself
+            return result
         self.preview_updated.emit()
         self.state_changed.emit()
         return result
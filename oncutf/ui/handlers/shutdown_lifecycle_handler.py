@@ -417,6 +417,7 @@ class ShutdownLifecycleHandler:
             self._pre_cleanup_flush_batch_operations()
             self._pre_cleanup_cleanup_drag_manager()
             self._pre_cleanup_cleanup_dialogs()
+            self._pre_cleanup_cancel_file_import()
             self._pre_cleanup_cleanup_metadata_thread()
 
         except Exception:
@@ -505,6 +506,15 @@ class ShutdownLifecycleHandler:
             except Exception as e:
                 logger.warning("[CloseEvent] Dialog cleanup failed: %s", e)
 
+    def _pre_cleanup_cancel_file_import(self) -> None:
+        """Cancel a recursive folder load still running in the background."""
+        file_load_manager = getattr(self.main_window, "file_load_manager", None)
+        if file_load_manager is not None:
+            try:
+                file_load_manager.cancel_background_import()
+            except Exception as e:
+                logger.warning("[CloseEvent] Background import cancellation failed: %s", e)
+
     def _pre_cleanup_cleanup_metadata_thread(self) -> None:
         """Cleanup metadata manager and thread before shutdown."""
         # Cancel any pending filesystem monitor resume timers to prevent post-shutdown execution
@@ -525,6 +535,22 @@ class ShutdownLifecycleHandler:
             except Exception as e:
                 logger.warning("[CloseEvent] Metadata manager cleanup failed: %s", e)
 
+        # Stop the metadata extraction worker processes
+        try:
+            from oncutf.infra.external.exopsis_process_pool import shutdown_exopsis_process_pool
+
+            shutdown_exopsis_process_pool()
+        except Exception as e:
+            logger.warning("[CloseEvent] Metadata worker processes shutdown failed: %s", e)
+
+        # Stop the preview worker processes
+        try:
+            from oncutf.core.rename.parallel_preview import shutdown_preview_pool
+
+            shutdown_preview_pool()
+        except Exception as e:
+            logger.warning("[CloseEvent] Preview worker processes shutdown failed: %s", e)
+
         # Then cleanup the metadata thread if it exists separately
         if hasattr(self.main_window, "metadata_thread") and self.main_window.metadata_thread:
             try:
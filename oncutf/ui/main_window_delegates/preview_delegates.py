@@ -32,6 +32,8 @@ class PreviewDelegates:
         The timer resets on each call, so only the final state triggers preview.
         """
         self._preview_pending = True
+        # The rename data changed, so a preview still running is stale
+        self.utility_manager.cancel_running_preview()
 
         # Cancel existing timer
         if self._preview_debounce_timer_id:
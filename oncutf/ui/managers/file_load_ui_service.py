@@ -38,6 +38,9 @@ class FileLoadUIService:
     def __init__(self, parent_window: Any = None) -> None:
         """Initialize with parent window reference for UI access."""
         self.parent_window = parent_window
+        # Progressive (background) load currently accepting batches
+        self._progressive_load_id: int | None = None
+        self._progressive_paths: set[str] = set()
         logger.debug("[FileLoadUIService] Initialized")
 
     def update_model_and_ui(self, items: list[FileItem], clear: bool = True) -> None:
@@ -60,6 +63,9 @@ class FileLoadUIService:
             logger.error("[FileLoadUIService] Parent window has no file_model attribute")
             return
 
+        # A synchronous load supersedes any progressive load still delivering
+        self._progressive_load_id = None
+
         try:
             # Set current folder path from first file's directory
             if items and clear:
@@ -87,20 +93,8 @@ class FileLoadUIService:
                         extra={"dev_only": True},
                     )
 
-            # Reset sort to default (filename ascending) on each new folder load.
-            # This ensures files always start in a predictable order regardless
-            # of whatever sort state was saved from a previous session.
-            if clear and hasattr(self.parent_window, "current_sort_column"):
-                self.parent_window.current_sort_column = SESSION_STATE_DEFAULTS["sort_column"]
-                self.parent_window.current_sort_order = Qt.SortOrder(
-                    SESSION_STATE_DEFAULTS["sort_order"]
-                )
-                logger.debug(
-                    "[FileLoadUIService] Reset sort state to default: column=%d, order=%d",
-                    SESSION_STATE_DEFAULTS["sort_column"],
-                    SESSION_STATE_DEFAULTS["sort_order"],
-                    extra={"dev_only": True},
-                )
+            if clear:
+                self._reset_sort_state()
 
             # Use streaming loading for large file sets (> 200 files)
             if len(items) > 200:
@@ -116,6 +110,113 @@ class FileLoadUIService:
         except Exception:
             logger.exception("[FileLoadUIService] Error updating model and UI")
 
+    def _reset_sort_state(self) -> None:
+        """Reset sort to default (filename ascending) on each new folder load.
+
+        This ensures files always start in a predictable order regardless
+        of whatever sort state was saved from a previous session.
+        """
+        if hasattr(self.parent_window, "current_sort_column"):
+            self.parent_window.current_sort_column = SESSION_STATE_DEFAULTS["sort_column"]
+            self.parent_window.current_sort_order = Qt.SortOrder(
+                SESSION_STATE_DEFAULTS["sort_order"]
+            )
+            logger.debug(
+                "[FileLoadUIService] Reset sort state to default: column=%d, order=%d",
+                SESSION_STATE_DEFAULTS["sort_column"],
+                SESSION_STATE_DEFAULTS["sort_order"],
+                extra={"dev_only": True},
+            )
+
+    # =====================================
+    # Progressive (background) loading
+    # =====================================
+
+    def begin_progressive_load(self, load_id: int, folder_path: str, clear: bool = True) -> None:
+        """Prepare the model for a load whose files arrive in batches.
+
+        Args:
+            load_id: Identifies the load; batches of other loads are ignored
+            folder_path: Root folder being loaded (recursively)
+            clear: Whether to replace (True) or merge (False)
+
+        """
+        self._progressive_load_id = load_id
+        if clear:
+            self.parent_window.context.set_current_folder(folder_path, True)
+            self._reset_sort_state()
+            self.parent_window.file_model.set_files([])
+            self.parent_window.context.file_store.set_loaded_files([])
+            self._progressive_paths = set()
+        else:
+            self._progressive_paths = {f.full_path for f in self.parent_window.file_model.files}
+
+        # Suppress placeholder visibility while the model is still empty
+        if hasattr(self.parent_window, "file_list_view"):
+            self.parent_window.file_list_view._loading_in_progress = True
+        logger.info(
+            "[FileLoadUIService] Progressive load %d started: %s (clear=%s)",
+            load_id,
+            folder_path,
+            clear,
+            extra={"dev_only": True},
+        )
+
+    def add_loaded_batch(self, load_id: int, items: list[FileItem]) -> None:
+        """Append a batch of a progressive load to the model and FileStore.
+
+        Args:
+            load_id: Load the batch belongs to
+            items: FileItem objects to append
+
+        """
+        if load_id != self._progressive_load_id:
+            return
+
+        new_items = [item for item in items if item.full_path not in self._progressive_paths]
+        self._progressive_paths.update(item.full_path for item in new_items)
+        if not new_items:
+            return
+
+        self.parent_window.file_model.add_files(new_items)
+        self.parent_window.context.file_store.add_loaded_files(new_items)
+        if hasattr(self.parent_window, "file_list_view"):
+            self.parent_window.file_list_view.set_placeholder_visible(False)
+
+    def finish_progressive_load(self, load_id: int, cancelled: bool = False) -> None:
+        """Refresh the UI after the last batch of a progressive load.
+
+        Args:
+            load_id: Load that finished
+            cancelled: Whether the load was cancelled before the walk completed
+
+        """
+        if load_id != self._progressive_load_id:
+            return
+
+        self._progressive_load_id = None
+        self._progressive_paths = set()
+        logger.info(
+            "[FileLoadUIService] Progressive load %d %s with %d files",
+            load_id,
+            "cancelled" if cancelled else "finished",
+            len(self.parent_window.file_model.files),
+        )
+        self.refresh_ui_after_load()
+        if not self.parent_window.file_model.files:
+            self.update_metadata_search_state(False)
+
+    def apply_file_changes(self, changes: list[Any]) -> None:
+        """Apply filesystem-monitor file events to the loaded files.
+
+        Args:
+            changes: FileChange events in the order they happened
+
+        """
+        manager = getattr(self.parent_window, "file_load_manager", None)
+        if manager is not None:
+            manager.apply_file_changes(changes)
+
     def _load_files_immediate(self, items: list[FileItem], clear: bool = True) -> None:
         """Load files immediately for small file sets.
 
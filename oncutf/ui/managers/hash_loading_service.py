@@ -25,7 +25,7 @@ from typing import TYPE_CHECKING, Any, Optional
 
 from PyQt5.QtCore import Qt
 
-from oncutf.config import STATUS_COLORS
+from oncutf.config import COMPARE_HASH_ALGORITHM, DUPLICATE_HASH_ALGORITHM, STATUS_COLORS
 from oncutf.domain.models.file_item import FileItem
 from oncutf.utils.filesystem.path_utils import paths_equal
 from oncutf.utils.logging.logger_factory import get_cached_logger
@@ -529,9 +529,11 @@ class HashLoadingService:
 
         # Setup worker based on operation type
         if operation == "duplicates":
-            self._hash_worker.setup_duplicate_scan(file_paths)
+            self._hash_worker.setup_duplicate_scan(file_paths, DUPLICATE_HASH_ALGORITHM)
         elif operation == "compare":
-            self._hash_worker.setup_external_comparison(file_paths, external_folder or "")
+            self._hash_worker.setup_external_comparison(
+                file_paths, external_folder or "", COMPARE_HASH_ALGORITHM
+            )
         elif operation == "checksums":
             self._hash_worker.setup_checksum_calculation(file_paths)
 
@@ -16,6 +16,7 @@ from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QColor, QFont, QStandardItem, QStandardItemModel
 
 from oncutf.config import METADATA_ICON_COLORS
+from oncutf.ui.widgets.metadata_tree.service import classify_metadata_key
 
 # Initialize Logger
 from oncutf.utils.logging.logger_factory import get_cached_logger
@@ -31,149 +32,10 @@ def format_key(key: str) -> str:
 def classify_key(key: str) -> str:
     """Classify a metadata key into a detailed group label.
     Enhanced grouping for better organization of metadata.
+
+    Uses the metadata tree's classification, memoized across files.
     """
-    key_lower = key.lower()
-
-    # File-related metadata
-    if key_lower.startswith("draft") or key_lower in {
-        "rotation",
-        "directory",
-        "sourcefile",
-    }:
-        return "File Info"
-
-    # Camera Settings - Critical for photography/videography
-    if any(
-        term in key_lower
-        for term in [
-            "iso",
-            "aperture",
-            "fnumber",
-            "shutter",
-            "exposure",
-            "focal",
-            "flash",
-            "metering",
-            "whitebalance",
-            "gain",
-            "lightvalue",
-        ]
-    ):
-        return "Camera Settings"
-
-    # GPS and Location
-    if any(term in key_lower for term in ["gps", "location", "latitude", "longitude", "altitude"]):
-        return "GPS & Location"
-
-    # Sensor Data (accelerometer, gyroscope, etc.)
-    if any(
-        term in key_lower
-        for term in [
-            "accelerometer",
-            "gyro",
-            "pitch",
-            "roll",
-            "yaw",
-            "rotation",
-            "orientation",
-            "gravity",
-            "magnetometer",
-            "compass",
-        ]
-    ):
-        return "Sensor Data"
-
-    # Audio-related metadata
-    if key_lower.startswith("audio") or key_lower in {
-        "samplerate",
-        "channelmode",
-        "bitrate",
-        "title",
-        "album",
-        "artist",
-        "composer",
-        "genre",
-        "duration",
-    }:
-        return "Audio Info"
-
-    # Image-specific metadata
-    if (
-        key_lower.startswith("image")
-        or "sensor" in key_lower
-        or any(term in key_lower for term in ["width", "height", "resolution", "dpi", "colorspace"])
-    ):
-        return "Image Info"
-
-    # Video-specific metadata
-    if any(
-        term in key_lower
-        for term in [
-            "movie",
-            "frame",
-            "codec",
-            "bitrate",
-            "fps",
-            "duration",
-            "format",
-            "avgbitrate",
-            "maxbitrate",
-            "videocodec",
-        ]
-    ):
-        return "Video Info"
-
-    # Color and Processing
-    if any(
-        term in key_lower
-        for term in [
-            "color",
-            "saturation",
-            "contrast",
-            "brightness",
-            "hue",
-            "gamma",
-            "curve",
-            "tone",
-            "highlight",
-            "shadow",
-            "vibrance",
-        ]
-    ):
-        return "Color & Processing"
-
-    # Lens Information
-    if any(
-        term in key_lower
-        for term in ["lens", "zoom", "focus", "distortion", "vignetting", "chromatic"]
-    ):
-        return "Lens Info"
-
-    # Copyright and Rights
-    if any(
-        term in key_lower
-        for term in ["copyright", "rights", "creator", "owner", "license", "usage"]
-    ):
-        return "Copyright & Rights"
-
-    # Technical/System
-    if any(
-        term in key_lower
-        for term in [
-            "version",
-            "software",
-            "firmware",
-            "make",
-            "model",
-            "serial",
-            "uuid",
-            "id",
-        ]
-    ):
-        return "Technical Info"
-
-    # Everything else
-    return "Other"
+    return classify_metadata_key(key)
 
 
 def create_item(text: str, alignment: Any = None, icon_name: str | None = None) -> QStandardItem:
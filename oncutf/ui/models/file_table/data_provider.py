@@ -20,13 +20,20 @@ if TYPE_CHECKING:
 from PyQt5.QtCore import QModelIndex, Qt, QVariant
 from PyQt5.QtGui import QColor
 
+from oncutf.config import FILE_TABLE_PREFETCH_MARGIN
 from oncutf.config.ui import MISSED_TEXT_COLOR, MODIFIED_TEXT_COLOR
 from oncutf.ui.adapters.qt_app_context import get_qt_app_context
+from oncutf.ui.models.file_table.row_state_cache import RowStateCache
 from oncutf.utils.filesystem.file_size_formatter import format_file_size_system_compatible
 from oncutf.utils.logging.logger_factory import get_cached_logger
 
 logger = get_cached_logger(__name__)
 
+# Columns whose text does not come from metadata
+_FILE_COLUMNS = frozenset(
+    {"filename", "color", "file_size", "type", "modified", "path", "file_hash"}
+)
+
 
 class DataProvider:
     """Provides Qt model data interface for file table display.
@@ -37,6 +44,7 @@ class DataProvider:
         - Provide flags() for cell behavior
         - Provide headerData() for column headers
         - Format data appropriately for different roles
+        - Batch-load hash and metadata state for the rows being painted
     """
 
     def __init__(
@@ -59,6 +67,7 @@ class DataProvider:
         self.column_manager = column_manager
         self.icon_manager = icon_manager
         self.parent_window = parent_window
+        self.row_states = RowStateCache()
 
     def row_count(self) -> int:
         """Return the number of rows (files) in the model.
@@ -101,13 +110,17 @@ class DataProvider:
             if column_key == "type":
                 return str(file.extension)
             if column_key == "modified":
-                if isinstance(file.modified, datetime):
-                    return file.modified.strftime("%Y-%m-%d %H:%M:%S")
+                modified = file.modified  # converted from the timestamp on access
+                if isinstance(modified, datetime):
+                    return modified.strftime("%Y-%m-%d %H:%M:%S")
                 # file.modified may be str in edge cases
-                return str(file.modified)
+                return str(modified)
             if column_key == "path":
                 return str(file.full_path)
             if column_key == "file_hash":
+                state = self.row_states.get(file.full_path)
+                if state is not None:
+                    return state.hash_value or ""
                 return self.icon_manager.get_hash_value(file.full_path)
             # For metadata columns, try to get from metadata cache
             return self._get_metadata_value(file, column_key)
@@ -154,15 +167,35 @@ class DataProvider:
             Metadata value as string or empty string if not found
 
         """
-        # Try to get metadata value from cache
-        if self.parent_window and hasattr(self.parent_window, "metadata_cache"):
+        state = self.row_states.get(file.full_path)
+        if state is not None and state.metadata is not None:
+            value = state.values.get(column_key)
+            if value is None:
+                from oncutf.core.metadata.field_mapper import MetadataFieldMapper
+
+                try:
+                    value = MetadataFieldMapper.get_metadata_value(state.metadata, column_key)
+                except Exception:
+                    logger.debug(
+                        "Error mapping metadata for %s",
+                        column_key,
+                        exc_info=True,
+                        extra={"dev_only": True},
+                    )
+                    value = ""
+                state.values[column_key] = value
+            return value
+
+        # Try to get metadata value from cache (rows not loaded by prefetch_rows)
+        if state is None and self.parent_window and hasattr(self.parent_window, "metadata_cache"):
             try:
                 entry = self.parent_window.metadata_cache.get_entry(file.full_path)
-                if entry and hasattr(entry, "data") and entry.data:
+                metadata = getattr(entry, "fields", None) or getattr(entry, "data", None)
+                if metadata:
                     # Use centralized metadata field mapper
                     from oncutf.core.metadata.field_mapper import MetadataFieldMapper
 
-                    return MetadataFieldMapper.get_metadata_value(entry.data, column_key)
+                    return MetadataFieldMapper.get_metadata_value(metadata, column_key)
             except Exception:
                 logger.debug(
                     "Error accessing metadata cache for %s",
@@ -205,6 +238,9 @@ class DataProvider:
 
         file = self.model.files[index.row()]
 
+        if role in (Qt.DisplayRole, Qt.DecorationRole) and file.full_path not in self.row_states:
+            self.prefetch_rows(index.row(), index.row())
+
         # Support Qt.UserRole for thumbnail viewport (returns FileItem)
         if role == Qt.UserRole:
             return file
@@ -270,21 +306,30 @@ class DataProvider:
             except Exception:
                 pass
 
-            if self.parent_window and hasattr(self.parent_window, "metadata_cache"):
-                entry = self.parent_window.metadata_cache.get_entry(file.full_path)
-                if entry and hasattr(entry, "data") and entry.data:
-                    # Check modified status first
-                    if is_modified or (hasattr(entry, "modified") and entry.modified):
-                        metadata_status = "modified"
-                    elif hasattr(entry, "is_extended") and entry.is_extended:
-                        metadata_status = "extended"
-                    else:
-                        metadata_status = "loaded"
-
-            # Determine hash status
-            hash_status = (
-                "tag" if self.icon_manager.has_hash_cached(file.full_path) else "hash_unavailable"
-            )
+            state = self.row_states.get(file.full_path)
+            if state is not None:
+                metadata_status = state.metadata_status
+                if is_modified and state.metadata is not None:
+                    metadata_status = "modified"
+                hash_status = "tag" if state.hash_value else "hash_unavailable"
+            else:
+                if self.parent_window and hasattr(self.parent_window, "metadata_cache"):
+                    entry = self.parent_window.metadata_cache.get_entry(file.full_path)
+                    if entry and hasattr(entry, "data") and entry.data:
+                        # Check modified status first
+                        if is_modified or (hasattr(entry, "modified") and entry.modified):
+                            metadata_status = "modified"
+                        elif hasattr(entry, "is_extended") and entry.is_extended:
+                            metadata_status = "extended"
+                        else:
+                            metadata_status = "loaded"
+
+                # Determine hash status
+                hash_status = (
+                    "tag"
+                    if self.icon_manager.has_hash_cached(file.full_path)
+                    else "hash_unavailable"
+                )
 
             # Create and return combined icon
             return self.icon_manager.create_combined_icon(metadata_status, hash_status)
@@ -297,6 +342,52 @@ class DataProvider:
 
         return None
 
+    def prefetch_rows(self, first_row: int, last_row: int) -> None:
+        """Load hash and metadata state for a window of rows in one batch.
+
+        Rows from *first_row* to *last_row* plus FILE_TABLE_PREFETCH_MARGIN on
+        each side are loaded unless already held, together with the values of
+        the visible metadata columns. data() then serves these rows without
+        database lookups.
+
+        Args:
+            first_row: First visible row
+            last_row: Last visible row
+
+        """
+        files = self.model.files
+        start = max(0, first_row - FILE_TABLE_PREFETCH_MARGIN)
+        stop = min(len(files), last_row + FILE_TABLE_PREFETCH_MARGIN + 1)
+        window = [f for f in files[start:stop] if f.full_path not in self.row_states]
+        if not window:
+            return
+
+        metadata_cache = getattr(self.parent_window, "metadata_cache", None)
+        self.row_states.load(window, metadata_cache)
+
+        metadata_columns = [
+            key for key in self.column_manager.get_visible_columns() if key not in _FILE_COLUMNS
+        ]
+        for file in window:
+            for column_key in metadata_columns:
+                self._get_metadata_value(file, column_key)
+
+    def invalidate_rows(
+        self, top_left: QModelIndex, bottom_right: QModelIndex, _roles: Any = None
+    ) -> None:
+        """Drop the loaded state of the rows in a dataChanged range."""
+        files = self.model.files
+        first = max(0, top_left.row())
+        last = min(len(files) - 1, bottom_right.row())
+        if first == 0 and last == len(files) - 1:
+            self.row_states.clear()
+        else:
+            self.row_states.invalidate(f.full_path for f in files[first : last + 1])
+
+    def clear_row_states(self) -> None:
+        """Drop the loaded state of all rows."""
+        self.row_states.clear()
+
     def set_data(self, index: QModelIndex, value: Any, role: int = Qt.EditRole) -> bool:
         """Set data for the given index.
 
@@ -10,6 +10,7 @@ Author: Michael Economou
 Date: 2026-01-01
 """
 
+from collections.abc import Iterable
 from typing import Any, Literal
 
 from PyQt5.QtCore import (
@@ -59,6 +60,7 @@ class FileTableModel(QAbstractTableModel):
         logger.debug("FileTableModel __init__ called", extra={"dev_only": True})
         self.parent_window: Any = parent_window
         self.files: list[FileItem] = []
+        self._row_index: dict[str, int] = {}
         self._direct_loader = None
         self._table_view_ref = None
 
@@ -77,6 +79,11 @@ class FileTableModel(QAbstractTableModel):
         )
         self._file_ops = FileOperationsManager(self, self._icon_manager)
 
+        # Drop batched row state whenever rows are repainted because they changed
+        self.dataChanged.connect(self._data_provider.invalidate_rows)
+        self.modelReset.connect(self._data_provider.clear_row_states)
+        self.layoutChanged.connect(self._data_provider.clear_row_states)
+
     # ==================== Column Management (delegated) ====================
 
     @property
@@ -137,6 +144,10 @@ class FileTableModel(QAbstractTableModel):
         """Get data for the given index and role."""
         return self._data_provider.data(index, role)
 
+    def prefetch_rows(self, first_row: int, last_row: int) -> None:
+        """Batch-load hash and metadata state for the visible rows."""
+        self._data_provider.prefetch_rows(first_row, last_row)
+
     def setData(self, index: QModelIndex, value: Any, role: int = Qt.EditRole) -> bool:
         """Set data for the given index."""
         return self._data_provider.set_data(index, value, role)
@@ -214,6 +225,25 @@ class FileTableModel(QAbstractTableModel):
         """Update the row for the given file item."""
         self._file_ops.update_file_metadata(file_item)
 
+    def rows_for_paths(self, paths: Iterable[str]) -> list[int]:
+        """Return the rows of the files with the given paths (unknown paths are skipped).
+
+        Uses a path-to-row index that is rebuilt when it no longer matches
+        ``files`` (at most once per call).
+        """
+        files = self.files
+        rebuilt = False
+        rows: list[int] = []
+        for path in paths:
+            row = self._row_index.get(path)
+            if (row is None or row >= len(files) or files[row].full_path != path) and not rebuilt:
+                self._row_index = {file.full_path: i for i, file in enumerate(files)}
+                rebuilt = True
+                row = self._row_index.get(path)
+            if row is not None and row < len(files) and files[row].full_path == path:
+                rows.append(row)
+        return rows
+
     # ==================== Sorting (partially delegated) ====================
 
     def sort(self, column: int, order: Qt.SortOrder = Qt.AscendingOrder) -> None:
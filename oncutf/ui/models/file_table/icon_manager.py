@@ -106,8 +106,9 @@ class IconManager:
         # Add metadata status
         if self.parent_window and hasattr(self.parent_window, "metadata_cache"):
             entry = self.parent_window.metadata_cache.get_entry(file.full_path)
-            if entry and hasattr(entry, "data") and entry.data:
-                field_count = len(entry.data)
+            metadata = getattr(entry, "fields", None) or getattr(entry, "data", None)
+            if metadata:
+                field_count = len(metadata)
                 # Check the is_extended property of the MetadataEntry object
                 if hasattr(entry, "is_extended") and entry.is_extended:
                     tooltip_parts.append(f"{field_count} extended metadata")
@@ -0,0 +1,136 @@
+"""oncutf.ui.models.file_table.row_state_cache.
+
+Batched hash and metadata state for file table rows.
+
+Painting a row needs its hash (status icon and hash column), its metadata
+status and the mapped values of the visible metadata columns. Looking these
+up per cell hits the hash and metadata databases on every repaint, and files
+without a hash are looked up again each time. ``RowStateCache`` loads the
+state of a whole window of rows with one hash query and one metadata query
+and keeps it, including misses, until the rows are invalidated.
+
+Author: Michael Economou
+Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from oncutf.config import FILE_TABLE_ROW_STATE_CACHE_SIZE
+from oncutf.utils.filesystem.file_status_helpers import get_hashes_for_files
+from oncutf.utils.filesystem.path_normalizer import normalize_path
+from oncutf.utils.logging.logger_factory import get_cached_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+    from oncutf.domain.models.file_item import FileItem
+
+logger = get_cached_logger(__name__)
+
+
+@dataclass
+class RowState:
+    """Hash and metadata state of one file, as loaded for display."""
+
+    hash_value: str | None
+    metadata_status: str
+    metadata: Mapping[str, Any] | None
+    values: dict[str, str] = field(default_factory=dict)
+
+
+class RowStateCache:
+    """Row states keyed by file path, loaded a window at a time.
+
+    The least recently loaded rows are dropped first once more than
+    *max_rows* are held.
+    """
+
+    def __init__(self, max_rows: int = FILE_TABLE_ROW_STATE_CACHE_SIZE) -> None:
+        """Initialize an empty cache holding at most *max_rows* rows."""
+        self._max_rows = max(1, max_rows)
+        self._states: OrderedDict[str, RowState] = OrderedDict()
+
+    def __contains__(self, file_path: str) -> bool:
+        """Return True if the state of *file_path* is loaded."""
+        return file_path in self._states
+
+    def __len__(self) -> int:
+        """Return the number of loaded rows."""
+        return len(self._states)
+
+    def get(self, file_path: str) -> RowState | None:
+        """Return the loaded state of *file_path*, or None if not loaded."""
+        return self._states.get(file_path)
+
+    def load(self, files: list[FileItem], metadata_cache: Any = None) -> None:
+        """Load the state of *files* with one hash and one metadata lookup.
+
+        Args:
+            files: Files to load (already loaded ones are reloaded)
+            metadata_cache: Metadata cache of the main window, if any
+
+        """
+        if not files:
+            return
+
+        paths = [f.full_path for f in files]
+        hashes = get_hashes_for_files(paths)
+        entries = self._metadata_entries(paths, metadata_cache)
+
+        for path in paths:
+            entry = entries.get(path)
+            metadata = self._entry_fields(entry)
+            if metadata is None:
+                status = "metadata_unavailable"
+            elif getattr(entry, "modified", False):
+                status = "modified"
+            elif getattr(entry, "is_extended", False):
+                status = "extended"
+            else:
+                status = "loaded"
+            self._states[path] = RowState(hashes.get(path), status, metadata)
+            self._states.move_to_end(path)
+
+        while len(self._states) > self._max_rows:
+            self._states.popitem(last=False)
+
+        logger.debug(
+            "[RowStateCache] Loaded %d rows (%d held)",
+            len(paths),
+            len(self._states),
+            extra={"dev_only": True},
+        )
+
+    @staticmethod
+    def _entry_fields(entry: Any) -> Mapping[str, Any] | None:
+        """Return the metadata of *entry* (undecoded where possible), or None."""
+        if entry is None:
+            return None
+        metadata = getattr(entry, "fields", None)
+        if metadata is None:
+            metadata = getattr(entry, "data", None)
+        return metadata or None
+
+    @staticmethod
+    def _metadata_entries(paths: list[str], metadata_cache: Any) -> dict[str, Any]:
+        """Return path -> metadata entry (or None) for *paths*."""
+        if metadata_cache is None:
+            return {}
+        if hasattr(metadata_cache, "get_entries_batch"):
+            normalized = {path: normalize_path(path) for path in paths}
+            entries = metadata_cache.get_entries_batch(list(normalized.values()))
+            return {path: entries.get(norm_path) for path, norm_path in normalized.items()}
+        return {path: metadata_cache.get_entry(path) for path in paths}
+
+    def invalidate(self, file_paths: Iterable[str]) -> None:
+        """Drop the state of *file_paths* so it is reloaded on next use."""
+        for path in file_paths:
+            self._states.pop(path, None)
+
+    def clear(self) -> None:
+        """Drop all row states."""
+        self._states.clear()
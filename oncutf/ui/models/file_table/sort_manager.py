@@ -72,7 +72,7 @@ class SortManager:
         if column_key == "type":
             return sorted(files, key=lambda f: f.extension.lower(), reverse=reverse)
         if column_key == "modified":
-            return sorted(files, key=lambda f: f.modified, reverse=reverse)
+            return sorted(files, key=lambda f: f.mtime, reverse=reverse)
         if column_key == "path":
             return sorted(files, key=lambda f: f.full_path.lower(), reverse=reverse)
         if column_key == "file_hash":
@@ -110,7 +110,9 @@ class SortManager:
         """
         if self.parent_window and hasattr(self.parent_window, "metadata_cache"):
             entry = self.parent_window.metadata_cache.get_entry(file.full_path)
-            if entry and hasattr(entry, "data") and entry.data:
+            # Look up fields without decoding the whole stored entry
+            metadata = getattr(entry, "fields", None) or getattr(entry, "data", None)
+            if metadata:
                 # Map column keys to metadata keys (using actual EXIF/QuickTime keys)
                 # Use centralized metadata field mapper for sorting
                 from oncutf.core.metadata.field_mapper import MetadataFieldMapper
@@ -121,8 +123,8 @@ class SortManager:
                 # Find the first available key in the metadata
                 found_value = None
                 for key in possible_keys:
-                    if key in entry.data:
-                        found_value = entry.data[key]
+                    if key in metadata:
+                        found_value = metadata[key]
                         break
 
                 if found_value is not None:
@@ -79,6 +79,9 @@ class UtilityManager:
         """
         logger.debug("[UtilityManager] request_preview_update called", extra={"dev_only": True})
 
+        # A preview still running for the old selection or rename data is stale
+        self.cancel_running_preview()
+
         # Cancel existing timer
         if self._preview_timer_id:
             cancel_timer(self._preview_timer_id)
@@ -86,6 +89,12 @@ class UtilityManager:
         # Schedule preview update with 300ms debounce (consistent with UI refresh)
         self._preview_timer_id = schedule_preview_update(self.generate_preview_names, delay=300)
 
+    def cancel_running_preview(self) -> None:
+        """Abandon a preview that is still being generated, if any."""
+        engine = getattr(self.main_window, "unified_rename_engine", None)
+        if engine:
+            engine.preview_manager.cancel_preview()
+
     def force_reload(self) -> None:
         """Triggered by F5.
         If Ctrl is held, metadata scan is skipped (like Select/Browse).
@@ -337,6 +346,11 @@ class UtilityManager:
                     )
                 )
 
+                if preview_result.cancelled:
+                    # Let the next request regenerate even if nothing changed
+                    self._last_rename_data_hash = None
+                    return
+
                 name_pairs = preview_result.name_pairs
                 has_changes = preview_result.has_changes
 
@@ -153,6 +153,11 @@ class FileListView(QTableView):
         # Install event filters on scrollbars to clear hover when mouse enters them
         self._setup_scrollbar_hover_clear()
 
+        # Load hash/metadata state of newly visible rows in one batch per scroll step
+        self.verticalScrollBar().valueChanged.connect(
+            lambda _value: self._viewport_handler.prefetch_visible_rows()
+        )
+
         # Schedule header visibility update
         schedule_ui_update(self._column_mgmt_behavior._update_header_visibility, delay=100)
 
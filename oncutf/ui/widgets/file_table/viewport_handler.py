@@ -8,6 +8,7 @@ Handles scrollbar visibility and viewport operations:
 - Force scrollbar updates
 - Refresh text display
 - Coordinate with column manager for horizontal scrollbar
+- Prefetch row state for the visible rows on scroll
 """
 
 from __future__ import annotations
@@ -160,6 +161,20 @@ class ViewportHandler:
             bottom_right = model.index(model.rowCount() - 1, model.columnCount() - 1)
             self._view.dataChanged(top_left, bottom_right)
 
+    def prefetch_visible_rows(self) -> None:
+        """Batch-load hash and metadata state for the rows now in view."""
+        model = self._view.model()
+        if model is None or not hasattr(model, "prefetch_rows") or model.rowCount() == 0:
+            return
+
+        first = self._view.rowAt(0)
+        if first < 0:
+            return
+        last = self._view.rowAt(self._view.viewport().height() - 1)
+        if last < 0:
+            last = model.rowCount() - 1
+        model.prefetch_rows(first, last)
+
     def ensure_scrollbar_visibility(self) -> None:
         """Public method to ensure scrollbar visibility is correct."""
         self.update_scrollbar_visibility()
@@ -0,0 +1,257 @@
+"""Module: item_model.py.
+
+Author: Michael Economou
+Date: 2026-10-16
+
+Qt item model for the metadata tree.
+
+The tree used to be a QStandardItemModel rebuilt on every selection change:
+two QStandardItems per field, a QFont and QColor per styled row, and a key
+simplification per field, whether the row was ever painted or not. For files
+with several hundred extended metadata keys that made arrowing through the
+file table lag on every keystroke.
+
+``MetadataTreeItemModel`` serves the rows straight from the TreeNodeData
+hierarchy built by the service. Display text, fonts, colors and tooltips are
+produced when the view asks for them and remembered per row; fonts and colors
+are shared by all rows. The controller keeps the models of recently shown
+files, so reselecting a file reuses its model as is.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from PyQt5.QtCore import QAbstractItemModel, QModelIndex, Qt
+from PyQt5.QtGui import QColor, QFont
+
+from oncutf.config import METADATA_ICON_COLORS
+from oncutf.ui.widgets.metadata_tree.model import FieldStatus
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from oncutf.ui.widgets.metadata_tree.model import TreeNodeData
+
+# internalId of top-level (group) indexes; field indexes store group row + 1
+_GROUP_ID = 0
+
+_MODIFIED_TOOLTIP = "Modified value"
+_EXTENDED_TOOLTIP = "Available only in extended metadata mode"
+
+# Same flags a QStandardItem has by default
+_DEFAULT_FLAGS = (
+    Qt.ItemIsSelectable
+    | Qt.ItemIsEditable
+    | Qt.ItemIsEnabled
+    | Qt.ItemIsDragEnabled
+    | Qt.ItemIsDropEnabled
+)
+
+
+class _RowDisplay:
+    """Display roles of one row (key and value columns)."""
+
+    __slots__ = ("fonts", "foregrounds", "texts", "tooltips")
+
+    def __init__(
+        self,
+        texts: tuple[str, str],
+        fonts: tuple[QFont | None, QFont | None] = (None, None),
+        foregrounds: tuple[QColor | None, QColor | None] = (None, None),
+        tooltips: tuple[str | None, str | None] = (None, None),
+    ) -> None:
+        self.texts = texts
+        self.fonts = fonts
+        self.foregrounds = foregrounds
+        self.tooltips = tooltips
+
+
+class _Styles:
+    """Fonts and colors shared by every metadata tree row (created on first use)."""
+
+    _instance: _Styles | None = None
+
+    def __init__(self) -> None:
+        self.group_font = QFont()
+        self.group_font.setBold(True)
+        self.group_font.setPointSize(10)
+        self.modified_font = QFont()
+        self.modified_font.setBold(True)
+        self.extended_font = QFont()
+        self.extended_font.setItalic(True)
+        self.modified_color = QColor(METADATA_ICON_COLORS["modified"])
+        self.extended_color = QColor(100, 150, 255)
+
+    @classmethod
+    def get(cls) -> _Styles:
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+
+class MetadataTreeItemModel(QAbstractItemModel):
+    """Two-column (Key, Value) model over a grouped TreeNodeData hierarchy.
+
+    Groups are top-level rows, their fields are children of the key column.
+    """
+
+    def __init__(
+        self,
+        root: TreeNodeData,
+        format_key: Callable[[str], str],
+        parent: Any = None,
+    ) -> None:
+        """Initialize the model.
+
+        Args:
+            root: Root node whose children are the group nodes
+            format_key: Turns a field key into its display text
+            parent: Optional QObject parent
+
+        """
+        super().__init__(parent)
+        self._groups = root.children
+        self._format_key = format_key
+        self._rows: dict[tuple[int, int], _RowDisplay] = {}
+
+    @property
+    def group_count(self) -> int:
+        """Number of top-level groups."""
+        return len(self._groups)
+
+    # -------------------------------------------------------------------------
+    # Structure
+    # -------------------------------------------------------------------------
+
+    def index(self, row: int, column: int, parent: QModelIndex | None = None) -> QModelIndex:
+        """Return the index of a group (no parent) or of a field in a group."""
+        if not 0 <= column < 2:
+            return QModelIndex()
+        if parent is None or not parent.isValid():
+            if 0 <= row < len(self._groups):
+                return self.createIndex(row, column, _GROUP_ID)
+            return QModelIndex()
+        if (
+            parent.internalId() == _GROUP_ID
+            and parent.column() == 0
+            and 0 <= row < len(self._groups[parent.row()].children)
+        ):
+            return self.createIndex(row, column, parent.row() + 1)
+        return QModelIndex()
+
+    def parent(self, index: QModelIndex | None = None) -> Any:
+        """Return the group of a field index (groups have no parent).
+
+        Called without an index, returns the QObject parent like QObject.parent().
+        """
+        if index is None:
+            return super().parent()
+        if not index.isValid() or index.internalId() == _GROUP_ID:
+            return QModelIndex()
+        return self.createIndex(index.internalId() - 1, 0, _GROUP_ID)
+
+    def rowCount(self, parent: QModelIndex | None = None) -> int:
+        """Return the number of groups, or of fields in a group."""
+        if parent is None or not parent.isValid():
+            return len(self._groups)
+        if parent.internalId() == _GROUP_ID and parent.column() == 0:
+            return len(self._groups[parent.row()].children)
+        return 0
+
+    def columnCount(self, _parent: QModelIndex | None = None) -> int:
+        """Return the column count (Key, Value)."""
+        return 2
+
+    def hasChildren(self, parent: QModelIndex | None = None) -> bool:
+        """Return True for the root and for groups with fields."""
+        return self.rowCount(parent) > 0
+
+    def headerData(
+        self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole
+    ) -> Any:
+        """Return the Key/Value column headers."""
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole and 0 <= section < 2:
+            return ("Key", "Value")[section]
+        return None
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlags:
+        """Return item flags: group rows are not selectable, group keys not editable."""
+        if not index.isValid():
+            return Qt.ItemIsDropEnabled
+        if index.internalId() == _GROUP_ID:
+            flags = _DEFAULT_FLAGS & ~Qt.ItemIsSelectable
+            if index.column() == 0:
+                flags &= ~Qt.ItemIsEditable
+            return flags
+        return _DEFAULT_FLAGS
+
+    # -------------------------------------------------------------------------
+    # Data
+    # -------------------------------------------------------------------------
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        """Return display text, font, color or tooltip for an index."""
+        if not index.isValid():
+            return None
+        column = index.column()
+        if role == Qt.DisplayRole:
+            return self._row_display(index).texts[column]
+        if role == Qt.FontRole:
+            return self._row_display(index).fonts[column]
+        if role == Qt.ForegroundRole:
+            return self._row_display(index).foregrounds[column]
+        if role == Qt.ToolTipRole:
+            return self._row_display(index).tooltips[column]
+        return None
+
+    def _row_display(self, index: QModelIndex) -> _RowDisplay:
+        """Return the display roles of a row, building them on first use."""
+        internal_id = index.internalId()
+        key = (internal_id, index.row())
+        display = self._rows.get(key)
+        if display is None:
+            if internal_id == _GROUP_ID:
+                display = self._group_display(self._groups[index.row()])
+            else:
+                display = self._field_display(self._groups[internal_id - 1].children[index.row()])
+            self._rows[key] = display
+        return display
+
+    @staticmethod
+    def _group_display(group: TreeNodeData) -> _RowDisplay:
+        extended_count = sum(1 for child in group.children if child.status == FieldStatus.EXTENDED)
+        if extended_count:
+            text = f"{group.key} [Extended] {group.value}"
+            tooltip = f"Contains {extended_count} keys from extended metadata"
+        else:
+            text = f"{group.key} {group.value}"
+            tooltip = None
+        return _RowDisplay(
+            (text, ""),
+            fonts=(_Styles.get().group_font, None),
+            tooltips=(tooltip, None),
+        )
+
+    def _field_display(self, field: TreeNodeData) -> _RowDisplay:
+        formatted_key = self._format_key(field.key)
+
+        if field.status == FieldStatus.MODIFIED:
+            styles = _Styles.get()
+            return _RowDisplay(
+                (formatted_key, field.value),
+                fonts=(styles.modified_font, styles.modified_font),
+                foregrounds=(styles.modified_color, styles.modified_color),
+                tooltips=(_MODIFIED_TOOLTIP, _MODIFIED_TOOLTIP),
+            )
+        if field.status == FieldStatus.EXTENDED:
+            styles = _Styles.get()
+            return _RowDisplay(
+                (f"[Ext] {formatted_key}", field.value),
+                fonts=(styles.extended_font, styles.extended_font),
+                foregrounds=(styles.extended_color, None),
+                tooltips=(_EXTENDED_TOOLTIP, _EXTENDED_TOOLTIP),
+            )
+        # Show the original key when it was simplified
+        key_tooltip = field.key if formatted_key != field.key else None
+        return _RowDisplay((formatted_key, field.value), tooltips=(key_tooltip, None))
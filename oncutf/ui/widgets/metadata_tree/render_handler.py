@@ -168,7 +168,7 @@ class TreeRenderHandler:
         """Apply the tree model to the view, using proxy if available.
 
         Args:
-            tree_model: The built QStandardItemModel
+            tree_model: The built (or reused) tree model
             filename: Filename for logging
 
         """
@@ -222,30 +222,22 @@ class MetadataTreeSearchHandler:
         if hasattr(model, "sourceModel"):
             source_model = model.sourceModel()
 
-        # Check if the source model has invisibleRootItem (QStandardItemModel)
-        if not hasattr(source_model, "invisibleRootItem"):
+        if not source_model:
             return
 
         # Traverse the tree model to collect keys and values
-        root_item = source_model.invisibleRootItem()
-        if not root_item:
-            return
-
-        for i in range(root_item.rowCount()):
-            group_item = root_item.child(i)
-            if not group_item:
-                continue
-
-            group_name = group_item.text()
+        for i in range(source_model.rowCount()):
+            group_index = source_model.index(i, 0)
+            group_name = source_model.data(group_index) or ""
 
             # Collect from group children
-            for j in range(group_item.rowCount()):
-                key_item = group_item.child(j, 0)  # Key column
-                value_item = group_item.child(j, 1)  # Value column
+            for j in range(source_model.rowCount(group_index)):
+                key_index = source_model.index(j, 0, group_index)  # Key column
+                value_index = source_model.index(j, 1, group_index)  # Value column
 
-                if key_item and value_item:
-                    key = key_item.text()
-                    value = value_item.text()
+                if key_index.isValid() and value_index.isValid():
+                    key = source_model.data(key_index) or ""
+                    value = source_model.data(value_index) or ""
 
                     # Skip empty or internal keys
                     if not key or key.startswith("__"):
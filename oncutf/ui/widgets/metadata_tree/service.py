@@ -20,6 +20,7 @@ from __future__ import annotations
 import re
 from typing import TYPE_CHECKING, Any
 
+from oncutf.config import METADATA_KEY_GROUP_CACHE_SIZE
 from oncutf.core.metadata.metadata_simplification_service import (
     get_metadata_simplification_service,
 )
@@ -47,6 +48,10 @@ _ACRONYMS: frozenset[str] = frozenset({
     "led", "ois", "ev", "wb", "af", "ae",
 })
 
+# Group label per metadata key, shared by all files: the same few hundred keys
+# come back on every selection and classifying one scans a dozen term lists
+_key_groups: dict[str, str] = {}
+
 
 class MetadataTreeService:
     """Service layer for metadata tree operations.
@@ -147,6 +152,19 @@ class MetadataTreeService:
         return str(value)
 
     def classify_key(self, key: str) -> str:
+        """Classify a metadata key into a group label (memoized across files).
+
+        Args:
+            key: The metadata key to classify
+
+        Returns:
+            Group label for the key
+
+        """
+        return classify_metadata_key(key)
+
+    @staticmethod
+    def _classify_key_uncached(key: str) -> str:
         """Classify a metadata key into a detailed group label.
 
         Groups metadata into logical categories for better organization:
@@ -322,6 +340,28 @@ class MetadataTreeService:
         # Everything else
         return "Other"
 
+    def display_signature(self, display_state: MetadataDisplayState) -> tuple[Any, ...]:
+        """Return what, besides the metadata itself, a built tree depends on.
+
+        Two builds for the same file with equal metadata and equal signatures
+        produce the same tree, so the view can reuse its model.
+
+        Args:
+            display_state: Current display state
+
+        Returns:
+            Comparable tuple of staged changes and extended-key settings
+
+        """
+        staged: dict[str, Any] = {}
+        if self._staging_manager and display_state.file_path:
+            staged = self._staging_manager.get_staged_changes(display_state.file_path)
+        return (
+            dict(staged),
+            display_state.is_extended_metadata,
+            frozenset(display_state.extended_keys),
+        )
+
     def build_tree_data(
         self,
         metadata: dict[str, Any],
@@ -660,6 +700,24 @@ class MetadataTreeService:
         return total_fields
 
 
+def classify_metadata_key(key: str) -> str:
+    """Classify a metadata key into a group label, memoized for all files.
+
+    Args:
+        key: The metadata key to classify
+
+    Returns:
+        Group label for the key
+
+    """
+    group = _key_groups.get(key)
+    if group is None:
+        if len(_key_groups) >= METADATA_KEY_GROUP_CACHE_SIZE:
+            _key_groups.clear()
+        group = _key_groups[key] = MetadataTreeService._classify_key_uncached(key)
+    return group
+
+
 def create_metadata_tree_service() -> MetadataTreeService:
     """Factory function to create a configured MetadataTreeService.
 
@@ -27,6 +27,7 @@ from pathlib import Path
 from typing import Any
 
 from PyQt5.QtCore import (
+    QAbstractItemModel,
     QModelIndex,
     QPoint,
     QSortFilterProxyModel,
@@ -220,7 +221,7 @@ class MetadataTreeView(QTreeView):
         # Note: This must be set before any metadata loading
 
         # Keep reference to the currently assigned tree model to avoid GC crashes
-        self._current_tree_model: QStandardItemModel | None = None
+        self._current_tree_model: QAbstractItemModel | None = None
         self._placeholder_model: QStandardItemModel | None = None
 
         # Scroll position behavior (replaces MetadataScrollMixin)
@@ -100,7 +100,8 @@ class MetadataTreeViewConfig:
         if source_model.rowCount() == 0:
             return True
 
-        if source_model.rowCount() == 1:
+        # Placeholders are QStandardItemModels; metadata models never are
+        if source_model.rowCount() == 1 and hasattr(source_model, "invisibleRootItem"):
             root = source_model.invisibleRootItem()
             if root and root.rowCount() == 1:
                 item = root.child(0, 0)
@@ -119,6 +119,12 @@ class PreviewTablesView(QWidget):
         # Constants
         self.PLACEHOLDER_SIZE = 120
 
+        # What the tables currently show, so an update can rewrite only the
+        # rows that changed
+        self._shown_pairs: list[tuple[str, str]] = []
+        self._shown_duplicates: set[str] = set()
+        self._row_statuses: list[str] = []
+
         # Initialize components
         self._setup_ui()
         self._setup_placeholders()
@@ -425,10 +431,17 @@ class PreviewTablesView(QWidget):
         self, name_pairs: list[tuple[str, str]], _preview_icons: dict, icon_paths: dict
     ):
         """Update preview tables with name pairs and status validation with performance optimizations."""
+        if self._update_changed_rows(name_pairs, _preview_icons, icon_paths):
+            return
+
         # Performance optimization: Disable all updates at once
         self.setUpdatesEnabled(False)
 
         try:
+            self._shown_pairs = []
+            self._shown_duplicates = set()
+            self._row_statuses = []
+
             # Clear tables efficiently
             self.old_names_table.setRowCount(0)
             self.new_names_table.setRowCount(0)
@@ -443,18 +456,16 @@ class PreviewTablesView(QWidget):
             self._set_placeholders_visible(False, defer_width_adjustment=True)
 
             # Performance optimization: Precompute duplicates in one pass
-            seen, duplicates = set(), set()
-            for _, new_name in name_pairs:
-                if new_name in seen:
-                    duplicates.add(new_name)
-                else:
-                    seen.add(new_name)
+            duplicates = self._find_duplicates(name_pairs)
 
             # Performance optimization: Batch process name pairs
             stats = {"unchanged": 0, "invalid": 0, "duplicate": 0, "valid": 0}
+            self._row_statuses = [""] * len(name_pairs)
             self._process_name_pairs_batch(
                 name_pairs, duplicates, stats, _preview_icons, icon_paths
             )
+            self._shown_pairs = list(name_pairs)
+            self._shown_duplicates = duplicates
 
             # Update status
             self._update_status_summary(stats, icon_paths)
@@ -466,6 +477,77 @@ class PreviewTablesView(QWidget):
             # Re-enable updates
             self.setUpdatesEnabled(True)
 
+    def _update_changed_rows(
+        self, name_pairs: list[tuple[str, str]], preview_icons: dict, icon_paths: dict
+    ) -> bool:
+        """Rewrite only the rows whose pair or duplicate status changed.
+
+        Applies when the tables already show a preview of the same files
+        (same row count and old names), which is the case while the user
+        edits rename modules. Returns False when a full rebuild is needed.
+        """
+        shown = self._shown_pairs
+        if not name_pairs or len(name_pairs) != len(shown):
+            return False
+        if self.new_names_table.rowCount() != len(shown):
+            return False
+        if any(
+            old != shown_old for (old, _), (shown_old, _) in zip(name_pairs, shown, strict=True)
+        ):
+            return False
+
+        duplicates = self._find_duplicates(name_pairs)
+        rows = {row for row, pair in enumerate(name_pairs) if pair != shown[row]}
+        flipped = duplicates ^ self._shown_duplicates
+        if flipped:
+            rows.update(row for row, (_, new) in enumerate(name_pairs) if new in flipped)
+
+        if rows:
+            self.setUpdatesEnabled(False)
+            try:
+                # Totals are recounted from _row_statuses below
+                row_stats = {"unchanged": 0, "invalid": 0, "duplicate": 0, "valid": 0}
+                for row in sorted(rows):
+                    self._process_name_pairs_batch_range(
+                        [name_pairs[row]],
+                        duplicates,
+                        row_stats,
+                        preview_icons,
+                        row,
+                        icon_paths,
+                    )
+            finally:
+                self.setUpdatesEnabled(True)
+            schedule_scroll_adjust(self._finalize_scrollbar_setup, 15)
+
+        self._shown_pairs = list(name_pairs)
+        self._shown_duplicates = duplicates
+
+        stats = {"unchanged": 0, "invalid": 0, "duplicate": 0, "valid": 0}
+        for status in self._row_statuses:
+            stats[status] += 1
+        self._update_status_summary(stats, icon_paths)
+
+        logger.debug(
+            "[PreviewTablesView] Updated %d of %d rows",
+            len(rows),
+            len(name_pairs),
+            extra={"dev_only": True},
+        )
+        return True
+
+    @staticmethod
+    def _find_duplicates(name_pairs: list[tuple[str, str]]) -> set[str]:
+        """Return the new names that occur more than once."""
+        seen: set[str] = set()
+        duplicates: set[str] = set()
+        for _, new_name in name_pairs:
+            if new_name in seen:
+                duplicates.add(new_name)
+            else:
+                seen.add(new_name)
+        return duplicates
+
     def _process_name_pairs_batch(
         self,
         name_pairs: list[tuple[str, str]],
@@ -550,6 +632,8 @@ class PreviewTablesView(QWidget):
                     icon_path = icon_paths.get("valid", "")
                     stats["valid"] += 1
 
+            self._row_statuses[row] = status
+
             # Set icon
             icon_item = QTableWidgetItem()
             if icon_path and Path(icon_path).exists():
@@ -660,6 +744,9 @@ class PreviewTablesView(QWidget):
             self.old_names_table.setRowCount(0)
             self.new_names_table.setRowCount(0)
             self.icon_table.setRowCount(0)
+            self._shown_pairs = []
+            self._shown_duplicates = set()
+            self._row_statuses = []
             self._set_placeholders_visible(True)
         finally:
             # Re-enable updates after clearing is complete
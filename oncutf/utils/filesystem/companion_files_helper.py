@@ -12,6 +12,11 @@ import re
 from pathlib import Path
 from typing import Any, ClassVar
 
+from oncutf.utils.filesystem.companion_index import (
+    CompanionIndex,
+    CompanionPatternTable,
+    get_companion_index,
+)
 from oncutf.utils.logging.logger_factory import get_cached_logger
 
 logger = get_cached_logger(__name__)
@@ -216,6 +221,9 @@ class CompanionFilesHelper:
         # but may share XMP sidecars
     }
 
+    # Compiled form of COMPANION_PATTERNS, paired with the dict it was built from
+    _compiled_table: ClassVar[tuple[dict[str, list[str]], CompanionPatternTable] | None] = None
+
     # File extensions that are commonly companion files
     COMPANION_EXTENSIONS: ClassVar[set[str]] = {
         # Metadata formats
@@ -237,6 +245,28 @@ class CompanionFilesHelper:
         "idx",
     }
 
+    @classmethod
+    def _pattern_table(cls) -> CompanionPatternTable:
+        """Return the compiled pattern table, rebuilt if the patterns were replaced."""
+        cached = cls._compiled_table
+        if cached is None or cached[0] is not cls.COMPANION_PATTERNS:
+            table = CompanionPatternTable(
+                cls.COMPANION_PATTERNS,
+                cls.COMPANION_EXTENSIONS,
+                cls._ORPHAN_FILTERABLE_PATTERNS,
+            )
+            cached = cls._compiled_table = (cls.COMPANION_PATTERNS, table)
+        return cached[1]
+
+    @classmethod
+    def companion_index(cls, folder_files: list[str]) -> CompanionIndex:
+        """Return the (cached) companion index of one folder's files.
+
+        Callers resolving many files of the same folder should look them up
+        on the index instead of calling find_companion_files per file.
+        """
+        return get_companion_index(folder_files, cls._pattern_table())
+
     @classmethod
     def find_companion_files(cls, main_file_path: str, folder_files: list[str]) -> list[str]:
         """Find companion files for a given main file.
@@ -249,35 +279,7 @@ class CompanionFilesHelper:
             List of companion file paths
 
         """
-        main_file = Path(main_file_path)
-        main_name = main_file.stem  # filename without extension
-        main_ext = main_file.suffix[1:].lower()  # extension without dot
-
-        companions = []
-
-        # Get patterns for this file extension
-        patterns = cls.COMPANION_PATTERNS.get(main_ext, [])
-
-        for file_path in folder_files:
-            if file_path == main_file_path:
-                continue
-
-            file_obj = Path(file_path)
-            filename = file_obj.name
-
-            # Check each pattern
-            for pattern in patterns:
-                match = re.match(pattern, filename, re.IGNORECASE)
-                if match and match.group(1) == main_name:
-                    companions.append(file_path)
-                    logger.debug(
-                        "[CompanionFiles] Found companion '%s' for '%s'",
-                        filename,
-                        main_file.name,
-                    )
-                    break
-
-        return companions
+        return cls.companion_index(folder_files).companions_of(main_file_path)
 
     @classmethod
     def get_main_file_for_companion(
@@ -293,36 +295,7 @@ class CompanionFilesHelper:
             Path to main file, or None if not found
 
         """
-        companion_file = Path(companion_path)
-        companion_name = companion_file.name
-        companion_ext = companion_file.suffix[1:].lower()
-
-        # Check if this is actually a companion file
-        if companion_ext not in cls.COMPANION_EXTENSIONS:
-            return None
-
-        # Try to find the main file
-        for file_path in folder_files:
-            if file_path == companion_path:
-                continue
-
-            file_obj = Path(file_path)
-            file_ext = file_obj.suffix[1:].lower()
-
-            # Check if this file could be the main file for our companion
-            patterns = cls.COMPANION_PATTERNS.get(file_ext, [])
-
-            for pattern in patterns:
-                match = re.match(pattern, companion_name, re.IGNORECASE)
-                if match and match.group(1) == file_obj.stem:
-                    logger.debug(
-                        "[CompanionFiles] Found main file '%s' for companion '%s'",
-                        file_obj.name,
-                        companion_name,
-                    )
-                    return file_path
-
-        return None
+        return cls.companion_index(folder_files).main_file_of(companion_path)
 
     @classmethod
     def group_files_with_companions(cls, file_paths: list[str]) -> dict[str, dict[str, Any]]:
@@ -337,25 +310,23 @@ class CompanionFilesHelper:
         """
         file_groups: dict[str, dict[str, Any]] = {}
         processed_files: set[str] = set()
+        table = cls._pattern_table()
 
         # Get all files by folder for efficient processing
         folders: dict[str, list[str]] = {}
         for path in file_paths:
-            folder = str(Path(path).parent)
-            if folder not in folders:
-                folders[folder] = []
-            folders[folder].append(path)
+            folders.setdefault(str(Path(path).parent), []).append(path)
+        indexes = {folder: CompanionIndex(files, table) for folder, files in folders.items()}
 
         # Process each file
         for file_path in file_paths:
             if file_path in processed_files:
                 continue
 
-            folder = str(Path(file_path).parent)
-            folder_files = folders[folder]
+            index = indexes[str(Path(file_path).parent)]
 
             # Check if this is a companion file
-            main_file = cls.get_main_file_for_companion(file_path, folder_files)
+            main_file = index.main_file_of(file_path)
 
             if main_file:
                 # This is a companion file - skip it for now
@@ -363,7 +334,7 @@ class CompanionFilesHelper:
                 continue
 
             # Orphaned companion: matches a known companion pattern but main file is absent
-            if cls._matches_any_companion_pattern(Path(file_path).name):
+            if table.is_orphan_filterable(Path(file_path).name):
                 processed_files.add(file_path)
                 logger.debug(
                     "[CompanionFiles] Orphaned companion filtered: %s", Path(file_path).name
@@ -371,7 +342,7 @@ class CompanionFilesHelper:
                 continue
 
             # This is a main file - find its companions
-            companions = cls.find_companion_files(file_path, folder_files)
+            companions = index.companions_of(file_path)
 
             file_groups[file_path] = {
                 "main": file_path,
@@ -407,10 +378,7 @@ class CompanionFilesHelper:
         Used to detect orphaned companions whose main media file is absent and
         which provide no standalone value (Sony M01.XML, M02.XML).
         """
-        return any(
-            re.match(pattern, filename, re.IGNORECASE)
-            for pattern in cls._ORPHAN_FILTERABLE_PATTERNS
-        )
+        return cls._pattern_table().is_orphan_filterable(filename)
 
     @classmethod
     def is_companion_file(cls, file_path: str, folder_files: list[str]) -> bool:
@@ -0,0 +1,203 @@
+"""companion_index.py.
+
+Dict-based companion lookup for a folder listing.
+
+Every companion pattern has the form ``^(.+)<suffix>$``: the captured group is
+the stem of the main file. Instead of matching every pattern of every
+candidate main file against every other file in the folder (O(N^2 * P)), a
+``CompanionIndex`` walks the listing once, runs only the patterns that can
+match each file's extension, and buckets files by stem and by captured group.
+Main/companion links are then resolved with dict lookups.
+
+Indexes are cached per folder (validated against the listing they were built
+from) and dropped when the filesystem monitor reports a change in the folder.
+
+Author: Michael Economou
+Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import threading
+from collections import OrderedDict, defaultdict
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from oncutf.utils.logging.logger_factory import get_cached_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+logger = get_cached_logger(__name__)
+
+# Folders whose index is kept; a rename or metadata pass touches only a few
+_MAX_CACHED_FOLDERS = 64
+
+# Trailing "\.ext$" of a pattern: only files with that extension can match it
+_PATTERN_EXTENSION = re.compile(r"\\\.([A-Za-z0-9]+)\$$")
+
+
+class CompanionPatternTable:
+    """Compiled companion patterns, indexed by main and companion extension."""
+
+    def __init__(
+        self,
+        patterns: Mapping[str, Sequence[str]],
+        companion_extensions: set[str] | frozenset[str],
+        orphan_patterns: Sequence[str] = (),
+    ) -> None:
+        """Compile *patterns* (main extension -> companion filename patterns).
+
+        Args:
+            patterns: Main file extension -> regex patterns with one group
+                capturing the main file's stem
+            companion_extensions: Extensions a file must have to be looked up
+                as a companion
+            orphan_patterns: Patterns of companions that are hidden even when
+                their main file is missing
+
+        """
+        self.companion_extensions = frozenset(companion_extensions)
+        self.main_patterns: dict[str, tuple[str, ...]] = {
+            ext: tuple(dict.fromkeys(ext_patterns)) for ext, ext_patterns in patterns.items()
+        }
+        self.compiled: dict[str, re.Pattern[str]] = {}
+        self._by_extension: dict[str, list[str]] = defaultdict(list)
+        self._unkeyed: list[str] = []
+        for pattern in dict.fromkeys(p for ps in self.main_patterns.values() for p in ps):
+            self.compiled[pattern] = re.compile(pattern, re.IGNORECASE)
+            match = _PATTERN_EXTENSION.search(pattern)
+            if match:
+                self._by_extension[match.group(1).lower()].append(pattern)
+            else:
+                self._unkeyed.append(pattern)
+        self._main_pattern_sets = {
+            ext: frozenset(ext_patterns) for ext, ext_patterns in self.main_patterns.items()
+        }
+        self._orphan_patterns = [re.compile(p, re.IGNORECASE) for p in orphan_patterns]
+
+    def patterns_for_extension(self, extension: str) -> list[str]:
+        """Return the patterns a file with *extension* (lowercase) could match."""
+        keyed = self._by_extension.get(extension, [])
+        return keyed + self._unkeyed if self._unkeyed else keyed
+
+    def is_main_pattern(self, main_extension: str, pattern: str) -> bool:
+        """Return True if *pattern* finds companions of *main_extension* files."""
+        return pattern in self._main_pattern_sets.get(main_extension, ())
+
+    def is_orphan_filterable(self, filename: str) -> bool:
+        """Return True if *filename* is a companion that is useless on its own."""
+        return any(pattern.match(filename) for pattern in self._orphan_patterns)
+
+
+class CompanionIndex:
+    """Main/companion links of one folder listing.
+
+    Lookups match the pairwise scans they replace, including their order:
+    companions are returned in listing order, and the main file of a
+    companion is the first candidate in the listing.
+    """
+
+    def __init__(self, folder_files: Sequence[str], table: CompanionPatternTable) -> None:
+        """Index *folder_files* in one pass."""
+        self.paths = tuple(folder_files)
+        self.table = table
+        self._extensions: list[str] = []
+        self._by_stem: dict[str, list[int]] = defaultdict(list)
+        self._by_capture: dict[tuple[str, str], list[int]] = defaultdict(list)
+
+        for position, path in enumerate(self.paths):
+            file_obj = Path(path)
+            extension = file_obj.suffix[1:].lower()
+            self._extensions.append(extension)
+            self._by_stem[file_obj.stem].append(position)
+            name = file_obj.name
+            for pattern in table.patterns_for_extension(extension):
+                match = table.compiled[pattern].match(name)
+                if match:
+                    self._by_capture[(pattern, match.group(1))].append(position)
+
+    def companions_of(self, main_file_path: str) -> list[str]:
+        """Return the companions of *main_file_path* in this listing."""
+        main_file = Path(main_file_path)
+        stem = main_file.stem
+        positions: set[int] = set()
+        for pattern in self.table.main_patterns.get(main_file.suffix[1:].lower(), ()):
+            positions.update(self._by_capture.get((pattern, stem), ()))
+        return [
+            self.paths[position]
+            for position in sorted(positions)
+            if self.paths[position] != main_file_path
+        ]
+
+    def main_file_of(self, companion_path: str) -> str | None:
+        """Return the main file *companion_path* belongs to, or None."""
+        companion_file = Path(companion_path)
+        extension = companion_file.suffix[1:].lower()
+        if extension not in self.table.companion_extensions:
+            return None
+
+        name = companion_file.name
+        first: int | None = None
+        for pattern in self.table.patterns_for_extension(extension):
+            match = self.table.compiled[pattern].match(name)
+            if not match:
+                continue
+            for position in self._by_stem.get(match.group(1), ()):
+                if first is not None and position >= first:
+                    break
+                if self.paths[position] != companion_path and self.table.is_main_pattern(
+                    self._extensions[position], pattern
+                ):
+                    first = position
+                    break
+        return None if first is None else self.paths[first]
+
+
+_cache: OrderedDict[str, CompanionIndex] = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _folder_key(path: str) -> str:
+    return os.path.normpath(path)
+
+
+def get_companion_index(
+    folder_files: Sequence[str], table: CompanionPatternTable
+) -> CompanionIndex:
+    """Return the index of *folder_files*, reusing the cached one if unchanged.
+
+    Args:
+        folder_files: Paths of the files in one folder
+        table: Pattern table the index is built with
+
+    Returns:
+        A CompanionIndex over exactly *folder_files*
+
+    """
+    folder = _folder_key(str(Path(folder_files[0]).parent)) if folder_files else ""
+    listing = tuple(folder_files)
+    with _cache_lock:
+        index = _cache.get(folder)
+        if index is not None and index.table is table and index.paths == listing:
+            _cache.move_to_end(folder)
+            return index
+
+    index = CompanionIndex(listing, table)
+    with _cache_lock:
+        _cache[folder] = index
+        _cache.move_to_end(folder)
+        while len(_cache) > _MAX_CACHED_FOLDERS:
+            _cache.popitem(last=False)
+    return index
+
+
+def invalidate_companion_index(folder: str | None = None) -> None:
+    """Drop the cached index of *folder*, or of every folder if None."""
+    with _cache_lock:
+        if folder is None:
+            _cache.clear()
+        elif _cache.pop(_folder_key(folder), None) is not None:
+            logger.debug("[CompanionIndex] Invalidated %s", folder, extra={"dev_only": True})
@@ -0,0 +1,60 @@
+"""Module: file_signature.py.
+
+Author: Michael Economou
+Date: 2026-10-16
+
+Cheap file identity snapshot used to validate cached per-file data.
+
+A FileSignature captures size, mtime (ns), inode and device from a single
+``os.stat`` call. Two signatures compare equal only if the file was not
+replaced or modified in between, which lets caches (hashes, metadata) serve
+stored values without re-reading file contents.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    import os
+
+
+_INT64_MASK = (1 << 64) - 1
+_INT64_SIGN = 1 << 63
+
+
+def _as_int64(value: int) -> int:
+    """Fold an unsigned stat field into SQLite's signed 64-bit INTEGER range."""
+    value &= _INT64_MASK
+    return value - (1 << 64) if value >= _INT64_SIGN else value
+
+
+class FileSignature(NamedTuple):
+    """Snapshot of the stat fields that change when a file is edited or replaced."""
+
+    size: int
+    mtime_ns: int
+    inode: int
+    device: int
+
+    @classmethod
+    def from_stat(cls, st: os.stat_result) -> FileSignature:
+        """Build a signature from an existing stat result (no extra syscall)."""
+        return cls(st.st_size, st.st_mtime_ns, _as_int64(st.st_ino), _as_int64(st.st_dev))
+
+
+def get_file_signature(file_path: str | Path) -> FileSignature | None:
+    """Stat a file once and return its signature.
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        FileSignature, or None if the file cannot be stat'ed
+
+    """
+    try:
+        return FileSignature.from_stat(Path(file_path).stat())
+    except (OSError, ValueError):
+        return None
@@ -238,6 +238,11 @@ def has_hash(file_path: str | Path, hash_type: str = "CRC32") -> bool:
     return get_hash_for_file(file_path, hash_type) is not None
 
 
+def get_hashes_for_files(file_paths: list[str], hash_type: str = "CRC32") -> dict[str, str | None]:
+    """Return dict: path (as given) -> hash string or None, in one batch lookup."""
+    return get_persistent_hash_cache().get_hashes_batch(file_paths, hash_type)
+
+
 # --- Batch helpers ---
 def batch_metadata_status(file_paths: list[str | Path]) -> dict[str, bool]:
     """Return dict: normalized path -> has_metadata (bool)."""
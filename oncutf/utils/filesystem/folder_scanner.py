@@ -0,0 +1,157 @@
+"""Module: folder_scanner.py.
+
+Author: Michael Economou
+Date: 2026-10-16
+
+Folder scanning with one stat per file.
+
+``os.scandir`` reports the entry type from the directory listing itself, and
+``DirEntry.stat()`` is cached per entry (on Windows it comes with the listing,
+free), so each accepted file costs a single stat for its size and mtime. On
+network shares and card readers that syscall count is what loading a folder
+costs; the results are enough to build FileItems without touching the files
+again (see ``FileItem.from_stat``).
+
+Recursive scans can list subdirectories in parallel threads: scandir releases
+the GIL while it waits on the filesystem, so a deep tree on a slow device is
+walked with several listings in flight. ``scan_folder`` returns the files in
+the same top-down order as ``os.walk`` either way; ``iter_directory_scans``
+yields each directory as soon as it is listed, for loads that show results
+while the walk continues.
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, NamedTuple
+
+from oncutf.utils.logging.logger_factory import get_cached_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+    from concurrent.futures import Future
+
+logger = get_cached_logger(__name__)
+
+_DirectoryScan = tuple[list["ScannedFile"], list[str]]
+
+
+class ScannedFile(NamedTuple):
+    """A file found by a scan, with the stat fields FileItem needs."""
+
+    path: str
+    size: int
+    mtime: float
+
+
+def _scan_directory(directory: str, accept: Callable[[str], bool] | None) -> _DirectoryScan:
+    """List one directory: accepted files (stat'ed once) and subdirectories."""
+    files: list[ScannedFile] = []
+    subdirs: list[str] = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    # Symlinked directories are not followed (like os.walk)
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif (accept is None or accept(entry.name)) and entry.is_file():
+                        st = entry.stat()
+                        files.append(ScannedFile(entry.path, st.st_size, st.st_mtime))
+                except OSError as e:
+                    logger.warning("[FolderScanner] Error reading entry %s: %s", entry.path, e)
+    except OSError as e:
+        logger.warning("[FolderScanner] Error listing directory %s: %s", directory, e)
+    return files, subdirs
+
+
+def iter_directory_scans(
+    folder_path: str,
+    *,
+    accept: Callable[[str], bool] | None = None,
+    max_workers: int = 1,
+    cancelled: Callable[[], bool] | None = None,
+) -> Iterator[tuple[str, list[ScannedFile], list[str]]]:
+    """Walk a folder tree, yielding each directory as soon as it is listed.
+
+    Directories are yielded in completion order when listed in parallel.
+    Stops listing new directories once *cancelled* returns True.
+
+    Args:
+        folder_path: Root folder; returned paths are joined onto it as given
+        accept: Optional filter called with each file name (before any stat)
+        max_workers: Threads listing directories (1 walks sequentially)
+        cancelled: Optional callable returning True to stop the walk
+
+    Yields:
+        (directory, accepted files, subdirectories) per directory
+
+    """
+    if max_workers <= 1:
+        pending = [folder_path]
+        while pending and not (cancelled and cancelled()):
+            directory = pending.pop()
+            files, subdirs = _scan_directory(directory, accept)
+            yield directory, files, subdirs
+            pending.extend(reversed(subdirs))
+        return
+
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="scan")
+    try:
+        in_flight: dict[Future[_DirectoryScan], str] = {
+            executor.submit(_scan_directory, folder_path, accept): folder_path
+        }
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            if cancelled and cancelled():
+                return
+            for future in done:
+                directory = in_flight.pop(future)
+                files, subdirs = future.result()
+                for subdir in subdirs:
+                    in_flight[executor.submit(_scan_directory, subdir, accept)] = subdir
+                yield directory, files, subdirs
+    finally:
+        # Drop listings not started yet (cancelled or abandoned walk)
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def scan_folder(
+    folder_path: str,
+    *,
+    recursive: bool = False,
+    accept: Callable[[str], bool] | None = None,
+    max_workers: int = 1,
+) -> list[ScannedFile]:
+    """Return the files in a folder with their size and mtime.
+
+    Args:
+        folder_path: Folder to scan; returned paths are joined onto it as given
+        recursive: Whether to descend into subdirectories
+        accept: Optional filter called with each file name (before any stat)
+        max_workers: Threads listing subdirectories of a recursive scan
+            (1 scans sequentially)
+
+    Returns:
+        Files in top-down order (a folder's files before its subfolders')
+
+    """
+    if not recursive:
+        return _scan_directory(folder_path, accept)[0]
+
+    scans: dict[str, _DirectoryScan] = {
+        directory: (files, subdirs)
+        for directory, files, subdirs in iter_directory_scans(
+            folder_path, accept=accept, max_workers=max_workers
+        )
+    }
+
+    # Assemble in os.walk top-down order
+    result: list[ScannedFile] = []
+    stack = [folder_path]
+    while stack:
+        files, subdirs = scans[stack.pop()]
+        result.extend(files)
+        stack.extend(reversed(subdirs))
+    return result
@@ -0,0 +1,70 @@
+"""Module: update_coalescer.py.
+
+Author: Michael Economou
+Date: 2026-10-16
+
+Coalesce bursts of UI updates into one update per frame interval.
+
+Long operations that report per file (metadata loading, hashing) would
+otherwise emit one model signal and one progress update per result. An
+``UpdateCoalescer`` collects the keys of finished items and hands them to
+its callback at most once per interval, however fast results arrive. It is
+driven by its callers (``add``/``poll``) rather than by a timer, so it also
+works while a loop in the UI thread pumps events itself.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable, Iterable
+
+
+class UpdateCoalescer[K: Hashable]:
+    """Accumulates keys and delivers them in batches, at most once per interval."""
+
+    def __init__(
+        self,
+        callback: Callable[[list[K]], None],
+        interval: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Deliver pending keys to *callback* at most every *interval* seconds.
+
+        Args:
+            callback: Called with the keys added since the last delivery, in
+                first-added order and without duplicates
+            interval: Minimum seconds between deliveries
+            clock: Time source (for tests)
+
+        """
+        self._callback = callback
+        self._interval = interval
+        self._clock = clock
+        self._pending: dict[K, None] = {}
+        self._last = clock()
+
+    def add(self, keys: Iterable[K]) -> None:
+        """Queue *keys* for the next delivery, delivering now if one is due."""
+        self._pending.update(dict.fromkeys(keys))
+        self.poll()
+
+    def poll(self) -> bool:
+        """Deliver pending keys if the interval has passed; return True if delivered."""
+        if not self._pending or self._clock() - self._last < self._interval:
+            return False
+        self.flush()
+        return True
+
+    def flush(self) -> None:
+        """Deliver pending keys now, regardless of the interval."""
+        self._last = self._clock()
+        if self._pending:
+            keys, self._pending = list(self._pending), {}
+            self._callback(keys)
+
+    def __len__(self) -> int:
+        """Return the number of keys waiting for delivery."""
+        return len(self._pending)
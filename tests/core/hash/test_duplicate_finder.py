@@ -0,0 +1,104 @@
+"""Tests for the staged duplicate candidate filter.
+
+Author: Michael Economou
+Date: 2026-10-16
+"""
+
+from oncutf.core.hash.duplicate_finder import (
+    PARTIAL_HASH_BYTES,
+    find_duplicate_candidates,
+    group_by_size,
+    group_duplicates,
+    partial_hash,
+)
+
+BIG = PARTIAL_HASH_BYTES * 3
+
+
+def _write(tmp_path, name, content):
+    path = tmp_path / name
+    path.write_bytes(content)
+    return str(path)
+
+
+def test_group_by_size_drops_unique_sizes_and_missing_files(tmp_path):
+    a = _write(tmp_path, "a.jpg", b"1234")
+    b = _write(tmp_path, "b.jpg", b"abcd")
+    _write(tmp_path, "c.jpg", b"unique size")
+
+    groups = group_by_size([a, b, str(tmp_path / "c.jpg"), str(tmp_path / "gone.jpg")])
+
+    assert [(group.size, group.paths) for group in groups] == [(4, [a, b])]
+
+
+def test_partial_hash_ignores_middle_bytes(tmp_path):
+    base = bytearray(b"m" * BIG)
+    a = _write(tmp_path, "a.mov", bytes(base))
+    base[BIG // 2] = ord("x")
+    b = _write(tmp_path, "b.mov", bytes(base))
+
+    assert partial_hash(a, BIG, "CRC32") == partial_hash(b, BIG, "CRC32")
+
+
+def test_partial_hash_sees_tail(tmp_path):
+    base = bytearray(b"m" * BIG)
+    a = _write(tmp_path, "a.mov", bytes(base))
+    base[-1] = ord("x")
+    b = _write(tmp_path, "b.mov", bytes(base))
+
+    assert partial_hash(a, BIG, "CRC32") != partial_hash(b, BIG, "CRC32")
+
+
+def test_find_duplicate_candidates_filters_by_partial_hash(tmp_path):
+    same = b"s" * BIG
+    a = _write(tmp_path, "a.mov", same)
+    b = _write(tmp_path, "b.mov", same)
+    c = _write(tmp_path, "c.mov", b"t" + same[1:])
+    small_1 = _write(tmp_path, "s1.txt", b"tiny")
+    small_2 = _write(tmp_path, "s2.txt", b"tin!")
+
+    candidates = find_duplicate_candidates([a, b, c, small_1, small_2], "CRC32")
+
+    assert sorted(sorted(group.paths) for group in candidates) == [
+        sorted([a, b]),
+        sorted([small_1, small_2]),
+    ]
+
+
+def test_find_duplicate_candidates_ignores_repeated_paths(tmp_path):
+    a = _write(tmp_path, "a.jpg", b"1234")
+
+    assert find_duplicate_candidates([a, a], "CRC32") == []
+
+
+def test_find_duplicate_candidates_reports_progress(tmp_path):
+    same = b"s" * BIG
+    a = _write(tmp_path, "a.mov", same)
+    b = _write(tmp_path, "b.mov", same)
+    small = _write(tmp_path, "s.txt", b"tiny")
+    reports = []
+
+    find_duplicate_candidates(
+        [a, b, small], "CRC32", progress_callback=lambda *report: reports.append(report)
+    )
+
+    # Stat pass (files only), then one report per partial hash with bytes read
+    per_file = 2 * PARTIAL_HASH_BYTES
+    assert reports == [
+        (3, 3, small, 0, 0),
+        (1, 2, a, per_file, 2 * per_file),
+        (2, 2, b, 2 * per_file, 2 * per_file),
+    ]
+
+
+def test_find_duplicate_candidates_cancelled(tmp_path):
+    a = _write(tmp_path, "a.jpg", b"1234")
+    b = _write(tmp_path, "b.jpg", b"1234")
+
+    assert find_duplicate_candidates([a, b], "CRC32", lambda: True) is None
+
+
+def test_group_duplicates_keeps_groups_of_two_or_more():
+    result = group_duplicates([("a", "h1"), ("b", "h1"), ("c", "h2"), ("d", None)])
+
+    assert result == {"h1": ["a", "b"]}
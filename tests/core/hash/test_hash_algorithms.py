@@ -0,0 +1,64 @@
+"""Tests for the hash algorithm registry.
+
+Author: Michael Economou
+Date: 2026-10-16
+"""
+
+import hashlib
+import os
+import zlib
+
+import pytest
+
+from oncutf.core.hash import hash_engine
+from oncutf.core.hash.hash_algorithms import (
+    HASH_ALGORITHM_BLAKE2B,
+    HASH_ALGORITHM_CRC32,
+    HASH_ALGORITHM_SHA256,
+    HASH_ROLE_FAST,
+    HASH_ROLE_STRONG,
+    available_algorithms,
+    resolve_algorithm,
+)
+from oncutf.core.hash.hash_engine import hash_file
+
+
+def test_stdlib_algorithms_always_available():
+    assert {HASH_ALGORITHM_CRC32, HASH_ALGORITHM_BLAKE2B, HASH_ALGORITHM_SHA256} <= set(
+        available_algorithms()
+    )
+
+
+def test_resolve_algorithm_names_are_case_insensitive():
+    assert resolve_algorithm("crc32") == HASH_ALGORITHM_CRC32
+    assert resolve_algorithm("Sha256") == HASH_ALGORITHM_SHA256
+
+
+def test_resolve_roles_to_installed_algorithms():
+    assert resolve_algorithm(HASH_ROLE_FAST) in available_algorithms()
+    assert resolve_algorithm(HASH_ROLE_STRONG) in available_algorithms()
+    assert resolve_algorithm(HASH_ROLE_STRONG) != HASH_ALGORITHM_CRC32
+
+
+def test_resolve_unknown_algorithm_raises():
+    with pytest.raises(ValueError, match="Unsupported hash algorithm"):
+        resolve_algorithm("md4")
+
+
+@pytest.mark.parametrize(
+    ("algorithm", "reference"),
+    [
+        (HASH_ALGORITHM_CRC32, lambda data: f"{zlib.crc32(data) & 0xFFFFFFFF:08x}"),
+        (HASH_ALGORITHM_BLAKE2B, lambda data: hashlib.blake2b(data, digest_size=32).hexdigest()),
+        (HASH_ALGORITHM_SHA256, lambda data: hashlib.sha256(data).hexdigest()),
+    ],
+)
+@pytest.mark.parametrize("size", [0, 3000, 10_000])
+def test_hash_file_matches_reference(tmp_path, monkeypatch, algorithm, reference, size):
+    monkeypatch.setattr(hash_engine, "MMAP_MIN_SIZE", 1024)
+    monkeypatch.setattr(hash_engine, "READ_CHUNK_SIZE", 4096)
+    data = os.urandom(size)
+    file_path = tmp_path / "data.bin"
+    file_path.write_bytes(data)
+
+    assert hash_file(file_path, algorithm) == reference(data)
@@ -0,0 +1,90 @@
+"""Tests for HashBatchWriter.
+
+Author: Michael Economou
+Date: 2026-10-16
+"""
+
+import threading
+import time
+
+from oncutf.infra.batch import HashBatchWriter
+from oncutf.infra.db.hash_store import HashRecord
+
+
+class RecordingStore:
+    """Bulk store callable that records each batch it receives."""
+
+    def __init__(self):
+        self.batches = []
+        self.flushed = threading.Event()
+
+    def __call__(self, records):
+        self.batches.append(list(records))
+        self.flushed.set()
+        return len(records)
+
+
+def _records(count):
+    return [HashRecord(f"/tmp/file_{i}.bin", f"{i:08x}") for i in range(count)]
+
+
+def test_close_flushes_pending_records():
+    store = RecordingStore()
+    writer = HashBatchWriter(store, max_batch_size=100, max_batch_age_ms=60_000)
+    writer.start()
+    for record in _records(10):
+        writer.submit(record)
+
+    assert writer.close(timeout=5) == 10
+    assert writer.flush_count == 1
+    assert [len(batch) for batch in store.batches] == [10]
+
+
+def test_flushes_when_batch_is_full():
+    store = RecordingStore()
+    writer = HashBatchWriter(store, max_batch_size=4, max_batch_age_ms=60_000)
+    writer.start()
+    for record in _records(9):
+        writer.submit(record)
+
+    assert writer.close(timeout=5) == 9
+    assert [len(batch) for batch in store.batches] == [4, 4, 1]
+
+
+def test_flushes_when_batch_is_old():
+    store = RecordingStore()
+    writer = HashBatchWriter(store, max_batch_size=100, max_batch_age_ms=20)
+    writer.start()
+    writer.submit(_records(1)[0])
+
+    assert store.flushed.wait(timeout=5)
+    assert writer.written_count == 1
+    writer.close(timeout=5)
+
+
+def test_close_without_start_flushes_synchronously():
+    store = RecordingStore()
+    writer = HashBatchWriter(store)
+    for record in _records(3):
+        writer.submit(record)
+
+    assert writer.close() == 3
+
+
+def test_store_errors_do_not_stop_writer():
+    calls = []
+
+    def flaky_store(records):
+        calls.append(len(records))
+        if len(calls) == 1:
+            raise RuntimeError("database is locked")
+        return len(records)
+
+    writer = HashBatchWriter(flaky_store, max_batch_size=2, max_batch_age_ms=60_000)
+    writer.start()
+    for record in _records(4):
+        writer.submit(record)
+        time.sleep(0.01)
+
+    assert writer.close(timeout=5) == 2
+    assert calls == [2, 2]
@@ -0,0 +1,156 @@
+"""Tests for the CRC32 hashing engines.
+
+Author: Michael Economou
+Date: 2026-10-16
+"""
+
+import hashlib
+import os
+import zlib
+
+import pytest
+
+from oncutf.core.hash import hash_engine
+from oncutf.core.hash.hash_engine import (
+    HASH_ENGINE_PROCESS,
+    HASH_ENGINE_THREAD,
+    ProcessHashEngine,
+    ThreadHashEngine,
+    crc32_file,
+    create_hash_engine,
+    hash_file_multi,
+    suggest_worker_count,
+)
+
+
+@pytest.fixture
+def small_chunks(monkeypatch):
+    """Force the mmap path and several slices on small test files."""
+    monkeypatch.setattr(hash_engine, "MMAP_MIN_SIZE", 1024)
+    monkeypatch.setattr(hash_engine, "READ_CHUNK_SIZE", 4096)
+
+
+def _expected(data):
+    return f"{zlib.crc32(data) & 0xFFFFFFFF:08x}"
+
+
+@pytest.mark.parametrize("size", [0, 1, 1023, 1024, 4096, 10_000])
+@pytest.mark.usefixtures("small_chunks")
+def test_crc32_file_matches_zlib(tmp_path, size):
+    data = os.urandom(size)
+    file_path = tmp_path / "data.bin"
+    file_path.write_bytes(data)
+
+    assert crc32_file(file_path) == _expected(data)
+
+
+@pytest.mark.usefixtures("small_chunks")
+def test_crc32_file_reports_progress(tmp_path):
+    file_path = tmp_path / "video.mov"
+    file_path.write_bytes(os.urandom(10_000))
+    progress = []
+
+    crc32_file(file_path, progress_callback=progress.append)
+
+    assert progress == [4096, 8192, 10_000]
+
+
+@pytest.mark.usefixtures("small_chunks")
+def test_crc32_file_cancelled(tmp_path):
+    file_path = tmp_path / "video.mov"
+    file_path.write_bytes(os.urandom(10_000))
+
+    assert crc32_file(file_path, cancellation_check=lambda: True) is None
+
+
+def test_crc32_file_missing_raises(tmp_path):
+    with pytest.raises(OSError):
+        crc32_file(tmp_path / "missing.bin")
+
+
+@pytest.mark.usefixtures("small_chunks")
+def test_hash_file_multi_reads_once(tmp_path):
+    data = os.urandom(5000)
+    file_path = tmp_path / "clip.mov"
+    file_path.write_bytes(data)
+
+    digests = hash_file_multi(file_path, ("CRC32", "SHA256"))
+
+    assert digests == [_expected(data), hashlib.sha256(data).hexdigest()]
+
+
+def test_create_thread_engine():
+    assert isinstance(create_hash_engine(HASH_ENGINE_THREAD, 4), ThreadHashEngine)
+    assert isinstance(create_hash_engine("bogus", 4), ThreadHashEngine)
+
+
+@pytest.mark.skipif(not ProcessHashEngine.is_available(), reason="requires spawn start method")
+@pytest.mark.usefixtures("small_chunks")
+def test_process_engine_matches_thread_engine(tmp_path):
+    files = []
+    for i in range(3):
+        file_path = tmp_path / f"clip_{i}.mov"
+        file_path.write_bytes(os.urandom(5000 + i))
+        files.append(file_path)
+
+    engine = create_hash_engine(HASH_ENGINE_PROCESS, 2)
+    try:
+        assert isinstance(engine, ProcessHashEngine)
+        progress = []
+        results = [engine.hash_file(str(f), progress_callback=progress.append) for f in files]
+    finally:
+        engine.shutdown()
+
+    assert results == [_expected(f.read_bytes()) for f in files]
+
+
+@pytest.mark.skipif(not ProcessHashEngine.is_available(), reason="requires spawn start method")
+@pytest.mark.usefixtures("small_chunks")
+def test_process_engine_cancellation(tmp_path):
+    file_path = tmp_path / "clip.mov"
+    file_path.write_bytes(os.urandom(10_000))
+
+    engine = ProcessHashEngine(1)
+    try:
+        engine.cancel()
+        assert engine.hash_file(str(file_path)) is None
+    finally:
+        engine.shutdown()
+
+
+def test_suggest_worker_count_single_stream_on_rotational(tmp_path, monkeypatch):
+    monkeypatch.setattr(hash_engine, "_device_streams", {})
+    monkeypatch.setattr(hash_engine, "_is_rotational", lambda _device: True)
+    paths = []
+    for i in range(3):
+        file_path = tmp_path / f"f{i}.bin"
+        file_path.write_bytes(b"x")
+        paths.append(str(file_path))
+
+    assert suggest_worker_count(paths, 8) == 1
+
+
+def test_suggest_worker_count_probes_once_per_device(tmp_path, monkeypatch):
+    monkeypatch.setattr(hash_engine, "_device_streams", {})
+    monkeypatch.setattr(hash_engine, "_is_rotational", lambda _device: False)
+    probes = []
+
+    def fake_throughput(paths):
+        probes.append(len(paths))
+        return 100.0 * len(paths)
+
+    monkeypatch.setattr(hash_engine, "_read_throughput", fake_throughput)
+    paths = []
+    for i in range(6):
+        file_path = tmp_path / f"f{i}.bin"
+        file_path.write_bytes(b"x" * (i + 1))
+        paths.append(str(file_path))
+
+    assert suggest_worker_count(paths, 8) == 8
+    assert suggest_worker_count(paths, 8) == 8
+    assert probes == [1, 4]
+
+
+def test_suggest_worker_count_trivial_inputs():
+    assert suggest_worker_count(["/only/one"], 8) == 8
+    assert suggest_worker_count(["/a", "/b"], 1) == 1
@@ -4,12 +4,15 @@ Author: Michael Economou
 Date: 2026-01-04
 """
 
+from types import SimpleNamespace
 from unittest.mock import Mock
 
 import pytest
 
 from oncutf.core.metadata.metadata_loader import MetadataLoader
 from oncutf.core.metadata.metadata_ui_bridge import NullMetadataUIBridge
+from oncutf.infra.cache.persistent_metadata_cache import MetadataCacheCheck, MetadataEntry
+from oncutf.utils.filesystem.path_normalizer import normalize_path
 
 
 @pytest.fixture
@@ -71,3 +74,21 @@ def test_cleanup(metadata_loader):
     metadata_loader._metadata_cancelled = True
 
     assert metadata_loader._metadata_cancelled is True
+
+
+@pytest.mark.unit
+def test_filter_cached_items_reloads_stale_and_missing(metadata_loader, mock_ui_bridge):
+    """Only files whose cached metadata is fresh (and extended if needed) are skipped."""
+    items = [SimpleNamespace(full_path=f"/photos/{name}.jpg") for name in "abcd"]
+    fast, extended, stale, missing = (normalize_path(item.full_path) for item in items)
+    mock_ui_bridge.cache_check_entries.return_value = MetadataCacheCheck(
+        {fast: MetadataEntry({"ISO": 1}), extended: MetadataEntry({"ISO": 2}, is_extended=True)},
+        [stale],
+        [missing],
+    )
+
+    needs_loading, skipped = metadata_loader._filter_cached_items(items, use_extended=False)
+    assert (needs_loading, skipped) == (items[2:], 2)
+
+    needs_loading, skipped = metadata_loader._filter_cached_items(items, use_extended=True)
+    assert (needs_loading, skipped) == ([items[0], *items[2:]], 1)
@@ -0,0 +1,97 @@
+"""Module: test_background_import.py
+
+Author: Michael Economou
+Date: 2026-10-16
+
+Tests for recursive folder loads in the background: the walk delivers
+FileItems in batches while it runs, can be cancelled, and the UI service
+appends the batches of the current load only.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from oncutf.app.state.file_store import FileStore
+from oncutf.core.file.background_import import BackgroundFolderImport
+from oncutf.domain.models.file_item import FileItem
+from oncutf.ui.managers.file_load_ui_service import FileLoadUIService
+from oncutf.ui.models.file_table.file_table_model import FileTableModel
+
+
+@pytest.fixture
+def tree(tmp_path):
+    """Ten folders with three photos each."""
+    for i in range(10):
+        folder = tmp_path / f"roll_{i}"
+        folder.mkdir()
+        for j in range(3):
+            (folder / f"img_{j}.jpg").write_bytes(b"x")
+    return tmp_path
+
+
+def _prepare(scanned):
+    return [FileItem.from_stat(f.path, f.size, f.mtime) for f in scanned]
+
+
+def test_import_delivers_all_files_in_batches(tree):
+    batches = []
+    finished = []
+    importer = BackgroundFolderImport(
+        str(tree),
+        accept=lambda name: name.endswith(".jpg"),
+        prepare=_prepare,
+        on_batch=batches.append,
+        on_finished=lambda count, cancelled: finished.append((count, cancelled)),
+        max_workers=4,
+    )
+
+    importer.start()
+    assert importer.wait(10)
+
+    paths = sorted(item.full_path for batch in batches for item in batch)
+    assert paths == sorted(str(p) for p in tree.rglob("*.jpg"))
+    assert len(batches[0]) == 3  # first folder shown on its own
+    assert finished == [(30, False)]
+
+
+def test_cancelled_import_stops_delivering(tree):
+    batches = []
+    finished = []
+    importer = BackgroundFolderImport(
+        str(tree),
+        accept=lambda name: name.endswith(".jpg"),
+        prepare=_prepare,
+        on_batch=lambda items: (batches.append(items), importer.cancel()),
+        on_finished=lambda count, cancelled: finished.append((count, cancelled)),
+        batch_interval=60,
+        max_workers=1,
+    )
+
+    importer.start()
+    assert importer.wait(10)
+
+    assert len(batches) == 1
+    assert finished == [(len(batches[0]), True)]
+
+
+def test_ui_service_appends_batches_of_current_load(qapp, tmp_path):  # noqa: ARG001
+    model = FileTableModel()
+    window = SimpleNamespace(
+        file_model=model,
+        context=SimpleNamespace(file_store=FileStore(), set_current_folder=MagicMock()),
+    )
+    service = FileLoadUIService(window)
+    items = [FileItem(str(tmp_path / f"img_{i}.jpg"), "jpg", None) for i in range(4)]
+
+    service.begin_progressive_load(1, str(tmp_path), clear=True)
+    service.add_loaded_batch(1, items[:2])
+    service.add_loaded_batch(1, items[1:3])
+    service.add_loaded_batch(0, items[3:])  # stale load
+    service.finish_progressive_load(1)
+    service.add_loaded_batch(1, items[3:])  # after finish
+
+    assert model.files == items[:3]
+    assert window.context.file_store.get_loaded_files() == items[:3]
+    window.context.set_current_folder.assert_called_once_with(str(tmp_path), True)
@@ -0,0 +1,169 @@
+"""Module: test_companion_index.py
+
+Author: Michael Economou
+Date: 2026-10-16
+
+Tests for the companion file index: dict lookups give the same results as
+the pairwise pattern scans they replace, and cached indexes are reused for
+an unchanged listing and dropped on invalidation.
+"""
+
+import random
+import re
+from pathlib import Path
+
+import pytest
+
+from oncutf.utils.filesystem import companion_index
+from oncutf.utils.filesystem.companion_files_helper import CompanionFilesHelper
+from oncutf.utils.filesystem.companion_index import (
+    CompanionIndex,
+    get_companion_index,
+    invalidate_companion_index,
+)
+
+FOLDER = "/shoot/card_a"
+
+
+def _pairwise_companions(main_file_path, folder_files):
+    """Reference: scan every file against every pattern of the main file."""
+    main_file = Path(main_file_path)
+    patterns = CompanionFilesHelper.COMPANION_PATTERNS.get(main_file.suffix[1:].lower(), [])
+    companions = []
+    for file_path in folder_files:
+        if file_path == main_file_path:
+            continue
+        for pattern in patterns:
+            match = re.match(pattern, Path(file_path).name, re.IGNORECASE)
+            if match and match.group(1) == main_file.stem:
+                companions.append(file_path)
+                break
+    return companions
+
+
+def _pairwise_main_file(companion_path, folder_files):
+    """Reference: scan every candidate main file's patterns."""
+    companion_file = Path(companion_path)
+    if companion_file.suffix[1:].lower() not in CompanionFilesHelper.COMPANION_EXTENSIONS:
+        return None
+    for file_path in folder_files:
+        if file_path == companion_path:
+            continue
+        file_obj = Path(file_path)
+        for pattern in CompanionFilesHelper.COMPANION_PATTERNS.get(file_obj.suffix[1:].lower(), []):
+            match = re.match(pattern, companion_file.name, re.IGNORECASE)
+            if match and match.group(1) == file_obj.stem:
+                return file_path
+    return None
+
+
+def _random_listing(seed, count=300):
+    rng = random.Random(seed)
+    stems = ["C0001", "C0002", "IMG_1234", "img_1234", "DSC00042", "clip", "a.b"]
+    names = set()
+    while len(names) < count:
+        stem = rng.choice(stems) + (str(rng.randrange(5)) if rng.random() < 0.5 else "")
+        suffix = rng.choice(
+            [
+                ".MP4",
+                ".mp4",
+                "M01.XML",
+                "m02.xml",
+                ".xml",
+                ".srt",
+                ".XMP",
+                ".xmp",
+                ".CR2",
+                ".jpg",
+                ".JPG",
+                ".arw",
+                ".cube",
+                ".mov",
+                ".txt",
+                ".png",
+                ".3dl",
+                ".vtt",
+            ]
+        )
+        names.add(stem + suffix)
+    listing = [f"{FOLDER}/{name}" for name in names]
+    rng.shuffle(listing)
+    return listing
+
+
+@pytest.fixture(autouse=True)
+def clear_index_cache():
+    invalidate_companion_index()
+    yield
+    invalidate_companion_index()
+
+
+class TestCompanionIndex:
+    """Test index lookups against the pairwise scans."""
+
+    def test_every_pattern_is_keyed_by_extension(self):
+        table = CompanionFilesHelper._pattern_table()
+
+        assert not table._unkeyed
+
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    def test_matches_pairwise_scan(self, seed):
+        listing = _random_listing(seed)
+        index = CompanionIndex(listing, CompanionFilesHelper._pattern_table())
+
+        for path in listing:
+            assert index.companions_of(path) == _pairwise_companions(path, listing)
+            assert index.main_file_of(path) == _pairwise_main_file(path, listing)
+
+    def test_sony_xml_and_xmp_sidecars(self):
+        listing = [
+            f"{FOLDER}/C0001.MP4",
+            f"{FOLDER}/C0001M01.XML",
+            f"{FOLDER}/IMG_1.CR2",
+            f"{FOLDER}/IMG_1.xmp",
+            f"{FOLDER}/IMG_2.jpg",
+        ]
+
+        assert CompanionFilesHelper.find_companion_files(listing[0], listing) == [listing[1]]
+        assert CompanionFilesHelper.get_main_file_for_companion(listing[1], listing) == listing[0]
+        assert CompanionFilesHelper.get_main_file_for_companion(listing[3], listing) == listing[2]
+        assert CompanionFilesHelper.get_main_file_for_companion(listing[4], listing) is None
+
+    def test_grouping_filters_orphaned_sony_xml(self):
+        listing = [f"{FOLDER}/C0001.MP4", f"{FOLDER}/C0001M01.XML", f"{FOLDER}/C0009M01.XML"]
+
+        groups = CompanionFilesHelper.group_files_with_companions(listing)
+
+        assert groups == {
+            listing[0]: {"main": listing[0], "companions": [listing[1]], "type": "group"}
+        }
+
+
+class TestCompanionIndexCache:
+    """Test per-folder caching of indexes."""
+
+    def test_unchanged_listing_reuses_index(self):
+        listing = _random_listing(4, 20)
+        table = CompanionFilesHelper._pattern_table()
+
+        assert get_companion_index(listing, table) is get_companion_index(list(listing), table)
+
+    def test_changed_listing_rebuilds_index(self):
+        listing = _random_listing(5, 20)
+        table = CompanionFilesHelper._pattern_table()
+        first = get_companion_index(listing, table)
+
+        second = get_companion_index([*listing, f"{FOLDER}/new.MP4"], table)
+
+        assert second is not first
+        assert second.paths[-1] == f"{FOLDER}/new.MP4"
+
+    def test_invalidation_drops_folder(self):
+        listing = _random_listing(6, 20)
+        table = CompanionFilesHelper._pattern_table()
+        first = get_companion_index(listing, table)
+
+        invalidate_companion_index(FOLDER + "/")
+
+        assert FOLDER not in companion_index._cache
+        assert get_companion_index(listing, table) is not first
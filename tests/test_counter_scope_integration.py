@@ -13,6 +13,7 @@ from pathlib import Path
 
 import pytest
 
+from oncutf.core.rename.counter_scope_index import CounterScopeIndex
 from oncutf.core.rename.preview_manager import (
     apply_rename_modules,
     calculate_scope_aware_index,
@@ -293,3 +294,76 @@ class TestCounterScopeIntegration:
 
         # Should fallback to global sequence: 001, 002, 003, 004, 005
         assert results == ["001", "002", "003", "004", "005"]
+
+
+class TestCounterScopeIndex:
+    """Test that the precomputed scope index matches the per-file scan."""
+
+    @pytest.fixture
+    def interleaved_files(self, tmp_path):
+        """Files whose folders and extensions alternate, with one repeated path."""
+        files = []
+        for i in range(12):
+            folder = tmp_path / f"folder_{i % 3}"
+            folder.mkdir(exist_ok=True)
+            path = folder / f"file{i}{('.jpg', '.png', '.JPG', '.txt')[i % 4]}"
+            path.touch()
+            files.append(FileItem.from_path(str(path)))
+        files.append(files[4])
+        return files
+
+    @pytest.mark.parametrize(
+        "scope",
+        [
+            CounterScope.GLOBAL,
+            CounterScope.PER_FOLDER,
+            CounterScope.PER_EXTENSION,
+            CounterScope.PER_FILEGROUP,
+        ],
+    )
+    def test_index_matches_scan(self, interleaved_files, scope):
+        """Indexed lookups return the same values as the rescan fallback."""
+        scope_index = CounterScopeIndex(interleaved_files)
+
+        for idx, file in enumerate(interleaved_files):
+            expected = calculate_scope_aware_index(scope.value, idx, file, interleaved_files)
+            assert scope_index.index_for(scope, idx, file) == expected
+
+    def test_index_rejects_mismatched_file(self, interleaved_files):
+        """A file that is not at the given position falls back to the scan."""
+        scope_index = CounterScopeIndex(interleaved_files)
+
+        assert scope_index.index_for(CounterScope.PER_FOLDER, 0, interleaved_files[1]) is None
+        assert scope_index.index_for(CounterScope.PER_FOLDER, 99, interleaved_files[1]) is None
+
+    def test_preview_uses_index(self, interleaved_files, monkeypatch):
+        """Preview generation resolves scoped counters without rescanning."""
+        from oncutf.core.rename.name_composer import NameComposer
+        from oncutf.core.rename.preview_manager import UnifiedPreviewManager
+        from oncutf.core.rename.query_managers import SmartCacheManager
+
+        class NoAvailability:
+            def get_hash_availability(self, files):
+                return {}
+
+            def get_metadata_availability(self, files):
+                return {}
+
+        def no_scan(*_args, **_kwargs):
+            raise AssertionError("scope index was not used")
+
+        monkeypatch.setattr(
+            "oncutf.utils.filesystem.file_grouper.calculate_filegroup_counter_index", no_scan
+        )
+        manager = UnifiedPreviewManager(NoAvailability(), SmartCacheManager())
+        modules_data = [
+            {"type": "counter", "start": 1, "step": 1, "padding": 2, "scope": "per_filegroup"}
+        ]
+
+        result = manager.generate_preview(interleaved_files[:12], modules_data, {}, None)
+
+        expected = [
+            NameComposer.calculate_scope_aware_index("per_folder", idx, file, interleaved_files) + 1
+            for idx, file in enumerate(interleaved_files[:12])
+        ]
+        assert [Path(new).stem for _, new in result.name_pairs] == [f"{n:02d}" for n in expected]
@@ -0,0 +1,132 @@
+"""Module: test_exopsis_process_pool.py
+
+Author: Michael Economou
+Date: 2026-10-16
+
+Tests for metadata extraction in worker processes: batches return the
+metadata of every file, a crashing worker is restarted and only the file
+that crashes it loses its metadata, and too many crashes mark the pool
+unhealthy.
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from oncutf.core.metadata.parallel_loader import ParallelMetadataLoader
+from oncutf.domain.models.file_item import FileItem
+from oncutf.infra.external.exopsis_process_pool import ExopsisProcessPool
+
+pytestmark = pytest.mark.skipif(
+    not ExopsisProcessPool.is_available(), reason="requires spawn start method"
+)
+
+
+def _fake_extract(path):
+    """Stand-in for exopsis: crash the worker on 'crash' files."""
+    name = Path(path).name
+    if name.startswith("crash"):
+        os._exit(1)
+    if name.startswith("bad"):
+        raise ValueError("unreadable")
+    return {"File:FileName": name, "File:PID": os.getpid()}
+
+
+@pytest.fixture
+def pool():
+    """Two-worker pool running the fake extractor."""
+    pool = ExopsisProcessPool(max_workers=2, batch_size=3, max_restarts=2, extract=_fake_extract)
+    yield pool
+    pool.shutdown()
+
+
+def test_extracts_all_files_in_workers(pool):
+    paths = [f"/photos/img_{i}.jpg" for i in range(10)]
+
+    results = dict(pool.extract(iter(paths)))
+
+    assert sorted(results) == sorted(paths)
+    assert all(metadata["File:FileName"] == Path(path).name for path, metadata in results.items())
+    assert os.getpid() not in {metadata["File:PID"] for metadata in results.values()}
+    health = pool.health_check()
+    assert health["healthy"]
+    assert health["restarts"] == 0
+
+
+def test_failed_files_get_empty_metadata(pool):
+    results = dict(pool.extract(["/photos/a.jpg", "/photos/bad.jpg"]))
+
+    assert results["/photos/bad.jpg"] == {}
+    assert results["/photos/a.jpg"]["File:FileName"] == "a.jpg"
+
+
+def test_worker_crash_restarts_pool_and_skips_file(pool):
+    paths = [f"/photos/img_{i}.jpg" for i in range(7)]
+
+    results = dict(pool.extract([*paths[:3], "/photos/crash.jpg", *paths[3:]]))
+
+    assert results.pop("/photos/crash.jpg") == {}
+    assert sorted(results) == sorted(paths)
+    assert all(results.values())
+    assert pool.health_check()["restarts"] == 2
+    assert pool.is_healthy()
+    assert dict(pool.extract(paths[:1]))[paths[0]]["File:FileName"] == "img_0.jpg"
+
+
+def test_gives_up_after_max_restarts():
+    pool = ExopsisProcessPool(max_workers=1, batch_size=1, max_restarts=0, extract=_fake_extract)
+    try:
+        results = dict(pool.extract(["/photos/crash.jpg", "/photos/a.jpg"]))
+    finally:
+        pool.shutdown()
+
+    assert results == {"/photos/crash.jpg": {}, "/photos/a.jpg": {}}
+    assert not pool.is_healthy()
+
+
+def test_cancellation_stops_extraction(pool):
+    paths = [f"/photos/img_{i}.jpg" for i in range(30)]
+
+    results = list(pool.extract(paths, cancellation_check=lambda: True))
+
+    assert results == []
+
+
+def test_parallel_loader_uses_process_pool(pool, monkeypatch):
+    from oncutf.core.metadata import parallel_loader
+
+    monkeypatch.setattr(parallel_loader, "get_exopsis_process_pool", lambda: pool)
+    items = [FileItem(f"/photos/img_{i}.jpg", "jpg", None) for i in range(5)]
+    items.append(items[0])
+    loaded = []
+
+    loader = ParallelMetadataLoader(backend="process")
+    count = loader.load_metadata_parallel(
+        iter(items), batch_callback=lambda _current, _total, batch: loaded.extend(batch)
+    )
+
+    assert count == 6
+    assert sorted(id(item) for item, _ in loaded) == sorted(id(item) for item in items)
+    assert all(metadata["File:FileName"] == item.filename for item, metadata in loaded)
+
+
+def test_reentrant_extraction_is_rejected_without_blocking(pool, monkeypatch):
+    from oncutf.infra.external import exopsis_process_pool
+
+    monkeypatch.setattr(exopsis_process_pool, "_pool", pool)
+    nested = []
+
+    def idle():
+        # Runs with batches in flight, like a load started from the event loop
+        nested.append(exopsis_process_pool.get_exopsis_process_pool())
+        with pytest.raises(RuntimeError):
+            next(pool.extract(["/photos/nested.jpg"]))
+
+    paths = [f"/photos/img_{i}.jpg" for i in range(4)]
+    results = dict(pool.extract(paths, idle=idle))
+
+    assert sorted(results) == sorted(paths)
+    assert nested and all(found is None for found in nested)
+    assert not pool.is_busy()
+    assert exopsis_process_pool.get_exopsis_process_pool() is pool
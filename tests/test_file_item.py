@@ -23,3 +23,39 @@ def test_metadata_flags():
     assert not fi.has_metadata
     fi.metadata = {"a": 1}
     assert fi.has_metadata
+
+
+def test_fileitem_is_slotted_and_shares_folder_strings():
+    a = FileItem.from_stat("/photos/roll/IMG_1.JPG", 10, 0)
+    b = FileItem.from_stat("/photos/roll/" + "IMG_2.JPG", 20, 0)
+
+    assert not hasattr(a, "__weakref__")
+    assert a.__dict__ == {}
+    assert a._folder is b._folder
+    assert a.extension is b.extension
+    assert a.full_path == a.path == "/photos/roll/IMG_1.JPG"
+    assert a.filename == a.name == "IMG_1.JPG"
+
+
+def test_fileitem_keeps_mtime_as_float_until_accessed():
+    fi = FileItem.from_stat("/photos/IMG_1.JPG", 10, 1234.5)
+
+    assert fi._modified == 1234.5
+    assert fi.mtime == 1234.5
+    assert fi.modified.timestamp() == 1234.5
+
+    fi.modified = datetime.fromtimestamp(0)
+    assert fi.mtime == 0
+
+
+def test_fileitem_path_and_filename_stay_independent():
+    fi = FileItem("/photos/old.jpg", "jpg", None)
+
+    fi.full_path = "/archive/new.jpg"  # renamed, display name kept until reload
+    assert fi.path == "/archive/new.jpg"
+    assert fi.filename == "old.jpg"
+
+    fi.metadata["EXIF:Model"] = "X100"  # created on first access
+    assert fi.has_metadata
+    fi.duration = 12.5  # optional attributes still work
+    assert fi.duration == 12.5
@@ -0,0 +1,139 @@
+"""Module: test_file_table_row_state.py
+
+Author: Michael Economou
+Date: 2026-10-16
+
+Tests for batched row state in the file table model: painting rows loads
+hash and metadata state for a window of rows in one lookup, repeated
+repaints (including files without a hash) never query again, and changed
+rows are reloaded.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from PyQt5.QtCore import Qt
+
+from oncutf.core.metadata.field_mapper import MetadataFieldMapper
+from oncutf.domain.models.file_item import FileItem
+from oncutf.ui.models.file_table import data_provider, icon_manager, row_state_cache
+from oncutf.ui.models.file_table.file_table_model import FileTableModel
+
+COLUMNS = ["filename", "file_hash", "iso"]
+
+
+class BatchMetadataCache:
+    """Metadata cache stand-in that only answers batch lookups."""
+
+    def __init__(self, metadata):
+        self.metadata = metadata
+        self.batches = []
+
+    def get_entries_batch(self, file_paths):
+        self.batches.append(list(file_paths))
+        return {
+            path: SimpleNamespace(data=self.metadata[path], modified=False, is_extended=False)
+            if path in self.metadata
+            else None
+            for path in file_paths
+        }
+
+    def get_entry(self, _path):
+        raise AssertionError("metadata looked up per cell")
+
+
+@pytest.fixture
+def files(tmp_path):
+    """Twenty files; even ones have a hash and metadata."""
+    items = []
+    for i in range(20):
+        path = tmp_path / f"IMG_{i:03d}.jpg"
+        path.write_bytes(b"x")
+        items.append(FileItem.from_path(str(path)))
+    return items
+
+
+@pytest.fixture
+def hash_batches(files, monkeypatch):
+    """Record batched hash lookups and forbid per-file ones."""
+    hashes = {f.full_path: f"{i:08x}" for i, f in enumerate(files) if i % 2 == 0}
+    batches = []
+
+    def get_hashes_for_files(paths):
+        batches.append(list(paths))
+        return {path: hashes.get(path) for path in paths}
+
+    def per_file(*_args, **_kwargs):
+        raise AssertionError("hash looked up per cell")
+
+    monkeypatch.setattr(row_state_cache, "get_hashes_for_files", get_hashes_for_files)
+    monkeypatch.setattr(icon_manager, "get_hash_for_file", per_file)
+    monkeypatch.setattr(icon_manager, "has_hash", per_file)
+    monkeypatch.setattr(data_provider, "FILE_TABLE_PREFETCH_MARGIN", 3)
+    return batches
+
+
+@pytest.fixture
+def model(qapp, files, hash_batches):  # noqa: ARG001
+    """Model over *files* with a hash and a metadata column."""
+    metadata = {f.full_path: {"ISO": 100 * (i + 1)} for i, f in enumerate(files) if i % 2 == 0}
+    parent = SimpleNamespace(metadata_cache=BatchMetadataCache(metadata))
+    table_model = FileTableModel(parent)
+    table_model.update_visible_columns(COLUMNS)
+    table_model.files = files
+    table_model._icon_manager.create_combined_icon = lambda meta, hash_status: (meta, hash_status)
+    return table_model
+
+
+def _cell(model, row, key, role=Qt.DisplayRole):
+    column = 0 if key == "status" else COLUMNS.index(key) + 1
+    return model.data(model.index(row, column), role)
+
+
+class TestRowStatePrefetch:
+    """Test batched loading of hash and metadata state."""
+
+    def test_window_is_loaded_in_one_batch(self, model, files, hash_batches):
+        assert _cell(model, 0, "file_hash") == "00000000"
+        assert _cell(model, 1, "file_hash") == ""
+        assert _cell(model, 2, "iso") == MetadataFieldMapper.get_metadata_value({"ISO": 300}, "iso")
+        assert _cell(model, 0, "status", Qt.DecorationRole) == ("loaded", "tag")
+        assert _cell(model, 1, "status", Qt.DecorationRole) == (
+            "metadata_unavailable",
+            "hash_unavailable",
+        )
+
+        assert hash_batches == [[f.full_path for f in files[:4]]]
+        assert len(model.parent_window.metadata_cache.batches) == 1
+
+    def test_missing_hash_is_not_queried_again(self, model, hash_batches):
+        for _ in range(3):
+            assert _cell(model, 1, "file_hash") == ""
+
+        assert len(hash_batches) == 1
+
+    def test_scroll_loads_only_new_rows(self, model, files, hash_batches):
+        model.prefetch_rows(0, 5)
+        model.prefetch_rows(4, 10)
+
+        assert hash_batches == [
+            [f.full_path for f in files[:9]],
+            [f.full_path for f in files[9:14]],
+        ]
+
+    def test_changed_row_is_reloaded(self, model, files, hash_batches):
+        _cell(model, 0, "file_hash")
+
+        model.refresh_icon_for_file(files[1].full_path)
+        _cell(model, 1, "file_hash")
+
+        assert files[1].full_path in hash_batches[-1]
+        assert files[0].full_path not in hash_batches[-1]
+
+    def test_reset_drops_all_rows(self, model, files, hash_batches):
+        _cell(model, 0, "file_hash")
+
+        model.set_files(list(files))
+        _cell(model, 0, "file_hash")
+
+        assert len(hash_batches) == 2
@@ -0,0 +1,161 @@
+"""Module: test_filesystem_delta_refresh.py
+
+Author: Michael Economou
+Date: 2026-10-16
+
+Tests for applying filesystem events without rescanning: created, deleted,
+renamed and modified files update the loaded FileItems in place, and the
+monitor falls back to a folder rescan only when its event queue overflows.
+Events from the monitor thread are applied in the main thread.
+"""
+
+import os
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from oncutf.app.state.file_store import FileStore
+from oncutf.core.file import monitor as monitor_module
+from oncutf.core.file.load_manager import FileChange, FileLoadManager
+from oncutf.core.file.monitor import FilesystemMonitor
+from oncutf.domain.models.file_item import FileItem
+from oncutf.ui.adapters.qt_file_load_ui import QtFileLoadUIAdapter
+from oncutf.ui.models.file_table.file_table_model import FileTableModel
+
+
+@pytest.fixture
+def folder(tmp_path):
+    """Folder with three loaded photos."""
+    for name in ("a.jpg", "b.jpg", "c.jpg"):
+        (tmp_path / name).write_bytes(b"x")
+    return tmp_path
+
+
+def test_file_changes_update_loaded_files_in_place(qapp, folder, monkeypatch):  # noqa: ARG001
+    monkeypatch.setattr(FileLoadManager, "_load_color_tags", lambda _self, _items: None)
+    items = [FileItem.from_path(str(folder / name)) for name in ("a.jpg", "b.jpg", "c.jpg")]
+    model = FileTableModel()
+    model.files = list(items)
+    store = FileStore()
+    store.set_loaded_files(items)
+    manager = FileLoadManager(parent_window=SimpleNamespace(file_model=model))
+    inserted = []
+    model.rowsInserted.connect(lambda _parent, first, last: inserted.append((first, last)))
+
+    (folder / "a.jpg").write_bytes(b"longer")
+    (folder / "b.jpg").unlink()
+    (folder / "c.jpg").rename(folder / "e.jpg")
+    (folder / "d.jpg").write_bytes(b"new")
+    (folder / "notes.unknownext").write_bytes(b"skip")
+    changes = [
+        FileChange("modified", str(folder / "a.jpg")),
+        FileChange("deleted", str(folder / "b.jpg")),
+        FileChange("moved", str(folder / "c.jpg"), str(folder / "e.jpg")),
+        FileChange("created", str(folder / "d.jpg")),
+        FileChange("created", str(folder / "notes.unknownext")),
+    ]
+
+    assert manager.apply_file_changes(changes, file_store=store)
+
+    a, b, c = items
+    assert a.size == 6
+    assert b.file_missing
+    assert c.full_path == str(folder / "e.jpg")
+    assert c.filename == "e.jpg"
+    assert [f.filename for f in model.files] == ["a.jpg", "b.jpg", "e.jpg", "d.jpg"]
+    assert [f.filename for f in store.get_loaded_files()] == ["a.jpg", "b.jpg", "e.jpg", "d.jpg"]
+    assert inserted == [(3, 3)]
+
+
+def test_modified_files_repaint_only_their_rows(qapp, folder):  # noqa: ARG001
+    items = [FileItem.from_path(str(folder / name)) for name in ("a.jpg", "b.jpg", "c.jpg")]
+    model = FileTableModel()
+    model.files = list(items)
+    manager = FileLoadManager(parent_window=SimpleNamespace(file_model=model))
+    emitted = []
+    model.dataChanged.connect(lambda top, bottom, *_: emitted.append((top.row(), bottom.row())))
+
+    os.utime(folder / "b.jpg", (0, 0))
+    manager.apply_file_changes([FileChange("modified", str(folder / "b.jpg"))], FileStore())
+
+    assert emitted == [(1, 1)]
+    assert items[1].modified.timestamp() == 0
+
+
+def _monitor_with_loaded(folder):
+    file_store = MagicMock()
+    file_store.get_loaded_files.return_value = [FileItem(str(folder / "a.jpg"), "jpg", None)]
+    load_manager = MagicMock()
+    return FilesystemMonitor(file_store=file_store, file_load_manager=load_manager), load_manager
+
+
+def test_monitor_applies_file_events_without_rescan(folder, monkeypatch):
+    monkeypatch.setattr(monitor_module, "queue_file_changes", lambda _events: False)
+    monitor, load_manager = _monitor_with_loaded(folder)
+    changed = []
+    monitor.directory_changed.connect(changed.append)
+
+    monitor._on_file_event(FileChange("created", str(folder / "d.jpg")))
+    monitor._on_file_event(FileChange("modified", str(folder / "d.jpg")))
+    monitor._process_pending_changes()
+    monitor.stop()
+
+    load_manager.apply_file_changes.assert_called_once()
+    assert [c.kind for c in load_manager.apply_file_changes.call_args.args[0]] == [
+        "created",
+        "modified",
+    ]
+    load_manager.refresh_loaded_folders.assert_not_called()
+    assert changed == [str(folder)]
+
+
+def test_monitor_hands_file_events_to_the_ui_adapter(folder, monkeypatch):
+    queued = []
+    monkeypatch.setattr(
+        monitor_module, "queue_file_changes", lambda events: queued.append(events) or True
+    )
+    monitor, load_manager = _monitor_with_loaded(folder)
+
+    monitor._on_file_event(FileChange("created", str(folder / "d.jpg")))
+    monitor._process_pending_changes()
+    monitor.stop()
+
+    assert [[c.kind for c in events] for events in queued] == [["created"]]
+    load_manager.apply_file_changes.assert_not_called()
+
+
+def test_adapter_applies_file_events_in_main_thread(qapp):
+    applied = []
+    load_manager = MagicMock()
+    load_manager.apply_file_changes.side_effect = lambda changes: applied.append(
+        (changes, threading.current_thread())
+    )
+    adapter = QtFileLoadUIAdapter(SimpleNamespace(file_load_manager=load_manager))
+    changes = [FileChange("created", "/photos/d.jpg")]
+
+    sender = threading.Thread(target=adapter.apply_file_changes, args=(changes,))
+    sender.start()
+    sender.join()
+    assert not applied
+    qapp.processEvents()
+
+    assert applied == [(changes, threading.main_thread())]
+
+
+def test_monitor_rescans_when_event_queue_overflows(folder, monkeypatch):
+    monkeypatch.setattr(monitor_module, "FILESYSTEM_MONITOR_MAX_PENDING_EVENTS", 2)
+    monitor, load_manager = _monitor_with_loaded(folder)
+
+    for i in range(3):
+        monitor._on_file_event(FileChange("created", str(folder / f"new_{i}.jpg")))
+    monitor._process_pending_changes()
+    monitor.stop()
+
+    load_manager.apply_file_changes.assert_not_called()
+    load_manager.refresh_loaded_folders.assert_called_once_with(
+        changed_folder=str(folder), file_store=monitor.file_store
+    )
+    assert not Path(folder / "new_0.jpg").exists()
@@ -0,0 +1,68 @@
+"""Module: test_folder_scanner.py
+
+Author: Michael Economou
+Date: 2026-10-16
+
+Tests for the scandir-based folder scanner: scanned files carry their size
+and mtime, recursive scans (sequential or parallel) return files in os.walk
+order, and FileItems are built from scan results without touching the disk.
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from oncutf.domain.models.file_item import FileItem
+from oncutf.utils.filesystem.folder_scanner import ScannedFile, scan_folder
+
+
+@pytest.fixture
+def tree(tmp_path):
+    """Nested folders with photos and one unwanted file."""
+    for relative in ("a.jpg", "notes.txt", "x/b.jpg", "x/y/c.jpg", "x/y/z/d.jpg", "w/e.jpg"):
+        path = tmp_path / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"1" * len(relative))
+    return tmp_path
+
+
+def _is_jpg(name):
+    return name.endswith(".jpg")
+
+
+def _walk_order(root):
+    return [
+        str(Path(folder) / name)
+        for folder, _, names in os.walk(root)
+        for name in names
+        if _is_jpg(name)
+    ]
+
+
+def test_scan_returns_size_and_mtime(tree):
+    scanned = scan_folder(str(tree), accept=_is_jpg)
+
+    assert scanned == [
+        ScannedFile(str(tree / "a.jpg"), 5, (tree / "a.jpg").stat().st_mtime),
+    ]
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_recursive_scan_matches_os_walk(tree, max_workers):
+    scanned = scan_folder(str(tree), recursive=True, accept=_is_jpg, max_workers=max_workers)
+
+    assert [f.path for f in scanned] == _walk_order(str(tree))
+    assert all(f.size == Path(f.path).stat().st_size for f in scanned)
+
+
+def test_missing_folder_scans_empty(tree):
+    assert scan_folder(str(tree / "gone"), recursive=True, accept=_is_jpg) == []
+
+
+def test_file_item_from_stat_needs_no_file():
+    item = FileItem.from_stat("/nowhere/IMG_1.JPG", 1234, 0)
+
+    assert item.extension == "jpg"
+    assert item.size == 1234
+    assert item.modified.timestamp() == 0
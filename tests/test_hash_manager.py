@@ -66,6 +66,30 @@ class TestHashManager:
         finally:
             Path(temp_path).unlink()
 
+    def test_calculate_crc32_rehashes_after_in_place_edit(self):
+        """Test that a cached hash is not served once the file changes on disk."""
+        import os
+
+        manager = HashManager()
+
+        with tempfile.NamedTemporaryFile(mode="w", delete=False) as f:
+            f.write("test")
+            temp_path = f.name
+
+        try:
+            assert manager.calculate_hash(temp_path) == "d87f7e0c"
+
+            # Same path, new content and mtime
+            original = Path(temp_path).stat()
+            Path(temp_path).write_text("string path test")
+            os.utime(temp_path, ns=(original.st_atime_ns, original.st_mtime_ns + 1_000_000))
+
+            assert manager.get_cached_hash(temp_path) is None
+            assert manager.calculate_hash(temp_path) == "cb1bffb9"
+            assert manager.get_cached_hash(temp_path) == "cb1bffb9"
+        finally:
+            Path(temp_path).unlink()
+
     def test_calculate_crc32_file_not_exists(self):
         """Test handling of non-existent files."""
         manager = HashManager()
@@ -126,17 +150,97 @@ class TestHashManager:
         """Test duplicate detection with duplicates found."""
         manager = HashManager()
 
-        files = [MockFileItem(filename="file1.txt"), MockFileItem(filename="file2.txt")]
+        with tempfile.TemporaryDirectory() as temp_dir:
+            files = [MockFileItem(filename="file1.txt"), MockFileItem(filename="file2.txt")]
+            for file_item in files:
+                # Same size, so both reach the full-hash stage
+                file_item.full_path = str(Path(temp_dir) / file_item.filename)
+                Path(file_item.full_path).write_bytes(b"data")
 
-        with patch.object(manager, "calculate_hash") as mock_calc:
-            mock_calc.side_effect = ["same_hash", "same_hash"]
+            with patch.object(manager, "calculate_hash") as mock_calc:
+                mock_calc.side_effect = ["same_hash", "same_hash"]
 
-            result = manager.find_duplicates_in_list(files)
+                result = manager.find_duplicates_in_list(files)
 
             assert len(result) == 1
             assert "same_hash" in result
             assert len(result["same_hash"]) == 2
 
+    def test_find_duplicates_skips_unique_sizes_and_partial_mismatches(self):
+        """Test that only files sharing size and partial hash are fully hashed."""
+        manager = HashManager()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            big = b"x" * (300 * 1024)
+            contents = {
+                "unique_size.bin": b"short",
+                "dup_a.bin": big,
+                "dup_b.bin": big,
+                "head_differs.bin": b"y" + big[1:],
+            }
+            paths = {}
+            for name, content in contents.items():
+                paths[name] = str(Path(temp_dir) / name)
+                Path(paths[name]).write_bytes(content)
+
+            with patch.object(manager, "calculate_hash", wraps=manager.calculate_hash) as mock_calc:
+                result = manager.find_duplicates_in_paths(list(paths.values()))
+
+            hashed = sorted(call.args[0] for call in mock_calc.call_args_list)
+            assert hashed == sorted([paths["dup_a.bin"], paths["dup_b.bin"]])
+            assert list(result.values()) == [[paths["dup_a.bin"], paths["dup_b.bin"]]]
+
+    def test_find_duplicates_stores_crc32_after_fast_partial_hashes(self):
+        """Test that partial hashes use the fast role and stored hashes stay CRC32."""
+        from oncutf.core.hash import duplicate_finder
+
+        manager = HashManager()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            big = b"x" * (300 * 1024)
+            paths = []
+            for name in ("a.bin", "b.bin"):
+                path = Path(temp_dir) / name
+                path.write_bytes(big)
+                paths.append(str(path))
+
+            with patch.object(
+                duplicate_finder, "partial_hash", wraps=duplicate_finder.partial_hash
+            ) as mock_partial:
+                result = manager.find_duplicates_in_paths(paths)
+
+            assert {call.args[2] for call in mock_partial.call_args_list} == {"fast"}
+            crc = manager.get_cached_hash(paths[0])
+            assert len(crc) == 8
+            assert result == {crc: paths}
+
+    def test_duplicate_scan_also_stores_crc32(self):
+        """Test that a "fast" duplicate scan stores the CRC32 the file table shows too."""
+        from oncutf.core.hash.parallel_hash_worker import ParallelHashWorker
+
+        worker = ParallelHashWorker(max_workers=2)
+        worker.enable_batch_operations(False)
+        found = []
+        worker.duplicates_found.connect(found.append)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            paths = []
+            for name in ("a.bin", "b.bin"):
+                path = Path(temp_dir) / name
+                path.write_bytes(b"duplicate scan")
+                paths.append(str(path))
+
+            worker.setup_duplicate_scan(paths, "fast")
+            worker.run()
+
+            manager = worker._hash_manager
+            fast = manager.get_cached_hash(paths[1], algorithm="fast")
+            assert manager.get_cached_hash(paths[1]) == calculate_crc32(paths[1])
+
+        assert len(found) == 1
+        assert list(found[0]) == [fast]
+        assert sorted(found[0][fast]) == paths
+
     def test_find_duplicates_in_list_empty(self):
         """Test duplicate detection with empty list."""
         manager = HashManager()
@@ -153,6 +257,37 @@ class TestHashManager:
             result = manager.find_duplicates_in_list(files)
             assert result == {}
 
+    def test_find_duplicates_in_paths_with_strong_algorithm(self):
+        """Test duplicate detection with a selectable non-CRC32 algorithm."""
+        manager = HashManager()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            paths = []
+            for name, content in (("a.bin", b"same"), ("b.bin", b"same"), ("c.bin", b"other")):
+                path = Path(temp_dir) / name
+                path.write_bytes(content)
+                paths.append(str(path))
+
+            result = manager.find_duplicates_in_paths(paths, algorithm="strong")
+
+            assert list(result.values()) == [paths[:2]]
+            assert len(next(iter(result))) == 64  # 256-bit digest, not CRC32
+
+    def test_cached_hash_is_per_algorithm(self):
+        """Test that hashes of different algorithms are cached independently."""
+        manager = HashManager()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "clip.mov"
+            path.write_bytes(b"frame data")
+
+            crc = manager.calculate_hash(path)
+            sha = manager.calculate_hash(path, algorithm="sha256")
+
+            assert manager.get_cached_hash(path) == crc
+            assert manager.get_cached_hash(path, algorithm="SHA256") == sha
+            assert crc != sha
+
     def test_compare_folders_success(self):
         """Test successful folder comparison."""
         manager = HashManager()
@@ -125,12 +125,13 @@ class TestHashWorkerProgress:
         files = []
 
         with tempfile.TemporaryDirectory() as temp_dir:
-            # Create files for duplicate scanning
+            # Create same-size files for duplicate scanning (files with a
+            # unique size are dropped before any hashing)
             p1 = Path(temp_dir) / "file1.txt"
             p2 = Path(temp_dir) / "file2.txt"
 
-            p1.write_bytes(b"X" * 15000)
-            p2.write_bytes(b"Y" * 10000)
+            p1.write_bytes(b"X" * 12500)
+            p2.write_bytes(b"Y" * 12500)
 
             files = [str(p1), str(p2)]
             total_size = 25000
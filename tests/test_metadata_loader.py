@@ -14,6 +14,7 @@ Tests cover:
 
 from __future__ import annotations
 
+from pathlib import Path
 from unittest.mock import MagicMock
 
 
@@ -125,6 +126,73 @@ class TestLoadMetadataForItems:
         callback.assert_not_called()
 
 
+class TestMultipleFilesLoading:
+    """Tests for the dialog-based multi-file loading path."""
+
+    def test_rows_repaint_after_their_batch_is_cached(self, monkeypatch) -> None:
+        """Rows are repainted only once their metadata is in the cache."""
+        import oncutf.app.services as app_services
+        from oncutf.core.metadata import metadata_loader
+        from oncutf.core.metadata.metadata_loader import MetadataLoader
+
+        monkeypatch.setattr(app_services, "create_metadata_dialog", MagicMock())
+        # Deliver every update at once, so ordering is what the test sees
+        monkeypatch.setattr(metadata_loader, "METADATA_UI_UPDATE_INTERVAL", 0)
+        bridge = MagicMock()
+        loader = MetadataLoader(ui_bridge=bridge)
+        monkeypatch.setattr(loader, "_enhance_with_companions", lambda _item, md, _items: md)
+        items = [MagicMock(full_path=f"/p/{i}.jpg", filename=f"{i}.jpg", size=1) for i in range(2)]
+
+        def load_metadata_parallel(**kwargs) -> None:
+            for i, item in enumerate(items, 1):
+                kwargs["progress_callback"](i, 2, item, {"k": i})
+            kwargs["batch_callback"](2, 2, [(item, {"k": 1}) for item in items])
+            kwargs["completion_callback"]()
+
+        loader._parallel_loader = MagicMock(load_metadata_parallel=load_metadata_parallel)
+
+        loader._load_multiple_files_metadata(items, False, None, "test")
+
+        names = [call[0] for call in bridge.mock_calls]
+        assert names.index("cache_set_batch") < names.index("emit_rows_changed")
+        bridge.emit_rows_changed.assert_called_with(["/p/0.jpg", "/p/1.jpg"])
+
+    def test_batches_are_cached_with_signatures_from_before_extraction(
+        self, monkeypatch, tmp_path
+    ) -> None:
+        """A file edited during extraction is cached with its earlier stat."""
+        import oncutf.app.services as app_services
+        from oncutf.core.metadata.metadata_loader import MetadataLoader
+        from oncutf.domain.models.file_item import FileItem
+        from oncutf.utils.filesystem.file_signature import get_file_signature
+
+        monkeypatch.setattr(app_services, "create_metadata_dialog", MagicMock())
+        bridge = MagicMock()
+        loader = MetadataLoader(ui_bridge=bridge)
+        monkeypatch.setattr(loader, "_enhance_with_companions", lambda _item, md, _items: md)
+        paths = [tmp_path / f"{i}.jpg" for i in range(2)]
+        for path in paths:
+            path.write_bytes(b"jpeg")
+        before = [get_file_signature(path) for path in paths]
+
+        def load_metadata_parallel(**kwargs) -> None:
+            extracted = []
+            for item in kwargs["items"]:
+                Path(item.full_path).write_bytes(b"edited during extraction")
+                extracted.append((item, {"k": 1}))
+            kwargs["batch_callback"](2, 2, extracted)
+            kwargs["completion_callback"]()
+
+        loader._parallel_loader = MagicMock(load_metadata_parallel=load_metadata_parallel)
+
+        loader._load_multiple_files_metadata(
+            [FileItem.from_path(str(path)) for path in paths], False, None, "test"
+        )
+
+        signatures = bridge.cache_set_batch.call_args.kwargs["signatures"]
+        assert signatures == {str(path): sig for path, sig in zip(paths, before, strict=True)}
+
+
 class TestMetadataWrapperProperty:
     """Tests for wrapper property (backed by ExopsisWrapper)."""
 
@@ -0,0 +1,120 @@
+"""Module: test_metadata_tree_item_model.py
+
+Author: Michael Economou
+Date: 2026-10-16
+
+Tests for the metadata tree item model: groups and fields are served from the
+service's tree data with the same texts and styling the QStandardItem version
+had, key classification is memoized, and the controller reuses a file's model
+until its metadata or staged changes change.
+"""
+
+import pytest
+from PyQt5.QtCore import QModelIndex, Qt
+
+from oncutf.config import METADATA_ICON_COLORS
+from oncutf.core.metadata import MetadataStagingManager
+from oncutf.ui.widgets.metadata_tree import service as service_module
+from oncutf.ui.widgets.metadata_tree.controller import MetadataTreeController
+from oncutf.ui.widgets.metadata_tree.model import MetadataDisplayState
+from oncutf.ui.widgets.metadata_tree.service import MetadataTreeService
+
+METADATA = {
+    "Directory": "/photos",
+    "ISOSpeed": 1600,
+    "FNumber": 2.8,
+    "Make": "Fujifilm",
+    "__internal": True,
+}
+
+
+@pytest.fixture
+def staging():
+    return MetadataStagingManager()
+
+
+@pytest.fixture
+def controller(staging):
+    return MetadataTreeController(MetadataTreeService(), staging)
+
+
+def _build(controller, metadata, path="/photos/a.jpg"):
+    return controller.build_qt_model(metadata, MetadataDisplayState(file_path=path))
+
+
+def _group(model, name):
+    for row in range(model.rowCount()):
+        index = model.index(row, 0)
+        if index.data().startswith(name):
+            return index
+    raise AssertionError(f"group {name} not found")
+
+
+def _field(model, group, text):
+    for row in range(model.rowCount(group)):
+        index = model.index(row, 0, group)
+        if index.data() == text:
+            return index
+    raise AssertionError(f"field {text} not found")
+
+
+def test_groups_and_fields(qapp, controller):  # noqa: ARG001
+    model = _build(controller, METADATA)
+
+    groups = [model.index(row, 0).data() for row in range(model.rowCount())]
+    assert groups == [
+        "File Info (1 fields)",
+        "Camera Settings (2 fields)",
+        "Technical Info (1 fields)",
+    ]
+    camera = _group(model, "Camera Settings")
+    assert model.rowCount(camera) == 2
+    assert model.parent(model.index(0, 1, camera)) == camera
+    assert not model.parent(camera).isValid()
+    assert model.rowCount(model.index(0, 0, camera)) == 0
+    assert model.index(0, 1, camera).data() == "f/2.8"  # FNumber sorts first
+    assert model.headerData(0, Qt.Horizontal) == "Key"
+    assert not model.flags(camera) & Qt.ItemIsSelectable
+    assert model.flags(model.index(0, 0, camera)) & Qt.ItemIsSelectable
+    assert not model.index(5, 0, QModelIndex()).isValid()
+
+
+def test_staged_fields_are_styled_as_modified(qapp, controller, staging):  # noqa: ARG001
+    staging.stage_change("/photos/a.jpg", "Make", "Canon")
+    model = _build(controller, METADATA)
+
+    technical = _group(model, "Technical Info")
+    key = model.index(0, 0, technical)
+    assert key.sibling(0, 1).data() == "Canon"
+    assert key.data(Qt.FontRole).bold()
+    assert key.data(Qt.ForegroundRole).name() == METADATA_ICON_COLORS["modified"].lower()
+    assert key.data(Qt.ToolTipRole) == "Modified value"
+    assert _field(model, _group(model, "File Info"), "Directory").data(Qt.FontRole) is None
+
+
+def test_model_is_reused_until_metadata_or_staging_changes(qapp, controller, staging):  # noqa: ARG001
+    first = _build(controller, METADATA)
+    _build(controller, {"Make": "Leica"}, path="/photos/b.jpg")
+
+    assert _build(controller, dict(METADATA)) is first
+    assert _build(controller, {**METADATA, "Make": "Canon"}) is not first
+
+    reused = _build(controller, METADATA)
+    staging.stage_change("/photos/a.jpg", "Make", "Sony")
+    assert _build(controller, METADATA) is not reused
+
+
+def test_key_classification_is_memoized(monkeypatch):
+    monkeypatch.setattr(service_module, "_key_groups", {})
+    calls = []
+    classify = MetadataTreeService._classify_key_uncached
+    monkeypatch.setattr(
+        MetadataTreeService,
+        "_classify_key_uncached",
+        staticmethod(lambda key: calls.append(key) or classify(key)),
+    )
+    service = MetadataTreeService()
+
+    assert service.classify_key("GPSLatitude") == "GPS & Location"
+    assert service.classify_key("GPSLatitude") == "GPS & Location"
+    assert calls == ["GPSLatitude"]
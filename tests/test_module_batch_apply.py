@@ -0,0 +1,139 @@
+"""Module: test_module_batch_apply.py
+
+Author: Michael Economou
+Date: 2026-10-16
+
+Tests for the apply_batch contract of rename module logic classes and the
+column-wise NameComposer.compose_names built on it.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from oncutf.core.rename import module_registry
+from oncutf.core.rename.module_registry import get_batch_apply
+from oncutf.core.rename.name_composer import NameComposer
+from oncutf.domain.models.file_item import FileItem
+from oncutf.modules.name_transform_module import NameTransformModule
+
+
+@pytest.fixture
+def files(tmp_path):
+    """Files across two folders with mixed extensions."""
+    items = []
+    for i, name in enumerate(["IMG_001.jpg", "IMG_002.CR2", "clip_IMG.mov", "notes.txt"]):
+        folder = tmp_path / f"folder_{i % 2}"
+        folder.mkdir(exist_ok=True)
+        path = folder / name
+        path.touch()
+        items.append(FileItem.from_path(str(path)))
+    return items
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"type": "counter", "start": 5, "step": 2, "padding": 3},
+        {"type": "counter", "start": "x"},
+        {"type": "specified_text", "text": "shot_"},
+        {"type": "specified_text", "text": ""},
+        {
+            "type": "remove_text_from_original_name",
+            "text_to_remove": "IMG",
+            "position": "Anywhere in name",
+        },
+        {
+            "type": "remove_text_from_original_name",
+            "text_to_remove": "img_",
+            "position": "Start of name",
+        },
+        {"type": "remove_text_from_original_name", "text_to_remove": "", "position": "End of name"},
+        {"type": "metadata", "field": ""},
+    ],
+)
+def test_apply_batch_matches_apply_from_data(files, data):
+    """apply_batch returns exactly the per-file results."""
+    logic_class = module_registry.get_logic_class(data["type"])
+    batch_apply = get_batch_apply(data["type"])
+    indices = list(range(len(files)))
+
+    assert batch_apply is not None
+    assert batch_apply(data, files, indices, None) == [
+        logic_class.apply_from_data(data, f, i, None) for f, i in zip(files, indices, strict=True)
+    ]
+
+
+def test_metadata_apply_batch_reads_provided_cache(files):
+    """Metadata batch lookups use the provided metadata cache per file."""
+    data = {"type": "metadata", "field": "Model", "category": "metadata_keys"}
+    metadata_cache = {f.full_path: {"Model": f"cam{i}"} for i, f in enumerate(files)}
+    batch_apply = get_batch_apply("metadata")
+
+    assert batch_apply(data, files, [0] * len(files), metadata_cache) == [
+        module_registry.get_logic_class("metadata").apply_from_data(data, f, 0, metadata_cache)
+        for f in files
+    ]
+
+
+def test_name_transform_apply_batch_matches_per_name():
+    """NameTransformModule.apply_batch matches apply_from_data for every name."""
+    data = {"case": "UPPER", "separator": "snake_case", "greeklish": False}
+    names = ["my photo", "Another Name", "   "]
+
+    assert NameTransformModule.apply_batch(data, names) == [
+        NameTransformModule.apply_from_data(data, name) for name in names
+    ]
+
+
+COMPOSE_MODULES = [
+    {"type": "specified_text", "text": "x_"},
+    {"type": "counter", "start": 1, "step": 1, "padding": 2, "scope": "per_folder"},
+    {"type": "original_name"},
+    {"type": "remove_text_from_original_name", "text_to_remove": "IMG"},
+]
+
+
+class TestComposeNames:
+    """Test column-wise name composition."""
+
+    def test_matches_per_file_composition(self, files):
+        """compose_names returns the same names as compose_name_with_context."""
+        composer = NameComposer()
+
+        names = composer.compose_names(files, COMPOSE_MODULES, None, {}, {})
+
+        assert names == [
+            composer.compose_name_with_context(f, COMPOSE_MODULES, i, None, {}, {}, all_files=files)
+            for i, f in enumerate(files)
+        ]
+
+    def test_missing_metadata_sentinel(self, files):
+        """Files without loaded metadata get the sentinel, others a name."""
+        modules = [{"type": "metadata", "field": "Model", "category": "metadata_keys"}]
+        availability = {files[0].full_path: True}
+
+        names = NameComposer().compose_names(files, modules, {}, {}, availability)
+
+        assert names[1:] == ["missing_metadata"] * (len(files) - 1)
+        assert names[0] not in ("missing_metadata", None)
+
+    def test_failing_batch_falls_back_per_file(self, files, monkeypatch):
+        """A raising apply_batch is retried per file; only failing files are None."""
+
+        class Flaky:
+            @staticmethod
+            def apply_batch(*_args):
+                raise RuntimeError("boom")
+
+            @staticmethod
+            def apply_from_data(_data, file_item, _index, _cache):
+                if file_item.filename.endswith(".txt"):
+                    raise RuntimeError("bad file")
+                return Path(file_item.filename).stem
+
+        monkeypatch.setitem(module_registry.MODULE_TYPE_MAP, "flaky", Flaky)
+
+        names = NameComposer().compose_names(files, [{"type": "flaky"}], None, {}, {})
+
+        assert names == ["IMG_001", "IMG_002", "clip_IMG", None]
@@ -0,0 +1,76 @@
+"""Module: test_parallel_metadata_loader.py
+
+Author: Michael Economou
+Date: 2026-10-16
+
+Tests for streaming metadata loading: only a bounded window of files is in
+flight, results reach the callbacks in batches, and cancellation stops
+pulling new files.
+"""
+
+import pytest
+
+from oncutf.core.metadata import parallel_loader
+from oncutf.core.metadata.parallel_loader import ParallelMetadataLoader
+from oncutf.domain.models.file_item import FileItem
+
+
+@pytest.fixture
+def loader(monkeypatch):
+    """Thread-backed loader with a stand-in for exopsis."""
+    loader = ParallelMetadataLoader(max_workers=2, backend="thread")
+    monkeypatch.setattr(
+        loader,
+        "_load_single_file_safe",
+        lambda item, _use_extended, _cancellation_check=None: {"File:FileName": item.filename},
+    )
+    return loader
+
+
+def _items(count, pulled):
+    for i in range(count):
+        pulled.append(i)
+        yield FileItem(f"/photos/img_{i}.jpg", "jpg", None)
+
+
+def test_items_are_pulled_a_window_ahead(loader):
+    pulled = []
+    yielded = 0
+
+    for item, metadata in loader.iter_metadata(_items(100, pulled)):
+        yielded += 1
+        assert metadata == {"File:FileName": item.filename}
+        assert len(pulled) - yielded <= 2 * loader.max_workers
+
+    assert yielded == 100
+
+
+def test_results_are_flushed_in_batches(loader, monkeypatch):
+    monkeypatch.setattr(parallel_loader, "METADATA_FLUSH_BATCH_SIZE", 8)
+    monkeypatch.setattr(parallel_loader, "METADATA_FLUSH_INTERVAL", 3600)
+    batches = []
+    progress = []
+
+    count = loader.load_metadata_parallel(
+        _items(20, []),
+        total=20,
+        progress_callback=lambda current, _total, _item, _meta: progress.append(current),
+        batch_callback=lambda current, total, batch: batches.append((current, total, len(batch))),
+    )
+
+    assert count == 20
+    assert progress == list(range(1, 21))
+    assert batches == [(8, 20, 8), (16, 20, 8), (20, 20, 4)]
+
+
+def test_cancellation_stops_pulling_items(loader):
+    pulled = []
+    results = []
+
+    for result in loader.iter_metadata(_items(1000, pulled)):
+        results.append(result)
+        if len(results) == 5:
+            loader.cancel()
+
+    assert loader.is_cancelled()
+    assert len(pulled) < 1000
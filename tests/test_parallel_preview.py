@@ -0,0 +1,285 @@
+"""Module: test_parallel_preview.py
+
+Author: Michael Economou
+Date: 2026-10-16
+
+Tests for the parallel preview engine: large module columns are computed in
+shared worker processes with the same result as the serial path, and a
+running preview is abandoned when a newer one supersedes it.
+"""
+
+import threading
+import time
+
+import pytest
+
+from oncutf.core.rename import module_registry, parallel_preview
+from oncutf.core.rename.name_composer import NameComposer
+from oncutf.core.rename.parallel_preview import ParallelColumnRunner, PreviewCancelledError
+from oncutf.core.rename.preview_manager import UnifiedPreviewManager
+from oncutf.core.rename.query_managers import SmartCacheManager
+from oncutf.domain.models.file_item import FileItem
+from oncutf.modules.metadata_module import MetadataModule, MetadataSnapshot
+from oncutf.utils.filesystem.path_normalizer import normalize_path
+
+pytestmark = pytest.mark.skipif(
+    not ParallelColumnRunner.is_available(), reason="parallel preview needs spawn"
+)
+
+MODULES = [
+    {
+        "type": "remove_text_from_original_name",
+        "text_to_remove": "IMG_",
+        "position": "Anywhere (all)",
+        "case_sensitive": False,
+    },
+    {"type": "metadata", "category": "metadata_keys", "field": "EXIF:Model"},
+    {"type": "metadata", "category": "file_dates", "field": "last_modified_year"},
+    {"type": "counter", "start": 1, "step": 1, "padding": 2, "scope": "per_folder"},
+]
+
+
+class NoAvailability:
+    """Batch query stand-in reporting no hashes or metadata."""
+
+    def get_hash_availability(self, _files):
+        return {}
+
+    def get_metadata_availability(self, _files):
+        return {}
+
+
+class NoExecutor:
+    """ProcessPoolExecutor stand-in that cannot start."""
+
+    def __init__(self, *_args, **_kwargs):
+        raise OSError("no processes")
+
+
+class SlowText:
+    """Module whose batch takes long enough to be superseded."""
+
+    @staticmethod
+    def apply_from_data(data, _file_item, _index=0, _metadata_cache=None):
+        return data.get("text", "")
+
+    @staticmethod
+    def apply_batch(data, file_items, _indices, _metadata_cache=None):
+        time.sleep(0.5)
+        return [data.get("text", "")] * len(file_items)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def preview_pool():
+    """Stop the shared worker processes after this module's tests."""
+    yield
+    parallel_preview.shutdown_preview_pool()
+
+
+@pytest.fixture
+def files(tmp_path):
+    """Twelve files over two folders."""
+    items = []
+    for i in range(12):
+        folder = tmp_path / f"card_{i % 2}"
+        folder.mkdir(exist_ok=True)
+        path = folder / f"IMG_{i:03d}.jpg"
+        path.write_bytes(b"x")
+        items.append(FileItem.from_path(str(path)))
+    return items
+
+
+@pytest.fixture
+def metadata_cache(files):
+    """Metadata for all but the last file, keyed like the real cache."""
+    return {
+        normalize_path(f.full_path): {"EXIF:Model": f"Cam{i % 3}"} for i, f in enumerate(files[:-1])
+    }
+
+
+def _runner(**kwargs):
+    options = {"min_files": 1, "max_workers": 2, "chunk_size": 5}
+    options.update(kwargs)
+    return ParallelColumnRunner(**options)
+
+
+def _compose(files, metadata_cache, column_runner=None):
+    availability = {f.full_path: True for f in files}
+    return NameComposer().compose_names(
+        files, MODULES, metadata_cache, {}, availability, column_runner=column_runner
+    )
+
+
+class TestParallelColumnRunner:
+    """Test chunked column computation."""
+
+    def test_matches_serial_composition(self, files, metadata_cache):
+        expected = _compose(files, metadata_cache)
+
+        assert _compose(files, metadata_cache, _runner()) == expected
+        assert expected[0].startswith("000Cam0")
+
+    def test_small_columns_stay_serial(self, files, metadata_cache, monkeypatch):
+        monkeypatch.setattr(parallel_preview, "ProcessPoolExecutor", NoExecutor)
+        runner = _runner(min_files=len(files) + 1)
+
+        def fail(*_args):
+            raise AssertionError("small column was run in parallel")
+
+        monkeypatch.setattr(runner, "_run", fail)
+
+        assert _compose(files, metadata_cache, runner) == _compose(files, metadata_cache)
+
+    def test_counter_and_original_name_stay_serial(self, files, monkeypatch):
+        runner = _runner()
+
+        def fail(*_args):
+            raise AssertionError("cheap column was run in parallel")
+
+        monkeypatch.setattr(runner, "_run", fail)
+        modules = [{"type": "original_name"}, {"type": "counter", "start": 1, "padding": 2}]
+
+        names = NameComposer().compose_names(files, modules, None, {}, {}, column_runner=runner)
+
+        assert names[0] == "IMG_00001"
+
+    def test_pool_failure_falls_back_to_serial(self, files, metadata_cache, monkeypatch):
+        monkeypatch.setattr(parallel_preview, "ProcessPoolExecutor", NoExecutor)
+
+        assert _compose(files, metadata_cache, _runner()) == _compose(files, metadata_cache)
+
+    def test_cancellation_raises(self, files, metadata_cache):
+        runner = _runner(cancellation_check=lambda: True)
+
+        with pytest.raises(PreviewCancelledError):
+            _compose(files, metadata_cache, runner)
+
+    def test_worker_processes_are_shared_between_previews(self, files, metadata_cache):
+        _compose(files, metadata_cache, _runner())
+        executor = parallel_preview._get_executor(2)
+        pids = set(executor._processes)
+
+        assert _compose(files, metadata_cache, _runner()) == _compose(files, metadata_cache)
+        assert parallel_preview._get_executor(2) is executor
+        assert set(executor._processes) == pids
+
+    def test_cancellation_drops_chunks_not_started(self, files, monkeypatch):
+        monkeypatch.setitem(module_registry.MODULE_TYPE_MAP, "slow_text", SlowText)
+        executor = parallel_preview._get_executor(2)
+        submitted = []
+
+        class RecordingExecutor:
+            def submit(self, *args):
+                future = executor.submit(*args)
+                submitted.append(future)
+                return future
+
+        monkeypatch.setattr(parallel_preview, "_get_executor", lambda _workers: RecordingExecutor())
+        started = time.monotonic()
+        runner = _runner(chunk_size=1, cancellation_check=lambda: time.monotonic() - started > 0.2)
+
+        with pytest.raises(PreviewCancelledError):
+            runner(
+                NameComposer()._compute_column,
+                "slow_text",
+                {"text": "x"},
+                files,
+                list(range(len(files))),
+                None,
+            )
+
+        assert len(submitted) == len(files)
+        assert sum(future.cancelled() for future in submitted) >= len(files) // 2
+
+
+class TestMetadataSnapshot:
+    """Test the metadata snapshot handed to worker processes."""
+
+    def test_snapshot_never_reads_the_persistent_cache(self, files, monkeypatch):
+        def fail():
+            raise AssertionError("persistent cache was read")
+
+        monkeypatch.setattr(
+            "oncutf.infra.cache.persistent_metadata_cache.get_persistent_metadata_cache", fail
+        )
+        data = {"category": "metadata_keys", "field": "EXIF:Model"}
+
+        assert MetadataModule.apply_batch(data, files[:2], [0, 1], MetadataSnapshot()) == [
+            MetadataModule.apply_from_data(data, f, 0, MetadataSnapshot()) for f in files[:2]
+        ]
+
+    def test_snapshot_carries_normalized_paths(self, files, metadata_cache):
+        snapshot = MetadataModule.snapshot(files, metadata_cache)
+
+        assert snapshot.normalized_paths[files[0].full_path] == normalize_path(files[0].full_path)
+        assert snapshot[normalize_path(files[0].full_path)] == {"EXIF:Model": "Cam0"}
+        assert snapshot[normalize_path(files[-1].full_path)] == {}
+
+
+class TestSupersededPreview:
+    """Test that a newer preview request cancels a running one."""
+
+    def test_superseded_preview_is_cancelled_and_not_cached(self, files, monkeypatch):
+        monkeypatch.setitem(module_registry.MODULE_TYPE_MAP, "slow_text", SlowText)
+        monkeypatch.setattr(
+            "oncutf.core.rename.preview_manager.ParallelColumnRunner",
+            lambda **kwargs: _runner(**kwargs),
+        )
+        manager = UnifiedPreviewManager(NoAvailability(), SmartCacheManager())
+        modules = [{"type": "slow_text", "text": "x"}]
+
+        timer = threading.Timer(0.1, manager.cancel_preview)
+        timer.start()
+        try:
+            result = manager.generate_preview(files, modules, {}, None)
+        finally:
+            timer.cancel()
+
+        assert result.cancelled
+        assert result.name_pairs == []
+
+        finished = manager.generate_preview(files, modules, {}, None)
+        assert not finished.cancelled
+        assert finished.name_pairs[0] == (files[0].filename, "x.jpg")
+
+    def test_request_during_event_processing_supersedes_preview(self, files, monkeypatch):
+        monkeypatch.setitem(module_registry.MODULE_TYPE_MAP, "slow_text", SlowText)
+        monkeypatch.setattr(
+            "oncutf.core.rename.preview_manager.ParallelColumnRunner",
+            lambda **kwargs: _runner(**kwargs),
+        )
+        manager = UnifiedPreviewManager(NoAvailability(), SmartCacheManager())
+        # A UI event (e.g. a new selection) processed while the workers run
+        monkeypatch.setattr("oncutf.app.services.ui_events.process_events", manager.cancel_preview)
+
+        result = manager.generate_preview(files, [{"type": "slow_text", "text": "x"}], {}, None)
+
+        assert result.cancelled
+
+    def test_preview_requested_from_an_event_runs_without_processing_events(
+        self, files, monkeypatch
+    ):
+        monkeypatch.setitem(module_registry.MODULE_TYPE_MAP, "slow_text", SlowText)
+        monkeypatch.setattr(
+            "oncutf.core.rename.preview_manager.ParallelColumnRunner",
+            lambda **kwargs: _runner(**kwargs),
+        )
+        manager = UnifiedPreviewManager(NoAvailability(), SmartCacheManager())
+        nested = []
+
+        def process_events():
+            if not nested:
+                nested.append(
+                    manager.generate_preview(files, [{"type": "slow_text", "text": "y"}], {}, None)
+                )
+            else:
+                nested.append("re-entered")
+
+        monkeypatch.setattr("oncutf.app.services.ui_events.process_events", process_events)
+
+        outer = manager.generate_preview(files, [{"type": "slow_text", "text": "x"}], {}, None)
+
+        assert outer.cancelled
+        assert len(nested) == 1
+        assert not nested[0].cancelled
+        assert nested[0].name_pairs[0] == (files[0].filename, "y.jpg")
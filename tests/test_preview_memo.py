@@ -0,0 +1,178 @@
+"""Module: test_preview_memo.py
+
+Author: Michael Economou
+Date: 2026-10-16
+
+Tests for incremental preview generation: per-module parts are memoized
+across previews and only the edited module is recomputed.
+"""
+
+import pytest
+
+from oncutf.core.rename import module_registry
+from oncutf.core.rename.preview_manager import UnifiedPreviewManager, apply_rename_modules
+from oncutf.core.rename.preview_memo import PreviewMemo
+from oncutf.core.rename.query_managers import SmartCacheManager
+from oncutf.domain.models.file_item import FileItem
+from oncutf.modules.logic.counter_logic import CounterLogic
+
+
+class NoAvailability:
+    """Batch query stand-in reporting no hashes or metadata."""
+
+    def get_hash_availability(self, _files):
+        return {}
+
+    def get_metadata_availability(self, _files):
+        return {}
+
+
+class CountingCounter:
+    """CounterLogic wrapper counting how often a part is computed."""
+
+    calls = 0
+
+    @classmethod
+    def apply_from_data(cls, *args):
+        cls.calls += 1
+        return CounterLogic.apply_from_data(*args)
+
+
+@pytest.fixture
+def files(tmp_path):
+    """Files spread over two folders."""
+    items = []
+    for i in range(6):
+        folder = tmp_path / f"folder_{i % 2}"
+        folder.mkdir(exist_ok=True)
+        path = folder / f"clip{i}.mov"
+        path.touch()
+        items.append(FileItem.from_path(str(path)))
+    return items
+
+
+@pytest.fixture
+def counting_counter(monkeypatch):
+    """Route counter modules through CountingCounter."""
+    CountingCounter.calls = 0
+    monkeypatch.setitem(module_registry.MODULE_TYPE_MAP, "counter", CountingCounter)
+    return CountingCounter
+
+
+def _modules(text):
+    return [
+        {"type": "specified_text", "text": text},
+        {"type": "counter", "start": 1, "step": 1, "padding": 3, "scope": "per_folder"},
+    ]
+
+
+def _preview(manager, files, modules_data):
+    # A fresh cache manager skips the whole-result cache, as an edit does
+    manager.cache_manager = SmartCacheManager()
+    return manager.generate_preview(files, modules_data, {}, None).name_pairs
+
+
+class TestIncrementalPreview:
+    """Test memoized preview generation."""
+
+    def test_editing_one_module_reuses_other_parts(self, files, counting_counter):
+        """Changing the text module does not recompute counter parts."""
+        manager = UnifiedPreviewManager(NoAvailability(), SmartCacheManager())
+
+        _preview(manager, files, _modules("take_"))
+        assert counting_counter.calls == len(files)
+
+        pairs = _preview(manager, files, _modules("shot_"))
+
+        assert counting_counter.calls == len(files)
+        assert [new for _, new in pairs] == [
+            "shot_001.mov",
+            "shot_001.mov",
+            "shot_002.mov",
+            "shot_002.mov",
+            "shot_003.mov",
+            "shot_003.mov",
+        ]
+
+    def test_file_independent_module_is_computed_once(self, files, monkeypatch):
+        """Specified text does not depend on the file and is computed once."""
+        from oncutf.modules.logic.specified_text_logic import SpecifiedTextLogic
+
+        calls = []
+
+        class CountingText:
+            @staticmethod
+            def apply_from_data(*args):
+                calls.append(args[1])
+                return SpecifiedTextLogic.apply_from_data(*args)
+
+        monkeypatch.setitem(module_registry.MODULE_TYPE_MAP, "specified_text", CountingText)
+        manager = UnifiedPreviewManager(NoAvailability(), SmartCacheManager())
+
+        pairs = _preview(manager, files, _modules("take_"))
+
+        assert len(calls) == 1
+        assert all(new.startswith("take_") for _, new in pairs)
+
+    def test_adding_a_file_computes_only_the_new_file(self, files, counting_counter):
+        """Extending the selection at the end reuses earlier files' parts."""
+        manager = UnifiedPreviewManager(NoAvailability(), SmartCacheManager())
+
+        _preview(manager, files[:5], _modules("take_"))
+        _preview(manager, files, _modules("take_"))
+
+        assert counting_counter.calls == len(files)
+
+    def test_memoized_names_match_direct_composition(self, files):
+        """Memoized previews produce the same names as uncached composition."""
+        manager = UnifiedPreviewManager(NoAvailability(), SmartCacheManager())
+        modules_data = [*_modules("a"), {"type": "original_name"}]
+
+        _preview(manager, files, modules_data)
+        pairs = _preview(manager, files, modules_data)
+
+        expected = [
+            apply_rename_modules(modules_data, idx, f, None, files) + ".mov"
+            for idx, f in enumerate(files)
+        ]
+        assert [new for _, new in pairs] == expected
+
+    def test_invalid_names_fall_back_to_original(self, files):
+        """Invalid composed names keep the original name on memo hits too."""
+        manager = UnifiedPreviewManager(NoAvailability(), SmartCacheManager())
+        modules_data = [{"type": "specified_text", "text": ""}]
+
+        first = _preview(manager, files, modules_data)
+        second = _preview(manager, files, modules_data)
+
+        assert first == second == [(f.filename, f.filename) for f in files]
+
+
+class TestPreviewMemo:
+    """Test PreviewMemo cache bookkeeping."""
+
+    def test_metadata_modules_are_not_memoized(self):
+        """Metadata parts depend on the metadata cache and are never cached."""
+        memo = PreviewMemo()
+
+        caches = memo.stage_caches([{"type": "metadata"}, {"type": "original_name"}], 10)
+
+        assert caches[0] is None
+        assert caches[1] == {}
+
+    def test_same_config_returns_same_cache(self):
+        """An unchanged module config maps to the same stage cache."""
+        memo = PreviewMemo()
+        first = memo.stage_caches(_modules("a"), 10)
+        first[0][("/x", 0)] = "a"
+
+        assert memo.stage_caches(_modules("a"), 10)[0] is first[0]
+        assert memo.stage_caches(_modules("b"), 10)[0] == {}
+
+    def test_least_recently_used_configs_are_dropped(self):
+        """Only max_stages module configs are kept."""
+        memo = PreviewMemo(max_stages=2)
+        for text in ("a", "b", "c"):
+            memo.stage_caches([{"type": "specified_text", "text": text}], 10)
+
+        assert memo.get_stats()["stage_count"] == 2
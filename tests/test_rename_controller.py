@@ -20,9 +20,12 @@ from oncutf.domain.models.file_item import FileItem
 class MockPreviewResult:
     """Mock PreviewResult from UnifiedRenameEngine."""
 
-    def __init__(self, name_pairs: list[tuple[str, str]], has_changes: bool = True):
+    def __init__(
+        self, name_pairs: list[tuple[str, str]], has_changes: bool = True, cancelled: bool = False
+    ):
         self.name_pairs = name_pairs
         self.has_changes = has_changes
+        self.cancelled = cancelled
 
 
 class MockValidationItem:
@@ -291,6 +294,28 @@ class TestGeneratePreview:
         assert result["has_changes"] is False
         assert len(result["name_pairs"]) == 0
 
+    def test_generate_preview_superseded(
+        self,
+        rename_controller,
+        sample_file_items,
+        sample_modules_data,
+        sample_post_transform,
+    ):
+        """Test that a preview superseded by a newer request is reported as cancelled."""
+        mock_result = MockPreviewResult([], has_changes=False, cancelled=True)
+        rename_controller._unified_rename_engine.generate_preview.return_value = mock_result
+
+        result = rename_controller.generate_preview(
+            file_items=sample_file_items,
+            modules_data=sample_modules_data,
+            post_transform=sample_post_transform,
+            metadata_cache={},
+        )
+
+        assert result["success"] is False
+        assert result["cancelled"] is True
+        assert result["name_pairs"] == []
+
     def test_generate_preview_exception_handling(
         self,
         rename_controller,
@@ -515,6 +540,30 @@ class TestExecuteRename:
         assert result["skipped_count"] == len(sample_file_items)
         assert "No changes detected" in result["errors"]
 
+    def test_execute_rename_superseded_preview(
+        self,
+        rename_controller,
+        sample_file_items,
+        sample_modules_data,
+        sample_post_transform,
+    ):
+        """Test that nothing is renamed when the preview was superseded."""
+        mock_preview = MockPreviewResult([], has_changes=False, cancelled=True)
+        rename_controller._unified_rename_engine.generate_preview.return_value = mock_preview
+
+        result = rename_controller.execute_rename(
+            file_items=sample_file_items,
+            modules_data=sample_modules_data,
+            post_transform=sample_post_transform,
+            metadata_cache={},
+            current_folder="/test",
+        )
+
+        assert result["success"] is False
+        assert result["renamed_count"] == 0
+        assert "Preview superseded by a newer request" in result["errors"]
+        rename_controller._unified_rename_engine.execute_rename.assert_not_called()
+
     def test_execute_rename_validation_errors(
         self,
         rename_controller,
@@ -0,0 +1,62 @@
+"""Module: test_update_coalescer.py
+
+Author: Michael Economou
+Date: 2026-10-16
+
+Tests for coalesced UI updates: keys added between frames are delivered
+once per interval, and the rows of many loaded files are repainted with a
+single dataChanged signal.
+"""
+
+from types import SimpleNamespace
+
+from oncutf.domain.models.file_item import FileItem
+from oncutf.ui.adapters.metadata_ui_bridge_qt import QtMetadataUIBridge
+from oncutf.ui.models.file_table.file_table_model import FileTableModel
+from oncutf.utils.shared.update_coalescer import UpdateCoalescer
+
+
+class FakeClock:
+    """Manually advanced time source."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_updates_are_delivered_once_per_interval():
+    clock = FakeClock()
+    delivered = []
+    coalescer = UpdateCoalescer(delivered.append, 0.1, clock)
+
+    coalescer.add(["a", "b"])
+    clock.now = 0.05
+    coalescer.add(["b", "c"])
+    assert delivered == []
+    assert len(coalescer) == 3
+
+    clock.now = 0.1
+    assert coalescer.poll()
+    coalescer.add(["d"])
+    assert not coalescer.poll()
+    coalescer.flush()
+
+    assert delivered == [["a", "b", "c"], ["d"]]
+    assert len(coalescer) == 0
+
+
+def test_rows_changed_emits_one_signal(qapp):  # noqa: ARG001
+    files = [FileItem(f"/photos/img_{i}.jpg", "jpg", None) for i in range(50)]
+    model = FileTableModel()
+    model.files = files
+    emitted = []
+    model.dataChanged.connect(lambda top, bottom, _roles: emitted.append((top.row(), bottom.row())))
+    bridge = QtMetadataUIBridge(SimpleNamespace(file_model=model))
+
+    bridge.emit_rows_changed([files[30].full_path, files[4].full_path, "/elsewhere.jpg"])
+    model.files = files[::-1]
+    bridge.emit_rows_changed([files[30].full_path])
+
+    assert emitted == [(4, 30), (19, 19)]
@@ -0,0 +1,66 @@
+"""Tests for incremental preview table updates.
+
+Author: Michael Economou
+Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from oncutf.ui.widgets.preview_tables_view import PreviewTablesView
+
+ICON_PATHS = {"valid": "", "invalid": "", "unchanged": "", "duplicate": ""}
+
+
+@pytest.fixture
+def view(qtbot):
+    """Create a PreviewTablesView showing three renamed files."""
+    widget = PreviewTablesView()
+    qtbot.addWidget(widget)
+    widget.update_from_pairs(
+        [("a.jpg", "x1.jpg"), ("b.jpg", "x2.jpg"), ("c.jpg", "x3.jpg")], {}, ICON_PATHS
+    )
+    return widget
+
+
+def _items(view):
+    return [view.new_names_table.item(row, 0) for row in range(view.new_names_table.rowCount())]
+
+
+def test_only_changed_rows_are_rewritten(view):
+    """Rows whose pair did not change keep their table items."""
+    before = _items(view)
+
+    view.update_from_pairs(
+        [("a.jpg", "x1.jpg"), ("b.jpg", "y2.jpg"), ("c.jpg", "x3.jpg")], {}, ICON_PATHS
+    )
+
+    after = _items(view)
+    assert after[0] is before[0]
+    assert after[2] is before[2]
+    assert after[1].text() == "y2.jpg"
+
+
+def test_duplicate_status_change_rewrites_other_rows(view):
+    """A row becoming a duplicate also refreshes the row it collides with."""
+    before = _items(view)
+    statuses = []
+    view.status_updated.connect(statuses.append)
+
+    view.update_from_pairs(
+        [("a.jpg", "x1.jpg"), ("b.jpg", "x1.jpg"), ("c.jpg", "x3.jpg")], {}, ICON_PATHS
+    )
+
+    after = _items(view)
+    assert after[0] is not before[0]
+    assert after[2] is before[2]
+    assert "Duplicates: 2" in statuses[-1]
+
+
+def test_different_files_rebuild_the_table(view):
+    """A different file list falls back to a full rebuild."""
+    view.update_from_pairs([("d.jpg", "x1.jpg")], {}, ICON_PATHS)
+
+    assert view.new_names_table.rowCount() == 1
+    assert view.old_names_table.item(0, 0).text() == "d.jpg"
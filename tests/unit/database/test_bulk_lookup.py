@@ -0,0 +1,121 @@
+"""Unit tests for chunked and temp-table key lookups.
+
+Author: Michael Economou
+Date: 2026-10-16
+
+Tests that batch reads in the database stores work for key sets larger than
+SQLite's host-parameter limit, return the latest row per path, and that the
+temporary key table used for anti-joins is dropped afterwards.
+"""
+
+import sqlite3
+import threading
+
+import pytest
+
+from oncutf.infra.db.bulk_lookup import fetch_by_keys, temporary_keys
+from oncutf.infra.db.hash_store import HashRecord, HashStore
+from oncutf.infra.db.metadata_store import MetadataStore
+from oncutf.infra.db.migrations import create_indexes, create_schema
+from oncutf.infra.db.path_store import PathStore
+from oncutf.infra.db.thumbnail_store import ThumbnailStore
+
+# More keys than SQLITE_MAX_VARIABLE_NUMBER on any SQLite build (32766 since 3.32)
+MANY = 33000
+
+
+@pytest.fixture
+def memory_db():
+    """Create an in-memory database with the current schema."""
+    conn = sqlite3.connect(":memory:", check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    cursor = conn.cursor()
+    create_schema(cursor)
+    create_indexes(cursor)
+    conn.commit()
+    return conn
+
+
+@pytest.fixture
+def path_store(memory_db):
+    return PathStore(memory_db)
+
+
+def _paths(count):
+    return [f"/bulk/card/IMG_{i:06d}.jpg" for i in range(count)]
+
+
+def test_fetch_by_keys_chunks_and_deduplicates(memory_db):
+    statements = []
+    memory_db.set_trace_callback(statements.append)
+    rows = fetch_by_keys(
+        memory_db.cursor(),
+        "SELECT value FROM json_each('[1,2,3,4,5]') WHERE value IN ({keys})",
+        [1, 2, 2, 3, 4, 5, 9],
+        chunk_size=2,
+    )
+    memory_db.set_trace_callback(None)
+
+    assert [row["value"] for row in rows] == [1, 2, 3, 4, 5]
+    assert len(statements) == 3
+
+
+def test_path_ids_resolve_past_parameter_limit(path_store, memory_db):
+    paths = _paths(MANY)
+    created = path_store.get_or_create_path_ids(paths)
+    memory_db.commit()
+
+    resolved = path_store.get_path_ids([*paths, "/bulk/missing.jpg"])
+
+    assert resolved == created
+    assert len(resolved) == MANY
+
+
+def test_metadata_batch_returns_latest_per_path(path_store, memory_db):
+    store = MetadataStore(memory_db, path_store, threading.RLock())
+    paths = _paths(1200)
+    for path in paths[:600]:
+        store.store_metadata(path, {"v": 1})
+    store.store_metadata(paths[0], {"v": 2}, is_modified=True)
+
+    result = store.get_metadata_batch([*paths, paths[1]])
+
+    assert result[paths[0]] == {"v": 2, "__modified__": True}
+    assert result[paths[599]] == {"v": 1}
+    assert result[paths[600]] is None
+    assert len(result) == 1200
+
+
+def test_hash_batches_past_parameter_limit(path_store, memory_db):
+    store = HashStore(memory_db, path_store, threading.RLock())
+    paths = _paths(MANY)
+    hashed = paths[::1000]
+    store.store_hashes_batch([HashRecord(path, f"{i:08x}") for i, path in enumerate(hashed)])
+
+    assert sorted(store.get_files_with_hash_batch(paths)) == sorted(hashed)
+    entries = store.get_hash_entries_batch(paths)
+    assert {path: value for path, (value, _signature) in entries.items()} == {
+        path: f"{i:08x}" for i, path in enumerate(hashed)
+    }
+
+
+def test_thumbnail_cleanup_keeps_valid_folders(memory_db):
+    store = ThumbnailStore(memory_db)
+    for folder in ("/a", "/b", "/c"):
+        store.save_folder_order(folder, [f"{folder}/x.jpg"])
+
+    removed = store.cleanup_orphaned_entries(["/a", "/c", *(f"/other/{i}" for i in range(MANY))])
+
+    assert removed == 1
+    assert store.get_folder_order("/b") is None
+    assert store.get_folder_order("/a") == ["/a/x.jpg"]
+
+
+def test_temporary_keys_table_is_dropped(memory_db):
+    cursor = memory_db.cursor()
+    with temporary_keys(cursor, ["x", "y", "x"]) as table:
+        cursor.execute(f"SELECT COUNT(*) FROM {table}")
+        assert cursor.fetchone()[0] == 2
+
+    cursor.execute("SELECT COUNT(*) FROM temp.sqlite_master WHERE name LIKE 'bulk_keys_%'")
+    assert cursor.fetchone()[0] == 0
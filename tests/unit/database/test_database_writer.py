@@ -0,0 +1,162 @@
+"""Unit tests for the DatabaseManager writer thread and read connections.
+
+Author: Michael Economou
+Date: 2026-10-16
+
+Tests that queued writes are group-committed with one savepoint per call,
+that a failing call only undoes its own writes, and that reads run on
+read-only per-thread connections that do not wait for the writer.
+"""
+
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from oncutf.infra.db import database_manager
+from oncutf.infra.db.connections import DatabaseWriter
+from oncutf.infra.db.database_manager import DatabaseManager
+
+
+@pytest.fixture
+def writer(tmp_path):
+    """Writer over a WAL database with one table, recording COMMITs."""
+    conn = sqlite3.connect(str(tmp_path / "w.db"), check_same_thread=False)
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("CREATE TABLE items (name TEXT)")
+    conn.commit()
+    commits = []
+    conn.set_trace_callback(lambda sql: commits.append(sql) if sql == "COMMIT" else None)
+    db_writer = DatabaseWriter(conn)
+    db_writer.start()
+    yield db_writer, commits
+    db_writer.stop()
+    conn.close()
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    """DatabaseManager on a temporary database file."""
+    monkeypatch.setattr(database_manager, "_FRESH_START_DONE", True)
+    manager = DatabaseManager(str(tmp_path / "oncutf.db"))
+    yield manager
+    manager.close()
+
+
+def _insert(db_writer, name):
+    db_writer.connection.execute("INSERT INTO items VALUES (?)", (name,))
+    return name
+
+
+def _names(db_writer):
+    rows = db_writer.connection.execute("SELECT name FROM items ORDER BY name").fetchall()
+    return [row[0] for row in rows]
+
+
+def test_queued_calls_share_one_commit(writer):
+    db_writer, commits = writer
+    started, release = threading.Event(), threading.Event()
+
+    def block():
+        started.set()
+        release.wait()
+
+    threads = [threading.Thread(target=db_writer.call, args=(block,))]
+    threads[0].start()
+    started.wait()
+
+    results = {}
+    for i in range(10):
+        thread = threading.Thread(
+            target=lambda i=i: results.update({i: db_writer.call(_insert, db_writer, f"n{i}")})
+        )
+        thread.start()
+        threads.append(thread)
+    while db_writer._queue.qsize() < 10:
+        time.sleep(0.01)
+    release.set()
+    for thread in threads:
+        thread.join(timeout=10)
+
+    assert results == {i: f"n{i}" for i in range(10)}
+    assert len(commits) == 2
+
+
+def test_failing_call_only_undoes_its_own_writes(writer):
+    db_writer, _commits = writer
+
+    def insert_then_fail():
+        _insert(db_writer, "bad")
+        raise ValueError("boom")
+
+    db_writer.call(_insert, db_writer, "good")
+    with pytest.raises(ValueError, match="boom"):
+        db_writer.call(insert_then_fail)
+
+    assert _names(db_writer) == ["good"]
+
+
+def test_reads_use_read_only_connection_per_thread(db, tmp_path):
+    assert db.store_metadata(str(tmp_path / "a.jpg"), {"ISO": 100})
+
+    connections = []
+
+    def read():
+        connections.append(db._connection.current())
+        connections.append(db._connection.current())
+
+    thread = threading.Thread(target=read)
+    thread.start()
+    thread.join()
+    read()
+
+    assert connections[0] is connections[1]
+    assert connections[2] is not connections[0]
+    with pytest.raises(sqlite3.OperationalError, match="readonly"):
+        connections[2].execute("DELETE FROM file_paths")
+    assert db.get_metadata(str(tmp_path / "a.jpg")) == {"ISO": 100}
+
+
+def test_reads_do_not_wait_for_writer(db, tmp_path):
+    path = str(tmp_path / "a.jpg")
+    db.store_metadata(path, {"ISO": 100})
+    results = []
+
+    with db.transaction() as conn:
+        conn.execute("DELETE FROM file_metadata")
+        reader = threading.Thread(target=lambda: results.append(db.get_metadata(path)))
+        reader.start()
+        reader.join(timeout=5)
+        assert results == [{"ISO": 100}]
+
+    assert db.get_metadata(path) is None
+
+
+def test_store_writes_from_other_threads(db, tmp_path):
+    paths = [str(tmp_path / f"f{i}.jpg") for i in range(20)]
+    threads = [
+        threading.Thread(target=db.store_hash, args=(path, f"{i:08x}", "CRC32", None))
+        for i, path in enumerate(paths)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    db.thumbnail_store.save_folder_order(str(tmp_path), paths)
+
+    assert [db.get_hash(path) for path in paths] == [f"{i:08x}" for i in range(20)]
+    assert db.get_thumbnail_folder_order(str(tmp_path)) == paths
+
+
+def test_close_runs_pending_writes(tmp_path, monkeypatch):
+    monkeypatch.setattr(database_manager, "_FRESH_START_DONE", True)
+    db_path = str(tmp_path / "oncutf.db")
+    manager = DatabaseManager(db_path)
+    manager.set_session_state("recent_folders", ["/a"])
+    manager.close()
+
+    assert manager.get_session_state("recent_folders", "gone") == "gone"
+    reopened = DatabaseManager(db_path)
+    assert reopened.get_session_state("recent_folders") == ["/a"]
+    reopened.close()
@@ -0,0 +1,179 @@
+"""Unit tests for HashStore stat-signature validation.
+
+Author: Michael Economou
+Date: 2026-10-16
+
+Tests that hashes are persisted with the size/mtime/inode signature they
+were computed against, that batches are written in one transaction, and
+that the v6 migration adds the columns.
+"""
+
+import os
+import sqlite3
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from oncutf.infra.cache.persistent_hash_cache import PersistentHashCache
+from oncutf.infra.db.hash_store import HashRecord, HashStore
+from oncutf.infra.db.migrations import create_indexes, create_schema, migrate_schema
+from oncutf.infra.db.path_store import PathStore
+from oncutf.utils.filesystem.file_signature import FileSignature, get_file_signature
+
+
+@pytest.fixture
+def memory_db():
+    """Create an in-memory database with the current schema."""
+    conn = sqlite3.connect(":memory:", check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    cursor = conn.cursor()
+    create_schema(cursor)
+    create_indexes(cursor)
+    conn.commit()
+    return conn
+
+
+@pytest.fixture
+def store(memory_db):
+    """Create a HashStore instance for testing."""
+    return HashStore(memory_db, PathStore(memory_db), threading.RLock())
+
+
+def test_store_hash_records_signature(store, tmp_path):
+    file_path = tmp_path / "clip.mov"
+    file_path.write_bytes(b"frame data")
+
+    assert store.store_hash(str(file_path), "deadbeef")
+
+    entry = store.get_hash_entry(str(file_path))
+    assert entry is not None
+    hash_value, signature = entry
+    assert hash_value == "deadbeef"
+    assert signature == get_file_signature(file_path)
+
+
+def test_store_hash_uses_given_signature(store, tmp_path):
+    file_path = tmp_path / "photo.jpg"
+    file_path.write_bytes(b"jpeg")
+    given = FileSignature(4, 123, 7, 9)
+
+    store.store_hash(str(file_path), "cafebabe", signature=given)
+
+    assert store.get_hash_entry(str(file_path)) == ("cafebabe", given)
+
+
+def test_signature_changes_after_in_place_edit(store, tmp_path):
+    file_path = tmp_path / "doc.txt"
+    file_path.write_bytes(b"original")
+    store.store_hash(str(file_path), "11111111")
+    stat_before = file_path.stat()
+
+    file_path.write_bytes(b"edited!!")
+    os.utime(file_path, ns=(stat_before.st_atime_ns, stat_before.st_mtime_ns + 1_000_000))
+
+    _hash_value, stored_signature = store.get_hash_entry(str(file_path))
+    assert stored_signature != get_file_signature(file_path)
+
+
+def test_get_hash_entry_missing(store, tmp_path):
+    assert store.get_hash_entry(str(tmp_path / "nope.bin")) is None
+
+
+def test_store_hashes_batch_single_commit(store, memory_db, tmp_path):
+    paths = []
+    for i in range(5):
+        file_path = tmp_path / f"file_{i}.bin"
+        file_path.write_bytes(b"x" * i)
+        paths.append(str(file_path))
+
+    commits = []
+    memory_db.set_trace_callback(lambda sql: commits.append(sql) if sql == "COMMIT" else None)
+    stored = store.store_hashes_batch([HashRecord(p, f"{i:08x}") for i, p in enumerate(paths)])
+    memory_db.set_trace_callback(None)
+
+    assert stored == 5
+    assert len(commits) == 1
+    for i, path in enumerate(paths):
+        assert store.get_hash_entry(path) == (f"{i:08x}", get_file_signature(path))
+
+
+def test_store_hashes_batch_keeps_latest_per_path(store, tmp_path):
+    file_path = tmp_path / "dup.bin"
+    file_path.write_bytes(b"data")
+    store.store_hash(str(file_path), "00000000")
+
+    stored = store.store_hashes_batch(
+        [
+            HashRecord(str(file_path), "11111111"),
+            HashRecord(str(file_path), "22222222"),
+            HashRecord("", "33333333"),
+        ]
+    )
+
+    assert stored == 1
+    assert store.get_hash(str(file_path)) == "22222222"
+
+
+def test_get_hash_entries_batch_returns_latest_and_omits_missing(store, tmp_path):
+    hashed = tmp_path / "hashed.bin"
+    hashed.write_bytes(b"data")
+    store.store_hash(str(hashed), "00000000")
+    store.store_hash(str(hashed), "11111111")
+
+    entries = store.get_hash_entries_batch([str(hashed), str(tmp_path / "none.bin")])
+
+    assert entries == {str(hashed): ("11111111", get_file_signature(hashed))}
+
+
+def test_presence_checks_ignore_hashes_of_edited_files(store, tmp_path):
+    kept = tmp_path / "kept.bin"
+    edited = tmp_path / "edited.bin"
+    for file_path in (kept, edited):
+        file_path.write_bytes(b"data")
+        store.store_hash(str(file_path), "11111111")
+    with patch("oncutf.infra.cache.persistent_hash_cache.get_database_manager", return_value=store):
+        cache = PersistentHashCache()
+    assert cache.has_hash(str(edited))
+
+    stat_before = edited.stat()
+    edited.write_bytes(b"DATA")
+    os.utime(edited, ns=(stat_before.st_atime_ns, stat_before.st_mtime_ns + 1_000_000))
+
+    assert cache.get_hash(str(edited)) is None
+    assert not cache.has_hash(str(edited))
+    assert cache.get_files_with_hash_batch([str(kept), str(edited)]) == [str(kept)]
+
+
+def test_get_or_create_path_ids(memory_db, tmp_path):
+    path_store = PathStore(memory_db)
+    existing = str(tmp_path / "a.txt")
+    existing_id = path_store.get_or_create_path_id(existing)
+
+    ids = path_store.get_or_create_path_ids([existing, str(tmp_path / "b.txt")])
+
+    assert ids[existing] == existing_id
+    assert ids[str(tmp_path / "b.txt")] == path_store.get_path_id(str(tmp_path / "b.txt"))
+
+
+def test_migration_adds_signature_columns():
+    conn = sqlite3.connect(":memory:")
+    cursor = conn.cursor()
+    cursor.execute(
+        """
+        CREATE TABLE file_hashes (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            path_id INTEGER NOT NULL,
+            algorithm TEXT NOT NULL DEFAULT 'CRC32',
+            hash_value TEXT NOT NULL,
+            file_size_at_hash INTEGER,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        """
+    )
+
+    migrate_schema(cursor, 5, 6)
+
+    cursor.execute("PRAGMA table_info(file_hashes)")
+    columns = {row[1] for row in cursor.fetchall()}
+    assert {"file_mtime_ns_at_hash", "file_inode_at_hash", "file_device_at_hash"} <= columns
@@ -0,0 +1,113 @@
+"""Unit tests for the compact metadata blob format.
+
+Author: Michael Economou
+Date: 2026-10-16
+
+Tests that metadata round-trips through the blob format, that fields are
+decoded only when read, that rows stored as JSON text stay readable, and
+that the metadata cache hands out entries without decoding them.
+"""
+
+import json
+import sqlite3
+import threading
+
+import pytest
+
+from oncutf.infra.cache.persistent_metadata_cache import MetadataEntry
+from oncutf.infra.db.metadata_codec import (
+    LazyMetadata,
+    decode_metadata,
+    encode_metadata,
+    open_metadata,
+)
+from oncutf.infra.db.metadata_store import MetadataStore
+from oncutf.infra.db.migrations import create_indexes, create_schema
+from oncutf.infra.db.path_store import PathStore
+
+SAMPLE = {
+    "EXIF:ISO": 400,
+    "EXIF:FNumber": 2.8,
+    "EXIF:Model": "ILCE-7SM3",
+    "XMP:Title": 'Ακρόπολη "noon"\n',
+    "QuickTime:Tracks": [{"Type": "video", "FPS": 25}, None],
+    "Composite:Flash": False,
+    "": "empty key",
+}
+
+
+@pytest.fixture
+def store():
+    """Metadata store over an in-memory database with the current schema."""
+    conn = sqlite3.connect(":memory:", check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    cursor = conn.cursor()
+    create_schema(cursor)
+    create_indexes(cursor)
+    conn.commit()
+    return MetadataStore(conn, PathStore(conn), threading.RLock())
+
+
+def _extended_metadata(count):
+    return {f"MakerNotes:Field{i:04d}": f"Value {i % 7}" if i % 3 else i for i in range(count)}
+
+
+def test_round_trip():
+    blob = encode_metadata(SAMPLE)
+
+    assert isinstance(blob, bytes)
+    assert decode_metadata(blob) == SAMPLE
+    assert list(LazyMetadata(blob)) == list(SAMPLE)
+    assert decode_metadata(encode_metadata({})) == {}
+
+
+def test_lazy_lookup_decodes_only_read_fields():
+    metadata = LazyMetadata(encode_metadata(SAMPLE))
+
+    assert len(metadata) == len(SAMPLE)
+    assert "EXIF:Model" in metadata
+    assert "EXIF:Mode" not in metadata
+    assert metadata["XMP:Title"] == SAMPLE["XMP:Title"]
+    assert metadata.get("missing", "default") == "default"
+    assert metadata._decoded == {"XMP:Title": SAMPLE["XMP:Title"]}
+    assert metadata == SAMPLE
+
+
+def test_blob_is_smaller_than_json():
+    metadata = _extended_metadata(400)
+
+    assert len(encode_metadata(metadata)) < len(json.dumps(metadata, ensure_ascii=False)) / 2
+
+
+def test_json_rows_stay_readable(store):
+    store.store_metadata("/a.jpg", {"old": True})
+    store.connection.execute(
+        "UPDATE file_metadata SET metadata_json = ?", (json.dumps(SAMPLE, ensure_ascii=False),)
+    )
+
+    assert store.get_metadata("/a.jpg") == SAMPLE
+    assert open_metadata(json.dumps(SAMPLE)) == SAMPLE
+    assert store.get_stored_metadata_batch(["/a.jpg"])["/a.jpg"].data == SAMPLE
+
+
+def test_store_reads_blobs_lazily(store):
+    metadata = _extended_metadata(300)
+    store.batch_store_metadata([("/a.jpg", metadata, True, True)])
+
+    stored = store.get_stored_metadata_batch(["/a.jpg", "/b.jpg"])
+
+    assert stored["/b.jpg"] is None
+    assert isinstance(stored["/a.jpg"].data, LazyMetadata)
+    assert stored["/a.jpg"].is_modified
+    assert store.get_metadata_batch(["/a.jpg"]) == {"/a.jpg": {**metadata, "__modified__": True}}
+
+
+def test_entry_decodes_in_full_on_data_access():
+    entry = MetadataEntry(LazyMetadata(encode_metadata(SAMPLE)))
+
+    assert entry.fields["EXIF:ISO"] == 400
+    assert isinstance(entry.fields, LazyMetadata)
+    entry.data["EXIF:ISO"] = 800
+
+    assert entry.data == {**SAMPLE, "EXIF:ISO": 800}
+    assert entry.fields is entry.data
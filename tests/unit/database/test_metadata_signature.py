@@ -0,0 +1,185 @@
+"""Unit tests for stat-signature validation of stored metadata.
+
+Author: Michael Economou
+Date: 2026-10-16
+
+Tests that metadata is persisted with the size/mtime/inode signature of
+its file, that the metadata caches report entries of edited files as
+stale, and that the v8 migration adds the columns.
+"""
+
+import os
+import sqlite3
+
+import pytest
+
+from oncutf.infra.cache import persistent_metadata_cache
+from oncutf.infra.cache.metadata_cache import MetadataCache
+from oncutf.infra.cache.persistent_metadata_cache import PersistentMetadataCache
+from oncutf.infra.db import database_manager
+from oncutf.infra.db.database_manager import DatabaseManager
+from oncutf.infra.db.migrations import migrate_schema
+from oncutf.utils.filesystem.file_signature import FileSignature, get_file_signature
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    """DatabaseManager on a temporary database file."""
+    monkeypatch.setattr(database_manager, "_FRESH_START_DONE", True)
+    manager = DatabaseManager(str(tmp_path / "oncutf.db"))
+    yield manager
+    manager.close()
+
+
+@pytest.fixture
+def cache(db, monkeypatch):
+    """PersistentMetadataCache backed by the temporary database."""
+    monkeypatch.setattr(persistent_metadata_cache, "get_database_manager", lambda: db)
+    return PersistentMetadataCache()
+
+
+def _write(path, content):
+    path.write_bytes(content)
+    return str(path)
+
+
+def _edit(path):
+    """Rewrite *path* in place with the same size and a later mtime."""
+    stat_before = path.stat()
+    path.write_bytes(path.read_bytes()[::-1])
+    os.utime(path, ns=(stat_before.st_atime_ns, stat_before.st_mtime_ns + 1_000_000))
+
+
+def test_store_records_signature(db, tmp_path):
+    single = _write(tmp_path / "a.jpg", b"jpeg")
+    batched = _write(tmp_path / "b.jpg", b"jpeg!")
+    given = FileSignature(1, 2, 3, 4)
+
+    db.store_metadata(single, {"ISO": 100}, signature=given)
+    db.batch_store_metadata([(batched, {"ISO": 200}, True, False)])
+
+    stored = db.get_stored_metadata_batch([single, batched])
+    assert stored[single].signature == given
+    assert stored[batched].signature == get_file_signature(batched)
+    assert stored[batched].is_extended
+
+
+def test_check_entries_splits_fresh_stale_missing(cache, tmp_path):
+    fresh = _write(tmp_path / "fresh.jpg", b"one")
+    edited = _write(tmp_path / "edited.jpg", b"two")
+    pending = _write(tmp_path / "pending.jpg", b"three")
+    missing = _write(tmp_path / "missing.jpg", b"four")
+    cache.set(fresh, {"ISO": 100})
+    cache.set(edited, {"ISO": 200})
+    cache.set(pending, {"ISO": 300}, modified=True)
+    _edit(tmp_path / "edited.jpg")
+    _edit(tmp_path / "pending.jpg")
+    cache.clear()
+
+    check = cache.check_entries([fresh, edited, pending, missing])
+
+    assert sorted(check.fresh) == sorted([fresh, pending])
+    assert check.stale == [edited]
+    assert check.missing == [missing]
+    stats = cache.get_cache_stats()
+    assert (stats["fresh_entries"], stats["stale_entries"], stats["missing_entries"]) == (2, 1, 1)
+
+
+def test_entry_reads_miss_on_edited_files(cache, tmp_path):
+    fresh = _write(tmp_path / "fresh.jpg", b"one")
+    edited = _write(tmp_path / "edited.jpg", b"two")
+    pending = _write(tmp_path / "pending.jpg", b"three")
+    cache.set(fresh, {"ISO": 100})
+    cache.set(edited, {"ISO": 200})
+    cache.set(pending, {"ISO": 300}, modified=True)
+    _edit(tmp_path / "edited.jpg")
+    _edit(tmp_path / "pending.jpg")
+
+    entries = cache.get_entries_batch([fresh, edited, pending])
+
+    assert entries[edited] is None
+    assert entries[fresh].data["ISO"] == 100
+    assert entries[pending].data["ISO"] == 300
+    assert edited not in cache._memory_cache
+    # The database row is stale too, so a single read misses as well
+    assert cache.get_entry(edited) is None
+    assert cache.get_entry(fresh) is entries[fresh]
+
+
+def test_set_batch_stores_signatures_with_one_write(cache, db, tmp_path, monkeypatch):
+    paths = [_write(tmp_path / f"{i}.jpg", b"jpeg" * i) for i in range(1, 4)]
+    writes = []
+    store = db.batch_store_metadata
+    monkeypatch.setattr(db, "batch_store_metadata", lambda *args: writes.append(store(*args)))
+
+    cache.set_batch([(path, {"ISO": 100}) for path in paths], is_extended=True)
+
+    assert writes == [3]
+    check = cache.check_entries(paths)
+    assert sorted(check.fresh) == sorted(paths)
+    assert all(entry.is_extended for entry in check.fresh.values())
+
+
+def test_set_batch_keeps_signature_taken_before_extraction(cache, tmp_path):
+    edited = _write(tmp_path / "edited.jpg", b"one")
+    unchanged = _write(tmp_path / "unchanged.jpg", b"two")
+    before_extraction = get_file_signature(edited)
+    _edit(tmp_path / "edited.jpg")  # edited while its metadata was being read
+
+    cache.set_batch(
+        [(edited, {"ISO": 100}), (unchanged, {"ISO": 200})],
+        signatures={edited: before_extraction},
+    )
+    cache.clear()
+
+    check = cache.check_entries([edited, unchanged])
+    assert check.stale == [edited]
+    assert list(check.fresh) == [unchanged]
+
+
+def test_rows_without_signature_are_stale(cache, db, tmp_path):
+    path = _write(tmp_path / "legacy.jpg", b"old")
+    db.store_metadata(path, {"ISO": 100})
+    with db.transaction() as conn:
+        conn.execute("UPDATE file_metadata SET file_mtime_ns_at_extract = NULL")
+
+    assert cache.check_entries([path]).stale == [path]
+
+
+def test_memory_cache_keeps_entries_until_file_changes(tmp_path):
+    path = tmp_path / "a.jpg"
+    path.write_bytes(b"jpeg")
+    cache = MetadataCache()
+    cache.set(path, {"ISO": 100})
+
+    assert cache.get(path) == {"ISO": 100}
+    assert cache.cleanup_expired() == 0
+    _edit(path)
+    assert cache.get(path) is None
+
+
+def test_migration_adds_signature_columns():
+    conn = sqlite3.connect(":memory:")
+    cursor = conn.cursor()
+    cursor.execute(
+        """
+        CREATE TABLE file_metadata (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            path_id INTEGER NOT NULL,
+            metadata_type TEXT NOT NULL DEFAULT 'fast',
+            metadata_json TEXT NOT NULL,
+            is_modified BOOLEAN DEFAULT FALSE
+        )
+        """
+    )
+
+    migrate_schema(cursor, 7, 8)
+
+    cursor.execute("PRAGMA table_info(file_metadata)")
+    columns = {row[1] for row in cursor.fetchall()}
+    assert {
+        "file_size_at_extract",
+        "file_mtime_ns_at_extract",
+        "file_inode_at_extract",
+        "file_device_at_extract",
+    } <= columns
@@ -0,0 +1,121 @@
+"""Unit tests for upsert-based metadata and hash persistence.
+
+Author: Michael Economou
+Date: 2026-10-16
+
+Tests that storing metadata and hashes again updates rows in place (one row
+per path for metadata, one per path and algorithm for hashes), and that the
+v7 migration removes duplicate rows, keeping the latest one.
+"""
+
+import sqlite3
+import threading
+
+import pytest
+
+from oncutf.infra.db.hash_store import HashRecord, HashStore
+from oncutf.infra.db.metadata_store import MetadataStore
+from oncutf.infra.db.migrations import create_indexes, create_schema, migrate_schema
+from oncutf.infra.db.path_store import PathStore
+
+
+@pytest.fixture
+def memory_db():
+    """Create an in-memory database with the current schema."""
+    conn = sqlite3.connect(":memory:", check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    cursor = conn.cursor()
+    create_schema(cursor)
+    create_indexes(cursor)
+    conn.commit()
+    return conn
+
+
+@pytest.fixture
+def stores(memory_db):
+    """Metadata and hash stores sharing one path store."""
+    path_store = PathStore(memory_db)
+    lock = threading.RLock()
+    return MetadataStore(memory_db, path_store, lock), HashStore(memory_db, path_store, lock)
+
+
+def _rows(conn, table):
+    return conn.execute(f"SELECT * FROM {table} ORDER BY id").fetchall()
+
+
+def test_restoring_metadata_updates_row_in_place(stores, memory_db):
+    metadata_store, _hash_store = stores
+    metadata_store.store_metadata("/a.jpg", {"ISO": 100})
+    first = _rows(memory_db, "file_metadata")
+
+    metadata_store.store_metadata("/a.jpg", {"ISO": 200}, is_modified=True)
+    metadata_store.batch_store_metadata([("/a.jpg", {"ISO": 300}, False, False)])
+
+    rows = _rows(memory_db, "file_metadata")
+    assert [row["id"] for row in rows] == [first[0]["id"]]
+    assert metadata_store.get_metadata("/a.jpg") == {"ISO": 300}
+
+
+def test_other_metadata_type_replaces_row(stores, memory_db):
+    metadata_store, _hash_store = stores
+    metadata_store.store_metadata("/a.jpg", {"ISO": 100})
+    metadata_store.store_metadata("/a.jpg", {"ISO": 100, "Lens": "50mm"}, is_extended=True)
+
+    assert [row["metadata_type"] for row in _rows(memory_db, "file_metadata")] == ["extended"]
+
+    metadata_store.batch_store_metadata(
+        [("/a.jpg", {"ISO": 1}, True, False), ("/a.jpg", {"ISO": 2}, False, False)]
+    )
+    assert [row["metadata_type"] for row in _rows(memory_db, "file_metadata")] == ["fast"]
+    assert metadata_store.get_metadata_batch(["/a.jpg"]) == {"/a.jpg": {"ISO": 2}}
+
+
+def test_rehashing_updates_row_in_place(stores, memory_db):
+    _metadata_store, hash_store = stores
+    hash_store.store_hash("/a.jpg", "00000001")
+    hash_store.store_hash("/a.jpg", "aaaaaaaa", algorithm="SHA256")
+    ids = [row["id"] for row in _rows(memory_db, "file_hashes")]
+
+    hash_store.store_hash("/a.jpg", "00000002")
+    hash_store.store_hashes_batch([HashRecord("/a.jpg", "00000003")])
+
+    assert [row["id"] for row in _rows(memory_db, "file_hashes")] == ids
+    assert hash_store.get_hash("/a.jpg") == "00000003"
+    assert hash_store.get_hash("/a.jpg", "SHA256") == "aaaaaaaa"
+
+
+def test_migration_keeps_latest_row_per_key():
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    cursor = conn.cursor()
+    create_schema(cursor)
+    cursor.executemany(
+        "INSERT INTO file_metadata (path_id, metadata_type, metadata_json, updated_at)"
+        " VALUES (?, ?, ?, ?)",
+        [
+            (1, "fast", '{"v": 1}', "2026-01-01 10:00:00"),
+            (1, "extended", '{"v": 2}', "2026-01-02 10:00:00"),
+            (1, "fast", '{"v": 3}', "2026-01-02 10:00:00"),
+            (2, "fast", '{"v": 4}', "2026-01-01 10:00:00"),
+        ],
+    )
+    cursor.executemany(
+        "INSERT INTO file_hashes (path_id, algorithm, hash_value, created_at) VALUES (?, ?, ?, ?)",
+        [
+            (1, "CRC32", "old", "2026-01-01 10:00:00"),
+            (1, "CRC32", "new", "2026-01-03 10:00:00"),
+            (1, "SHA256", "sha", "2026-01-01 10:00:00"),
+        ],
+    )
+
+    migrate_schema(cursor, 6, 7)
+    create_indexes(cursor)
+
+    metadata = [(row["path_id"], row["metadata_json"]) for row in _rows(conn, "file_metadata")]
+    assert metadata == [(1, '{"v": 3}'), (2, '{"v": 4}')]
+    hashes = [(row["algorithm"], row["hash_value"]) for row in _rows(conn, "file_hashes")]
+    assert hashes == [("CRC32", "new"), ("SHA256", "sha")]
+    with pytest.raises(sqlite3.IntegrityError):
+        cursor.execute(
+            "INSERT INTO file_hashes (path_id, algorithm, hash_value) VALUES (1, 'CRC32', 'x')"
+        )
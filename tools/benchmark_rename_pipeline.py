@@ -0,0 +1,362 @@
+#!/usr/bin/env python3
+"""Benchmark the rename pipeline on reproducible synthetic file sets.
+
+Author: Michael Economou
+Date: 2026-10-16
+
+Generates FileItem sets (card-dump style folders, mixed extensions, RAW+JPG
+companion groups with XMP sidecars, fake EXIF metadata) from a fixed seed and
+times, for each module stack and size:
+
+- preview_cold: UnifiedRenameEngine.generate_preview with empty caches
+- preview_edit: generate_preview after editing one module (warm memo)
+- validate: validate_preview of the resulting pairs
+- execute_dry_run: execute_rename with the filesystem rename stubbed out
+  (plan building, validation and conflict checks still run)
+
+Availability queries are answered from the synthetic dataset instead of the
+persistent caches, so runs never touch the user's database. Results are
+written as JSON and can be compared across commits:
+
+    python tools/benchmark_rename_pipeline.py -o before.json
+    git checkout my-branch
+    python tools/benchmark_rename_pipeline.py -o after.json --compare before.json
+
+Sizes default to 10k and 100k files; pass --sizes 10000 100000 1000000 for the
+full suite (1M files needs several GB of RAM).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from oncutf.app.ports import service_registry  # noqa: E402
+from oncutf.core import performance_monitor  # noqa: E402
+from oncutf.core.rename.unified_rename_engine import UnifiedRenameEngine  # noqa: E402
+from oncutf.domain.models.file_item import FileItem  # noqa: E402
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+SCHEMA_VERSION = 1
+DEFAULT_SIZES = (10_000, 100_000)
+DEFAULT_SEED = 1234
+
+# Nonexistent root: paths normalize to themselves and renames cannot conflict
+DATASET_ROOT = "/oncutf-bench"
+
+FILES_PER_FOLDER = 500
+COMPANION_GROUP_RATIO = 0.3
+SIDECAR_RATIO = 0.5
+METADATA_RATIO = 0.8
+
+# (extension, weight) for files outside companion groups
+SINGLE_EXTENSIONS = (
+    ("JPG", 40),
+    ("MOV", 15),
+    ("MP4", 15),
+    ("CR3", 10),
+    ("ARW", 5),
+    ("PNG", 5),
+    ("WAV", 5),
+    ("MXF", 5),
+)
+RAW_EXTENSIONS = ("CR3", "ARW", "NEF")
+CAMERA_MODELS = ("Canon EOS R5", "Sony ILCE-7M4", "Nikon Z 9", "ARRI ALEXA 35")
+
+# name -> (modules, post_transform); every stack has a specified_text module,
+# which preview_edit changes
+STACKS: dict[str, tuple[list[dict[str, Any]], dict[str, Any]]] = {
+    "text_counter": (
+        [
+            {"type": "specified_text", "text": "shoot_"},
+            {"type": "counter", "start": 1, "step": 1, "padding": 5, "scope": "global"},
+        ],
+        {},
+    ),
+    "original_scoped_counter": (
+        [
+            {"type": "original_name"},
+            {"type": "specified_text", "text": "_"},
+            {"type": "counter", "start": 1, "step": 1, "padding": 4, "scope": "per_folder"},
+        ],
+        {"case": "lower", "separator": "as-is", "greeklish": False},
+    ),
+    "remove_text_transform": (
+        [
+            {
+                "type": "remove_text_from_original_name",
+                "text_to_remove": "IMG_",
+                "position": "Start of name",
+                "case_sensitive": False,
+            },
+            {"type": "specified_text", "text": "_v"},
+            {"type": "counter", "start": 1, "step": 1, "padding": 3, "scope": "per_extension"},
+        ],
+        {"case": "upper", "separator": "snake_case", "greeklish": False},
+    ),
+    "metadata": (
+        [
+            {"type": "metadata", "category": "metadata_keys", "field": "EXIF:Model"},
+            {"type": "specified_text", "text": "_"},
+            {"type": "original_name"},
+        ],
+        {"case": "original", "separator": "snake_case", "greeklish": False},
+    ),
+}
+
+
+@dataclass
+class Dataset:
+    """Synthetic files plus the metadata and availability reported for them."""
+
+    files: list[FileItem]
+    metadata: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+
+class SyntheticAvailability:
+    """BatchQueryManager stand-in answering from a Dataset."""
+
+    def __init__(self, dataset: Dataset) -> None:
+        """Report metadata for the files the dataset has metadata for."""
+        self._metadata = dataset.metadata
+
+    def get_hash_availability(self, _files: list[FileItem]) -> dict[str, bool]:
+        """No file has a cached hash."""
+        return {}
+
+    def get_metadata_availability(self, files: list[FileItem]) -> dict[str, bool]:
+        """Return path -> whether the dataset has metadata for it."""
+        return {f.full_path: f.full_path in self._metadata for f in files}
+
+
+def generate_dataset(size: int, seed: int = DEFAULT_SEED) -> Dataset:
+    """Generate *size* FileItems deterministically from *seed*."""
+    rng = random.Random(seed)
+    extensions, weights = zip(*SINGLE_EXTENSIONS, strict=True)
+    base_time = datetime(2026, 1, 1, tzinfo=UTC).timestamp()
+
+    dataset = Dataset(files=[])
+    shot = 0
+    while len(dataset.files) < size:
+        folder = f"{DATASET_ROOT}/card_{shot // FILES_PER_FOLDER:04d}/DCIM"
+        stem = f"IMG_{shot:06d}"
+        if rng.random() < COMPANION_GROUP_RATIO:
+            group = [rng.choice(RAW_EXTENSIONS), "JPG"]
+            if rng.random() < SIDECAR_RATIO:
+                group.append("XMP")
+        else:
+            group = rng.choices(extensions, weights)
+
+        modified = datetime.fromtimestamp(base_time + shot * 7, tz=UTC)
+        has_metadata = rng.random() < METADATA_RATIO
+        model = rng.choice(CAMERA_MODELS)
+        for extension in group[: size - len(dataset.files)]:
+            path = f"{folder}/{stem}.{extension}"
+            dataset.files.append(FileItem(path, extension.lower(), modified))
+            if has_metadata and extension != "XMP":
+                dataset.metadata[path] = {
+                    "EXIF:Model": model,
+                    "EXIF:DateTimeOriginal": modified.strftime("%Y:%m:%d %H:%M:%S"),
+                    "File:FileSize": f"{rng.randint(1, 80)} MB",
+                }
+        shot += 1
+    return dataset
+
+
+def edited(modules: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Return *modules* with the first specified_text module's text changed."""
+    result = [dict(module) for module in modules]
+    for module in result:
+        if module["type"] == "specified_text":
+            module["text"] += "x"
+            break
+    return result
+
+
+def create_engine(dataset: Dataset) -> UnifiedRenameEngine:
+    """Create an engine with empty caches that never touches the database."""
+    engine = UnifiedRenameEngine()
+    engine.batch_query_manager = SyntheticAvailability(dataset)  # type: ignore[assignment]
+    engine.preview_manager.batch_query_manager = engine.batch_query_manager
+    # Dry run: everything up to the filesystem call
+    engine.execution_manager._execute_single_rename = lambda _item: True  # type: ignore[method-assign, assignment]
+    return engine
+
+
+def time_runs(
+    run: Callable[[], Any], repeats: int, setup: Callable[[], Any] | None = None
+) -> list[float]:
+    """Return the duration of *repeats* calls of *run*, each after *setup*."""
+    durations = []
+    for _ in range(repeats):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        run()
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+def benchmark_stack(stack: str, dataset: Dataset, repeats: int) -> list[dict[str, Any]]:
+    """Time every operation for one module stack over one dataset."""
+    modules, post_transform = STACKS[stack]
+    files = dataset.files
+    state: dict[str, Any] = {}
+
+    def cold_setup() -> None:
+        state["engine"] = create_engine(dataset)
+
+    def preview_cold() -> None:
+        state["pairs"] = (
+            state["engine"]
+            .generate_preview(files, modules, post_transform, dataset.metadata)
+            .name_pairs
+        )
+
+    def edit_setup() -> None:
+        cold_setup()
+        preview_cold()
+        state["engine"].cache_manager.clear_cache()
+
+    def preview_edit() -> None:
+        state["engine"].generate_preview(files, edited(modules), post_transform, dataset.metadata)
+
+    def validate() -> None:
+        state["engine"].validate_preview(state["pairs"])
+
+    def execute_dry_run() -> None:
+        state["engine"].execute_rename(files, [new for _, new in state["pairs"]])
+
+    runs = {
+        "preview_cold": time_runs(preview_cold, repeats, cold_setup),
+        "preview_edit": time_runs(preview_edit, repeats, edit_setup),
+        "validate": time_runs(validate, repeats, state["engine"].cache_manager.clear_cache),
+        "execute_dry_run": time_runs(execute_dry_run, repeats),
+    }
+    return [
+        {
+            "stack": stack,
+            "files": len(files),
+            "operation": operation,
+            "best_s": round(min(durations), 6),
+            "median_s": round(statistics.median(durations), 6),
+            "runs_s": [round(d, 6) for d in durations],
+        }
+        for operation, durations in runs.items()
+    ]
+
+
+def environment_info() -> dict[str, Any]:
+    """Describe the commit and machine the results were taken on."""
+
+    def git(*args: str) -> str:
+        try:
+            return subprocess.run(
+                ["git", *args], cwd=PROJECT_ROOT, capture_output=True, text=True, check=True
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return ""
+
+    return {
+        "commit": git("rev-parse", "HEAD"),
+        "dirty": bool(git("status", "--porcelain", "--untracked-files=no")),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "created": datetime.now(UTC).isoformat(timespec="seconds"),
+    }
+
+
+def compare(results: list[dict[str, Any]], baseline: dict[str, Any]) -> float:
+    """Print best-time ratios against *baseline*; return the worst ratio."""
+    previous = {(r["stack"], r["files"], r["operation"]): r["best_s"] for r in baseline["results"]}
+    print(f"\nCompared with {baseline.get('commit', '?')[:10]} (ratio > 1 is slower):")
+    print(f"{'stack':<26}{'files':>9}  {'operation':<16}{'before':>10}{'after':>10}{'ratio':>8}")
+    worst = 0.0
+    for r in results:
+        before = previous.get((r["stack"], r["files"], r["operation"]))
+        if not before:
+            continue
+        ratio = r["best_s"] / before
+        worst = max(worst, ratio)
+        print(
+            f"{r['stack']:<26}{r['files']:>9}  {r['operation']:<16}"
+            f"{before:>10.4f}{r['best_s']:>10.4f}{ratio:>8.2f}"
+        )
+    return worst
+
+
+def main() -> int:
+    """Run the benchmark suite."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--stacks", nargs="+", choices=sorted(STACKS), default=list(STACKS))
+    parser.add_argument("--repeats", type=int, default=3, help="runs per operation (best is kept)")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("-o", "--output", type=Path, help="write JSON results here")
+    parser.add_argument("--compare", type=Path, help="baseline JSON to compare against")
+    parser.add_argument(
+        "--fail-above",
+        type=float,
+        help="exit with status 1 if any best time exceeds the baseline by this ratio",
+    )
+    args = parser.parse_args()
+
+    # Per-file debug/info logging would dominate the timings. Headless runs
+    # have no application services registered, and the engine's own
+    # slow-operation warnings duplicate this report
+    logging.disable(logging.INFO)
+    service_registry.logger.setLevel(logging.ERROR)
+    performance_monitor.logger.setLevel(logging.ERROR)
+
+    results: list[dict[str, Any]] = []
+    print(f"{'stack':<26}{'files':>9}  {'operation':<16}{'best s':>10}{'median s':>10}")
+    for size in args.sizes:
+        dataset = generate_dataset(size, args.seed)
+        for stack in args.stacks:
+            for r in benchmark_stack(stack, dataset, args.repeats):
+                results.append(r)
+                print(
+                    f"{r['stack']:<26}{r['files']:>9}  {r['operation']:<16}"
+                    f"{r['best_s']:>10.4f}{r['median_s']:>10.4f}"
+                )
+
+    report = {
+        "schema": SCHEMA_VERSION,
+        **environment_info(),
+        "seed": args.seed,
+        "repeats": args.repeats,
+        "results": results,
+    }
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        worst = compare(results, json.loads(args.compare.read_text(encoding="utf-8")))
+        if args.fail_above and worst > args.fail_above:
+            print(f"\nRegression: worst ratio {worst:.2f} > {args.fail_above:.2f}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,11 +8,12 @@ Author: Michael Economou
 Date: 2025-12-19
 
 Usage:
-    python scripts/profile_memory.py [--detailed] [--save]
+    python scripts/profile_memory.py [--detailed] [--save] [--file-items N]
 
 Options:
-    --detailed  Show detailed memory breakdown by module
-    --save      Save memory snapshot to reports/memory_snapshot.txt
+    --detailed      Show detailed memory breakdown by module
+    --save          Save memory snapshot to reports/memory_snapshot.txt
+    --file-items N  Measure the memory of N FileItems instead of startup
 """
 
 from __future__ import annotations
@@ -22,6 +23,10 @@ import linecache
 import sys
 import tracemalloc
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
 # Add project root to path
 PROJECT_ROOT = Path(__file__).parent.parent
@@ -173,6 +178,73 @@ def profile_startup_memory(detailed: bool = False) -> tuple[int, int, list[str]]
     return current, peak, report_lines
 
 
+class _DictFileItem:
+    """FileItem layout before __slots__ (one __dict__ and full strings per item)."""
+
+    def __init__(self, path: str, size: int, mtime: float) -> None:
+        from datetime import UTC, datetime
+
+        name = Path(path).name
+        self.full_path = path
+        self.path = path
+        self.extension = Path(path).suffix[1:].lower()
+        self.modified = datetime.fromtimestamp(mtime, tz=UTC).astimezone()
+        self.filename = name
+        self.name = name
+        self.size = size
+        self.metadata: dict[str, object] = {}
+        self.metadata_status = "none"
+        self.checked = False
+        self.hash_value = None
+        self.color = "none"
+        self.rename_dirty = False
+        self.pre_rename_name = ""
+        self.file_missing = False
+
+
+def _measure_items(factory: Callable[[str, int, float], object], count: int) -> int:
+    """Return the bytes allocated while building *count* items with *factory*."""
+    # Paths are built before tracing, as a folder scan hands them over
+    paths = [f"/photos/2026/roll_{i // 500:04d}/IMG_{i:06d}.JPG" for i in range(count)]
+
+    tracemalloc.start()
+    items = [factory(path, 4_000_000, 1_760_000_000.0 + i) for i, path in enumerate(paths)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    del items
+    return current
+
+
+def profile_file_item_memory(count: int) -> list[str]:
+    """Compare the memory of FileItems with the previous __dict__-based layout.
+
+    Args:
+        count: Number of items to build (500 per folder).
+
+    Returns:
+        Report lines.
+
+    """
+    from oncutf.domain.models.file_item import FileItem
+
+    print(f"Building {count} file items...")
+    print("-" * 50)
+
+    slotted = _measure_items(FileItem.from_stat, count)
+    legacy = _measure_items(_DictFileItem, count)
+
+    return [
+        "",
+        "=" * 50,
+        f"FILEITEM MEMORY ({count} items)",
+        "=" * 50,
+        f"FileItem (slots):   {format_size(slotted)} ({slotted / count:.0f} B/item)",
+        f"FileItem (__dict__): {format_size(legacy)} ({legacy / count:.0f} B/item)",
+        f"Saved: {format_size(legacy - slotted)} ({1 - slotted / legacy:.0%})",
+    ]
+
+
 def save_report(lines: list[str], path: Path) -> None:
     """Save memory report to file.
 
@@ -199,13 +271,22 @@ def main() -> int:
     parser.add_argument(
         "--save", action="store_true", help="Save report to reports/memory_snapshot.txt"
     )
+    parser.add_argument(
+        "--file-items",
+        type=int,
+        metavar="N",
+        help="Measure the memory of N FileItems instead of startup",
+    )
     args = parser.parse_args()
 
     print("=" * 50)
     print("oncutf Memory Profiler")
     print("=" * 50)
 
-    _current, _peak, report_lines = profile_startup_memory(args.detailed)
+    if args.file_items:
+        report_lines = profile_file_item_memory(args.file_items)
+    else:
+        _current, _peak, report_lines = profile_startup_memory(args.detailed)
 
     # Print report
     for line in report_lines: